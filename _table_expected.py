@@ -0,0 +1,7251 @@
+table = {
+    (2, 2, 0, 95, 1): (1, ('u1', 'u2')),
+    (2, 2, 3, 92, 1): (1, ('u1', 'u2')),
+    (2, 2, 6, 89, 1): (1, ('u1', 'u2')),
+    (2, 2, 9, 86, 1): (1, ('u1', 'u2')),
+    (2, 2, 12, 83, 1): (1, ('u1', 'u2')),
+    (2, 2, 15, 80, 1): (1, ('u1', 'u2')),
+    (2, 2, 18, 77, 1): (1, ('u1', 'u2')),
+    (2, 2, 21, 74, 1): (1, ('u1', 'u2')),
+    (2, 2, 24, 71, 1): (1, ('u1', 'u2')),
+    (3, 6, 0, 90, 1): (2, ('u1', 'u2')),
+    (3, 6, 3, 87, 1): (2, ('u1', 'u2')),
+    (3, 6, 6, 84, 1): (2, ('u1', 'u2')),
+    (3, 6, 9, 81, 1): (2, ('u1', 'u2')),
+    (3, 6, 12, 78, 1): (2, ('u1', 'u2')),
+    (3, 6, 15, 75, 1): (2, ('u1', 'u2')),
+    (3, 6, 18, 72, 1): (2, ('u1', 'u2')),
+    (3, 6, 21, 69, 1): (2, ('u1', 'u2')),
+    (4, 2, 0, 93, 1): (2, ('u1', 'u2')),
+    (4, 2, 3, 90, 1): (2, ('u1', 'u2')),
+    (4, 2, 6, 87, 1): (2, ('u1', 'u2')),
+    (4, 2, 9, 84, 1): (2, ('u1', 'u2')),
+    (4, 2, 12, 81, 1): (2, ('u1', 'u2')),
+    (4, 2, 15, 78, 1): (2, ('u1', 'u2')),
+    (4, 2, 18, 75, 1): (2, ('u1', 'u2')),
+    (4, 4, 0, 91, 1): (3, ('u1', 'u2')),
+    (4, 4, 3, 88, 1): (3, ('u1', 'u2')),
+    (4, 4, 6, 85, 1): (3, ('u1', 'u2')),
+    (4, 4, 9, 82, 1): (3, ('u1', 'u2')),
+    (4, 4, 12, 79, 1): (3, ('u1', 'u2')),
+    (4, 4, 15, 76, 1): (3, ('u1', 'u2')),
+    (4, 4, 18, 73, 1): (3, ('u1', 'u2')),
+    (4, 6, 0, 89, 1): (3, ('u1', 'u2')),
+    (4, 8, 0, 87, 1): (3, ('u1', 'u2')),
+    (4, 6, 3, 86, 1): (3, ('u1', 'u2')),
+    (4, 6, 6, 83, 1): (3, ('u1', 'u2')),
+    (4, 8, 3, 84, 1): (3, ('u1', 'u2')),
+    (4, 8, 6, 81, 1): (3, ('u1', 'u2')),
+    (4, 6, 9, 80, 1): (3, ('u1', 'u2')),
+    (4, 6, 12, 77, 1): (3, ('u1', 'u2')),
+    (4, 8, 9, 78, 1): (3, ('u1', 'u2')),
+    (4, 8, 12, 75, 1): (3, ('u1', 'u2')),
+    (4, 6, 15, 74, 1): (3, ('u1', 'u2')),
+    (4, 6, 18, 71, 1): (3, ('u1', 'u2')),
+    (4, 8, 15, 72, 1): (3, ('u1', 'u2')),
+    (4, 8, 18, 69, 1): (3, ('u1', 'u2')),
+    (3, 10, 0, 86, 1): (3, ('u1', 'u2')),
+    (3, 10, 3, 83, 1): (3, ('u1', 'u2')),
+    (3, 10, 6, 80, 1): (3, ('u1', 'u2')),
+    (3, 10, 9, 77, 1): (3, ('u1', 'u2')),
+    (3, 10, 12, 74, 1): (3, ('u1', 'u2')),
+    (3, 10, 15, 71, 1): (3, ('u1', 'u2')),
+    (3, 10, 18, 68, 1): (3, ('u1', 'u2')),
+    (3, 10, 21, 65, 1): (3, ('u1', 'u2')),
+    (3, 12, 0, 84, 1): (4, ('u1', 'u2')),
+    (4, 10, 0, 85, 1): (4, ('u1', 'u2')),
+    (4, 12, 0, 83, 1): (4, ('u1', 'u2')),
+    (3, 12, 3, 81, 1): (4, ('u1', 'u2')),
+    (4, 10, 3, 82, 1): (4, ('u1', 'u2')),
+    (3, 12, 6, 78, 1): (4, ('u1', 'u2')),
+    (4, 10, 6, 79, 1): (4, ('u1', 'u2')),
+    (4, 12, 3, 80, 1): (4, ('u1', 'u2')),
+    (4, 12, 6, 77, 1): (4, ('u1', 'u2')),
+    (3, 12, 9, 75, 1): (4, ('u1', 'u2')),
+    (4, 10, 9, 76, 1): (4, ('u1', 'u2')),
+    (3, 12, 12, 72, 1): (4, ('u1', 'u2')),
+    (4, 10, 12, 73, 1): (4, ('u1', 'u2')),
+    (4, 12, 9, 74, 1): (4, ('u1', 'u2')),
+    (4, 12, 12, 71, 1): (4, ('u1', 'u2')),
+    (3, 12, 15, 69, 1): (4, ('u1', 'u2')),
+    (4, 10, 15, 70, 1): (4, ('u1', 'u2')),
+    (3, 12, 18, 66, 1): (4, ('u1', 'u2')),
+    (4, 10, 18, 67, 1): (4, ('u1', 'u2')),
+    (4, 12, 15, 68, 1): (4, ('u1', 'u2')),
+    (4, 12, 18, 65, 1): (4, ('u1', 'u2')),
+    (3, 14, 0, 82, 1): (4, ('u1', 'u2')),
+    (3, 14, 3, 79, 1): (4, ('u1', 'u2')),
+    (3, 14, 6, 76, 1): (4, ('u1', 'u2')),
+    (3, 14, 9, 73, 1): (4, ('u1', 'u2')),
+    (3, 14, 12, 70, 1): (4, ('u1', 'u2')),
+    (3, 14, 15, 67, 1): (4, ('u1', 'u2')),
+    (3, 16, 0, 80, 1): (5, ('u1', 'u2')),
+    (3, 16, 3, 77, 1): (5, ('u1', 'u2')),
+    (3, 16, 6, 74, 1): (5, ('u1', 'u2')),
+    (3, 16, 9, 71, 1): (5, ('u1', 'u2')),
+    (3, 16, 12, 68, 1): (5, ('u1', 'u2')),
+    (3, 16, 15, 65, 1): (5, ('u1', 'u2')),
+    (4, 14, 0, 81, 1): (5, ('u1', 'u2')),
+    (4, 14, 3, 78, 1): (5, ('u1', 'u2')),
+    (5, 14, 0, 80, 1): (5, ('u1', 'u2')),
+    (5, 14, 3, 77, 1): (5, ('u1', 'u2')),
+    (4, 14, 6, 75, 1): (5, ('u1', 'u2')),
+    (4, 14, 9, 72, 1): (5, ('u1', 'u2')),
+    (5, 14, 6, 74, 1): (5, ('u1', 'u2')),
+    (5, 14, 9, 71, 1): (5, ('u1', 'u2')),
+    (4, 14, 12, 69, 1): (5, ('u1', 'u2')),
+    (4, 14, 15, 66, 1): (5, ('u1', 'u2')),
+    (5, 14, 12, 68, 1): (5, ('u1', 'u2')),
+    (5, 14, 15, 65, 1): (5, ('u1', 'u2')),
+    (3, 12, 21, 63, 1): (4, ('u1', 'u2')),
+    (3, 14, 18, 64, 1): (4, ('u1', 'u2')),
+    (3, 14, 21, 61, 1): (4, ('u1', 'u2')),
+    (4, 16, 0, 79, 1): (5, ('u1', 'u2')),
+    (4, 16, 3, 76, 1): (5, ('u1', 'u2')),
+    (4, 16, 6, 73, 1): (5, ('u1', 'u2')),
+    (4, 16, 9, 70, 1): (5, ('u1', 'u2')),
+    (4, 16, 12, 67, 1): (5, ('u1', 'u2')),
+    (3, 16, 18, 62, 1): (5, ('u1', 'u2')),
+    (4, 14, 18, 63, 1): (5, ('u1', 'u2')),
+    (4, 16, 15, 64, 1): (5, ('u1', 'u2')),
+    (4, 16, 18, 61, 1): (5, ('u1', 'u2')),
+    (3, 18, 0, 78, 1): (5, ('u1', 'u2')),
+    (3, 18, 3, 75, 1): (5, ('u1', 'u2')),
+    (3, 18, 6, 72, 1): (5, ('u1', 'u2')),
+    (3, 18, 9, 69, 1): (5, ('u1', 'u2')),
+    (3, 18, 12, 66, 1): (5, ('u1', 'u2')),
+    (3, 18, 15, 63, 1): (5, ('u1', 'u2')),
+    (3, 20, 0, 76, 1): (6, ('u1', 'u2')),
+    (3, 20, 3, 73, 1): (6, ('u1', 'u2')),
+    (3, 20, 6, 70, 1): (6, ('u1', 'u2')),
+    (3, 20, 9, 67, 1): (6, ('u1', 'u2')),
+    (3, 20, 12, 64, 1): (6, ('u1', 'u2')),
+    (3, 20, 15, 61, 1): (6, ('u1', 'u2')),
+    (4, 18, 0, 77, 1): (6, ('u1', 'u2')),
+    (4, 18, 3, 74, 1): (6, ('u1', 'u2')),
+    (5, 18, 0, 76, 1): (6, ('u1', 'u2')),
+    (5, 18, 3, 73, 1): (6, ('u1', 'u2')),
+    (4, 18, 6, 71, 1): (6, ('u1', 'u2')),
+    (4, 18, 9, 68, 1): (6, ('u1', 'u2')),
+    (5, 18, 6, 70, 1): (6, ('u1', 'u2')),
+    (5, 18, 9, 67, 1): (6, ('u1', 'u2')),
+    (4, 18, 12, 65, 1): (6, ('u1', 'u2')),
+    (4, 18, 15, 62, 1): (6, ('u1', 'u2')),
+    (5, 18, 12, 64, 1): (6, ('u1', 'u2')),
+    (5, 18, 15, 61, 1): (6, ('u1', 'u2')),
+    (3, 22, 0, 74, 1): (6, ('u1', 'u2')),
+    (3, 22, 3, 71, 1): (6, ('u1', 'u2')),
+    (3, 22, 6, 68, 1): (6, ('u1', 'u2')),
+    (3, 22, 9, 65, 1): (6, ('u1', 'u2')),
+    (4, 20, 0, 75, 1): (6, ('u1', 'u2')),
+    (4, 20, 3, 72, 1): (6, ('u1', 'u2')),
+    (4, 20, 6, 69, 1): (6, ('u1', 'u2')),
+    (4, 20, 9, 66, 1): (6, ('u1', 'u2')),
+    (3, 22, 12, 62, 1): (6, ('u1', 'u2')),
+    (4, 20, 12, 63, 1): (6, ('u1', 'u2')),
+    (4, 22, 0, 73, 1): (7, ('u1', 'u2')),
+    (4, 22, 3, 70, 1): (7, ('u1', 'u2')),
+    (4, 22, 6, 67, 1): (7, ('u1', 'u2')),
+    (4, 22, 9, 64, 1): (7, ('u1', 'u2')),
+    (4, 22, 12, 61, 1): (7, ('u1', 'u2')),
+    (6, 20, 0, 73, 1): (7, ('u1', 'u2')),
+    (6, 20, 3, 70, 1): (7, ('u1', 'u2')),
+    (6, 20, 6, 67, 1): (7, ('u1', 'u2')),
+    (6, 20, 9, 64, 1): (7, ('u1', 'u2')),
+    (6, 20, 12, 61, 1): (7, ('u1', 'u2')),
+    (3, 16, 21, 59, 1): (5, ('u1', 'u2')),
+    (3, 18, 18, 60, 1): (5, ('u1', 'u2')),
+    (3, 18, 21, 57, 1): (5, ('u1', 'u2')),
+    (3, 20, 18, 58, 1): (6, ('u1', 'u2')),
+    (4, 18, 18, 59, 1): (6, ('u1', 'u2')),
+    (4, 20, 15, 60, 1): (6, ('u1', 'u2')),
+    (4, 20, 18, 57, 1): (6, ('u1', 'u2')),
+    (3, 22, 15, 59, 1): (6, ('u1', 'u2')),
+    (3, 24, 0, 72, 1): (7, ('u1', 'u2')),
+    (3, 24, 3, 69, 1): (7, ('u1', 'u2')),
+    (3, 24, 6, 66, 1): (7, ('u1', 'u2')),
+    (3, 24, 9, 63, 1): (7, ('u1', 'u2')),
+    (3, 24, 12, 60, 1): (7, ('u1', 'u2')),
+    (3, 24, 15, 57, 1): (7, ('u1', 'u2')),
+    (5, 22, 0, 72, 1): (7, ('u1', 'u2')),
+    (5, 22, 3, 69, 1): (7, ('u1', 'u2')),
+    (5, 22, 6, 66, 1): (7, ('u1', 'u2')),
+    (5, 22, 9, 63, 1): (7, ('u1', 'u2')),
+    (4, 22, 15, 58, 1): (7, ('u1', 'u2')),
+    (5, 22, 12, 60, 1): (7, ('u1', 'u2')),
+    (5, 22, 15, 57, 1): (7, ('u1', 'u2')),
+    (3, 26, 0, 70, 1): (7, ('u1', 'u2')),
+    (3, 26, 3, 67, 1): (7, ('u1', 'u2')),
+    (3, 26, 6, 64, 1): (7, ('u1', 'u2')),
+    (3, 26, 9, 61, 1): (7, ('u1', 'u2')),
+    (4, 24, 0, 71, 1): (7, ('u1', 'u2')),
+    (4, 24, 3, 68, 1): (7, ('u1', 'u2')),
+    (4, 24, 6, 65, 1): (7, ('u1', 'u2')),
+    (4, 24, 9, 62, 1): (7, ('u1', 'u2')),
+    (3, 26, 12, 58, 1): (7, ('u1', 'u2')),
+    (4, 24, 12, 59, 1): (7, ('u1', 'u2')),
+    (4, 26, 0, 69, 1): (8, ('u1', 'u2')),
+    (4, 26, 3, 66, 1): (8, ('u1', 'u2')),
+    (4, 26, 6, 63, 1): (8, ('u1', 'u2')),
+    (4, 26, 9, 60, 1): (8, ('u1', 'u2')),
+    (4, 26, 12, 57, 1): (8, ('u1', 'u2')),
+    (5, 24, 0, 70, 1): (8, ('u1', 'u2')),
+    (6, 24, 0, 69, 1): (8, ('u1', 'u2')),
+    (5, 24, 3, 67, 1): (8, ('u1', 'u2')),
+    (5, 24, 6, 64, 1): (8, ('u1', 'u2')),
+    (6, 24, 3, 66, 1): (8, ('u1', 'u2')),
+    (6, 24, 6, 63, 1): (8, ('u1', 'u2')),
+    (5, 24, 9, 61, 1): (8, ('u1', 'u2')),
+    (5, 24, 12, 58, 1): (8, ('u1', 'u2')),
+    (6, 24, 9, 60, 1): (8, ('u1', 'u2')),
+    (6, 24, 12, 57, 1): (8, ('u1', 'u2')),
+    (3, 20, 21, 55, 1): (6, ('u1', 'u2')),
+    (3, 22, 18, 56, 1): (6, ('u1', 'u2')),
+    (3, 22, 21, 53, 1): (6, ('u1', 'u2')),
+    (3, 24, 18, 54, 1): (7, ('u1', 'u2')),
+    (4, 22, 18, 55, 1): (7, ('u1', 'u2')),
+    (4, 24, 15, 56, 1): (7, ('u1', 'u2')),
+    (4, 24, 18, 53, 1): (7, ('u1', 'u2')),
+    (3, 26, 15, 55, 1): (7, ('u1', 'u2')),
+    (3, 28, 0, 68, 1): (8, ('u1', 'u2')),
+    (3, 28, 3, 65, 1): (8, ('u1', 'u2')),
+    (3, 28, 6, 62, 1): (8, ('u1', 'u2')),
+    (3, 28, 9, 59, 1): (8, ('u1', 'u2')),
+    (3, 28, 12, 56, 1): (8, ('u1', 'u2')),
+    (3, 28, 15, 53, 1): (8, ('u1', 'u2')),
+    (5, 26, 0, 68, 1): (8, ('u1', 'u2')),
+    (5, 26, 3, 65, 1): (8, ('u1', 'u2')),
+    (5, 26, 6, 62, 1): (8, ('u1', 'u2')),
+    (5, 26, 9, 59, 1): (8, ('u1', 'u2')),
+    (4, 26, 15, 54, 1): (8, ('u1', 'u2')),
+    (5, 24, 15, 55, 1): (8, ('u1', 'u2')),
+    (5, 26, 12, 56, 1): (8, ('u1', 'u2')),
+    (5, 26, 15, 53, 1): (8, ('u1', 'u2')),
+    (3, 30, 0, 66, 1): (8, ('u1', 'u2')),
+    (3, 30, 3, 63, 1): (8, ('u1', 'u2')),
+    (3, 30, 6, 60, 1): (8, ('u1', 'u2')),
+    (3, 30, 9, 57, 1): (8, ('u1', 'u2')),
+    (4, 28, 0, 67, 1): (8, ('u1', 'u2')),
+    (4, 28, 3, 64, 1): (8, ('u1', 'u2')),
+    (4, 28, 6, 61, 1): (8, ('u1', 'u2')),
+    (4, 28, 9, 58, 1): (8, ('u1', 'u2')),
+    (3, 30, 12, 54, 1): (8, ('u1', 'u2')),
+    (4, 28, 12, 55, 1): (8, ('u1', 'u2')),
+    (4, 30, 0, 65, 1): (9, ('u1', 'u2')),
+    (4, 30, 3, 62, 1): (9, ('u1', 'u2')),
+    (4, 30, 6, 59, 1): (9, ('u1', 'u2')),
+    (4, 30, 9, 56, 1): (9, ('u1', 'u2')),
+    (4, 30, 12, 53, 1): (9, ('u1', 'u2')),
+    (5, 28, 0, 66, 1): (9, ('u1', 'u2')),
+    (6, 28, 0, 65, 1): (9, ('u1', 'u2')),
+    (5, 28, 3, 63, 1): (9, ('u1', 'u2')),
+    (5, 28, 6, 60, 1): (9, ('u1', 'u2')),
+    (6, 28, 3, 62, 1): (9, ('u1', 'u2')),
+    (6, 28, 6, 59, 1): (9, ('u1', 'u2')),
+    (5, 28, 9, 57, 1): (9, ('u1', 'u2')),
+    (5, 28, 12, 54, 1): (9, ('u1', 'u2')),
+    (6, 28, 9, 56, 1): (9, ('u1', 'u2')),
+    (6, 28, 12, 53, 1): (9, ('u1', 'u2')),
+    (3, 24, 21, 51, 1): (7, ('u1', 'u2')),
+    (3, 26, 18, 52, 1): (7, ('u1', 'u2')),
+    (3, 26, 21, 49, 1): (7, ('u1', 'u2')),
+    (3, 28, 18, 50, 1): (8, ('u1', 'u2')),
+    (4, 26, 18, 51, 1): (8, ('u1', 'u2')),
+    (4, 28, 15, 52, 1): (8, ('u1', 'u2')),
+    (4, 28, 18, 49, 1): (8, ('u1', 'u2')),
+    (3, 30, 15, 51, 1): (8, ('u1', 'u2')),
+    (3, 32, 0, 64, 1): (9, ('u1', 'u2')),
+    (3, 32, 3, 61, 1): (9, ('u1', 'u2')),
+    (3, 32, 6, 58, 1): (9, ('u1', 'u2')),
+    (3, 32, 9, 55, 1): (9, ('u1', 'u2')),
+    (3, 32, 12, 52, 1): (9, ('u1', 'u2')),
+    (3, 32, 15, 49, 1): (9, ('u1', 'u2')),
+    (5, 30, 0, 64, 1): (9, ('u1', 'u2')),
+    (5, 30, 3, 61, 1): (9, ('u1', 'u2')),
+    (5, 30, 6, 58, 1): (9, ('u1', 'u2')),
+    (5, 30, 9, 55, 1): (9, ('u1', 'u2')),
+    (4, 30, 15, 50, 1): (9, ('u1', 'u2')),
+    (5, 28, 15, 51, 1): (9, ('u1', 'u2')),
+    (5, 30, 12, 52, 1): (9, ('u1', 'u2')),
+    (5, 30, 15, 49, 1): (9, ('u1', 'u2')),
+    (3, 34, 0, 62, 1): (9, ('u1', 'u2')),
+    (3, 34, 3, 59, 1): (9, ('u1', 'u2')),
+    (3, 34, 6, 56, 1): (9, ('u1', 'u2')),
+    (3, 34, 9, 53, 1): (9, ('u1', 'u2')),
+    (4, 32, 0, 63, 1): (9, ('u1', 'u2')),
+    (4, 32, 3, 60, 1): (9, ('u1', 'u2')),
+    (4, 32, 6, 57, 1): (9, ('u1', 'u2')),
+    (4, 32, 9, 54, 1): (9, ('u1', 'u2')),
+    (3, 34, 12, 50, 1): (9, ('u1', 'u2')),
+    (4, 32, 12, 51, 1): (9, ('u1', 'u2')),
+    (4, 34, 0, 61, 1): (10, ('u1', 'u2')),
+    (4, 34, 3, 58, 1): (10, ('u1', 'u2')),
+    (4, 34, 6, 55, 1): (10, ('u1', 'u2')),
+    (4, 34, 9, 52, 1): (10, ('u1', 'u2')),
+    (4, 34, 12, 49, 1): (10, ('u1', 'u2')),
+    (5, 32, 0, 62, 1): (10, ('u1', 'u2')),
+    (6, 30, 0, 63, 1): (10, ('u1', 'u2')),
+    (6, 32, 0, 61, 1): (10, ('u1', 'u2')),
+    (5, 32, 3, 59, 1): (10, ('u1', 'u2')),
+    (6, 30, 3, 60, 1): (10, ('u1', 'u2')),
+    (5, 32, 6, 56, 1): (10, ('u1', 'u2')),
+    (6, 30, 6, 57, 1): (10, ('u1', 'u2')),
+    (6, 32, 3, 58, 1): (10, ('u1', 'u2')),
+    (6, 32, 6, 55, 1): (10, ('u1', 'u2')),
+    (5, 32, 9, 53, 1): (10, ('u1', 'u2')),
+    (6, 30, 9, 54, 1): (10, ('u1', 'u2')),
+    (5, 32, 12, 50, 1): (10, ('u1', 'u2')),
+    (6, 30, 12, 51, 1): (10, ('u1', 'u2')),
+    (6, 32, 9, 52, 1): (10, ('u1', 'u2')),
+    (6, 32, 12, 49, 1): (10, ('u1', 'u2')),
+    (3, 28, 21, 47, 1): (8, ('u1', 'u2')),
+    (3, 30, 18, 48, 1): (8, ('u1', 'u2')),
+    (3, 30, 21, 45, 1): (8, ('u1', 'u2')),
+    (3, 32, 18, 46, 1): (9, ('u1', 'u2')),
+    (4, 30, 18, 47, 1): (9, ('u1', 'u2')),
+    (4, 32, 15, 48, 1): (9, ('u1', 'u2')),
+    (4, 32, 18, 45, 1): (9, ('u1', 'u2')),
+    (3, 34, 15, 47, 1): (9, ('u1', 'u2')),
+    (3, 36, 0, 60, 1): (10, ('u1', 'u2')),
+    (3, 36, 3, 57, 1): (10, ('u1', 'u2')),
+    (3, 36, 6, 54, 1): (10, ('u1', 'u2')),
+    (3, 36, 9, 51, 1): (10, ('u1', 'u2')),
+    (3, 36, 12, 48, 1): (10, ('u1', 'u2')),
+    (3, 36, 15, 45, 1): (10, ('u1', 'u2')),
+    (5, 34, 0, 60, 1): (10, ('u1', 'u2')),
+    (5, 34, 3, 57, 1): (10, ('u1', 'u2')),
+    (5, 34, 6, 54, 1): (10, ('u1', 'u2')),
+    (5, 34, 9, 51, 1): (10, ('u1', 'u2')),
+    (4, 34, 15, 46, 1): (10, ('u1', 'u2')),
+    (5, 32, 15, 47, 1): (10, ('u1', 'u2')),
+    (5, 34, 12, 48, 1): (10, ('u1', 'u2')),
+    (5, 34, 15, 45, 1): (10, ('u1', 'u2')),
+    (3, 38, 0, 58, 1): (10, ('u1', 'u2')),
+    (3, 38, 3, 55, 1): (10, ('u1', 'u2')),
+    (3, 38, 6, 52, 1): (10, ('u1', 'u2')),
+    (3, 38, 9, 49, 1): (10, ('u1', 'u2')),
+    (4, 36, 0, 59, 1): (10, ('u1', 'u2')),
+    (4, 36, 3, 56, 1): (10, ('u1', 'u2')),
+    (4, 36, 6, 53, 1): (10, ('u1', 'u2')),
+    (4, 36, 9, 50, 1): (10, ('u1', 'u2')),
+    (3, 38, 12, 46, 1): (10, ('u1', 'u2')),
+    (4, 36, 12, 47, 1): (10, ('u1', 'u2')),
+    (4, 38, 0, 57, 1): (11, ('u1', 'u2')),
+    (4, 38, 3, 54, 1): (11, ('u1', 'u2')),
+    (4, 38, 6, 51, 1): (11, ('u1', 'u2')),
+    (4, 38, 9, 48, 1): (11, ('u1', 'u2')),
+    (4, 38, 12, 45, 1): (11, ('u1', 'u2')),
+    (5, 36, 0, 58, 1): (11, ('u1', 'u2')),
+    (6, 34, 0, 59, 1): (11, ('u1', 'u2')),
+    (6, 36, 0, 57, 1): (11, ('u1', 'u2')),
+    (5, 36, 3, 55, 1): (11, ('u1', 'u2')),
+    (6, 34, 3, 56, 1): (11, ('u1', 'u2')),
+    (5, 36, 6, 52, 1): (11, ('u1', 'u2')),
+    (6, 34, 6, 53, 1): (11, ('u1', 'u2')),
+    (6, 36, 3, 54, 1): (11, ('u1', 'u2')),
+    (6, 36, 6, 51, 1): (11, ('u1', 'u2')),
+    (5, 36, 9, 49, 1): (11, ('u1', 'u2')),
+    (6, 34, 9, 50, 1): (11, ('u1', 'u2')),
+    (5, 36, 12, 46, 1): (11, ('u1', 'u2')),
+    (6, 34, 12, 47, 1): (11, ('u1', 'u2')),
+    (6, 36, 9, 48, 1): (11, ('u1', 'u2')),
+    (6, 36, 12, 45, 1): (11, ('u1', 'u2')),
+    (3, 32, 21, 43, 1): (9, ('u1', 'u2')),
+    (3, 34, 18, 44, 1): (9, ('u1', 'u2')),
+    (3, 34, 21, 41, 1): (9, ('u1', 'u2')),
+    (3, 36, 18, 42, 1): (10, ('u1', 'u2')),
+    (4, 34, 18, 43, 1): (10, ('u1', 'u2')),
+    (4, 36, 15, 44, 1): (10, ('u1', 'u2')),
+    (4, 36, 18, 41, 1): (10, ('u1', 'u2')),
+    (3, 38, 15, 43, 1): (10, ('u1', 'u2')),
+    (3, 40, 0, 56, 1): (11, ('u1', 'u2')),
+    (3, 40, 3, 53, 1): (11, ('u1', 'u2')),
+    (3, 40, 6, 50, 1): (11, ('u1', 'u2')),
+    (3, 40, 9, 47, 1): (11, ('u1', 'u2')),
+    (3, 40, 12, 44, 1): (11, ('u1', 'u2')),
+    (3, 40, 15, 41, 1): (11, ('u1', 'u2')),
+    (5, 38, 0, 56, 1): (11, ('u1', 'u2')),
+    (5, 38, 3, 53, 1): (11, ('u1', 'u2')),
+    (5, 38, 6, 50, 1): (11, ('u1', 'u2')),
+    (5, 38, 9, 47, 1): (11, ('u1', 'u2')),
+    (4, 38, 15, 42, 1): (11, ('u1', 'u2')),
+    (5, 36, 15, 43, 1): (11, ('u1', 'u2')),
+    (5, 38, 12, 44, 1): (11, ('u1', 'u2')),
+    (5, 38, 15, 41, 1): (11, ('u1', 'u2')),
+    (3, 42, 0, 54, 1): (11, ('u1', 'u2')),
+    (3, 42, 3, 51, 1): (11, ('u1', 'u2')),
+    (3, 42, 6, 48, 1): (11, ('u1', 'u2')),
+    (3, 42, 9, 45, 1): (11, ('u1', 'u2')),
+    (4, 40, 0, 55, 1): (11, ('u1', 'u2')),
+    (4, 40, 3, 52, 1): (11, ('u1', 'u2')),
+    (4, 40, 6, 49, 1): (11, ('u1', 'u2')),
+    (4, 40, 9, 46, 1): (11, ('u1', 'u2')),
+    (3, 42, 12, 42, 1): (11, ('u1', 'u2')),
+    (4, 40, 12, 43, 1): (11, ('u1', 'u2')),
+    (4, 42, 0, 53, 1): (12, ('u1', 'u2')),
+    (4, 42, 3, 50, 1): (12, ('u1', 'u2')),
+    (4, 42, 6, 47, 1): (12, ('u1', 'u2')),
+    (4, 42, 9, 44, 1): (12, ('u1', 'u2')),
+    (4, 42, 12, 41, 1): (12, ('u1', 'u2')),
+    (5, 40, 0, 54, 1): (12, ('u1', 'u2')),
+    (6, 38, 0, 55, 1): (12, ('u1', 'u2')),
+    (6, 40, 0, 53, 1): (12, ('u1', 'u2')),
+    (5, 40, 3, 51, 1): (12, ('u1', 'u2')),
+    (6, 38, 3, 52, 1): (12, ('u1', 'u2')),
+    (5, 40, 6, 48, 1): (12, ('u1', 'u2')),
+    (6, 38, 6, 49, 1): (12, ('u1', 'u2')),
+    (6, 40, 3, 50, 1): (12, ('u1', 'u2')),
+    (6, 40, 6, 47, 1): (12, ('u1', 'u2')),
+    (5, 40, 9, 45, 1): (12, ('u1', 'u2')),
+    (6, 38, 9, 46, 1): (12, ('u1', 'u2')),
+    (5, 40, 12, 42, 1): (12, ('u1', 'u2')),
+    (6, 38, 12, 43, 1): (12, ('u1', 'u2')),
+    (6, 40, 9, 44, 1): (12, ('u1', 'u2')),
+    (6, 40, 12, 41, 1): (12, ('u1', 'u2')),
+    (3, 44, 0, 52, 1): (12, ('u1', 'u2')),
+    (3, 44, 3, 49, 1): (12, ('u1', 'u2')),
+    (3, 46, 0, 50, 1): (12, ('u1', 'u2')),
+    (3, 46, 3, 47, 1): (12, ('u1', 'u2')),
+    (3, 44, 6, 46, 1): (12, ('u1', 'u2')),
+    (3, 44, 9, 43, 1): (12, ('u1', 'u2')),
+    (3, 46, 6, 44, 1): (12, ('u1', 'u2')),
+    (3, 46, 9, 41, 1): (12, ('u1', 'u2')),
+    (4, 44, 0, 51, 1): (12, ('u1', 'u2')),
+    (4, 44, 3, 48, 1): (12, ('u1', 'u2')),
+    (4, 44, 6, 45, 1): (12, ('u1', 'u2')),
+    (5, 42, 0, 52, 1): (12, ('u1', 'u2')),
+    (5, 42, 3, 49, 1): (12, ('u1', 'u2')),
+    (5, 42, 6, 46, 1): (12, ('u1', 'u2')),
+    (4, 44, 9, 42, 1): (12, ('u1', 'u2')),
+    (5, 42, 9, 43, 1): (12, ('u1', 'u2')),
+    (5, 44, 0, 50, 1): (13, ('u1', 'u2')),
+    (5, 44, 3, 47, 1): (13, ('u1', 'u2')),
+    (5, 44, 6, 44, 1): (13, ('u1', 'u2')),
+    (5, 44, 9, 41, 1): (13, ('u1', 'u2')),
+    (6, 42, 0, 51, 1): (13, ('u1', 'u2')),
+    (6, 42, 3, 48, 1): (13, ('u1', 'u2')),
+    (7, 42, 0, 50, 1): (13, ('u1', 'u2')),
+    (7, 42, 3, 47, 1): (13, ('u1', 'u2')),
+    (6, 42, 6, 45, 1): (13, ('u1', 'u2')),
+    (6, 42, 9, 42, 1): (13, ('u1', 'u2')),
+    (7, 42, 6, 44, 1): (13, ('u1', 'u2')),
+    (7, 42, 9, 41, 1): (13, ('u1', 'u2')),
+    (3, 36, 21, 39, 1): (10, ('u1', 'u2')),
+    (3, 38, 18, 40, 1): (10, ('u1', 'u2')),
+    (3, 38, 21, 37, 1): (10, ('u1', 'u2')),
+    (3, 40, 18, 38, 1): (11, ('u1', 'u2')),
+    (4, 38, 18, 39, 1): (11, ('u1', 'u2')),
+    (4, 40, 15, 40, 1): (11, ('u1', 'u2')),
+    (4, 40, 18, 37, 1): (11, ('u1', 'u2')),
+    (3, 42, 15, 39, 1): (11, ('u1', 'u2')),
+    (3, 44, 12, 40, 1): (12, ('u1', 'u2')),
+    (3, 44, 15, 37, 1): (12, ('u1', 'u2')),
+    (4, 42, 15, 38, 1): (12, ('u1', 'u2')),
+    (5, 40, 15, 39, 1): (12, ('u1', 'u2')),
+    (5, 42, 12, 40, 1): (12, ('u1', 'u2')),
+    (5, 42, 15, 37, 1): (12, ('u1', 'u2')),
+    (3, 46, 12, 38, 1): (12, ('u1', 'u2')),
+    (4, 44, 12, 39, 1): (12, ('u1', 'u2')),
+    (4, 46, 0, 49, 1): (13, ('u1', 'u2')),
+    (4, 46, 3, 46, 1): (13, ('u1', 'u2')),
+    (4, 46, 6, 43, 1): (13, ('u1', 'u2')),
+    (4, 46, 9, 40, 1): (13, ('u1', 'u2')),
+    (4, 46, 12, 37, 1): (13, ('u1', 'u2')),
+    (6, 44, 0, 49, 1): (13, ('u1', 'u2')),
+    (6, 44, 3, 46, 1): (13, ('u1', 'u2')),
+    (6, 44, 6, 43, 1): (13, ('u1', 'u2')),
+    (5, 44, 12, 38, 1): (13, ('u1', 'u2')),
+    (6, 42, 12, 39, 1): (13, ('u1', 'u2')),
+    (6, 44, 9, 40, 1): (13, ('u1', 'u2')),
+    (6, 44, 12, 37, 1): (13, ('u1', 'u2')),
+    (3, 48, 0, 48, 1): (13, ('u1', 'u2')),
+    (3, 48, 3, 45, 1): (13, ('u1', 'u2')),
+    (3, 50, 0, 46, 1): (13, ('u1', 'u2')),
+    (3, 50, 3, 43, 1): (13, ('u1', 'u2')),
+    (3, 48, 6, 42, 1): (13, ('u1', 'u2')),
+    (3, 48, 9, 39, 1): (13, ('u1', 'u2')),
+    (3, 50, 6, 40, 1): (13, ('u1', 'u2')),
+    (3, 50, 9, 37, 1): (13, ('u1', 'u2')),
+    (4, 48, 0, 47, 1): (13, ('u1', 'u2')),
+    (4, 48, 3, 44, 1): (13, ('u1', 'u2')),
+    (4, 48, 6, 41, 1): (13, ('u1', 'u2')),
+    (5, 46, 0, 48, 1): (13, ('u1', 'u2')),
+    (5, 46, 3, 45, 1): (13, ('u1', 'u2')),
+    (5, 46, 6, 42, 1): (13, ('u1', 'u2')),
+    (4, 48, 9, 38, 1): (13, ('u1', 'u2')),
+    (5, 46, 9, 39, 1): (13, ('u1', 'u2')),
+    (5, 48, 0, 46, 1): (14, ('u1', 'u2')),
+    (5, 48, 3, 43, 1): (14, ('u1', 'u2')),
+    (5, 48, 6, 40, 1): (14, ('u1', 'u2')),
+    (5, 48, 9, 37, 1): (14, ('u1', 'u2')),
+    (6, 46, 0, 47, 1): (14, ('u1', 'u2')),
+    (6, 46, 3, 44, 1): (14, ('u1', 'u2')),
+    (7, 46, 0, 46, 1): (14, ('u1', 'u2')),
+    (7, 46, 3, 43, 1): (14, ('u1', 'u2')),
+    (6, 46, 6, 41, 1): (14, ('u1', 'u2')),
+    (6, 46, 9, 38, 1): (14, ('u1', 'u2')),
+    (7, 46, 6, 40, 1): (14, ('u1', 'u2')),
+    (7, 46, 9, 37, 1): (14, ('u1', 'u2')),
+    (3, 40, 21, 35, 1): (11, ('u1', 'u2')),
+    (3, 42, 18, 36, 1): (11, ('u1', 'u2')),
+    (3, 42, 21, 33, 1): (11, ('u1', 'u2')),
+    (3, 44, 18, 34, 1): (12, ('u1', 'u2')),
+    (4, 42, 18, 35, 1): (12, ('u1', 'u2')),
+    (4, 44, 15, 36, 1): (12, ('u1', 'u2')),
+    (4, 44, 18, 33, 1): (12, ('u1', 'u2')),
+    (3, 46, 15, 35, 1): (12, ('u1', 'u2')),
+    (3, 48, 12, 36, 1): (13, ('u1', 'u2')),
+    (3, 48, 15, 33, 1): (13, ('u1', 'u2')),
+    (4, 46, 15, 34, 1): (13, ('u1', 'u2')),
+    (5, 44, 15, 35, 1): (13, ('u1', 'u2')),
+    (5, 46, 12, 36, 1): (13, ('u1', 'u2')),
+    (5, 46, 15, 33, 1): (13, ('u1', 'u2')),
+    (3, 50, 12, 34, 1): (13, ('u1', 'u2')),
+    (4, 48, 12, 35, 1): (13, ('u1', 'u2')),
+    (4, 50, 0, 45, 1): (14, ('u1', 'u2')),
+    (4, 50, 3, 42, 1): (14, ('u1', 'u2')),
+    (4, 50, 6, 39, 1): (14, ('u1', 'u2')),
+    (4, 50, 9, 36, 1): (14, ('u1', 'u2')),
+    (4, 50, 12, 33, 1): (14, ('u1', 'u2')),
+    (6, 48, 0, 45, 1): (14, ('u1', 'u2')),
+    (6, 48, 3, 42, 1): (14, ('u1', 'u2')),
+    (6, 48, 6, 39, 1): (14, ('u1', 'u2')),
+    (5, 48, 12, 34, 1): (14, ('u1', 'u2')),
+    (6, 46, 12, 35, 1): (14, ('u1', 'u2')),
+    (6, 48, 9, 36, 1): (14, ('u1', 'u2')),
+    (6, 48, 12, 33, 1): (14, ('u1', 'u2')),
+    (3, 52, 0, 44, 1): (14, ('u1', 'u2')),
+    (3, 52, 3, 41, 1): (14, ('u1', 'u2')),
+    (3, 54, 0, 42, 1): (14, ('u1', 'u2')),
+    (3, 54, 3, 39, 1): (14, ('u1', 'u2')),
+    (3, 52, 6, 38, 1): (14, ('u1', 'u2')),
+    (3, 52, 9, 35, 1): (14, ('u1', 'u2')),
+    (3, 54, 6, 36, 1): (14, ('u1', 'u2')),
+    (3, 54, 9, 33, 1): (14, ('u1', 'u2')),
+    (4, 52, 0, 43, 1): (14, ('u1', 'u2')),
+    (4, 52, 3, 40, 1): (14, ('u1', 'u2')),
+    (4, 52, 6, 37, 1): (14, ('u1', 'u2')),
+    (5, 50, 0, 44, 1): (14, ('u1', 'u2')),
+    (5, 50, 3, 41, 1): (14, ('u1', 'u2')),
+    (5, 50, 6, 38, 1): (14, ('u1', 'u2')),
+    (4, 52, 9, 34, 1): (14, ('u1', 'u2')),
+    (5, 50, 9, 35, 1): (14, ('u1', 'u2')),
+    (5, 52, 0, 42, 1): (15, ('u1', 'u2')),
+    (5, 52, 3, 39, 1): (15, ('u1', 'u2')),
+    (5, 52, 6, 36, 1): (15, ('u1', 'u2')),
+    (5, 52, 9, 33, 1): (15, ('u1', 'u2')),
+    (6, 50, 0, 43, 1): (15, ('u1', 'u2')),
+    (6, 50, 3, 40, 1): (15, ('u1', 'u2')),
+    (7, 50, 0, 42, 1): (15, ('u1', 'u2')),
+    (7, 50, 3, 39, 1): (15, ('u1', 'u2')),
+    (6, 50, 6, 37, 1): (15, ('u1', 'u2')),
+    (6, 50, 9, 34, 1): (15, ('u1', 'u2')),
+    (7, 50, 6, 36, 1): (15, ('u1', 'u2')),
+    (7, 50, 9, 33, 1): (15, ('u1', 'u2')),
+    (3, 44, 21, 31, 1): (12, ('u1', 'u2')),
+    (3, 46, 18, 32, 1): (12, ('u1', 'u2')),
+    (3, 46, 21, 29, 1): (12, ('u1', 'u2')),
+    (3, 48, 18, 30, 1): (13, ('u1', 'u2')),
+    (4, 46, 18, 31, 1): (13, ('u1', 'u2')),
+    (4, 48, 15, 32, 1): (13, ('u1', 'u2')),
+    (4, 48, 18, 29, 1): (13, ('u1', 'u2')),
+    (3, 50, 15, 31, 1): (13, ('u1', 'u2')),
+    (3, 52, 12, 32, 1): (14, ('u1', 'u2')),
+    (3, 52, 15, 29, 1): (14, ('u1', 'u2')),
+    (4, 50, 15, 30, 1): (14, ('u1', 'u2')),
+    (5, 48, 15, 31, 1): (14, ('u1', 'u2')),
+    (5, 50, 12, 32, 1): (14, ('u1', 'u2')),
+    (5, 50, 15, 29, 1): (14, ('u1', 'u2')),
+    (3, 54, 12, 30, 1): (14, ('u1', 'u2')),
+    (4, 52, 12, 31, 1): (14, ('u1', 'u2')),
+    (4, 54, 0, 41, 1): (15, ('u1', 'u2')),
+    (4, 54, 3, 38, 1): (15, ('u1', 'u2')),
+    (4, 54, 6, 35, 1): (15, ('u1', 'u2')),
+    (4, 54, 9, 32, 1): (15, ('u1', 'u2')),
+    (4, 54, 12, 29, 1): (15, ('u1', 'u2')),
+    (6, 52, 0, 41, 1): (15, ('u1', 'u2')),
+    (6, 52, 3, 38, 1): (15, ('u1', 'u2')),
+    (6, 52, 6, 35, 1): (15, ('u1', 'u2')),
+    (5, 52, 12, 30, 1): (15, ('u1', 'u2')),
+    (6, 50, 12, 31, 1): (15, ('u1', 'u2')),
+    (6, 52, 9, 32, 1): (15, ('u1', 'u2')),
+    (6, 52, 12, 29, 1): (15, ('u1', 'u2')),
+    (3, 56, 0, 40, 1): (15, ('u1', 'u2')),
+    (3, 56, 3, 37, 1): (15, ('u1', 'u2')),
+    (3, 58, 0, 38, 1): (15, ('u1', 'u2')),
+    (3, 58, 3, 35, 1): (15, ('u1', 'u2')),
+    (3, 56, 6, 34, 1): (15, ('u1', 'u2')),
+    (3, 56, 9, 31, 1): (15, ('u1', 'u2')),
+    (3, 58, 6, 32, 1): (15, ('u1', 'u2')),
+    (3, 58, 9, 29, 1): (15, ('u1', 'u2')),
+    (4, 56, 0, 39, 1): (15, ('u1', 'u2')),
+    (4, 56, 3, 36, 1): (15, ('u1', 'u2')),
+    (4, 56, 6, 33, 1): (15, ('u1', 'u2')),
+    (5, 54, 0, 40, 1): (15, ('u1', 'u2')),
+    (5, 54, 3, 37, 1): (15, ('u1', 'u2')),
+    (5, 54, 6, 34, 1): (15, ('u1', 'u2')),
+    (4, 56, 9, 30, 1): (15, ('u1', 'u2')),
+    (5, 54, 9, 31, 1): (15, ('u1', 'u2')),
+    (5, 56, 0, 38, 1): (16, ('u1', 'u2')),
+    (5, 56, 3, 35, 1): (16, ('u1', 'u2')),
+    (5, 56, 6, 32, 1): (16, ('u1', 'u2')),
+    (5, 56, 9, 29, 1): (16, ('u1', 'u2')),
+    (6, 54, 0, 39, 1): (16, ('u1', 'u2')),
+    (7, 52, 0, 40, 1): (16, ('u1', 'u2')),
+    (6, 54, 3, 36, 1): (16, ('u1', 'u2')),
+    (7, 52, 3, 37, 1): (16, ('u1', 'u2')),
+    (7, 54, 0, 38, 1): (16, ('u1', 'u2')),
+    (7, 54, 3, 35, 1): (16, ('u1', 'u2')),
+    (6, 54, 6, 33, 1): (16, ('u1', 'u2')),
+    (7, 52, 6, 34, 1): (16, ('u1', 'u2')),
+    (6, 54, 9, 30, 1): (16, ('u1', 'u2')),
+    (7, 52, 9, 31, 1): (16, ('u1', 'u2')),
+    (7, 54, 6, 32, 1): (16, ('u1', 'u2')),
+    (7, 54, 9, 29, 1): (16, ('u1', 'u2')),
+    (3, 60, 0, 36, 1): (16, ('u1', 'u2')),
+    (4, 58, 0, 37, 1): (16, ('u1', 'u2')),
+    (4, 60, 0, 35, 1): (16, ('u1', 'u2')),
+    (3, 60, 3, 33, 1): (16, ('u1', 'u2')),
+    (4, 58, 3, 34, 1): (16, ('u1', 'u2')),
+    (3, 60, 6, 30, 1): (16, ('u1', 'u2')),
+    (4, 58, 6, 31, 1): (16, ('u1', 'u2')),
+    (4, 60, 3, 32, 1): (16, ('u1', 'u2')),
+    (4, 60, 6, 29, 1): (16, ('u1', 'u2')),
+    (5, 58, 0, 36, 1): (16, ('u1', 'u2')),
+    (5, 58, 3, 33, 1): (16, ('u1', 'u2')),
+    (6, 56, 0, 37, 1): (16, ('u1', 'u2')),
+    (6, 56, 3, 34, 1): (16, ('u1', 'u2')),
+    (5, 58, 6, 30, 1): (16, ('u1', 'u2')),
+    (6, 56, 6, 31, 1): (16, ('u1', 'u2')),
+    (6, 58, 0, 35, 1): (17, ('u1', 'u2')),
+    (6, 58, 3, 32, 1): (17, ('u1', 'u2')),
+    (6, 58, 6, 29, 1): (17, ('u1', 'u2')),
+    (7, 56, 0, 36, 1): (17, ('u1', 'u2')),
+    (8, 56, 0, 35, 1): (17, ('u1', 'u2')),
+    (7, 56, 3, 33, 1): (17, ('u1', 'u2')),
+    (7, 56, 6, 30, 1): (17, ('u1', 'u2')),
+    (8, 56, 3, 32, 1): (17, ('u1', 'u2')),
+    (8, 56, 6, 29, 1): (17, ('u1', 'u2')),
+    (3, 48, 21, 27, 1): (13, ('u1', 'u2')),
+    (3, 50, 18, 28, 1): (13, ('u1', 'u2')),
+    (3, 50, 21, 25, 1): (13, ('u1', 'u2')),
+    (3, 52, 18, 26, 1): (14, ('u1', 'u2')),
+    (4, 50, 18, 27, 1): (14, ('u1', 'u2')),
+    (4, 52, 15, 28, 1): (14, ('u1', 'u2')),
+    (4, 52, 18, 25, 1): (14, ('u1', 'u2')),
+    (3, 54, 15, 27, 1): (14, ('u1', 'u2')),
+    (3, 56, 12, 28, 1): (15, ('u1', 'u2')),
+    (3, 56, 15, 25, 1): (15, ('u1', 'u2')),
+    (4, 54, 15, 26, 1): (15, ('u1', 'u2')),
+    (5, 52, 15, 27, 1): (15, ('u1', 'u2')),
+    (5, 54, 12, 28, 1): (15, ('u1', 'u2')),
+    (5, 54, 15, 25, 1): (15, ('u1', 'u2')),
+    (3, 58, 12, 26, 1): (15, ('u1', 'u2')),
+    (4, 56, 12, 27, 1): (15, ('u1', 'u2')),
+    (4, 58, 9, 28, 1): (16, ('u1', 'u2')),
+    (4, 58, 12, 25, 1): (16, ('u1', 'u2')),
+    (5, 56, 12, 26, 1): (16, ('u1', 'u2')),
+    (6, 54, 12, 27, 1): (16, ('u1', 'u2')),
+    (6, 56, 9, 28, 1): (16, ('u1', 'u2')),
+    (6, 56, 12, 25, 1): (16, ('u1', 'u2')),
+    (3, 62, 0, 34, 1): (16, ('u1', 'u2')),
+    (3, 62, 3, 31, 1): (16, ('u1', 'u2')),
+    (3, 60, 9, 27, 1): (16, ('u1', 'u2')),
+    (3, 62, 6, 28, 1): (16, ('u1', 'u2')),
+    (3, 62, 9, 25, 1): (16, ('u1', 'u2')),
+    (4, 60, 9, 26, 1): (16, ('u1', 'u2')),
+    (5, 58, 9, 27, 1): (16, ('u1', 'u2')),
+    (5, 60, 0, 34, 1): (17, ('u1', 'u2')),
+    (5, 60, 3, 31, 1): (17, ('u1', 'u2')),
+    (5, 60, 6, 28, 1): (17, ('u1', 'u2')),
+    (5, 60, 9, 25, 1): (17, ('u1', 'u2')),
+    (7, 58, 0, 34, 1): (17, ('u1', 'u2')),
+    (7, 58, 3, 31, 1): (17, ('u1', 'u2')),
+    (6, 58, 9, 26, 1): (17, ('u1', 'u2')),
+    (7, 56, 9, 27, 1): (17, ('u1', 'u2')),
+    (7, 58, 6, 28, 1): (17, ('u1', 'u2')),
+    (7, 58, 9, 25, 1): (17, ('u1', 'u2')),
+    (3, 64, 0, 32, 1): (17, ('u1', 'u2')),
+    (4, 62, 0, 33, 1): (17, ('u1', 'u2')),
+    (4, 64, 0, 31, 1): (17, ('u1', 'u2')),
+    (3, 64, 3, 29, 1): (17, ('u1', 'u2')),
+    (4, 62, 3, 30, 1): (17, ('u1', 'u2')),
+    (3, 64, 6, 26, 1): (17, ('u1', 'u2')),
+    (4, 62, 6, 27, 1): (17, ('u1', 'u2')),
+    (4, 64, 3, 28, 1): (17, ('u1', 'u2')),
+    (4, 64, 6, 25, 1): (17, ('u1', 'u2')),
+    (5, 62, 0, 32, 1): (17, ('u1', 'u2')),
+    (5, 62, 3, 29, 1): (17, ('u1', 'u2')),
+    (6, 60, 0, 33, 1): (17, ('u1', 'u2')),
+    (6, 60, 3, 30, 1): (17, ('u1', 'u2')),
+    (5, 62, 6, 26, 1): (17, ('u1', 'u2')),
+    (6, 60, 6, 27, 1): (17, ('u1', 'u2')),
+    (6, 62, 0, 31, 1): (18, ('u1', 'u2')),
+    (6, 62, 3, 28, 1): (18, ('u1', 'u2')),
+    (6, 62, 6, 25, 1): (18, ('u1', 'u2')),
+    (7, 60, 0, 32, 1): (18, ('u1', 'u2')),
+    (8, 60, 0, 31, 1): (18, ('u1', 'u2')),
+    (7, 60, 3, 29, 1): (18, ('u1', 'u2')),
+    (7, 60, 6, 26, 1): (18, ('u1', 'u2')),
+    (8, 60, 3, 28, 1): (18, ('u1', 'u2')),
+    (8, 60, 6, 25, 1): (18, ('u1', 'u2')),
+    (3, 52, 21, 23, 1): (14, ('u1', 'u2')),
+    (3, 54, 18, 24, 1): (14, ('u1', 'u2')),
+    (3, 54, 21, 21, 1): (14, ('u1', 'u2')),
+    (3, 56, 18, 22, 1): (15, ('u1', 'u2')),
+    (4, 54, 18, 23, 1): (15, ('u1', 'u2')),
+    (4, 56, 15, 24, 1): (15, ('u1', 'u2')),
+    (4, 56, 18, 21, 1): (15, ('u1', 'u2')),
+    (3, 58, 15, 23, 1): (15, ('u1', 'u2')),
+    (3, 60, 12, 24, 1): (16, ('u1', 'u2')),
+    (3, 60, 15, 21, 1): (16, ('u1', 'u2')),
+    (4, 58, 15, 22, 1): (16, ('u1', 'u2')),
+    (5, 56, 15, 23, 1): (16, ('u1', 'u2')),
+    (5, 58, 12, 24, 1): (16, ('u1', 'u2')),
+    (5, 58, 15, 21, 1): (16, ('u1', 'u2')),
+    (3, 62, 12, 22, 1): (16, ('u1', 'u2')),
+    (4, 60, 12, 23, 1): (16, ('u1', 'u2')),
+    (4, 62, 9, 24, 1): (17, ('u1', 'u2')),
+    (4, 62, 12, 21, 1): (17, ('u1', 'u2')),
+    (5, 60, 12, 22, 1): (17, ('u1', 'u2')),
+    (6, 58, 12, 23, 1): (17, ('u1', 'u2')),
+    (6, 60, 9, 24, 1): (17, ('u1', 'u2')),
+    (6, 60, 12, 21, 1): (17, ('u1', 'u2')),
+    (3, 66, 0, 30, 1): (17, ('u1', 'u2')),
+    (3, 66, 3, 27, 1): (17, ('u1', 'u2')),
+    (3, 64, 9, 23, 1): (17, ('u1', 'u2')),
+    (3, 66, 6, 24, 1): (17, ('u1', 'u2')),
+    (3, 66, 9, 21, 1): (17, ('u1', 'u2')),
+    (4, 64, 9, 22, 1): (17, ('u1', 'u2')),
+    (5, 62, 9, 23, 1): (17, ('u1', 'u2')),
+    (5, 64, 0, 30, 1): (18, ('u1', 'u2')),
+    (5, 64, 3, 27, 1): (18, ('u1', 'u2')),
+    (5, 64, 6, 24, 1): (18, ('u1', 'u2')),
+    (5, 64, 9, 21, 1): (18, ('u1', 'u2')),
+    (7, 62, 0, 30, 1): (18, ('u1', 'u2')),
+    (7, 62, 3, 27, 1): (18, ('u1', 'u2')),
+    (6, 62, 9, 22, 1): (18, ('u1', 'u2')),
+    (7, 60, 9, 23, 1): (18, ('u1', 'u2')),
+    (7, 62, 6, 24, 1): (18, ('u1', 'u2')),
+    (7, 62, 9, 21, 1): (18, ('u1', 'u2')),
+    (3, 68, 0, 28, 1): (18, ('u1', 'u2')),
+    (4, 66, 0, 29, 1): (18, ('u1', 'u2')),
+    (4, 68, 0, 27, 1): (18, ('u1', 'u2')),
+    (3, 68, 3, 25, 1): (18, ('u1', 'u2')),
+    (4, 66, 3, 26, 1): (18, ('u1', 'u2')),
+    (3, 68, 6, 22, 1): (18, ('u1', 'u2')),
+    (4, 66, 6, 23, 1): (18, ('u1', 'u2')),
+    (4, 68, 3, 24, 1): (18, ('u1', 'u2')),
+    (4, 68, 6, 21, 1): (18, ('u1', 'u2')),
+    (5, 66, 0, 28, 1): (18, ('u1', 'u2')),
+    (5, 66, 3, 25, 1): (18, ('u1', 'u2')),
+    (6, 64, 0, 29, 1): (18, ('u1', 'u2')),
+    (6, 64, 3, 26, 1): (18, ('u1', 'u2')),
+    (5, 66, 6, 22, 1): (18, ('u1', 'u2')),
+    (6, 64, 6, 23, 1): (18, ('u1', 'u2')),
+    (6, 66, 0, 27, 1): (19, ('u1', 'u2')),
+    (6, 66, 3, 24, 1): (19, ('u1', 'u2')),
+    (6, 66, 6, 21, 1): (19, ('u1', 'u2')),
+    (7, 64, 0, 28, 1): (19, ('u1', 'u2')),
+    (8, 64, 0, 27, 1): (19, ('u1', 'u2')),
+    (7, 64, 3, 25, 1): (19, ('u1', 'u2')),
+    (7, 64, 6, 22, 1): (19, ('u1', 'u2')),
+    (8, 64, 3, 24, 1): (19, ('u1', 'u2')),
+    (8, 64, 6, 21, 1): (19, ('u1', 'u2')),
+    (3, 56, 21, 19, 1): (15, ('u1', 'u2')),
+    (3, 58, 18, 20, 1): (15, ('u1', 'u2')),
+    (3, 58, 21, 17, 1): (15, ('u1', 'u2')),
+    (3, 60, 18, 18, 1): (16, ('u1', 'u2')),
+    (4, 58, 18, 19, 1): (16, ('u1', 'u2')),
+    (4, 60, 15, 20, 1): (16, ('u1', 'u2')),
+    (4, 60, 18, 17, 1): (16, ('u1', 'u2')),
+    (3, 62, 15, 19, 1): (16, ('u1', 'u2')),
+    (3, 64, 12, 20, 1): (17, ('u1', 'u2')),
+    (3, 64, 15, 17, 1): (17, ('u1', 'u2')),
+    (4, 62, 15, 18, 1): (17, ('u1', 'u2')),
+    (5, 60, 15, 19, 1): (17, ('u1', 'u2')),
+    (5, 62, 12, 20, 1): (17, ('u1', 'u2')),
+    (5, 62, 15, 17, 1): (17, ('u1', 'u2')),
+    (3, 66, 12, 18, 1): (17, ('u1', 'u2')),
+    (4, 64, 12, 19, 1): (17, ('u1', 'u2')),
+    (4, 66, 9, 20, 1): (18, ('u1', 'u2')),
+    (4, 66, 12, 17, 1): (18, ('u1', 'u2')),
+    (5, 64, 12, 18, 1): (18, ('u1', 'u2')),
+    (6, 62, 12, 19, 1): (18, ('u1', 'u2')),
+    (6, 64, 9, 20, 1): (18, ('u1', 'u2')),
+    (6, 64, 12, 17, 1): (18, ('u1', 'u2')),
+    (3, 70, 0, 26, 1): (18, ('u1', 'u2')),
+    (3, 70, 3, 23, 1): (18, ('u1', 'u2')),
+    (3, 68, 9, 19, 1): (18, ('u1', 'u2')),
+    (3, 70, 6, 20, 1): (18, ('u1', 'u2')),
+    (3, 70, 9, 17, 1): (18, ('u1', 'u2')),
+    (4, 68, 9, 18, 1): (18, ('u1', 'u2')),
+    (5, 66, 9, 19, 1): (18, ('u1', 'u2')),
+    (5, 68, 0, 26, 1): (19, ('u1', 'u2')),
+    (5, 68, 3, 23, 1): (19, ('u1', 'u2')),
+    (5, 68, 6, 20, 1): (19, ('u1', 'u2')),
+    (5, 68, 9, 17, 1): (19, ('u1', 'u2')),
+    (7, 66, 0, 26, 1): (19, ('u1', 'u2')),
+    (7, 66, 3, 23, 1): (19, ('u1', 'u2')),
+    (6, 66, 9, 18, 1): (19, ('u1', 'u2')),
+    (7, 64, 9, 19, 1): (19, ('u1', 'u2')),
+    (7, 66, 6, 20, 1): (19, ('u1', 'u2')),
+    (7, 66, 9, 17, 1): (19, ('u1', 'u2')),
+    (3, 72, 0, 24, 1): (19, ('u1', 'u2')),
+    (4, 70, 0, 25, 1): (19, ('u1', 'u2')),
+    (4, 72, 0, 23, 1): (19, ('u1', 'u2')),
+    (3, 72, 3, 21, 1): (19, ('u1', 'u2')),
+    (4, 70, 3, 22, 1): (19, ('u1', 'u2')),
+    (3, 72, 6, 18, 1): (19, ('u1', 'u2')),
+    (4, 70, 6, 19, 1): (19, ('u1', 'u2')),
+    (4, 72, 3, 20, 1): (19, ('u1', 'u2')),
+    (4, 72, 6, 17, 1): (19, ('u1', 'u2')),
+    (5, 70, 0, 24, 1): (19, ('u1', 'u2')),
+    (5, 70, 3, 21, 1): (19, ('u1', 'u2')),
+    (6, 68, 0, 25, 1): (19, ('u1', 'u2')),
+    (6, 68, 3, 22, 1): (19, ('u1', 'u2')),
+    (5, 70, 6, 18, 1): (19, ('u1', 'u2')),
+    (6, 68, 6, 19, 1): (19, ('u1', 'u2')),
+    (6, 70, 0, 23, 1): (20, ('u1', 'u2')),
+    (6, 70, 3, 20, 1): (20, ('u1', 'u2')),
+    (6, 70, 6, 17, 1): (20, ('u1', 'u2')),
+    (7, 68, 0, 24, 1): (20, ('u1', 'u2')),
+    (8, 66, 0, 25, 1): (20, ('u1', 'u2')),
+    (8, 68, 0, 23, 1): (20, ('u1', 'u2')),
+    (7, 68, 3, 21, 1): (20, ('u1', 'u2')),
+    (8, 66, 3, 22, 1): (20, ('u1', 'u2')),
+    (7, 68, 6, 18, 1): (20, ('u1', 'u2')),
+    (8, 66, 6, 19, 1): (20, ('u1', 'u2')),
+    (8, 68, 3, 20, 1): (20, ('u1', 'u2')),
+    (8, 68, 6, 17, 1): (20, ('u1', 'u2')),
+    (3, 60, 21, 15, 1): (16, ('u1', 'u2')),
+    (3, 62, 18, 16, 1): (16, ('u1', 'u2')),
+    (3, 62, 21, 13, 1): (16, ('u1', 'u2')),
+    (3, 64, 18, 14, 1): (17, ('u1', 'u2')),
+    (4, 62, 18, 15, 1): (17, ('u1', 'u2')),
+    (4, 64, 15, 16, 1): (17, ('u1', 'u2')),
+    (4, 64, 18, 13, 1): (17, ('u1', 'u2')),
+    (3, 66, 15, 15, 1): (17, ('u1', 'u2')),
+    (3, 68, 12, 16, 1): (18, ('u1', 'u2')),
+    (3, 68, 15, 13, 1): (18, ('u1', 'u2')),
+    (4, 66, 15, 14, 1): (18, ('u1', 'u2')),
+    (5, 64, 15, 15, 1): (18, ('u1', 'u2')),
+    (5, 66, 12, 16, 1): (18, ('u1', 'u2')),
+    (5, 66, 15, 13, 1): (18, ('u1', 'u2')),
+    (3, 70, 12, 14, 1): (18, ('u1', 'u2')),
+    (4, 68, 12, 15, 1): (18, ('u1', 'u2')),
+    (4, 70, 9, 16, 1): (19, ('u1', 'u2')),
+    (4, 70, 12, 13, 1): (19, ('u1', 'u2')),
+    (5, 68, 12, 14, 1): (19, ('u1', 'u2')),
+    (6, 66, 12, 15, 1): (19, ('u1', 'u2')),
+    (6, 68, 9, 16, 1): (19, ('u1', 'u2')),
+    (6, 68, 12, 13, 1): (19, ('u1', 'u2')),
+    (3, 74, 0, 22, 1): (19, ('u1', 'u2')),
+    (3, 74, 3, 19, 1): (19, ('u1', 'u2')),
+    (3, 72, 9, 15, 1): (19, ('u1', 'u2')),
+    (3, 74, 6, 16, 1): (19, ('u1', 'u2')),
+    (3, 74, 9, 13, 1): (19, ('u1', 'u2')),
+    (4, 72, 9, 14, 1): (19, ('u1', 'u2')),
+    (5, 70, 9, 15, 1): (19, ('u1', 'u2')),
+    (5, 72, 0, 22, 1): (20, ('u1', 'u2')),
+    (5, 72, 3, 19, 1): (20, ('u1', 'u2')),
+    (5, 72, 6, 16, 1): (20, ('u1', 'u2')),
+    (5, 72, 9, 13, 1): (20, ('u1', 'u2')),
+    (7, 70, 0, 22, 1): (20, ('u1', 'u2')),
+    (7, 70, 3, 19, 1): (20, ('u1', 'u2')),
+    (6, 70, 9, 14, 1): (20, ('u1', 'u2')),
+    (7, 68, 9, 15, 1): (20, ('u1', 'u2')),
+    (7, 70, 6, 16, 1): (20, ('u1', 'u2')),
+    (7, 70, 9, 13, 1): (20, ('u1', 'u2')),
+    (3, 76, 0, 20, 1): (20, ('u1', 'u2')),
+    (4, 74, 0, 21, 1): (20, ('u1', 'u2')),
+    (4, 76, 0, 19, 1): (20, ('u1', 'u2')),
+    (3, 76, 3, 17, 1): (20, ('u1', 'u2')),
+    (4, 74, 3, 18, 1): (20, ('u1', 'u2')),
+    (3, 76, 6, 14, 1): (20, ('u1', 'u2')),
+    (4, 74, 6, 15, 1): (20, ('u1', 'u2')),
+    (4, 76, 3, 16, 1): (20, ('u1', 'u2')),
+    (4, 76, 6, 13, 1): (20, ('u1', 'u2')),
+    (5, 74, 0, 20, 1): (20, ('u1', 'u2')),
+    (5, 74, 3, 17, 1): (20, ('u1', 'u2')),
+    (6, 72, 0, 21, 1): (20, ('u1', 'u2')),
+    (6, 72, 3, 18, 1): (20, ('u1', 'u2')),
+    (5, 74, 6, 14, 1): (20, ('u1', 'u2')),
+    (6, 72, 6, 15, 1): (20, ('u1', 'u2')),
+    (6, 74, 0, 19, 1): (21, ('u1', 'u2')),
+    (6, 74, 3, 16, 1): (21, ('u1', 'u2')),
+    (6, 74, 6, 13, 1): (21, ('u1', 'u2')),
+    (7, 72, 0, 20, 1): (21, ('u1', 'u2')),
+    (8, 70, 0, 21, 1): (21, ('u1', 'u2')),
+    (8, 72, 0, 19, 1): (21, ('u1', 'u2')),
+    (7, 72, 3, 17, 1): (21, ('u1', 'u2')),
+    (8, 70, 3, 18, 1): (21, ('u1', 'u2')),
+    (7, 72, 6, 14, 1): (21, ('u1', 'u2')),
+    (8, 70, 6, 15, 1): (21, ('u1', 'u2')),
+    (8, 72, 3, 16, 1): (21, ('u1', 'u2')),
+    (8, 72, 6, 13, 1): (21, ('u1', 'u2')),
+    (3, 64, 21, 11, 1): (17, ('u1', 'u2')),
+    (3, 66, 18, 12, 1): (17, ('u1', 'u2')),
+    (3, 66, 21, 9, 1): (17, ('u1', 'u2')),
+    (3, 68, 18, 10, 1): (18, ('u1', 'u2')),
+    (4, 66, 18, 11, 1): (18, ('u1', 'u2')),
+    (4, 68, 15, 12, 1): (18, ('u1', 'u2')),
+    (4, 68, 18, 9, 1): (18, ('u1', 'u2')),
+    (3, 70, 15, 11, 1): (18, ('u1', 'u2')),
+    (3, 72, 12, 12, 1): (19, ('u1', 'u2')),
+    (3, 72, 15, 9, 1): (19, ('u1', 'u2')),
+    (4, 70, 15, 10, 1): (19, ('u1', 'u2')),
+    (5, 68, 15, 11, 1): (19, ('u1', 'u2')),
+    (5, 70, 12, 12, 1): (19, ('u1', 'u2')),
+    (5, 70, 15, 9, 1): (19, ('u1', 'u2')),
+    (3, 74, 12, 10, 1): (19, ('u1', 'u2')),
+    (4, 72, 12, 11, 1): (19, ('u1', 'u2')),
+    (4, 74, 9, 12, 1): (20, ('u1', 'u2')),
+    (4, 74, 12, 9, 1): (20, ('u1', 'u2')),
+    (5, 72, 12, 10, 1): (20, ('u1', 'u2')),
+    (6, 70, 12, 11, 1): (20, ('u1', 'u2')),
+    (6, 72, 9, 12, 1): (20, ('u1', 'u2')),
+    (6, 72, 12, 9, 1): (20, ('u1', 'u2')),
+    (3, 78, 0, 18, 1): (20, ('u1', 'u2')),
+    (3, 78, 3, 15, 1): (20, ('u1', 'u2')),
+    (3, 76, 9, 11, 1): (20, ('u1', 'u2')),
+    (3, 78, 6, 12, 1): (20, ('u1', 'u2')),
+    (3, 78, 9, 9, 1): (20, ('u1', 'u2')),
+    (4, 76, 9, 10, 1): (20, ('u1', 'u2')),
+    (5, 74, 9, 11, 1): (20, ('u1', 'u2')),
+    (5, 76, 0, 18, 1): (21, ('u1', 'u2')),
+    (5, 76, 3, 15, 1): (21, ('u1', 'u2')),
+    (5, 76, 6, 12, 1): (21, ('u1', 'u2')),
+    (5, 76, 9, 9, 1): (21, ('u1', 'u2')),
+    (7, 74, 0, 18, 1): (21, ('u1', 'u2')),
+    (7, 74, 3, 15, 1): (21, ('u1', 'u2')),
+    (6, 74, 9, 10, 1): (21, ('u1', 'u2')),
+    (7, 72, 9, 11, 1): (21, ('u1', 'u2')),
+    (7, 74, 6, 12, 1): (21, ('u1', 'u2')),
+    (7, 74, 9, 9, 1): (21, ('u1', 'u2')),
+    (3, 80, 0, 16, 1): (21, ('u1', 'u2')),
+    (4, 78, 0, 17, 1): (21, ('u1', 'u2')),
+    (4, 80, 0, 15, 1): (21, ('u1', 'u2')),
+    (3, 80, 3, 13, 1): (21, ('u1', 'u2')),
+    (4, 78, 3, 14, 1): (21, ('u1', 'u2')),
+    (3, 80, 6, 10, 1): (21, ('u1', 'u2')),
+    (4, 78, 6, 11, 1): (21, ('u1', 'u2')),
+    (4, 80, 3, 12, 1): (21, ('u1', 'u2')),
+    (4, 80, 6, 9, 1): (21, ('u1', 'u2')),
+    (5, 78, 0, 16, 1): (21, ('u1', 'u2')),
+    (5, 78, 3, 13, 1): (21, ('u1', 'u2')),
+    (6, 76, 0, 17, 1): (21, ('u1', 'u2')),
+    (6, 76, 3, 14, 1): (21, ('u1', 'u2')),
+    (5, 78, 6, 10, 1): (21, ('u1', 'u2')),
+    (6, 76, 6, 11, 1): (21, ('u1', 'u2')),
+    (6, 78, 0, 15, 1): (22, ('u1', 'u2')),
+    (6, 78, 3, 12, 1): (22, ('u1', 'u2')),
+    (6, 78, 6, 9, 1): (22, ('u1', 'u2')),
+    (7, 76, 0, 16, 1): (22, ('u1', 'u2')),
+    (8, 74, 0, 17, 1): (22, ('u1', 'u2')),
+    (8, 76, 0, 15, 1): (22, ('u1', 'u2')),
+    (7, 76, 3, 13, 1): (22, ('u1', 'u2')),
+    (8, 74, 3, 14, 1): (22, ('u1', 'u2')),
+    (7, 76, 6, 10, 1): (22, ('u1', 'u2')),
+    (8, 74, 6, 11, 1): (22, ('u1', 'u2')),
+    (8, 76, 3, 12, 1): (22, ('u1', 'u2')),
+    (8, 76, 6, 9, 1): (22, ('u1', 'u2')),
+    (3, 68, 21, 7, 1): (18, ('u1', 'u2')),
+    (3, 70, 18, 8, 1): (18, ('u1', 'u2')),
+    (3, 70, 21, 5, 1): (18, ('u1', 'u2')),
+    (3, 72, 18, 6, 1): (19, ('u1', 'u2')),
+    (4, 70, 18, 7, 1): (19, ('u1', 'u2')),
+    (4, 72, 15, 8, 1): (19, ('u1', 'u2')),
+    (4, 72, 18, 5, 1): (19, ('u1', 'u2')),
+    (3, 74, 15, 7, 1): (19, ('u1', 'u2')),
+    (3, 76, 12, 8, 1): (20, ('u1', 'u2')),
+    (3, 76, 15, 5, 1): (20, ('u1', 'u2')),
+    (4, 74, 15, 6, 1): (20, ('u1', 'u2')),
+    (5, 72, 15, 7, 1): (20, ('u1', 'u2')),
+    (5, 74, 12, 8, 1): (20, ('u1', 'u2')),
+    (5, 74, 15, 5, 1): (20, ('u1', 'u2')),
+    (3, 78, 12, 6, 1): (20, ('u1', 'u2')),
+    (4, 76, 12, 7, 1): (20, ('u1', 'u2')),
+    (4, 78, 9, 8, 1): (21, ('u1', 'u2')),
+    (4, 78, 12, 5, 1): (21, ('u1', 'u2')),
+    (5, 76, 12, 6, 1): (21, ('u1', 'u2')),
+    (6, 74, 12, 7, 1): (21, ('u1', 'u2')),
+    (6, 76, 9, 8, 1): (21, ('u1', 'u2')),
+    (6, 76, 12, 5, 1): (21, ('u1', 'u2')),
+    (3, 82, 0, 14, 1): (21, ('u1', 'u2')),
+    (3, 82, 3, 11, 1): (21, ('u1', 'u2')),
+    (3, 80, 9, 7, 1): (21, ('u1', 'u2')),
+    (3, 82, 6, 8, 1): (21, ('u1', 'u2')),
+    (3, 82, 9, 5, 1): (21, ('u1', 'u2')),
+    (4, 80, 9, 6, 1): (21, ('u1', 'u2')),
+    (5, 78, 9, 7, 1): (21, ('u1', 'u2')),
+    (5, 80, 0, 14, 1): (22, ('u1', 'u2')),
+    (5, 80, 3, 11, 1): (22, ('u1', 'u2')),
+    (5, 80, 6, 8, 1): (22, ('u1', 'u2')),
+    (5, 80, 9, 5, 1): (22, ('u1', 'u2')),
+    (7, 78, 0, 14, 1): (22, ('u1', 'u2')),
+    (7, 78, 3, 11, 1): (22, ('u1', 'u2')),
+    (6, 78, 9, 6, 1): (22, ('u1', 'u2')),
+    (7, 76, 9, 7, 1): (22, ('u1', 'u2')),
+    (7, 78, 6, 8, 1): (22, ('u1', 'u2')),
+    (7, 78, 9, 5, 1): (22, ('u1', 'u2')),
+    (3, 84, 0, 12, 1): (22, ('u1', 'u2')),
+    (4, 82, 0, 13, 1): (22, ('u1', 'u2')),
+    (4, 84, 0, 11, 1): (22, ('u1', 'u2')),
+    (3, 84, 3, 9, 1): (22, ('u1', 'u2')),
+    (4, 82, 3, 10, 1): (22, ('u1', 'u2')),
+    (3, 84, 6, 6, 1): (22, ('u1', 'u2')),
+    (4, 82, 6, 7, 1): (22, ('u1', 'u2')),
+    (4, 84, 3, 8, 1): (22, ('u1', 'u2')),
+    (4, 84, 6, 5, 1): (22, ('u1', 'u2')),
+    (5, 82, 0, 12, 1): (22, ('u1', 'u2')),
+    (5, 82, 3, 9, 1): (22, ('u1', 'u2')),
+    (6, 80, 0, 13, 1): (22, ('u1', 'u2')),
+    (6, 80, 3, 10, 1): (22, ('u1', 'u2')),
+    (5, 82, 6, 6, 1): (22, ('u1', 'u2')),
+    (6, 80, 6, 7, 1): (22, ('u1', 'u2')),
+    (6, 82, 0, 11, 1): (23, ('u1', 'u2')),
+    (6, 82, 3, 8, 1): (23, ('u1', 'u2')),
+    (6, 82, 6, 5, 1): (23, ('u1', 'u2')),
+    (7, 80, 0, 12, 1): (23, ('u1', 'u2')),
+    (8, 78, 0, 13, 1): (23, ('u1', 'u2')),
+    (8, 80, 0, 11, 1): (23, ('u1', 'u2')),
+    (7, 80, 3, 9, 1): (23, ('u1', 'u2')),
+    (8, 78, 3, 10, 1): (23, ('u1', 'u2')),
+    (7, 80, 6, 6, 1): (23, ('u1', 'u2')),
+    (8, 78, 6, 7, 1): (23, ('u1', 'u2')),
+    (8, 80, 3, 8, 1): (23, ('u1', 'u2')),
+    (8, 80, 6, 5, 1): (23, ('u1', 'u2')),
+    (3, 72, 21, 3, 1): (19, ('u1', 'u2')),
+    (3, 74, 18, 4, 1): (19, ('u1', 'u2')),
+    (3, 74, 21, 1, 1): (19, ('u1', 'u2')),
+    (3, 76, 18, 2, 1): (20, ('u1', 'u2')),
+    (4, 74, 18, 3, 1): (20, ('u1', 'u2')),
+    (4, 76, 15, 4, 1): (20, ('u1', 'u2')),
+    (4, 76, 18, 1, 1): (20, ('u1', 'u2')),
+    (3, 78, 15, 3, 1): (20, ('u1', 'u2')),
+    (3, 80, 12, 4, 1): (21, ('u1', 'u2')),
+    (3, 80, 15, 1, 1): (21, ('u1', 'u2')),
+    (4, 78, 15, 2, 1): (21, ('u1', 'u2')),
+    (5, 76, 15, 3, 1): (21, ('u1', 'u2')),
+    (5, 78, 12, 4, 1): (21, ('u1', 'u2')),
+    (5, 78, 15, 1, 1): (21, ('u1', 'u2')),
+    (3, 82, 12, 2, 1): (21, ('u1', 'u2')),
+    (4, 80, 12, 3, 1): (21, ('u1', 'u2')),
+    (4, 82, 9, 4, 1): (22, ('u1', 'u2')),
+    (4, 82, 12, 1, 1): (22, ('u1', 'u2')),
+    (5, 80, 12, 2, 1): (22, ('u1', 'u2')),
+    (6, 78, 12, 3, 1): (22, ('u1', 'u2')),
+    (6, 80, 9, 4, 1): (22, ('u1', 'u2')),
+    (6, 80, 12, 1, 1): (22, ('u1', 'u2')),
+    (3, 86, 0, 10, 1): (22, ('u1', 'u2')),
+    (3, 86, 3, 7, 1): (22, ('u1', 'u2')),
+    (3, 84, 9, 3, 1): (22, ('u1', 'u2')),
+    (3, 86, 6, 4, 1): (22, ('u1', 'u2')),
+    (3, 86, 9, 1, 1): (22, ('u1', 'u2')),
+    (4, 84, 9, 2, 1): (22, ('u1', 'u2')),
+    (5, 82, 9, 3, 1): (22, ('u1', 'u2')),
+    (5, 84, 0, 10, 1): (23, ('u1', 'u2')),
+    (5, 84, 3, 7, 1): (23, ('u1', 'u2')),
+    (5, 84, 6, 4, 1): (23, ('u1', 'u2')),
+    (5, 84, 9, 1, 1): (23, ('u1', 'u2')),
+    (7, 82, 0, 10, 1): (23, ('u1', 'u2')),
+    (7, 82, 3, 7, 1): (23, ('u1', 'u2')),
+    (6, 82, 9, 2, 1): (23, ('u1', 'u2')),
+    (7, 80, 9, 3, 1): (23, ('u1', 'u2')),
+    (7, 82, 6, 4, 1): (23, ('u1', 'u2')),
+    (7, 82, 9, 1, 1): (23, ('u1', 'u2')),
+    (3, 88, 0, 8, 1): (23, ('u1', 'u2')),
+    (4, 86, 0, 9, 1): (23, ('u1', 'u2')),
+    (4, 88, 0, 7, 1): (23, ('u1', 'u2')),
+    (3, 88, 3, 5, 1): (23, ('u1', 'u2')),
+    (4, 86, 3, 6, 1): (23, ('u1', 'u2')),
+    (3, 88, 6, 2, 1): (23, ('u1', 'u2')),
+    (4, 86, 6, 3, 1): (23, ('u1', 'u2')),
+    (4, 88, 3, 4, 1): (23, ('u1', 'u2')),
+    (4, 88, 6, 1, 1): (23, ('u1', 'u2')),
+    (5, 86, 0, 8, 1): (23, ('u1', 'u2')),
+    (5, 86, 3, 5, 1): (23, ('u1', 'u2')),
+    (6, 84, 0, 9, 1): (23, ('u1', 'u2')),
+    (6, 84, 3, 6, 1): (23, ('u1', 'u2')),
+    (5, 86, 6, 2, 1): (23, ('u1', 'u2')),
+    (6, 84, 6, 3, 1): (23, ('u1', 'u2')),
+    (6, 86, 0, 7, 1): (24, ('u1', 'u2')),
+    (6, 86, 3, 4, 1): (24, ('u1', 'u2')),
+    (6, 86, 6, 1, 1): (24, ('u1', 'u2')),
+    (7, 84, 0, 8, 1): (24, ('u1', 'u2')),
+    (8, 82, 0, 9, 1): (24, ('u1', 'u2')),
+    (8, 84, 0, 7, 1): (24, ('u1', 'u2')),
+    (7, 84, 3, 5, 1): (24, ('u1', 'u2')),
+    (8, 82, 3, 6, 1): (24, ('u1', 'u2')),
+    (7, 84, 6, 2, 1): (24, ('u1', 'u2')),
+    (8, 82, 6, 3, 1): (24, ('u1', 'u2')),
+    (8, 84, 3, 4, 1): (24, ('u1', 'u2')),
+    (8, 84, 6, 1, 1): (24, ('u1', 'u2')),
+    (3, 90, 0, 6, 1): (23, ('u1', 'u2')),
+    (3, 90, 3, 3, 1): (23, ('u1', 'u2')),
+    (3, 92, 0, 4, 1): (24, ('u1', 'u2')),
+    (3, 92, 3, 1, 1): (24, ('u1', 'u2')),
+    (4, 90, 0, 5, 1): (24, ('u1', 'u2')),
+    (5, 88, 0, 6, 1): (24, ('u1', 'u2')),
+    (4, 90, 3, 2, 1): (24, ('u1', 'u2')),
+    (5, 88, 3, 3, 1): (24, ('u1', 'u2')),
+    (5, 90, 0, 4, 1): (24, ('u1', 'u2')),
+    (5, 90, 3, 1, 1): (24, ('u1', 'u2')),
+    (6, 88, 0, 5, 1): (24, ('u1', 'u2')),
+    (7, 86, 0, 6, 1): (24, ('u1', 'u2')),
+    (6, 88, 3, 2, 1): (24, ('u1', 'u2')),
+    (7, 86, 3, 3, 1): (24, ('u1', 'u2')),
+    (7, 88, 0, 4, 1): (25, ('u1', 'u2')),
+    (7, 88, 3, 1, 1): (25, ('u1', 'u2')),
+    (8, 86, 0, 5, 1): (25, ('u1', 'u2')),
+    (8, 86, 3, 2, 1): (25, ('u1', 'u2')),
+    (9, 86, 0, 4, 1): (25, ('u1', 'u2')),
+    (9, 86, 3, 1, 1): (25, ('u1', 'u2')),
+    (4, 2, 21, 72, 1): (2, ('u1', 'u2')),
+    (4, 2, 24, 69, 1): (2, ('u1', 'u2')),
+    (4, 4, 21, 70, 1): (3, ('u1', 'u2')),
+    (2, 2, 27, 68, 1): (1, ('u1', 'u2')),
+    (2, 2, 30, 65, 1): (1, ('u1', 'u2')),
+    (3, 6, 24, 66, 1): (2, ('u1', 'u2')),
+    (4, 4, 24, 67, 1): (3, ('u1', 'u2')),
+    (4, 6, 21, 68, 1): (3, ('u1', 'u2')),
+    (4, 6, 24, 65, 1): (3, ('u1', 'u2')),
+    (4, 8, 21, 66, 1): (3, ('u1', 'u2')),
+    (3, 6, 27, 63, 1): (2, ('u1', 'u2')),
+    (3, 10, 24, 62, 1): (3, ('u1', 'u2')),
+    (4, 8, 24, 63, 1): (3, ('u1', 'u2')),
+    (4, 10, 21, 64, 1): (4, ('u1', 'u2')),
+    (4, 10, 24, 61, 1): (4, ('u1', 'u2')),
+    (4, 12, 21, 62, 1): (4, ('u1', 'u2')),
+    (5, 14, 18, 62, 1): (5, ('u1', 'u2')),
+    (3, 10, 27, 59, 1): (3, ('u1', 'u2')),
+    (3, 12, 24, 60, 1): (4, ('u1', 'u2')),
+    (3, 12, 27, 57, 1): (4, ('u1', 'u2')),
+    (3, 14, 24, 58, 1): (4, ('u1', 'u2')),
+    (4, 12, 24, 59, 1): (4, ('u1', 'u2')),
+    (4, 14, 21, 60, 1): (5, ('u1', 'u2')),
+    (4, 14, 24, 57, 1): (5, ('u1', 'u2')),
+    (4, 16, 21, 58, 1): (5, ('u1', 'u2')),
+    (5, 14, 21, 59, 1): (5, ('u1', 'u2')),
+    (5, 18, 18, 58, 1): (6, ('u1', 'u2')),
+    (6, 20, 15, 58, 1): (7, ('u1', 'u2')),
+    (3, 14, 27, 55, 1): (4, ('u1', 'u2')),
+    (3, 16, 24, 56, 1): (5, ('u1', 'u2')),
+    (3, 16, 27, 53, 1): (5, ('u1', 'u2')),
+    (3, 18, 24, 54, 1): (5, ('u1', 'u2')),
+    (4, 16, 24, 55, 1): (5, ('u1', 'u2')),
+    (4, 18, 21, 56, 1): (6, ('u1', 'u2')),
+    (4, 18, 24, 53, 1): (6, ('u1', 'u2')),
+    (4, 20, 21, 54, 1): (6, ('u1', 'u2')),
+    (5, 18, 21, 55, 1): (6, ('u1', 'u2')),
+    (5, 22, 18, 54, 1): (7, ('u1', 'u2')),
+    (6, 20, 18, 55, 1): (7, ('u1', 'u2')),
+    (6, 24, 15, 54, 1): (8, ('u1', 'u2')),
+    (3, 18, 27, 51, 1): (5, ('u1', 'u2')),
+    (3, 20, 24, 52, 1): (6, ('u1', 'u2')),
+    (3, 20, 27, 49, 1): (6, ('u1', 'u2')),
+    (3, 22, 24, 50, 1): (6, ('u1', 'u2')),
+    (4, 20, 24, 51, 1): (6, ('u1', 'u2')),
+    (4, 22, 21, 52, 1): (7, ('u1', 'u2')),
+    (4, 22, 24, 49, 1): (7, ('u1', 'u2')),
+    (4, 24, 21, 50, 1): (7, ('u1', 'u2')),
+    (5, 22, 21, 51, 1): (7, ('u1', 'u2')),
+    (5, 24, 18, 52, 1): (8, ('u1', 'u2')),
+    (5, 24, 21, 49, 1): (8, ('u1', 'u2')),
+    (5, 26, 18, 50, 1): (8, ('u1', 'u2')),
+    (6, 24, 18, 51, 1): (8, ('u1', 'u2')),
+    (6, 28, 15, 50, 1): (9, ('u1', 'u2')),
+    (3, 22, 27, 47, 1): (6, ('u1', 'u2')),
+    (3, 24, 24, 48, 1): (7, ('u1', 'u2')),
+    (3, 24, 27, 45, 1): (7, ('u1', 'u2')),
+    (3, 26, 24, 46, 1): (7, ('u1', 'u2')),
+    (4, 24, 24, 47, 1): (7, ('u1', 'u2')),
+    (4, 26, 21, 48, 1): (8, ('u1', 'u2')),
+    (4, 26, 24, 45, 1): (8, ('u1', 'u2')),
+    (4, 28, 21, 46, 1): (8, ('u1', 'u2')),
+    (5, 26, 21, 47, 1): (8, ('u1', 'u2')),
+    (5, 28, 18, 48, 1): (9, ('u1', 'u2')),
+    (5, 28, 21, 45, 1): (9, ('u1', 'u2')),
+    (5, 30, 18, 46, 1): (9, ('u1', 'u2')),
+    (6, 28, 18, 47, 1): (9, ('u1', 'u2')),
+    (6, 30, 15, 48, 1): (10, ('u1', 'u2')),
+    (6, 30, 18, 45, 1): (10, ('u1', 'u2')),
+    (6, 32, 15, 46, 1): (10, ('u1', 'u2')),
+    (3, 26, 27, 43, 1): (7, ('u1', 'u2')),
+    (3, 28, 24, 44, 1): (8, ('u1', 'u2')),
+    (3, 28, 27, 41, 1): (8, ('u1', 'u2')),
+    (3, 30, 24, 42, 1): (8, ('u1', 'u2')),
+    (4, 28, 24, 43, 1): (8, ('u1', 'u2')),
+    (4, 30, 21, 44, 1): (9, ('u1', 'u2')),
+    (4, 30, 24, 41, 1): (9, ('u1', 'u2')),
+    (4, 32, 21, 42, 1): (9, ('u1', 'u2')),
+    (5, 30, 21, 43, 1): (9, ('u1', 'u2')),
+    (5, 32, 18, 44, 1): (10, ('u1', 'u2')),
+    (5, 32, 21, 41, 1): (10, ('u1', 'u2')),
+    (5, 34, 18, 42, 1): (10, ('u1', 'u2')),
+    (6, 32, 18, 43, 1): (10, ('u1', 'u2')),
+    (6, 34, 15, 44, 1): (11, ('u1', 'u2')),
+    (6, 34, 18, 41, 1): (11, ('u1', 'u2')),
+    (6, 36, 15, 42, 1): (11, ('u1', 'u2')),
+    (3, 30, 27, 39, 1): (8, ('u1', 'u2')),
+    (3, 32, 24, 40, 1): (9, ('u1', 'u2')),
+    (3, 32, 27, 37, 1): (9, ('u1', 'u2')),
+    (3, 34, 24, 38, 1): (9, ('u1', 'u2')),
+    (4, 32, 24, 39, 1): (9, ('u1', 'u2')),
+    (4, 34, 21, 40, 1): (10, ('u1', 'u2')),
+    (4, 34, 24, 37, 1): (10, ('u1', 'u2')),
+    (4, 36, 21, 38, 1): (10, ('u1', 'u2')),
+    (5, 34, 21, 39, 1): (10, ('u1', 'u2')),
+    (5, 36, 18, 40, 1): (11, ('u1', 'u2')),
+    (5, 36, 21, 37, 1): (11, ('u1', 'u2')),
+    (5, 38, 18, 38, 1): (11, ('u1', 'u2')),
+    (6, 36, 18, 39, 1): (11, ('u1', 'u2')),
+    (6, 38, 15, 40, 1): (12, ('u1', 'u2')),
+    (6, 38, 18, 37, 1): (12, ('u1', 'u2')),
+    (6, 40, 15, 38, 1): (12, ('u1', 'u2')),
+    (7, 42, 12, 38, 1): (13, ('u1', 'u2')),
+    (3, 34, 27, 35, 1): (9, ('u1', 'u2')),
+    (3, 36, 24, 36, 1): (10, ('u1', 'u2')),
+    (3, 36, 27, 33, 1): (10, ('u1', 'u2')),
+    (3, 38, 24, 34, 1): (10, ('u1', 'u2')),
+    (4, 36, 24, 35, 1): (10, ('u1', 'u2')),
+    (4, 38, 21, 36, 1): (11, ('u1', 'u2')),
+    (4, 38, 24, 33, 1): (11, ('u1', 'u2')),
+    (4, 40, 21, 34, 1): (11, ('u1', 'u2')),
+    (5, 38, 21, 35, 1): (11, ('u1', 'u2')),
+    (5, 40, 18, 36, 1): (12, ('u1', 'u2')),
+    (5, 40, 21, 33, 1): (12, ('u1', 'u2')),
+    (5, 42, 18, 34, 1): (12, ('u1', 'u2')),
+    (6, 40, 18, 35, 1): (12, ('u1', 'u2')),
+    (6, 42, 15, 36, 1): (13, ('u1', 'u2')),
+    (6, 42, 18, 33, 1): (13, ('u1', 'u2')),
+    (6, 44, 15, 34, 1): (13, ('u1', 'u2')),
+    (7, 42, 15, 35, 1): (13, ('u1', 'u2')),
+    (7, 46, 12, 34, 1): (14, ('u1', 'u2')),
+    (3, 38, 27, 31, 1): (10, ('u1', 'u2')),
+    (3, 40, 24, 32, 1): (11, ('u1', 'u2')),
+    (3, 40, 27, 29, 1): (11, ('u1', 'u2')),
+    (3, 42, 24, 30, 1): (11, ('u1', 'u2')),
+    (4, 40, 24, 31, 1): (11, ('u1', 'u2')),
+    (4, 42, 21, 32, 1): (12, ('u1', 'u2')),
+    (4, 42, 24, 29, 1): (12, ('u1', 'u2')),
+    (4, 44, 21, 30, 1): (12, ('u1', 'u2')),
+    (5, 42, 21, 31, 1): (12, ('u1', 'u2')),
+    (5, 44, 18, 32, 1): (13, ('u1', 'u2')),
+    (5, 44, 21, 29, 1): (13, ('u1', 'u2')),
+    (5, 46, 18, 30, 1): (13, ('u1', 'u2')),
+    (6, 44, 18, 31, 1): (13, ('u1', 'u2')),
+    (6, 46, 15, 32, 1): (14, ('u1', 'u2')),
+    (6, 46, 18, 29, 1): (14, ('u1', 'u2')),
+    (6, 48, 15, 30, 1): (14, ('u1', 'u2')),
+    (7, 46, 15, 31, 1): (14, ('u1', 'u2')),
+    (7, 50, 12, 30, 1): (15, ('u1', 'u2')),
+    (3, 42, 27, 27, 1): (11, ('u1', 'u2')),
+    (3, 44, 24, 28, 1): (12, ('u1', 'u2')),
+    (3, 44, 27, 25, 1): (12, ('u1', 'u2')),
+    (3, 46, 24, 26, 1): (12, ('u1', 'u2')),
+    (4, 44, 24, 27, 1): (12, ('u1', 'u2')),
+    (4, 46, 21, 28, 1): (13, ('u1', 'u2')),
+    (4, 46, 24, 25, 1): (13, ('u1', 'u2')),
+    (4, 48, 21, 26, 1): (13, ('u1', 'u2')),
+    (5, 46, 21, 27, 1): (13, ('u1', 'u2')),
+    (5, 48, 18, 28, 1): (14, ('u1', 'u2')),
+    (5, 48, 21, 25, 1): (14, ('u1', 'u2')),
+    (5, 50, 18, 26, 1): (14, ('u1', 'u2')),
+    (6, 48, 18, 27, 1): (14, ('u1', 'u2')),
+    (6, 50, 15, 28, 1): (15, ('u1', 'u2')),
+    (6, 50, 18, 25, 1): (15, ('u1', 'u2')),
+    (6, 52, 15, 26, 1): (15, ('u1', 'u2')),
+    (7, 50, 15, 27, 1): (15, ('u1', 'u2')),
+    (7, 52, 12, 28, 1): (16, ('u1', 'u2')),
+    (7, 52, 15, 25, 1): (16, ('u1', 'u2')),
+    (7, 54, 12, 26, 1): (16, ('u1', 'u2')),
+    (8, 56, 9, 26, 1): (17, ('u1', 'u2')),
+    (3, 46, 27, 23, 1): (12, ('u1', 'u2')),
+    (3, 48, 24, 24, 1): (13, ('u1', 'u2')),
+    (3, 48, 27, 21, 1): (13, ('u1', 'u2')),
+    (3, 50, 24, 22, 1): (13, ('u1', 'u2')),
+    (4, 48, 24, 23, 1): (13, ('u1', 'u2')),
+    (4, 50, 21, 24, 1): (14, ('u1', 'u2')),
+    (4, 50, 24, 21, 1): (14, ('u1', 'u2')),
+    (4, 52, 21, 22, 1): (14, ('u1', 'u2')),
+    (5, 50, 21, 23, 1): (14, ('u1', 'u2')),
+    (5, 52, 18, 24, 1): (15, ('u1', 'u2')),
+    (5, 52, 21, 21, 1): (15, ('u1', 'u2')),
+    (5, 54, 18, 22, 1): (15, ('u1', 'u2')),
+    (6, 52, 18, 23, 1): (15, ('u1', 'u2')),
+    (6, 54, 15, 24, 1): (16, ('u1', 'u2')),
+    (6, 54, 18, 21, 1): (16, ('u1', 'u2')),
+    (6, 56, 15, 22, 1): (16, ('u1', 'u2')),
+    (7, 54, 15, 23, 1): (16, ('u1', 'u2')),
+    (7, 56, 12, 24, 1): (17, ('u1', 'u2')),
+    (7, 56, 15, 21, 1): (17, ('u1', 'u2')),
+    (7, 58, 12, 22, 1): (17, ('u1', 'u2')),
+    (8, 56, 12, 23, 1): (17, ('u1', 'u2')),
+    (8, 60, 9, 22, 1): (18, ('u1', 'u2')),
+    (3, 50, 27, 19, 1): (13, ('u1', 'u2')),
+    (3, 52, 24, 20, 1): (14, ('u1', 'u2')),
+    (3, 52, 27, 17, 1): (14, ('u1', 'u2')),
+    (3, 54, 24, 18, 1): (14, ('u1', 'u2')),
+    (4, 52, 24, 19, 1): (14, ('u1', 'u2')),
+    (4, 54, 21, 20, 1): (15, ('u1', 'u2')),
+    (4, 54, 24, 17, 1): (15, ('u1', 'u2')),
+    (4, 56, 21, 18, 1): (15, ('u1', 'u2')),
+    (5, 54, 21, 19, 1): (15, ('u1', 'u2')),
+    (5, 56, 18, 20, 1): (16, ('u1', 'u2')),
+    (5, 56, 21, 17, 1): (16, ('u1', 'u2')),
+    (5, 58, 18, 18, 1): (16, ('u1', 'u2')),
+    (6, 56, 18, 19, 1): (16, ('u1', 'u2')),
+    (6, 58, 15, 20, 1): (17, ('u1', 'u2')),
+    (6, 58, 18, 17, 1): (17, ('u1', 'u2')),
+    (6, 60, 15, 18, 1): (17, ('u1', 'u2')),
+    (7, 58, 15, 19, 1): (17, ('u1', 'u2')),
+    (7, 60, 12, 20, 1): (18, ('u1', 'u2')),
+    (7, 60, 15, 17, 1): (18, ('u1', 'u2')),
+    (7, 62, 12, 18, 1): (18, ('u1', 'u2')),
+    (8, 60, 12, 19, 1): (18, ('u1', 'u2')),
+    (8, 64, 9, 18, 1): (19, ('u1', 'u2')),
+    (3, 54, 27, 15, 1): (14, ('u1', 'u2')),
+    (3, 56, 24, 16, 1): (15, ('u1', 'u2')),
+    (3, 56, 27, 13, 1): (15, ('u1', 'u2')),
+    (3, 58, 24, 14, 1): (15, ('u1', 'u2')),
+    (4, 56, 24, 15, 1): (15, ('u1', 'u2')),
+    (4, 58, 21, 16, 1): (16, ('u1', 'u2')),
+    (4, 58, 24, 13, 1): (16, ('u1', 'u2')),
+    (4, 60, 21, 14, 1): (16, ('u1', 'u2')),
+    (5, 58, 21, 15, 1): (16, ('u1', 'u2')),
+    (5, 60, 18, 16, 1): (17, ('u1', 'u2')),
+    (5, 60, 21, 13, 1): (17, ('u1', 'u2')),
+    (5, 62, 18, 14, 1): (17, ('u1', 'u2')),
+    (6, 60, 18, 15, 1): (17, ('u1', 'u2')),
+    (6, 62, 15, 16, 1): (18, ('u1', 'u2')),
+    (6, 62, 18, 13, 1): (18, ('u1', 'u2')),
+    (6, 64, 15, 14, 1): (18, ('u1', 'u2')),
+    (7, 62, 15, 15, 1): (18, ('u1', 'u2')),
+    (7, 64, 12, 16, 1): (19, ('u1', 'u2')),
+    (7, 64, 15, 13, 1): (19, ('u1', 'u2')),
+    (7, 66, 12, 14, 1): (19, ('u1', 'u2')),
+    (8, 64, 12, 15, 1): (19, ('u1', 'u2')),
+    (8, 66, 9, 16, 1): (20, ('u1', 'u2')),
+    (8, 66, 12, 13, 1): (20, ('u1', 'u2')),
+    (8, 68, 9, 14, 1): (20, ('u1', 'u2')),
+    (3, 58, 27, 11, 1): (15, ('u1', 'u2')),
+    (3, 60, 24, 12, 1): (16, ('u1', 'u2')),
+    (3, 60, 27, 9, 1): (16, ('u1', 'u2')),
+    (3, 62, 24, 10, 1): (16, ('u1', 'u2')),
+    (4, 60, 24, 11, 1): (16, ('u1', 'u2')),
+    (4, 62, 21, 12, 1): (17, ('u1', 'u2')),
+    (4, 62, 24, 9, 1): (17, ('u1', 'u2')),
+    (4, 64, 21, 10, 1): (17, ('u1', 'u2')),
+    (5, 62, 21, 11, 1): (17, ('u1', 'u2')),
+    (5, 64, 18, 12, 1): (18, ('u1', 'u2')),
+    (5, 64, 21, 9, 1): (18, ('u1', 'u2')),
+    (5, 66, 18, 10, 1): (18, ('u1', 'u2')),
+    (6, 64, 18, 11, 1): (18, ('u1', 'u2')),
+    (6, 66, 15, 12, 1): (19, ('u1', 'u2')),
+    (6, 66, 18, 9, 1): (19, ('u1', 'u2')),
+    (6, 68, 15, 10, 1): (19, ('u1', 'u2')),
+    (7, 66, 15, 11, 1): (19, ('u1', 'u2')),
+    (7, 68, 12, 12, 1): (20, ('u1', 'u2')),
+    (7, 68, 15, 9, 1): (20, ('u1', 'u2')),
+    (7, 70, 12, 10, 1): (20, ('u1', 'u2')),
+    (8, 68, 12, 11, 1): (20, ('u1', 'u2')),
+    (8, 70, 9, 12, 1): (21, ('u1', 'u2')),
+    (8, 70, 12, 9, 1): (21, ('u1', 'u2')),
+    (8, 72, 9, 10, 1): (21, ('u1', 'u2')),
+    (3, 62, 27, 7, 1): (16, ('u1', 'u2')),
+    (3, 64, 24, 8, 1): (17, ('u1', 'u2')),
+    (3, 64, 27, 5, 1): (17, ('u1', 'u2')),
+    (3, 66, 24, 6, 1): (17, ('u1', 'u2')),
+    (4, 64, 24, 7, 1): (17, ('u1', 'u2')),
+    (4, 66, 21, 8, 1): (18, ('u1', 'u2')),
+    (4, 66, 24, 5, 1): (18, ('u1', 'u2')),
+    (4, 68, 21, 6, 1): (18, ('u1', 'u2')),
+    (5, 66, 21, 7, 1): (18, ('u1', 'u2')),
+    (5, 68, 18, 8, 1): (19, ('u1', 'u2')),
+    (5, 68, 21, 5, 1): (19, ('u1', 'u2')),
+    (5, 70, 18, 6, 1): (19, ('u1', 'u2')),
+    (6, 68, 18, 7, 1): (19, ('u1', 'u2')),
+    (6, 70, 15, 8, 1): (20, ('u1', 'u2')),
+    (6, 70, 18, 5, 1): (20, ('u1', 'u2')),
+    (6, 72, 15, 6, 1): (20, ('u1', 'u2')),
+    (7, 70, 15, 7, 1): (20, ('u1', 'u2')),
+    (7, 72, 12, 8, 1): (21, ('u1', 'u2')),
+    (7, 72, 15, 5, 1): (21, ('u1', 'u2')),
+    (7, 74, 12, 6, 1): (21, ('u1', 'u2')),
+    (8, 72, 12, 7, 1): (21, ('u1', 'u2')),
+    (8, 74, 9, 8, 1): (22, ('u1', 'u2')),
+    (8, 74, 12, 5, 1): (22, ('u1', 'u2')),
+    (8, 76, 9, 6, 1): (22, ('u1', 'u2')),
+    (3, 66, 27, 3, 1): (17, ('u1', 'u2')),
+    (3, 68, 24, 4, 1): (18, ('u1', 'u2')),
+    (3, 68, 27, 1, 1): (18, ('u1', 'u2')),
+    (3, 70, 24, 2, 1): (18, ('u1', 'u2')),
+    (4, 68, 24, 3, 1): (18, ('u1', 'u2')),
+    (4, 70, 21, 4, 1): (19, ('u1', 'u2')),
+    (4, 70, 24, 1, 1): (19, ('u1', 'u2')),
+    (4, 72, 21, 2, 1): (19, ('u1', 'u2')),
+    (5, 70, 21, 3, 1): (19, ('u1', 'u2')),
+    (5, 72, 18, 4, 1): (20, ('u1', 'u2')),
+    (5, 72, 21, 1, 1): (20, ('u1', 'u2')),
+    (5, 74, 18, 2, 1): (20, ('u1', 'u2')),
+    (6, 72, 18, 3, 1): (20, ('u1', 'u2')),
+    (6, 74, 15, 4, 1): (21, ('u1', 'u2')),
+    (6, 74, 18, 1, 1): (21, ('u1', 'u2')),
+    (6, 76, 15, 2, 1): (21, ('u1', 'u2')),
+    (7, 74, 15, 3, 1): (21, ('u1', 'u2')),
+    (7, 76, 12, 4, 1): (22, ('u1', 'u2')),
+    (7, 76, 15, 1, 1): (22, ('u1', 'u2')),
+    (7, 78, 12, 2, 1): (22, ('u1', 'u2')),
+    (8, 76, 12, 3, 1): (22, ('u1', 'u2')),
+    (8, 78, 9, 4, 1): (23, ('u1', 'u2')),
+    (8, 78, 12, 1, 1): (23, ('u1', 'u2')),
+    (8, 80, 9, 2, 1): (23, ('u1', 'u2')),
+    (4, 2, 27, 66, 1): (2, ('u1', 'u2')),
+    (2, 2, 33, 62, 1): (1, ('u1', 'u2')),
+    (4, 2, 30, 63, 1): (2, ('u1', 'u2')),
+    (4, 4, 27, 64, 1): (3, ('u1', 'u2')),
+    (4, 4, 30, 61, 1): (3, ('u1', 'u2')),
+    (4, 6, 27, 62, 1): (3, ('u1', 'u2')),
+    (2, 2, 36, 59, 1): (1, ('u1', 'u2')),
+    (3, 6, 30, 60, 1): (2, ('u1', 'u2')),
+    (3, 6, 33, 57, 1): (2, ('u1', 'u2')),
+    (4, 6, 30, 59, 1): (3, ('u1', 'u2')),
+    (4, 8, 27, 60, 1): (3, ('u1', 'u2')),
+    (4, 8, 30, 57, 1): (3, ('u1', 'u2')),
+    (4, 10, 27, 58, 1): (4, ('u1', 'u2')),
+    (3, 10, 30, 56, 1): (3, ('u1', 'u2')),
+    (3, 10, 33, 53, 1): (3, ('u1', 'u2')),
+    (3, 12, 30, 54, 1): (4, ('u1', 'u2')),
+    (4, 10, 30, 55, 1): (4, ('u1', 'u2')),
+    (4, 12, 27, 56, 1): (4, ('u1', 'u2')),
+    (4, 12, 30, 53, 1): (4, ('u1', 'u2')),
+    (4, 14, 27, 54, 1): (5, ('u1', 'u2')),
+    (5, 14, 24, 56, 1): (5, ('u1', 'u2')),
+    (5, 14, 27, 53, 1): (5, ('u1', 'u2')),
+    (3, 12, 33, 51, 1): (4, ('u1', 'u2')),
+    (3, 14, 30, 52, 1): (4, ('u1', 'u2')),
+    (3, 14, 33, 49, 1): (4, ('u1', 'u2')),
+    (3, 16, 30, 50, 1): (5, ('u1', 'u2')),
+    (4, 14, 30, 51, 1): (5, ('u1', 'u2')),
+    (4, 16, 27, 52, 1): (5, ('u1', 'u2')),
+    (4, 16, 30, 49, 1): (5, ('u1', 'u2')),
+    (4, 18, 27, 50, 1): (6, ('u1', 'u2')),
+    (5, 18, 24, 52, 1): (6, ('u1', 'u2')),
+    (5, 18, 27, 49, 1): (6, ('u1', 'u2')),
+    (6, 20, 21, 52, 1): (7, ('u1', 'u2')),
+    (6, 20, 24, 49, 1): (7, ('u1', 'u2')),
+    (3, 16, 33, 47, 1): (5, ('u1', 'u2')),
+    (3, 18, 30, 48, 1): (5, ('u1', 'u2')),
+    (3, 18, 33, 45, 1): (5, ('u1', 'u2')),
+    (3, 20, 30, 46, 1): (6, ('u1', 'u2')),
+    (4, 18, 30, 47, 1): (6, ('u1', 'u2')),
+    (4, 20, 27, 48, 1): (6, ('u1', 'u2')),
+    (4, 20, 30, 45, 1): (6, ('u1', 'u2')),
+    (4, 22, 27, 46, 1): (7, ('u1', 'u2')),
+    (5, 22, 24, 48, 1): (7, ('u1', 'u2')),
+    (5, 22, 27, 45, 1): (7, ('u1', 'u2')),
+    (5, 24, 24, 46, 1): (8, ('u1', 'u2')),
+    (6, 24, 21, 48, 1): (8, ('u1', 'u2')),
+    (6, 24, 24, 45, 1): (8, ('u1', 'u2')),
+    (3, 20, 33, 43, 1): (6, ('u1', 'u2')),
+    (3, 22, 30, 44, 1): (6, ('u1', 'u2')),
+    (3, 22, 33, 41, 1): (6, ('u1', 'u2')),
+    (3, 24, 30, 42, 1): (7, ('u1', 'u2')),
+    (4, 22, 30, 43, 1): (7, ('u1', 'u2')),
+    (4, 24, 27, 44, 1): (7, ('u1', 'u2')),
+    (4, 24, 30, 41, 1): (7, ('u1', 'u2')),
+    (4, 26, 27, 42, 1): (8, ('u1', 'u2')),
+    (5, 24, 27, 43, 1): (8, ('u1', 'u2')),
+    (5, 26, 24, 44, 1): (8, ('u1', 'u2')),
+    (5, 26, 27, 41, 1): (8, ('u1', 'u2')),
+    (5, 28, 24, 42, 1): (9, ('u1', 'u2')),
+    (6, 28, 21, 44, 1): (9, ('u1', 'u2')),
+    (6, 28, 24, 41, 1): (9, ('u1', 'u2')),
+    (6, 30, 21, 42, 1): (10, ('u1', 'u2')),
+    (3, 24, 33, 39, 1): (7, ('u1', 'u2')),
+    (3, 26, 30, 40, 1): (7, ('u1', 'u2')),
+    (3, 26, 33, 37, 1): (7, ('u1', 'u2')),
+    (3, 28, 30, 38, 1): (8, ('u1', 'u2')),
+    (4, 26, 30, 39, 1): (8, ('u1', 'u2')),
+    (4, 28, 27, 40, 1): (8, ('u1', 'u2')),
+    (4, 28, 30, 37, 1): (8, ('u1', 'u2')),
+    (4, 30, 27, 38, 1): (9, ('u1', 'u2')),
+    (5, 28, 27, 39, 1): (9, ('u1', 'u2')),
+    (5, 30, 24, 40, 1): (9, ('u1', 'u2')),
+    (5, 30, 27, 37, 1): (9, ('u1', 'u2')),
+    (5, 32, 24, 38, 1): (10, ('u1', 'u2')),
+    (6, 30, 24, 39, 1): (10, ('u1', 'u2')),
+    (6, 32, 21, 40, 1): (10, ('u1', 'u2')),
+    (6, 32, 24, 37, 1): (10, ('u1', 'u2')),
+    (6, 34, 21, 38, 1): (11, ('u1', 'u2')),
+    (3, 28, 33, 35, 1): (8, ('u1', 'u2')),
+    (3, 30, 30, 36, 1): (8, ('u1', 'u2')),
+    (3, 30, 33, 33, 1): (8, ('u1', 'u2')),
+    (3, 32, 30, 34, 1): (9, ('u1', 'u2')),
+    (4, 30, 30, 35, 1): (9, ('u1', 'u2')),
+    (4, 32, 27, 36, 1): (9, ('u1', 'u2')),
+    (4, 32, 30, 33, 1): (9, ('u1', 'u2')),
+    (4, 34, 27, 34, 1): (10, ('u1', 'u2')),
+    (5, 32, 27, 35, 1): (10, ('u1', 'u2')),
+    (5, 34, 24, 36, 1): (10, ('u1', 'u2')),
+    (5, 34, 27, 33, 1): (10, ('u1', 'u2')),
+    (5, 36, 24, 34, 1): (11, ('u1', 'u2')),
+    (6, 34, 24, 35, 1): (11, ('u1', 'u2')),
+    (6, 36, 21, 36, 1): (11, ('u1', 'u2')),
+    (6, 36, 24, 33, 1): (11, ('u1', 'u2')),
+    (6, 38, 21, 34, 1): (12, ('u1', 'u2')),
+    (3, 32, 33, 31, 1): (9, ('u1', 'u2')),
+    (3, 34, 30, 32, 1): (9, ('u1', 'u2')),
+    (3, 34, 33, 29, 1): (9, ('u1', 'u2')),
+    (3, 36, 30, 30, 1): (10, ('u1', 'u2')),
+    (4, 34, 30, 31, 1): (10, ('u1', 'u2')),
+    (4, 36, 27, 32, 1): (10, ('u1', 'u2')),
+    (4, 36, 30, 29, 1): (10, ('u1', 'u2')),
+    (4, 38, 27, 30, 1): (11, ('u1', 'u2')),
+    (5, 36, 27, 31, 1): (11, ('u1', 'u2')),
+    (5, 38, 24, 32, 1): (11, ('u1', 'u2')),
+    (5, 38, 27, 29, 1): (11, ('u1', 'u2')),
+    (5, 40, 24, 30, 1): (12, ('u1', 'u2')),
+    (6, 38, 24, 31, 1): (12, ('u1', 'u2')),
+    (6, 40, 21, 32, 1): (12, ('u1', 'u2')),
+    (6, 40, 24, 29, 1): (12, ('u1', 'u2')),
+    (6, 42, 21, 30, 1): (13, ('u1', 'u2')),
+    (7, 42, 18, 32, 1): (13, ('u1', 'u2')),
+    (7, 42, 21, 29, 1): (13, ('u1', 'u2')),
+    (3, 36, 33, 27, 1): (10, ('u1', 'u2')),
+    (3, 38, 30, 28, 1): (10, ('u1', 'u2')),
+    (3, 38, 33, 25, 1): (10, ('u1', 'u2')),
+    (3, 40, 30, 26, 1): (11, ('u1', 'u2')),
+    (4, 38, 30, 27, 1): (11, ('u1', 'u2')),
+    (4, 40, 27, 28, 1): (11, ('u1', 'u2')),
+    (4, 40, 30, 25, 1): (11, ('u1', 'u2')),
+    (4, 42, 27, 26, 1): (12, ('u1', 'u2')),
+    (5, 40, 27, 27, 1): (12, ('u1', 'u2')),
+    (5, 42, 24, 28, 1): (12, ('u1', 'u2')),
+    (5, 42, 27, 25, 1): (12, ('u1', 'u2')),
+    (5, 44, 24, 26, 1): (13, ('u1', 'u2')),
+    (6, 42, 24, 27, 1): (13, ('u1', 'u2')),
+    (6, 44, 21, 28, 1): (13, ('u1', 'u2')),
+    (6, 44, 24, 25, 1): (13, ('u1', 'u2')),
+    (6, 46, 21, 26, 1): (14, ('u1', 'u2')),
+    (7, 46, 18, 28, 1): (14, ('u1', 'u2')),
+    (7, 46, 21, 25, 1): (14, ('u1', 'u2')),
+    (3, 40, 33, 23, 1): (11, ('u1', 'u2')),
+    (3, 42, 30, 24, 1): (11, ('u1', 'u2')),
+    (3, 42, 33, 21, 1): (11, ('u1', 'u2')),
+    (3, 44, 30, 22, 1): (12, ('u1', 'u2')),
+    (4, 42, 30, 23, 1): (12, ('u1', 'u2')),
+    (4, 44, 27, 24, 1): (12, ('u1', 'u2')),
+    (4, 44, 30, 21, 1): (12, ('u1', 'u2')),
+    (4, 46, 27, 22, 1): (13, ('u1', 'u2')),
+    (5, 44, 27, 23, 1): (13, ('u1', 'u2')),
+    (5, 46, 24, 24, 1): (13, ('u1', 'u2')),
+    (5, 46, 27, 21, 1): (13, ('u1', 'u2')),
+    (5, 48, 24, 22, 1): (14, ('u1', 'u2')),
+    (6, 46, 24, 23, 1): (14, ('u1', 'u2')),
+    (6, 48, 21, 24, 1): (14, ('u1', 'u2')),
+    (6, 48, 24, 21, 1): (14, ('u1', 'u2')),
+    (6, 50, 21, 22, 1): (15, ('u1', 'u2')),
+    (7, 50, 18, 24, 1): (15, ('u1', 'u2')),
+    (7, 50, 21, 21, 1): (15, ('u1', 'u2')),
+    (7, 52, 18, 22, 1): (16, ('u1', 'u2')),
+    (3, 44, 33, 19, 1): (12, ('u1', 'u2')),
+    (3, 46, 30, 20, 1): (12, ('u1', 'u2')),
+    (3, 46, 33, 17, 1): (12, ('u1', 'u2')),
+    (3, 48, 30, 18, 1): (13, ('u1', 'u2')),
+    (4, 46, 30, 19, 1): (13, ('u1', 'u2')),
+    (4, 48, 27, 20, 1): (13, ('u1', 'u2')),
+    (4, 48, 30, 17, 1): (13, ('u1', 'u2')),
+    (4, 50, 27, 18, 1): (14, ('u1', 'u2')),
+    (5, 48, 27, 19, 1): (14, ('u1', 'u2')),
+    (5, 50, 24, 20, 1): (14, ('u1', 'u2')),
+    (5, 50, 27, 17, 1): (14, ('u1', 'u2')),
+    (5, 52, 24, 18, 1): (15, ('u1', 'u2')),
+    (6, 50, 24, 19, 1): (15, ('u1', 'u2')),
+    (6, 52, 21, 20, 1): (15, ('u1', 'u2')),
+    (6, 52, 24, 17, 1): (15, ('u1', 'u2')),
+    (6, 54, 21, 18, 1): (16, ('u1', 'u2')),
+    (7, 52, 21, 19, 1): (16, ('u1', 'u2')),
+    (7, 54, 18, 20, 1): (16, ('u1', 'u2')),
+    (7, 54, 21, 17, 1): (16, ('u1', 'u2')),
+    (7, 56, 18, 18, 1): (17, ('u1', 'u2')),
+    (8, 56, 15, 20, 1): (17, ('u1', 'u2')),
+    (8, 56, 18, 17, 1): (17, ('u1', 'u2')),
+    (3, 48, 33, 15, 1): (13, ('u1', 'u2')),
+    (3, 50, 30, 16, 1): (13, ('u1', 'u2')),
+    (3, 50, 33, 13, 1): (13, ('u1', 'u2')),
+    (3, 52, 30, 14, 1): (14, ('u1', 'u2')),
+    (4, 50, 30, 15, 1): (14, ('u1', 'u2')),
+    (4, 52, 27, 16, 1): (14, ('u1', 'u2')),
+    (4, 52, 30, 13, 1): (14, ('u1', 'u2')),
+    (4, 54, 27, 14, 1): (15, ('u1', 'u2')),
+    (5, 52, 27, 15, 1): (15, ('u1', 'u2')),
+    (5, 54, 24, 16, 1): (15, ('u1', 'u2')),
+    (5, 54, 27, 13, 1): (15, ('u1', 'u2')),
+    (5, 56, 24, 14, 1): (16, ('u1', 'u2')),
+    (6, 54, 24, 15, 1): (16, ('u1', 'u2')),
+    (6, 56, 21, 16, 1): (16, ('u1', 'u2')),
+    (6, 56, 24, 13, 1): (16, ('u1', 'u2')),
+    (6, 58, 21, 14, 1): (17, ('u1', 'u2')),
+    (7, 56, 21, 15, 1): (17, ('u1', 'u2')),
+    (7, 58, 18, 16, 1): (17, ('u1', 'u2')),
+    (7, 58, 21, 13, 1): (17, ('u1', 'u2')),
+    (7, 60, 18, 14, 1): (18, ('u1', 'u2')),
+    (8, 60, 15, 16, 1): (18, ('u1', 'u2')),
+    (8, 60, 18, 13, 1): (18, ('u1', 'u2')),
+    (3, 52, 33, 11, 1): (14, ('u1', 'u2')),
+    (3, 54, 30, 12, 1): (14, ('u1', 'u2')),
+    (3, 54, 33, 9, 1): (14, ('u1', 'u2')),
+    (3, 56, 30, 10, 1): (15, ('u1', 'u2')),
+    (4, 54, 30, 11, 1): (15, ('u1', 'u2')),
+    (4, 56, 27, 12, 1): (15, ('u1', 'u2')),
+    (4, 56, 30, 9, 1): (15, ('u1', 'u2')),
+    (4, 58, 27, 10, 1): (16, ('u1', 'u2')),
+    (5, 56, 27, 11, 1): (16, ('u1', 'u2')),
+    (5, 58, 24, 12, 1): (16, ('u1', 'u2')),
+    (5, 58, 27, 9, 1): (16, ('u1', 'u2')),
+    (5, 60, 24, 10, 1): (17, ('u1', 'u2')),
+    (6, 58, 24, 11, 1): (17, ('u1', 'u2')),
+    (6, 60, 21, 12, 1): (17, ('u1', 'u2')),
+    (6, 60, 24, 9, 1): (17, ('u1', 'u2')),
+    (6, 62, 21, 10, 1): (18, ('u1', 'u2')),
+    (7, 60, 21, 11, 1): (18, ('u1', 'u2')),
+    (7, 62, 18, 12, 1): (18, ('u1', 'u2')),
+    (7, 62, 21, 9, 1): (18, ('u1', 'u2')),
+    (7, 64, 18, 10, 1): (19, ('u1', 'u2')),
+    (8, 64, 15, 12, 1): (19, ('u1', 'u2')),
+    (8, 64, 18, 9, 1): (19, ('u1', 'u2')),
+    (8, 66, 15, 10, 1): (20, ('u1', 'u2')),
+    (3, 56, 33, 7, 1): (15, ('u1', 'u2')),
+    (3, 58, 30, 8, 1): (15, ('u1', 'u2')),
+    (3, 58, 33, 5, 1): (15, ('u1', 'u2')),
+    (3, 60, 30, 6, 1): (16, ('u1', 'u2')),
+    (4, 58, 30, 7, 1): (16, ('u1', 'u2')),
+    (4, 60, 27, 8, 1): (16, ('u1', 'u2')),
+    (4, 60, 30, 5, 1): (16, ('u1', 'u2')),
+    (4, 62, 27, 6, 1): (17, ('u1', 'u2')),
+    (5, 60, 27, 7, 1): (17, ('u1', 'u2')),
+    (5, 62, 24, 8, 1): (17, ('u1', 'u2')),
+    (5, 62, 27, 5, 1): (17, ('u1', 'u2')),
+    (5, 64, 24, 6, 1): (18, ('u1', 'u2')),
+    (6, 62, 24, 7, 1): (18, ('u1', 'u2')),
+    (6, 64, 21, 8, 1): (18, ('u1', 'u2')),
+    (6, 64, 24, 5, 1): (18, ('u1', 'u2')),
+    (6, 66, 21, 6, 1): (19, ('u1', 'u2')),
+    (7, 64, 21, 7, 1): (19, ('u1', 'u2')),
+    (7, 66, 18, 8, 1): (19, ('u1', 'u2')),
+    (7, 66, 21, 5, 1): (19, ('u1', 'u2')),
+    (7, 68, 18, 6, 1): (20, ('u1', 'u2')),
+    (8, 66, 18, 7, 1): (20, ('u1', 'u2')),
+    (8, 68, 15, 8, 1): (20, ('u1', 'u2')),
+    (8, 68, 18, 5, 1): (20, ('u1', 'u2')),
+    (8, 70, 15, 6, 1): (21, ('u1', 'u2')),
+    (3, 60, 33, 3, 1): (16, ('u1', 'u2')),
+    (3, 62, 30, 4, 1): (16, ('u1', 'u2')),
+    (3, 62, 33, 1, 1): (16, ('u1', 'u2')),
+    (3, 64, 30, 2, 1): (17, ('u1', 'u2')),
+    (4, 62, 30, 3, 1): (17, ('u1', 'u2')),
+    (4, 64, 27, 4, 1): (17, ('u1', 'u2')),
+    (4, 64, 30, 1, 1): (17, ('u1', 'u2')),
+    (4, 66, 27, 2, 1): (18, ('u1', 'u2')),
+    (5, 64, 27, 3, 1): (18, ('u1', 'u2')),
+    (5, 66, 24, 4, 1): (18, ('u1', 'u2')),
+    (5, 66, 27, 1, 1): (18, ('u1', 'u2')),
+    (5, 68, 24, 2, 1): (19, ('u1', 'u2')),
+    (6, 66, 24, 3, 1): (19, ('u1', 'u2')),
+    (6, 68, 21, 4, 1): (19, ('u1', 'u2')),
+    (6, 68, 24, 1, 1): (19, ('u1', 'u2')),
+    (6, 70, 21, 2, 1): (20, ('u1', 'u2')),
+    (7, 68, 21, 3, 1): (20, ('u1', 'u2')),
+    (7, 70, 18, 4, 1): (20, ('u1', 'u2')),
+    (7, 70, 21, 1, 1): (20, ('u1', 'u2')),
+    (7, 72, 18, 2, 1): (21, ('u1', 'u2')),
+    (8, 70, 18, 3, 1): (21, ('u1', 'u2')),
+    (8, 72, 15, 4, 1): (21, ('u1', 'u2')),
+    (8, 72, 18, 1, 1): (21, ('u1', 'u2')),
+    (8, 74, 15, 2, 1): (22, ('u1', 'u2')),
+    (4, 2, 33, 60, 1): (2, ('u1', 'u2')),
+    (4, 2, 36, 57, 1): (2, ('u1', 'u2')),
+    (4, 4, 33, 58, 1): (3, ('u1', 'u2')),
+    (2, 2, 39, 56, 1): (1, ('u1', 'u2')),
+    (2, 2, 42, 53, 1): (1, ('u1', 'u2')),
+    (3, 6, 36, 54, 1): (2, ('u1', 'u2')),
+    (4, 4, 36, 55, 1): (3, ('u1', 'u2')),
+    (4, 6, 33, 56, 1): (3, ('u1', 'u2')),
+    (4, 6, 36, 53, 1): (3, ('u1', 'u2')),
+    (4, 8, 33, 54, 1): (3, ('u1', 'u2')),
+    (3, 6, 39, 51, 1): (2, ('u1', 'u2')),
+    (3, 10, 36, 50, 1): (3, ('u1', 'u2')),
+    (4, 8, 36, 51, 1): (3, ('u1', 'u2')),
+    (4, 10, 33, 52, 1): (4, ('u1', 'u2')),
+    (4, 10, 36, 49, 1): (4, ('u1', 'u2')),
+    (4, 12, 33, 50, 1): (4, ('u1', 'u2')),
+    (5, 14, 30, 50, 1): (5, ('u1', 'u2')),
+    (3, 10, 39, 47, 1): (3, ('u1', 'u2')),
+    (3, 12, 36, 48, 1): (4, ('u1', 'u2')),
+    (3, 12, 39, 45, 1): (4, ('u1', 'u2')),
+    (3, 14, 36, 46, 1): (4, ('u1', 'u2')),
+    (4, 12, 36, 47, 1): (4, ('u1', 'u2')),
+    (4, 14, 33, 48, 1): (5, ('u1', 'u2')),
+    (4, 14, 36, 45, 1): (5, ('u1', 'u2')),
+    (4, 16, 33, 46, 1): (5, ('u1', 'u2')),
+    (5, 14, 33, 47, 1): (5, ('u1', 'u2')),
+    (5, 18, 30, 46, 1): (6, ('u1', 'u2')),
+    (6, 20, 27, 46, 1): (7, ('u1', 'u2')),
+    (3, 14, 39, 43, 1): (4, ('u1', 'u2')),
+    (3, 16, 36, 44, 1): (5, ('u1', 'u2')),
+    (3, 16, 39, 41, 1): (5, ('u1', 'u2')),
+    (3, 18, 36, 42, 1): (5, ('u1', 'u2')),
+    (4, 16, 36, 43, 1): (5, ('u1', 'u2')),
+    (4, 18, 33, 44, 1): (6, ('u1', 'u2')),
+    (4, 18, 36, 41, 1): (6, ('u1', 'u2')),
+    (4, 20, 33, 42, 1): (6, ('u1', 'u2')),
+    (5, 18, 33, 43, 1): (6, ('u1', 'u2')),
+    (5, 22, 30, 42, 1): (7, ('u1', 'u2')),
+    (6, 20, 30, 43, 1): (7, ('u1', 'u2')),
+    (6, 24, 27, 42, 1): (8, ('u1', 'u2')),
+    (3, 18, 39, 39, 1): (5, ('u1', 'u2')),
+    (3, 20, 36, 40, 1): (6, ('u1', 'u2')),
+    (3, 20, 39, 37, 1): (6, ('u1', 'u2')),
+    (3, 22, 36, 38, 1): (6, ('u1', 'u2')),
+    (4, 20, 36, 39, 1): (6, ('u1', 'u2')),
+    (4, 22, 33, 40, 1): (7, ('u1', 'u2')),
+    (4, 22, 36, 37, 1): (7, ('u1', 'u2')),
+    (4, 24, 33, 38, 1): (7, ('u1', 'u2')),
+    (5, 22, 33, 39, 1): (7, ('u1', 'u2')),
+    (5, 24, 30, 40, 1): (8, ('u1', 'u2')),
+    (5, 24, 33, 37, 1): (8, ('u1', 'u2')),
+    (5, 26, 30, 38, 1): (8, ('u1', 'u2')),
+    (6, 24, 30, 39, 1): (8, ('u1', 'u2')),
+    (6, 28, 27, 38, 1): (9, ('u1', 'u2')),
+    (3, 22, 39, 35, 1): (6, ('u1', 'u2')),
+    (3, 24, 36, 36, 1): (7, ('u1', 'u2')),
+    (3, 24, 39, 33, 1): (7, ('u1', 'u2')),
+    (3, 26, 36, 34, 1): (7, ('u1', 'u2')),
+    (4, 24, 36, 35, 1): (7, ('u1', 'u2')),
+    (4, 26, 33, 36, 1): (8, ('u1', 'u2')),
+    (4, 26, 36, 33, 1): (8, ('u1', 'u2')),
+    (4, 28, 33, 34, 1): (8, ('u1', 'u2')),
+    (5, 26, 33, 35, 1): (8, ('u1', 'u2')),
+    (5, 28, 30, 36, 1): (9, ('u1', 'u2')),
+    (5, 28, 33, 33, 1): (9, ('u1', 'u2')),
+    (5, 30, 30, 34, 1): (9, ('u1', 'u2')),
+    (6, 28, 30, 35, 1): (9, ('u1', 'u2')),
+    (6, 30, 27, 36, 1): (10, ('u1', 'u2')),
+    (6, 30, 30, 33, 1): (10, ('u1', 'u2')),
+    (6, 32, 27, 34, 1): (10, ('u1', 'u2')),
+    (3, 26, 39, 31, 1): (7, ('u1', 'u2')),
+    (3, 28, 36, 32, 1): (8, ('u1', 'u2')),
+    (3, 28, 39, 29, 1): (8, ('u1', 'u2')),
+    (3, 30, 36, 30, 1): (8, ('u1', 'u2')),
+    (4, 28, 36, 31, 1): (8, ('u1', 'u2')),
+    (4, 30, 33, 32, 1): (9, ('u1', 'u2')),
+    (4, 30, 36, 29, 1): (9, ('u1', 'u2')),
+    (4, 32, 33, 30, 1): (9, ('u1', 'u2')),
+    (5, 30, 33, 31, 1): (9, ('u1', 'u2')),
+    (5, 32, 30, 32, 1): (10, ('u1', 'u2')),
+    (5, 32, 33, 29, 1): (10, ('u1', 'u2')),
+    (5, 34, 30, 30, 1): (10, ('u1', 'u2')),
+    (6, 32, 30, 31, 1): (10, ('u1', 'u2')),
+    (6, 34, 27, 32, 1): (11, ('u1', 'u2')),
+    (6, 34, 30, 29, 1): (11, ('u1', 'u2')),
+    (6, 36, 27, 30, 1): (11, ('u1', 'u2')),
+    (3, 30, 39, 27, 1): (8, ('u1', 'u2')),
+    (3, 32, 36, 28, 1): (9, ('u1', 'u2')),
+    (3, 32, 39, 25, 1): (9, ('u1', 'u2')),
+    (3, 34, 36, 26, 1): (9, ('u1', 'u2')),
+    (4, 32, 36, 27, 1): (9, ('u1', 'u2')),
+    (4, 34, 33, 28, 1): (10, ('u1', 'u2')),
+    (4, 34, 36, 25, 1): (10, ('u1', 'u2')),
+    (4, 36, 33, 26, 1): (10, ('u1', 'u2')),
+    (5, 34, 33, 27, 1): (10, ('u1', 'u2')),
+    (5, 36, 30, 28, 1): (11, ('u1', 'u2')),
+    (5, 36, 33, 25, 1): (11, ('u1', 'u2')),
+    (5, 38, 30, 26, 1): (11, ('u1', 'u2')),
+    (6, 36, 30, 27, 1): (11, ('u1', 'u2')),
+    (6, 38, 27, 28, 1): (12, ('u1', 'u2')),
+    (6, 38, 30, 25, 1): (12, ('u1', 'u2')),
+    (6, 40, 27, 26, 1): (12, ('u1', 'u2')),
+    (7, 42, 24, 26, 1): (13, ('u1', 'u2')),
+    (3, 34, 39, 23, 1): (9, ('u1', 'u2')),
+    (3, 36, 36, 24, 1): (10, ('u1', 'u2')),
+    (3, 36, 39, 21, 1): (10, ('u1', 'u2')),
+    (3, 38, 36, 22, 1): (10, ('u1', 'u2')),
+    (4, 36, 36, 23, 1): (10, ('u1', 'u2')),
+    (4, 38, 33, 24, 1): (11, ('u1', 'u2')),
+    (4, 38, 36, 21, 1): (11, ('u1', 'u2')),
+    (4, 40, 33, 22, 1): (11, ('u1', 'u2')),
+    (5, 38, 33, 23, 1): (11, ('u1', 'u2')),
+    (5, 40, 30, 24, 1): (12, ('u1', 'u2')),
+    (5, 40, 33, 21, 1): (12, ('u1', 'u2')),
+    (5, 42, 30, 22, 1): (12, ('u1', 'u2')),
+    (6, 40, 30, 23, 1): (12, ('u1', 'u2')),
+    (6, 42, 27, 24, 1): (13, ('u1', 'u2')),
+    (6, 42, 30, 21, 1): (13, ('u1', 'u2')),
+    (6, 44, 27, 22, 1): (13, ('u1', 'u2')),
+    (7, 42, 27, 23, 1): (13, ('u1', 'u2')),
+    (7, 46, 24, 22, 1): (14, ('u1', 'u2')),
+    (3, 38, 39, 19, 1): (10, ('u1', 'u2')),
+    (3, 40, 36, 20, 1): (11, ('u1', 'u2')),
+    (3, 40, 39, 17, 1): (11, ('u1', 'u2')),
+    (3, 42, 36, 18, 1): (11, ('u1', 'u2')),
+    (4, 40, 36, 19, 1): (11, ('u1', 'u2')),
+    (4, 42, 33, 20, 1): (12, ('u1', 'u2')),
+    (4, 42, 36, 17, 1): (12, ('u1', 'u2')),
+    (4, 44, 33, 18, 1): (12, ('u1', 'u2')),
+    (5, 42, 33, 19, 1): (12, ('u1', 'u2')),
+    (5, 44, 30, 20, 1): (13, ('u1', 'u2')),
+    (5, 44, 33, 17, 1): (13, ('u1', 'u2')),
+    (5, 46, 30, 18, 1): (13, ('u1', 'u2')),
+    (6, 44, 30, 19, 1): (13, ('u1', 'u2')),
+    (6, 46, 27, 20, 1): (14, ('u1', 'u2')),
+    (6, 46, 30, 17, 1): (14, ('u1', 'u2')),
+    (6, 48, 27, 18, 1): (14, ('u1', 'u2')),
+    (7, 46, 27, 19, 1): (14, ('u1', 'u2')),
+    (7, 50, 24, 18, 1): (15, ('u1', 'u2')),
+    (3, 42, 39, 15, 1): (11, ('u1', 'u2')),
+    (3, 44, 36, 16, 1): (12, ('u1', 'u2')),
+    (3, 44, 39, 13, 1): (12, ('u1', 'u2')),
+    (3, 46, 36, 14, 1): (12, ('u1', 'u2')),
+    (4, 44, 36, 15, 1): (12, ('u1', 'u2')),
+    (4, 46, 33, 16, 1): (13, ('u1', 'u2')),
+    (4, 46, 36, 13, 1): (13, ('u1', 'u2')),
+    (4, 48, 33, 14, 1): (13, ('u1', 'u2')),
+    (5, 46, 33, 15, 1): (13, ('u1', 'u2')),
+    (5, 48, 30, 16, 1): (14, ('u1', 'u2')),
+    (5, 48, 33, 13, 1): (14, ('u1', 'u2')),
+    (5, 50, 30, 14, 1): (14, ('u1', 'u2')),
+    (6, 48, 30, 15, 1): (14, ('u1', 'u2')),
+    (6, 50, 27, 16, 1): (15, ('u1', 'u2')),
+    (6, 50, 30, 13, 1): (15, ('u1', 'u2')),
+    (6, 52, 27, 14, 1): (15, ('u1', 'u2')),
+    (7, 50, 27, 15, 1): (15, ('u1', 'u2')),
+    (7, 52, 24, 16, 1): (16, ('u1', 'u2')),
+    (7, 52, 27, 13, 1): (16, ('u1', 'u2')),
+    (7, 54, 24, 14, 1): (16, ('u1', 'u2')),
+    (8, 56, 21, 14, 1): (17, ('u1', 'u2')),
+    (3, 46, 39, 11, 1): (12, ('u1', 'u2')),
+    (3, 48, 36, 12, 1): (13, ('u1', 'u2')),
+    (3, 48, 39, 9, 1): (13, ('u1', 'u2')),
+    (3, 50, 36, 10, 1): (13, ('u1', 'u2')),
+    (4, 48, 36, 11, 1): (13, ('u1', 'u2')),
+    (4, 50, 33, 12, 1): (14, ('u1', 'u2')),
+    (4, 50, 36, 9, 1): (14, ('u1', 'u2')),
+    (4, 52, 33, 10, 1): (14, ('u1', 'u2')),
+    (5, 50, 33, 11, 1): (14, ('u1', 'u2')),
+    (5, 52, 30, 12, 1): (15, ('u1', 'u2')),
+    (5, 52, 33, 9, 1): (15, ('u1', 'u2')),
+    (5, 54, 30, 10, 1): (15, ('u1', 'u2')),
+    (6, 52, 30, 11, 1): (15, ('u1', 'u2')),
+    (6, 54, 27, 12, 1): (16, ('u1', 'u2')),
+    (6, 54, 30, 9, 1): (16, ('u1', 'u2')),
+    (6, 56, 27, 10, 1): (16, ('u1', 'u2')),
+    (7, 54, 27, 11, 1): (16, ('u1', 'u2')),
+    (7, 56, 24, 12, 1): (17, ('u1', 'u2')),
+    (7, 56, 27, 9, 1): (17, ('u1', 'u2')),
+    (7, 58, 24, 10, 1): (17, ('u1', 'u2')),
+    (8, 56, 24, 11, 1): (17, ('u1', 'u2')),
+    (8, 60, 21, 10, 1): (18, ('u1', 'u2')),
+    (3, 50, 39, 7, 1): (13, ('u1', 'u2')),
+    (3, 52, 36, 8, 1): (14, ('u1', 'u2')),
+    (3, 52, 39, 5, 1): (14, ('u1', 'u2')),
+    (3, 54, 36, 6, 1): (14, ('u1', 'u2')),
+    (4, 52, 36, 7, 1): (14, ('u1', 'u2')),
+    (4, 54, 33, 8, 1): (15, ('u1', 'u2')),
+    (4, 54, 36, 5, 1): (15, ('u1', 'u2')),
+    (4, 56, 33, 6, 1): (15, ('u1', 'u2')),
+    (5, 54, 33, 7, 1): (15, ('u1', 'u2')),
+    (5, 56, 30, 8, 1): (16, ('u1', 'u2')),
+    (5, 56, 33, 5, 1): (16, ('u1', 'u2')),
+    (5, 58, 30, 6, 1): (16, ('u1', 'u2')),
+    (6, 56, 30, 7, 1): (16, ('u1', 'u2')),
+    (6, 58, 27, 8, 1): (17, ('u1', 'u2')),
+    (6, 58, 30, 5, 1): (17, ('u1', 'u2')),
+    (6, 60, 27, 6, 1): (17, ('u1', 'u2')),
+    (7, 58, 27, 7, 1): (17, ('u1', 'u2')),
+    (7, 60, 24, 8, 1): (18, ('u1', 'u2')),
+    (7, 60, 27, 5, 1): (18, ('u1', 'u2')),
+    (7, 62, 24, 6, 1): (18, ('u1', 'u2')),
+    (8, 60, 24, 7, 1): (18, ('u1', 'u2')),
+    (8, 64, 21, 6, 1): (19, ('u1', 'u2')),
+    (3, 54, 39, 3, 1): (14, ('u1', 'u2')),
+    (3, 56, 36, 4, 1): (15, ('u1', 'u2')),
+    (3, 56, 39, 1, 1): (15, ('u1', 'u2')),
+    (3, 58, 36, 2, 1): (15, ('u1', 'u2')),
+    (4, 56, 36, 3, 1): (15, ('u1', 'u2')),
+    (4, 58, 33, 4, 1): (16, ('u1', 'u2')),
+    (4, 58, 36, 1, 1): (16, ('u1', 'u2')),
+    (4, 60, 33, 2, 1): (16, ('u1', 'u2')),
+    (5, 58, 33, 3, 1): (16, ('u1', 'u2')),
+    (5, 60, 30, 4, 1): (17, ('u1', 'u2')),
+    (5, 60, 33, 1, 1): (17, ('u1', 'u2')),
+    (5, 62, 30, 2, 1): (17, ('u1', 'u2')),
+    (6, 60, 30, 3, 1): (17, ('u1', 'u2')),
+    (6, 62, 27, 4, 1): (18, ('u1', 'u2')),
+    (6, 62, 30, 1, 1): (18, ('u1', 'u2')),
+    (6, 64, 27, 2, 1): (18, ('u1', 'u2')),
+    (7, 62, 27, 3, 1): (18, ('u1', 'u2')),
+    (7, 64, 24, 4, 1): (19, ('u1', 'u2')),
+    (7, 64, 27, 1, 1): (19, ('u1', 'u2')),
+    (7, 66, 24, 2, 1): (19, ('u1', 'u2')),
+    (8, 64, 24, 3, 1): (19, ('u1', 'u2')),
+    (8, 66, 21, 4, 1): (20, ('u1', 'u2')),
+    (8, 66, 24, 1, 1): (20, ('u1', 'u2')),
+    (8, 68, 21, 2, 1): (20, ('u1', 'u2')),
+    (4, 2, 39, 54, 1): (2, ('u1', 'u2')),
+    (2, 2, 45, 50, 1): (1, ('u1', 'u2')),
+    (4, 2, 42, 51, 1): (2, ('u1', 'u2')),
+    (4, 4, 39, 52, 1): (3, ('u1', 'u2')),
+    (4, 4, 42, 49, 1): (3, ('u1', 'u2')),
+    (4, 6, 39, 50, 1): (3, ('u1', 'u2')),
+    (2, 2, 48, 47, 1): (1, ('u1', 'u2')),
+    (3, 6, 42, 48, 1): (2, ('u1', 'u2')),
+    (3, 6, 45, 45, 1): (2, ('u1', 'u2')),
+    (4, 6, 42, 47, 1): (3, ('u1', 'u2')),
+    (4, 8, 39, 48, 1): (3, ('u1', 'u2')),
+    (4, 8, 42, 45, 1): (3, ('u1', 'u2')),
+    (4, 10, 39, 46, 1): (4, ('u1', 'u2')),
+    (3, 10, 42, 44, 1): (3, ('u1', 'u2')),
+    (3, 10, 45, 41, 1): (3, ('u1', 'u2')),
+    (3, 12, 42, 42, 1): (4, ('u1', 'u2')),
+    (4, 10, 42, 43, 1): (4, ('u1', 'u2')),
+    (4, 12, 39, 44, 1): (4, ('u1', 'u2')),
+    (4, 12, 42, 41, 1): (4, ('u1', 'u2')),
+    (4, 14, 39, 42, 1): (5, ('u1', 'u2')),
+    (5, 14, 36, 44, 1): (5, ('u1', 'u2')),
+    (5, 14, 39, 41, 1): (5, ('u1', 'u2')),
+    (3, 12, 45, 39, 1): (4, ('u1', 'u2')),
+    (3, 14, 42, 40, 1): (4, ('u1', 'u2')),
+    (3, 14, 45, 37, 1): (4, ('u1', 'u2')),
+    (3, 16, 42, 38, 1): (5, ('u1', 'u2')),
+    (4, 14, 42, 39, 1): (5, ('u1', 'u2')),
+    (4, 16, 39, 40, 1): (5, ('u1', 'u2')),
+    (4, 16, 42, 37, 1): (5, ('u1', 'u2')),
+    (4, 18, 39, 38, 1): (6, ('u1', 'u2')),
+    (5, 18, 36, 40, 1): (6, ('u1', 'u2')),
+    (5, 18, 39, 37, 1): (6, ('u1', 'u2')),
+    (6, 20, 33, 40, 1): (7, ('u1', 'u2')),
+    (6, 20, 36, 37, 1): (7, ('u1', 'u2')),
+    (3, 16, 45, 35, 1): (5, ('u1', 'u2')),
+    (3, 18, 42, 36, 1): (5, ('u1', 'u2')),
+    (3, 18, 45, 33, 1): (5, ('u1', 'u2')),
+    (3, 20, 42, 34, 1): (6, ('u1', 'u2')),
+    (4, 18, 42, 35, 1): (6, ('u1', 'u2')),
+    (4, 20, 39, 36, 1): (6, ('u1', 'u2')),
+    (4, 20, 42, 33, 1): (6, ('u1', 'u2')),
+    (4, 22, 39, 34, 1): (7, ('u1', 'u2')),
+    (5, 22, 36, 36, 1): (7, ('u1', 'u2')),
+    (5, 22, 39, 33, 1): (7, ('u1', 'u2')),
+    (5, 24, 36, 34, 1): (8, ('u1', 'u2')),
+    (6, 24, 33, 36, 1): (8, ('u1', 'u2')),
+    (6, 24, 36, 33, 1): (8, ('u1', 'u2')),
+    (3, 20, 45, 31, 1): (6, ('u1', 'u2')),
+    (3, 22, 42, 32, 1): (6, ('u1', 'u2')),
+    (3, 22, 45, 29, 1): (6, ('u1', 'u2')),
+    (3, 24, 42, 30, 1): (7, ('u1', 'u2')),
+    (4, 22, 42, 31, 1): (7, ('u1', 'u2')),
+    (4, 24, 39, 32, 1): (7, ('u1', 'u2')),
+    (4, 24, 42, 29, 1): (7, ('u1', 'u2')),
+    (4, 26, 39, 30, 1): (8, ('u1', 'u2')),
+    (5, 24, 39, 31, 1): (8, ('u1', 'u2')),
+    (5, 26, 36, 32, 1): (8, ('u1', 'u2')),
+    (5, 26, 39, 29, 1): (8, ('u1', 'u2')),
+    (5, 28, 36, 30, 1): (9, ('u1', 'u2')),
+    (6, 28, 33, 32, 1): (9, ('u1', 'u2')),
+    (6, 28, 36, 29, 1): (9, ('u1', 'u2')),
+    (6, 30, 33, 30, 1): (10, ('u1', 'u2')),
+    (3, 24, 45, 27, 1): (7, ('u1', 'u2')),
+    (3, 26, 42, 28, 1): (7, ('u1', 'u2')),
+    (3, 26, 45, 25, 1): (7, ('u1', 'u2')),
+    (3, 28, 42, 26, 1): (8, ('u1', 'u2')),
+    (4, 26, 42, 27, 1): (8, ('u1', 'u2')),
+    (4, 28, 39, 28, 1): (8, ('u1', 'u2')),
+    (4, 28, 42, 25, 1): (8, ('u1', 'u2')),
+    (4, 30, 39, 26, 1): (9, ('u1', 'u2')),
+    (5, 28, 39, 27, 1): (9, ('u1', 'u2')),
+    (5, 30, 36, 28, 1): (9, ('u1', 'u2')),
+    (5, 30, 39, 25, 1): (9, ('u1', 'u2')),
+    (5, 32, 36, 26, 1): (10, ('u1', 'u2')),
+    (6, 30, 36, 27, 1): (10, ('u1', 'u2')),
+    (6, 32, 33, 28, 1): (10, ('u1', 'u2')),
+    (6, 32, 36, 25, 1): (10, ('u1', 'u2')),
+    (6, 34, 33, 26, 1): (11, ('u1', 'u2')),
+    (3, 28, 45, 23, 1): (8, ('u1', 'u2')),
+    (3, 30, 42, 24, 1): (8, ('u1', 'u2')),
+    (3, 30, 45, 21, 1): (8, ('u1', 'u2')),
+    (3, 32, 42, 22, 1): (9, ('u1', 'u2')),
+    (4, 30, 42, 23, 1): (9, ('u1', 'u2')),
+    (4, 32, 39, 24, 1): (9, ('u1', 'u2')),
+    (4, 32, 42, 21, 1): (9, ('u1', 'u2')),
+    (4, 34, 39, 22, 1): (10, ('u1', 'u2')),
+    (5, 32, 39, 23, 1): (10, ('u1', 'u2')),
+    (5, 34, 36, 24, 1): (10, ('u1', 'u2')),
+    (5, 34, 39, 21, 1): (10, ('u1', 'u2')),
+    (5, 36, 36, 22, 1): (11, ('u1', 'u2')),
+    (6, 34, 36, 23, 1): (11, ('u1', 'u2')),
+    (6, 36, 33, 24, 1): (11, ('u1', 'u2')),
+    (6, 36, 36, 21, 1): (11, ('u1', 'u2')),
+    (6, 38, 33, 22, 1): (12, ('u1', 'u2')),
+    (3, 32, 45, 19, 1): (9, ('u1', 'u2')),
+    (3, 34, 42, 20, 1): (9, ('u1', 'u2')),
+    (3, 34, 45, 17, 1): (9, ('u1', 'u2')),
+    (3, 36, 42, 18, 1): (10, ('u1', 'u2')),
+    (4, 34, 42, 19, 1): (10, ('u1', 'u2')),
+    (4, 36, 39, 20, 1): (10, ('u1', 'u2')),
+    (4, 36, 42, 17, 1): (10, ('u1', 'u2')),
+    (4, 38, 39, 18, 1): (11, ('u1', 'u2')),
+    (5, 36, 39, 19, 1): (11, ('u1', 'u2')),
+    (5, 38, 36, 20, 1): (11, ('u1', 'u2')),
+    (5, 38, 39, 17, 1): (11, ('u1', 'u2')),
+    (5, 40, 36, 18, 1): (12, ('u1', 'u2')),
+    (6, 38, 36, 19, 1): (12, ('u1', 'u2')),
+    (6, 40, 33, 20, 1): (12, ('u1', 'u2')),
+    (6, 40, 36, 17, 1): (12, ('u1', 'u2')),
+    (6, 42, 33, 18, 1): (13, ('u1', 'u2')),
+    (7, 42, 30, 20, 1): (13, ('u1', 'u2')),
+    (7, 42, 33, 17, 1): (13, ('u1', 'u2')),
+    (3, 36, 45, 15, 1): (10, ('u1', 'u2')),
+    (3, 38, 42, 16, 1): (10, ('u1', 'u2')),
+    (3, 38, 45, 13, 1): (10, ('u1', 'u2')),
+    (3, 40, 42, 14, 1): (11, ('u1', 'u2')),
+    (4, 38, 42, 15, 1): (11, ('u1', 'u2')),
+    (4, 40, 39, 16, 1): (11, ('u1', 'u2')),
+    (4, 40, 42, 13, 1): (11, ('u1', 'u2')),
+    (4, 42, 39, 14, 1): (12, ('u1', 'u2')),
+    (5, 40, 39, 15, 1): (12, ('u1', 'u2')),
+    (5, 42, 36, 16, 1): (12, ('u1', 'u2')),
+    (5, 42, 39, 13, 1): (12, ('u1', 'u2')),
+    (5, 44, 36, 14, 1): (13, ('u1', 'u2')),
+    (6, 42, 36, 15, 1): (13, ('u1', 'u2')),
+    (6, 44, 33, 16, 1): (13, ('u1', 'u2')),
+    (6, 44, 36, 13, 1): (13, ('u1', 'u2')),
+    (6, 46, 33, 14, 1): (14, ('u1', 'u2')),
+    (7, 46, 30, 16, 1): (14, ('u1', 'u2')),
+    (7, 46, 33, 13, 1): (14, ('u1', 'u2')),
+    (3, 40, 45, 11, 1): (11, ('u1', 'u2')),
+    (3, 42, 42, 12, 1): (11, ('u1', 'u2')),
+    (3, 42, 45, 9, 1): (11, ('u1', 'u2')),
+    (3, 44, 42, 10, 1): (12, ('u1', 'u2')),
+    (4, 42, 42, 11, 1): (12, ('u1', 'u2')),
+    (4, 44, 39, 12, 1): (12, ('u1', 'u2')),
+    (4, 44, 42, 9, 1): (12, ('u1', 'u2')),
+    (4, 46, 39, 10, 1): (13, ('u1', 'u2')),
+    (5, 44, 39, 11, 1): (13, ('u1', 'u2')),
+    (5, 46, 36, 12, 1): (13, ('u1', 'u2')),
+    (5, 46, 39, 9, 1): (13, ('u1', 'u2')),
+    (5, 48, 36, 10, 1): (14, ('u1', 'u2')),
+    (6, 46, 36, 11, 1): (14, ('u1', 'u2')),
+    (6, 48, 33, 12, 1): (14, ('u1', 'u2')),
+    (6, 48, 36, 9, 1): (14, ('u1', 'u2')),
+    (6, 50, 33, 10, 1): (15, ('u1', 'u2')),
+    (7, 50, 30, 12, 1): (15, ('u1', 'u2')),
+    (7, 50, 33, 9, 1): (15, ('u1', 'u2')),
+    (7, 52, 30, 10, 1): (16, ('u1', 'u2')),
+    (3, 44, 45, 7, 1): (12, ('u1', 'u2')),
+    (3, 46, 42, 8, 1): (12, ('u1', 'u2')),
+    (3, 46, 45, 5, 1): (12, ('u1', 'u2')),
+    (3, 48, 42, 6, 1): (13, ('u1', 'u2')),
+    (4, 46, 42, 7, 1): (13, ('u1', 'u2')),
+    (4, 48, 39, 8, 1): (13, ('u1', 'u2')),
+    (4, 48, 42, 5, 1): (13, ('u1', 'u2')),
+    (4, 50, 39, 6, 1): (14, ('u1', 'u2')),
+    (5, 48, 39, 7, 1): (14, ('u1', 'u2')),
+    (5, 50, 36, 8, 1): (14, ('u1', 'u2')),
+    (5, 50, 39, 5, 1): (14, ('u1', 'u2')),
+    (5, 52, 36, 6, 1): (15, ('u1', 'u2')),
+    (6, 50, 36, 7, 1): (15, ('u1', 'u2')),
+    (6, 52, 33, 8, 1): (15, ('u1', 'u2')),
+    (6, 52, 36, 5, 1): (15, ('u1', 'u2')),
+    (6, 54, 33, 6, 1): (16, ('u1', 'u2')),
+    (7, 52, 33, 7, 1): (16, ('u1', 'u2')),
+    (7, 54, 30, 8, 1): (16, ('u1', 'u2')),
+    (7, 54, 33, 5, 1): (16, ('u1', 'u2')),
+    (7, 56, 30, 6, 1): (17, ('u1', 'u2')),
+    (8, 56, 27, 8, 1): (17, ('u1', 'u2')),
+    (8, 56, 30, 5, 1): (17, ('u1', 'u2')),
+    (3, 48, 45, 3, 1): (13, ('u1', 'u2')),
+    (3, 50, 42, 4, 1): (13, ('u1', 'u2')),
+    (3, 50, 45, 1, 1): (13, ('u1', 'u2')),
+    (3, 52, 42, 2, 1): (14, ('u1', 'u2')),
+    (4, 50, 42, 3, 1): (14, ('u1', 'u2')),
+    (4, 52, 39, 4, 1): (14, ('u1', 'u2')),
+    (4, 52, 42, 1, 1): (14, ('u1', 'u2')),
+    (4, 54, 39, 2, 1): (15, ('u1', 'u2')),
+    (5, 52, 39, 3, 1): (15, ('u1', 'u2')),
+    (5, 54, 36, 4, 1): (15, ('u1', 'u2')),
+    (5, 54, 39, 1, 1): (15, ('u1', 'u2')),
+    (5, 56, 36, 2, 1): (16, ('u1', 'u2')),
+    (6, 54, 36, 3, 1): (16, ('u1', 'u2')),
+    (6, 56, 33, 4, 1): (16, ('u1', 'u2')),
+    (6, 56, 36, 1, 1): (16, ('u1', 'u2')),
+    (6, 58, 33, 2, 1): (17, ('u1', 'u2')),
+    (7, 56, 33, 3, 1): (17, ('u1', 'u2')),
+    (7, 58, 30, 4, 1): (17, ('u1', 'u2')),
+    (7, 58, 33, 1, 1): (17, ('u1', 'u2')),
+    (7, 60, 30, 2, 1): (18, ('u1', 'u2')),
+    (8, 60, 27, 4, 1): (18, ('u1', 'u2')),
+    (8, 60, 30, 1, 1): (18, ('u1', 'u2')),
+    (4, 2, 45, 48, 1): (2, ('u1', 'u2')),
+    (4, 2, 48, 45, 1): (2, ('u1', 'u2')),
+    (4, 4, 45, 46, 1): (3, ('u1', 'u2')),
+    (2, 2, 51, 44, 1): (1, ('u1', 'u2')),
+    (2, 2, 54, 41, 1): (1, ('u1', 'u2')),
+    (3, 6, 48, 42, 1): (2, ('u1', 'u2')),
+    (4, 4, 48, 43, 1): (3, ('u1', 'u2')),
+    (4, 6, 45, 44, 1): (3, ('u1', 'u2')),
+    (4, 6, 48, 41, 1): (3, ('u1', 'u2')),
+    (4, 8, 45, 42, 1): (3, ('u1', 'u2')),
+    (3, 6, 51, 39, 1): (2, ('u1', 'u2')),
+    (3, 10, 48, 38, 1): (3, ('u1', 'u2')),
+    (4, 8, 48, 39, 1): (3, ('u1', 'u2')),
+    (4, 10, 45, 40, 1): (4, ('u1', 'u2')),
+    (4, 10, 48, 37, 1): (4, ('u1', 'u2')),
+    (4, 12, 45, 38, 1): (4, ('u1', 'u2')),
+    (5, 14, 42, 38, 1): (5, ('u1', 'u2')),
+    (3, 10, 51, 35, 1): (3, ('u1', 'u2')),
+    (3, 12, 48, 36, 1): (4, ('u1', 'u2')),
+    (3, 12, 51, 33, 1): (4, ('u1', 'u2')),
+    (3, 14, 48, 34, 1): (4, ('u1', 'u2')),
+    (4, 12, 48, 35, 1): (4, ('u1', 'u2')),
+    (4, 14, 45, 36, 1): (5, ('u1', 'u2')),
+    (4, 14, 48, 33, 1): (5, ('u1', 'u2')),
+    (4, 16, 45, 34, 1): (5, ('u1', 'u2')),
+    (5, 14, 45, 35, 1): (5, ('u1', 'u2')),
+    (5, 18, 42, 34, 1): (6, ('u1', 'u2')),
+    (6, 20, 39, 34, 1): (7, ('u1', 'u2')),
+    (3, 14, 51, 31, 1): (4, ('u1', 'u2')),
+    (3, 16, 48, 32, 1): (5, ('u1', 'u2')),
+    (3, 16, 51, 29, 1): (5, ('u1', 'u2')),
+    (3, 18, 48, 30, 1): (5, ('u1', 'u2')),
+    (4, 16, 48, 31, 1): (5, ('u1', 'u2')),
+    (4, 18, 45, 32, 1): (6, ('u1', 'u2')),
+    (4, 18, 48, 29, 1): (6, ('u1', 'u2')),
+    (4, 20, 45, 30, 1): (6, ('u1', 'u2')),
+    (5, 18, 45, 31, 1): (6, ('u1', 'u2')),
+    (5, 22, 42, 30, 1): (7, ('u1', 'u2')),
+    (6, 20, 42, 31, 1): (7, ('u1', 'u2')),
+    (6, 24, 39, 30, 1): (8, ('u1', 'u2')),
+    (3, 18, 51, 27, 1): (5, ('u1', 'u2')),
+    (3, 20, 48, 28, 1): (6, ('u1', 'u2')),
+    (3, 20, 51, 25, 1): (6, ('u1', 'u2')),
+    (3, 22, 48, 26, 1): (6, ('u1', 'u2')),
+    (4, 20, 48, 27, 1): (6, ('u1', 'u2')),
+    (4, 22, 45, 28, 1): (7, ('u1', 'u2')),
+    (4, 22, 48, 25, 1): (7, ('u1', 'u2')),
+    (4, 24, 45, 26, 1): (7, ('u1', 'u2')),
+    (5, 22, 45, 27, 1): (7, ('u1', 'u2')),
+    (5, 24, 42, 28, 1): (8, ('u1', 'u2')),
+    (5, 24, 45, 25, 1): (8, ('u1', 'u2')),
+    (5, 26, 42, 26, 1): (8, ('u1', 'u2')),
+    (6, 24, 42, 27, 1): (8, ('u1', 'u2')),
+    (6, 28, 39, 26, 1): (9, ('u1', 'u2')),
+    (3, 22, 51, 23, 1): (6, ('u1', 'u2')),
+    (3, 24, 48, 24, 1): (7, ('u1', 'u2')),
+    (3, 24, 51, 21, 1): (7, ('u1', 'u2')),
+    (3, 26, 48, 22, 1): (7, ('u1', 'u2')),
+    (4, 24, 48, 23, 1): (7, ('u1', 'u2')),
+    (4, 26, 45, 24, 1): (8, ('u1', 'u2')),
+    (4, 26, 48, 21, 1): (8, ('u1', 'u2')),
+    (4, 28, 45, 22, 1): (8, ('u1', 'u2')),
+    (5, 26, 45, 23, 1): (8, ('u1', 'u2')),
+    (5, 28, 42, 24, 1): (9, ('u1', 'u2')),
+    (5, 28, 45, 21, 1): (9, ('u1', 'u2')),
+    (5, 30, 42, 22, 1): (9, ('u1', 'u2')),
+    (6, 28, 42, 23, 1): (9, ('u1', 'u2')),
+    (6, 30, 39, 24, 1): (10, ('u1', 'u2')),
+    (6, 30, 42, 21, 1): (10, ('u1', 'u2')),
+    (6, 32, 39, 22, 1): (10, ('u1', 'u2')),
+    (3, 26, 51, 19, 1): (7, ('u1', 'u2')),
+    (3, 28, 48, 20, 1): (8, ('u1', 'u2')),
+    (3, 28, 51, 17, 1): (8, ('u1', 'u2')),
+    (3, 30, 48, 18, 1): (8, ('u1', 'u2')),
+    (4, 28, 48, 19, 1): (8, ('u1', 'u2')),
+    (4, 30, 45, 20, 1): (9, ('u1', 'u2')),
+    (4, 30, 48, 17, 1): (9, ('u1', 'u2')),
+    (4, 32, 45, 18, 1): (9, ('u1', 'u2')),
+    (5, 30, 45, 19, 1): (9, ('u1', 'u2')),
+    (5, 32, 42, 20, 1): (10, ('u1', 'u2')),
+    (5, 32, 45, 17, 1): (10, ('u1', 'u2')),
+    (5, 34, 42, 18, 1): (10, ('u1', 'u2')),
+    (6, 32, 42, 19, 1): (10, ('u1', 'u2')),
+    (6, 34, 39, 20, 1): (11, ('u1', 'u2')),
+    (6, 34, 42, 17, 1): (11, ('u1', 'u2')),
+    (6, 36, 39, 18, 1): (11, ('u1', 'u2')),
+    (3, 30, 51, 15, 1): (8, ('u1', 'u2')),
+    (3, 32, 48, 16, 1): (9, ('u1', 'u2')),
+    (3, 32, 51, 13, 1): (9, ('u1', 'u2')),
+    (3, 34, 48, 14, 1): (9, ('u1', 'u2')),
+    (4, 32, 48, 15, 1): (9, ('u1', 'u2')),
+    (4, 34, 45, 16, 1): (10, ('u1', 'u2')),
+    (4, 34, 48, 13, 1): (10, ('u1', 'u2')),
+    (4, 36, 45, 14, 1): (10, ('u1', 'u2')),
+    (5, 34, 45, 15, 1): (10, ('u1', 'u2')),
+    (5, 36, 42, 16, 1): (11, ('u1', 'u2')),
+    (5, 36, 45, 13, 1): (11, ('u1', 'u2')),
+    (5, 38, 42, 14, 1): (11, ('u1', 'u2')),
+    (6, 36, 42, 15, 1): (11, ('u1', 'u2')),
+    (6, 38, 39, 16, 1): (12, ('u1', 'u2')),
+    (6, 38, 42, 13, 1): (12, ('u1', 'u2')),
+    (6, 40, 39, 14, 1): (12, ('u1', 'u2')),
+    (7, 42, 36, 14, 1): (13, ('u1', 'u2')),
+    (3, 34, 51, 11, 1): (9, ('u1', 'u2')),
+    (3, 36, 48, 12, 1): (10, ('u1', 'u2')),
+    (3, 36, 51, 9, 1): (10, ('u1', 'u2')),
+    (3, 38, 48, 10, 1): (10, ('u1', 'u2')),
+    (4, 36, 48, 11, 1): (10, ('u1', 'u2')),
+    (4, 38, 45, 12, 1): (11, ('u1', 'u2')),
+    (4, 38, 48, 9, 1): (11, ('u1', 'u2')),
+    (4, 40, 45, 10, 1): (11, ('u1', 'u2')),
+    (5, 38, 45, 11, 1): (11, ('u1', 'u2')),
+    (5, 40, 42, 12, 1): (12, ('u1', 'u2')),
+    (5, 40, 45, 9, 1): (12, ('u1', 'u2')),
+    (5, 42, 42, 10, 1): (12, ('u1', 'u2')),
+    (6, 40, 42, 11, 1): (12, ('u1', 'u2')),
+    (6, 42, 39, 12, 1): (13, ('u1', 'u2')),
+    (6, 42, 42, 9, 1): (13, ('u1', 'u2')),
+    (6, 44, 39, 10, 1): (13, ('u1', 'u2')),
+    (7, 42, 39, 11, 1): (13, ('u1', 'u2')),
+    (7, 46, 36, 10, 1): (14, ('u1', 'u2')),
+    (3, 38, 51, 7, 1): (10, ('u1', 'u2')),
+    (3, 40, 48, 8, 1): (11, ('u1', 'u2')),
+    (3, 40, 51, 5, 1): (11, ('u1', 'u2')),
+    (3, 42, 48, 6, 1): (11, ('u1', 'u2')),
+    (4, 40, 48, 7, 1): (11, ('u1', 'u2')),
+    (4, 42, 45, 8, 1): (12, ('u1', 'u2')),
+    (4, 42, 48, 5, 1): (12, ('u1', 'u2')),
+    (4, 44, 45, 6, 1): (12, ('u1', 'u2')),
+    (5, 42, 45, 7, 1): (12, ('u1', 'u2')),
+    (5, 44, 42, 8, 1): (13, ('u1', 'u2')),
+    (5, 44, 45, 5, 1): (13, ('u1', 'u2')),
+    (5, 46, 42, 6, 1): (13, ('u1', 'u2')),
+    (6, 44, 42, 7, 1): (13, ('u1', 'u2')),
+    (6, 46, 39, 8, 1): (14, ('u1', 'u2')),
+    (6, 46, 42, 5, 1): (14, ('u1', 'u2')),
+    (6, 48, 39, 6, 1): (14, ('u1', 'u2')),
+    (7, 46, 39, 7, 1): (14, ('u1', 'u2')),
+    (7, 50, 36, 6, 1): (15, ('u1', 'u2')),
+    (3, 42, 51, 3, 1): (11, ('u1', 'u2')),
+    (3, 44, 48, 4, 1): (12, ('u1', 'u2')),
+    (3, 44, 51, 1, 1): (12, ('u1', 'u2')),
+    (3, 46, 48, 2, 1): (12, ('u1', 'u2')),
+    (4, 44, 48, 3, 1): (12, ('u1', 'u2')),
+    (4, 46, 45, 4, 1): (13, ('u1', 'u2')),
+    (4, 46, 48, 1, 1): (13, ('u1', 'u2')),
+    (4, 48, 45, 2, 1): (13, ('u1', 'u2')),
+    (5, 46, 45, 3, 1): (13, ('u1', 'u2')),
+    (5, 48, 42, 4, 1): (14, ('u1', 'u2')),
+    (5, 48, 45, 1, 1): (14, ('u1', 'u2')),
+    (5, 50, 42, 2, 1): (14, ('u1', 'u2')),
+    (6, 48, 42, 3, 1): (14, ('u1', 'u2')),
+    (6, 50, 39, 4, 1): (15, ('u1', 'u2')),
+    (6, 50, 42, 1, 1): (15, ('u1', 'u2')),
+    (6, 52, 39, 2, 1): (15, ('u1', 'u2')),
+    (7, 50, 39, 3, 1): (15, ('u1', 'u2')),
+    (7, 52, 36, 4, 1): (16, ('u1', 'u2')),
+    (7, 52, 39, 1, 1): (16, ('u1', 'u2')),
+    (7, 54, 36, 2, 1): (16, ('u1', 'u2')),
+    (8, 56, 33, 2, 1): (17, ('u1', 'u2')),
+    (4, 2, 51, 42, 1): (2, ('u1', 'u2')),
+    (2, 2, 57, 38, 1): (1, ('u1', 'u2')),
+    (4, 2, 54, 39, 1): (2, ('u1', 'u2')),
+    (4, 4, 51, 40, 1): (3, ('u1', 'u2')),
+    (4, 4, 54, 37, 1): (3, ('u1', 'u2')),
+    (4, 6, 51, 38, 1): (3, ('u1', 'u2')),
+    (2, 2, 60, 35, 1): (1, ('u1', 'u2')),
+    (3, 6, 54, 36, 1): (2, ('u1', 'u2')),
+    (3, 6, 57, 33, 1): (2, ('u1', 'u2')),
+    (4, 6, 54, 35, 1): (3, ('u1', 'u2')),
+    (4, 8, 51, 36, 1): (3, ('u1', 'u2')),
+    (4, 8, 54, 33, 1): (3, ('u1', 'u2')),
+    (4, 10, 51, 34, 1): (4, ('u1', 'u2')),
+    (3, 10, 54, 32, 1): (3, ('u1', 'u2')),
+    (3, 10, 57, 29, 1): (3, ('u1', 'u2')),
+    (3, 12, 54, 30, 1): (4, ('u1', 'u2')),
+    (4, 10, 54, 31, 1): (4, ('u1', 'u2')),
+    (4, 12, 51, 32, 1): (4, ('u1', 'u2')),
+    (4, 12, 54, 29, 1): (4, ('u1', 'u2')),
+    (4, 14, 51, 30, 1): (5, ('u1', 'u2')),
+    (5, 14, 48, 32, 1): (5, ('u1', 'u2')),
+    (5, 14, 51, 29, 1): (5, ('u1', 'u2')),
+    (3, 12, 57, 27, 1): (4, ('u1', 'u2')),
+    (3, 14, 54, 28, 1): (4, ('u1', 'u2')),
+    (3, 14, 57, 25, 1): (4, ('u1', 'u2')),
+    (3, 16, 54, 26, 1): (5, ('u1', 'u2')),
+    (4, 14, 54, 27, 1): (5, ('u1', 'u2')),
+    (4, 16, 51, 28, 1): (5, ('u1', 'u2')),
+    (4, 16, 54, 25, 1): (5, ('u1', 'u2')),
+    (4, 18, 51, 26, 1): (6, ('u1', 'u2')),
+    (5, 18, 48, 28, 1): (6, ('u1', 'u2')),
+    (5, 18, 51, 25, 1): (6, ('u1', 'u2')),
+    (6, 20, 45, 28, 1): (7, ('u1', 'u2')),
+    (6, 20, 48, 25, 1): (7, ('u1', 'u2')),
+    (3, 16, 57, 23, 1): (5, ('u1', 'u2')),
+    (3, 18, 54, 24, 1): (5, ('u1', 'u2')),
+    (3, 18, 57, 21, 1): (5, ('u1', 'u2')),
+    (3, 20, 54, 22, 1): (6, ('u1', 'u2')),
+    (4, 18, 54, 23, 1): (6, ('u1', 'u2')),
+    (4, 20, 51, 24, 1): (6, ('u1', 'u2')),
+    (4, 20, 54, 21, 1): (6, ('u1', 'u2')),
+    (4, 22, 51, 22, 1): (7, ('u1', 'u2')),
+    (5, 22, 48, 24, 1): (7, ('u1', 'u2')),
+    (5, 22, 51, 21, 1): (7, ('u1', 'u2')),
+    (5, 24, 48, 22, 1): (8, ('u1', 'u2')),
+    (6, 24, 45, 24, 1): (8, ('u1', 'u2')),
+    (6, 24, 48, 21, 1): (8, ('u1', 'u2')),
+    (3, 20, 57, 19, 1): (6, ('u1', 'u2')),
+    (3, 22, 54, 20, 1): (6, ('u1', 'u2')),
+    (3, 22, 57, 17, 1): (6, ('u1', 'u2')),
+    (3, 24, 54, 18, 1): (7, ('u1', 'u2')),
+    (4, 22, 54, 19, 1): (7, ('u1', 'u2')),
+    (4, 24, 51, 20, 1): (7, ('u1', 'u2')),
+    (4, 24, 54, 17, 1): (7, ('u1', 'u2')),
+    (4, 26, 51, 18, 1): (8, ('u1', 'u2')),
+    (5, 24, 51, 19, 1): (8, ('u1', 'u2')),
+    (5, 26, 48, 20, 1): (8, ('u1', 'u2')),
+    (5, 26, 51, 17, 1): (8, ('u1', 'u2')),
+    (5, 28, 48, 18, 1): (9, ('u1', 'u2')),
+    (6, 28, 45, 20, 1): (9, ('u1', 'u2')),
+    (6, 28, 48, 17, 1): (9, ('u1', 'u2')),
+    (6, 30, 45, 18, 1): (10, ('u1', 'u2')),
+    (3, 24, 57, 15, 1): (7, ('u1', 'u2')),
+    (3, 26, 54, 16, 1): (7, ('u1', 'u2')),
+    (3, 26, 57, 13, 1): (7, ('u1', 'u2')),
+    (3, 28, 54, 14, 1): (8, ('u1', 'u2')),
+    (4, 26, 54, 15, 1): (8, ('u1', 'u2')),
+    (4, 28, 51, 16, 1): (8, ('u1', 'u2')),
+    (4, 28, 54, 13, 1): (8, ('u1', 'u2')),
+    (4, 30, 51, 14, 1): (9, ('u1', 'u2')),
+    (5, 28, 51, 15, 1): (9, ('u1', 'u2')),
+    (5, 30, 48, 16, 1): (9, ('u1', 'u2')),
+    (5, 30, 51, 13, 1): (9, ('u1', 'u2')),
+    (5, 32, 48, 14, 1): (10, ('u1', 'u2')),
+    (6, 30, 48, 15, 1): (10, ('u1', 'u2')),
+    (6, 32, 45, 16, 1): (10, ('u1', 'u2')),
+    (6, 32, 48, 13, 1): (10, ('u1', 'u2')),
+    (6, 34, 45, 14, 1): (11, ('u1', 'u2')),
+    (3, 28, 57, 11, 1): (8, ('u1', 'u2')),
+    (3, 30, 54, 12, 1): (8, ('u1', 'u2')),
+    (3, 30, 57, 9, 1): (8, ('u1', 'u2')),
+    (3, 32, 54, 10, 1): (9, ('u1', 'u2')),
+    (4, 30, 54, 11, 1): (9, ('u1', 'u2')),
+    (4, 32, 51, 12, 1): (9, ('u1', 'u2')),
+    (4, 32, 54, 9, 1): (9, ('u1', 'u2')),
+    (4, 34, 51, 10, 1): (10, ('u1', 'u2')),
+    (5, 32, 51, 11, 1): (10, ('u1', 'u2')),
+    (5, 34, 48, 12, 1): (10, ('u1', 'u2')),
+    (5, 34, 51, 9, 1): (10, ('u1', 'u2')),
+    (5, 36, 48, 10, 1): (11, ('u1', 'u2')),
+    (6, 34, 48, 11, 1): (11, ('u1', 'u2')),
+    (6, 36, 45, 12, 1): (11, ('u1', 'u2')),
+    (6, 36, 48, 9, 1): (11, ('u1', 'u2')),
+    (6, 38, 45, 10, 1): (12, ('u1', 'u2')),
+    (3, 32, 57, 7, 1): (9, ('u1', 'u2')),
+    (3, 34, 54, 8, 1): (9, ('u1', 'u2')),
+    (3, 34, 57, 5, 1): (9, ('u1', 'u2')),
+    (3, 36, 54, 6, 1): (10, ('u1', 'u2')),
+    (4, 34, 54, 7, 1): (10, ('u1', 'u2')),
+    (4, 36, 51, 8, 1): (10, ('u1', 'u2')),
+    (4, 36, 54, 5, 1): (10, ('u1', 'u2')),
+    (4, 38, 51, 6, 1): (11, ('u1', 'u2')),
+    (5, 36, 51, 7, 1): (11, ('u1', 'u2')),
+    (5, 38, 48, 8, 1): (11, ('u1', 'u2')),
+    (5, 38, 51, 5, 1): (11, ('u1', 'u2')),
+    (5, 40, 48, 6, 1): (12, ('u1', 'u2')),
+    (6, 38, 48, 7, 1): (12, ('u1', 'u2')),
+    (6, 40, 45, 8, 1): (12, ('u1', 'u2')),
+    (6, 40, 48, 5, 1): (12, ('u1', 'u2')),
+    (6, 42, 45, 6, 1): (13, ('u1', 'u2')),
+    (7, 42, 42, 8, 1): (13, ('u1', 'u2')),
+    (7, 42, 45, 5, 1): (13, ('u1', 'u2')),
+    (3, 36, 57, 3, 1): (10, ('u1', 'u2')),
+    (3, 38, 54, 4, 1): (10, ('u1', 'u2')),
+    (3, 38, 57, 1, 1): (10, ('u1', 'u2')),
+    (3, 40, 54, 2, 1): (11, ('u1', 'u2')),
+    (4, 38, 54, 3, 1): (11, ('u1', 'u2')),
+    (4, 40, 51, 4, 1): (11, ('u1', 'u2')),
+    (4, 40, 54, 1, 1): (11, ('u1', 'u2')),
+    (4, 42, 51, 2, 1): (12, ('u1', 'u2')),
+    (5, 40, 51, 3, 1): (12, ('u1', 'u2')),
+    (5, 42, 48, 4, 1): (12, ('u1', 'u2')),
+    (5, 42, 51, 1, 1): (12, ('u1', 'u2')),
+    (5, 44, 48, 2, 1): (13, ('u1', 'u2')),
+    (6, 42, 48, 3, 1): (13, ('u1', 'u2')),
+    (6, 44, 45, 4, 1): (13, ('u1', 'u2')),
+    (6, 44, 48, 1, 1): (13, ('u1', 'u2')),
+    (6, 46, 45, 2, 1): (14, ('u1', 'u2')),
+    (7, 46, 42, 4, 1): (14, ('u1', 'u2')),
+    (7, 46, 45, 1, 1): (14, ('u1', 'u2')),
+    (4, 2, 57, 36, 1): (2, ('u1', 'u2')),
+    (4, 2, 60, 33, 1): (2, ('u1', 'u2')),
+    (4, 4, 57, 34, 1): (3, ('u1', 'u2')),
+    (2, 2, 63, 32, 1): (1, ('u1', 'u2')),
+    (2, 2, 66, 29, 1): (1, ('u1', 'u2')),
+    (3, 6, 60, 30, 1): (2, ('u1', 'u2')),
+    (4, 4, 60, 31, 1): (3, ('u1', 'u2')),
+    (4, 6, 57, 32, 1): (3, ('u1', 'u2')),
+    (4, 6, 60, 29, 1): (3, ('u1', 'u2')),
+    (4, 8, 57, 30, 1): (3, ('u1', 'u2')),
+    (3, 6, 63, 27, 1): (2, ('u1', 'u2')),
+    (3, 10, 60, 26, 1): (3, ('u1', 'u2')),
+    (4, 8, 60, 27, 1): (3, ('u1', 'u2')),
+    (4, 10, 57, 28, 1): (4, ('u1', 'u2')),
+    (4, 10, 60, 25, 1): (4, ('u1', 'u2')),
+    (4, 12, 57, 26, 1): (4, ('u1', 'u2')),
+    (5, 14, 54, 26, 1): (5, ('u1', 'u2')),
+    (3, 10, 63, 23, 1): (3, ('u1', 'u2')),
+    (3, 12, 60, 24, 1): (4, ('u1', 'u2')),
+    (3, 12, 63, 21, 1): (4, ('u1', 'u2')),
+    (3, 14, 60, 22, 1): (4, ('u1', 'u2')),
+    (4, 12, 60, 23, 1): (4, ('u1', 'u2')),
+    (4, 14, 57, 24, 1): (5, ('u1', 'u2')),
+    (4, 14, 60, 21, 1): (5, ('u1', 'u2')),
+    (4, 16, 57, 22, 1): (5, ('u1', 'u2')),
+    (5, 14, 57, 23, 1): (5, ('u1', 'u2')),
+    (5, 18, 54, 22, 1): (6, ('u1', 'u2')),
+    (6, 20, 51, 22, 1): (7, ('u1', 'u2')),
+    (3, 14, 63, 19, 1): (4, ('u1', 'u2')),
+    (3, 16, 60, 20, 1): (5, ('u1', 'u2')),
+    (3, 16, 63, 17, 1): (5, ('u1', 'u2')),
+    (3, 18, 60, 18, 1): (5, ('u1', 'u2')),
+    (4, 16, 60, 19, 1): (5, ('u1', 'u2')),
+    (4, 18, 57, 20, 1): (6, ('u1', 'u2')),
+    (4, 18, 60, 17, 1): (6, ('u1', 'u2')),
+    (4, 20, 57, 18, 1): (6, ('u1', 'u2')),
+    (5, 18, 57, 19, 1): (6, ('u1', 'u2')),
+    (5, 22, 54, 18, 1): (7, ('u1', 'u2')),
+    (6, 20, 54, 19, 1): (7, ('u1', 'u2')),
+    (6, 24, 51, 18, 1): (8, ('u1', 'u2')),
+    (3, 18, 63, 15, 1): (5, ('u1', 'u2')),
+    (3, 20, 60, 16, 1): (6, ('u1', 'u2')),
+    (3, 20, 63, 13, 1): (6, ('u1', 'u2')),
+    (3, 22, 60, 14, 1): (6, ('u1', 'u2')),
+    (4, 20, 60, 15, 1): (6, ('u1', 'u2')),
+    (4, 22, 57, 16, 1): (7, ('u1', 'u2')),
+    (4, 22, 60, 13, 1): (7, ('u1', 'u2')),
+    (4, 24, 57, 14, 1): (7, ('u1', 'u2')),
+    (5, 22, 57, 15, 1): (7, ('u1', 'u2')),
+    (5, 24, 54, 16, 1): (8, ('u1', 'u2')),
+    (5, 24, 57, 13, 1): (8, ('u1', 'u2')),
+    (5, 26, 54, 14, 1): (8, ('u1', 'u2')),
+    (6, 24, 54, 15, 1): (8, ('u1', 'u2')),
+    (6, 28, 51, 14, 1): (9, ('u1', 'u2')),
+    (3, 22, 63, 11, 1): (6, ('u1', 'u2')),
+    (3, 24, 60, 12, 1): (7, ('u1', 'u2')),
+    (3, 24, 63, 9, 1): (7, ('u1', 'u2')),
+    (3, 26, 60, 10, 1): (7, ('u1', 'u2')),
+    (4, 24, 60, 11, 1): (7, ('u1', 'u2')),
+    (4, 26, 57, 12, 1): (8, ('u1', 'u2')),
+    (4, 26, 60, 9, 1): (8, ('u1', 'u2')),
+    (4, 28, 57, 10, 1): (8, ('u1', 'u2')),
+    (5, 26, 57, 11, 1): (8, ('u1', 'u2')),
+    (5, 28, 54, 12, 1): (9, ('u1', 'u2')),
+    (5, 28, 57, 9, 1): (9, ('u1', 'u2')),
+    (5, 30, 54, 10, 1): (9, ('u1', 'u2')),
+    (6, 28, 54, 11, 1): (9, ('u1', 'u2')),
+    (6, 30, 51, 12, 1): (10, ('u1', 'u2')),
+    (6, 30, 54, 9, 1): (10, ('u1', 'u2')),
+    (6, 32, 51, 10, 1): (10, ('u1', 'u2')),
+    (3, 26, 63, 7, 1): (7, ('u1', 'u2')),
+    (3, 28, 60, 8, 1): (8, ('u1', 'u2')),
+    (3, 28, 63, 5, 1): (8, ('u1', 'u2')),
+    (3, 30, 60, 6, 1): (8, ('u1', 'u2')),
+    (4, 28, 60, 7, 1): (8, ('u1', 'u2')),
+    (4, 30, 57, 8, 1): (9, ('u1', 'u2')),
+    (4, 30, 60, 5, 1): (9, ('u1', 'u2')),
+    (4, 32, 57, 6, 1): (9, ('u1', 'u2')),
+    (5, 30, 57, 7, 1): (9, ('u1', 'u2')),
+    (5, 32, 54, 8, 1): (10, ('u1', 'u2')),
+    (5, 32, 57, 5, 1): (10, ('u1', 'u2')),
+    (5, 34, 54, 6, 1): (10, ('u1', 'u2')),
+    (6, 32, 54, 7, 1): (10, ('u1', 'u2')),
+    (6, 34, 51, 8, 1): (11, ('u1', 'u2')),
+    (6, 34, 54, 5, 1): (11, ('u1', 'u2')),
+    (6, 36, 51, 6, 1): (11, ('u1', 'u2')),
+    (3, 30, 63, 3, 1): (8, ('u1', 'u2')),
+    (3, 32, 60, 4, 1): (9, ('u1', 'u2')),
+    (3, 32, 63, 1, 1): (9, ('u1', 'u2')),
+    (3, 34, 60, 2, 1): (9, ('u1', 'u2')),
+    (4, 32, 60, 3, 1): (9, ('u1', 'u2')),
+    (4, 34, 57, 4, 1): (10, ('u1', 'u2')),
+    (4, 34, 60, 1, 1): (10, ('u1', 'u2')),
+    (4, 36, 57, 2, 1): (10, ('u1', 'u2')),
+    (5, 34, 57, 3, 1): (10, ('u1', 'u2')),
+    (5, 36, 54, 4, 1): (11, ('u1', 'u2')),
+    (5, 36, 57, 1, 1): (11, ('u1', 'u2')),
+    (5, 38, 54, 2, 1): (11, ('u1', 'u2')),
+    (6, 36, 54, 3, 1): (11, ('u1', 'u2')),
+    (6, 38, 51, 4, 1): (12, ('u1', 'u2')),
+    (6, 38, 54, 1, 1): (12, ('u1', 'u2')),
+    (6, 40, 51, 2, 1): (12, ('u1', 'u2')),
+    (7, 42, 48, 2, 1): (13, ('u1', 'u2')),
+    (4, 2, 63, 30, 1): (2, ('u1', 'u2')),
+    (2, 2, 69, 26, 1): (1, ('u1', 'u2')),
+    (4, 2, 66, 27, 1): (2, ('u1', 'u2')),
+    (4, 4, 63, 28, 1): (3, ('u1', 'u2')),
+    (4, 4, 66, 25, 1): (3, ('u1', 'u2')),
+    (4, 6, 63, 26, 1): (3, ('u1', 'u2')),
+    (2, 2, 72, 23, 1): (1, ('u1', 'u2')),
+    (3, 6, 66, 24, 1): (2, ('u1', 'u2')),
+    (3, 6, 69, 21, 1): (2, ('u1', 'u2')),
+    (4, 6, 66, 23, 1): (3, ('u1', 'u2')),
+    (4, 8, 63, 24, 1): (3, ('u1', 'u2')),
+    (4, 8, 66, 21, 1): (3, ('u1', 'u2')),
+    (4, 10, 63, 22, 1): (4, ('u1', 'u2')),
+    (3, 10, 66, 20, 1): (3, ('u1', 'u2')),
+    (3, 10, 69, 17, 1): (3, ('u1', 'u2')),
+    (3, 12, 66, 18, 1): (4, ('u1', 'u2')),
+    (4, 10, 66, 19, 1): (4, ('u1', 'u2')),
+    (4, 12, 63, 20, 1): (4, ('u1', 'u2')),
+    (4, 12, 66, 17, 1): (4, ('u1', 'u2')),
+    (4, 14, 63, 18, 1): (5, ('u1', 'u2')),
+    (5, 14, 60, 20, 1): (5, ('u1', 'u2')),
+    (5, 14, 63, 17, 1): (5, ('u1', 'u2')),
+    (3, 12, 69, 15, 1): (4, ('u1', 'u2')),
+    (3, 14, 66, 16, 1): (4, ('u1', 'u2')),
+    (3, 14, 69, 13, 1): (4, ('u1', 'u2')),
+    (3, 16, 66, 14, 1): (5, ('u1', 'u2')),
+    (4, 14, 66, 15, 1): (5, ('u1', 'u2')),
+    (4, 16, 63, 16, 1): (5, ('u1', 'u2')),
+    (4, 16, 66, 13, 1): (5, ('u1', 'u2')),
+    (4, 18, 63, 14, 1): (6, ('u1', 'u2')),
+    (5, 18, 60, 16, 1): (6, ('u1', 'u2')),
+    (5, 18, 63, 13, 1): (6, ('u1', 'u2')),
+    (6, 20, 57, 16, 1): (7, ('u1', 'u2')),
+    (6, 20, 60, 13, 1): (7, ('u1', 'u2')),
+    (3, 16, 69, 11, 1): (5, ('u1', 'u2')),
+    (3, 18, 66, 12, 1): (5, ('u1', 'u2')),
+    (3, 18, 69, 9, 1): (5, ('u1', 'u2')),
+    (3, 20, 66, 10, 1): (6, ('u1', 'u2')),
+    (4, 18, 66, 11, 1): (6, ('u1', 'u2')),
+    (4, 20, 63, 12, 1): (6, ('u1', 'u2')),
+    (4, 20, 66, 9, 1): (6, ('u1', 'u2')),
+    (4, 22, 63, 10, 1): (7, ('u1', 'u2')),
+    (5, 22, 60, 12, 1): (7, ('u1', 'u2')),
+    (5, 22, 63, 9, 1): (7, ('u1', 'u2')),
+    (5, 24, 60, 10, 1): (8, ('u1', 'u2')),
+    (6, 24, 57, 12, 1): (8, ('u1', 'u2')),
+    (6, 24, 60, 9, 1): (8, ('u1', 'u2')),
+    (3, 20, 69, 7, 1): (6, ('u1', 'u2')),
+    (3, 22, 66, 8, 1): (6, ('u1', 'u2')),
+    (3, 22, 69, 5, 1): (6, ('u1', 'u2')),
+    (3, 24, 66, 6, 1): (7, ('u1', 'u2')),
+    (4, 22, 66, 7, 1): (7, ('u1', 'u2')),
+    (4, 24, 63, 8, 1): (7, ('u1', 'u2')),
+    (4, 24, 66, 5, 1): (7, ('u1', 'u2')),
+    (4, 26, 63, 6, 1): (8, ('u1', 'u2')),
+    (5, 24, 63, 7, 1): (8, ('u1', 'u2')),
+    (5, 26, 60, 8, 1): (8, ('u1', 'u2')),
+    (5, 26, 63, 5, 1): (8, ('u1', 'u2')),
+    (5, 28, 60, 6, 1): (9, ('u1', 'u2')),
+    (6, 28, 57, 8, 1): (9, ('u1', 'u2')),
+    (6, 28, 60, 5, 1): (9, ('u1', 'u2')),
+    (6, 30, 57, 6, 1): (10, ('u1', 'u2')),
+    (3, 24, 69, 3, 1): (7, ('u1', 'u2')),
+    (3, 26, 66, 4, 1): (7, ('u1', 'u2')),
+    (3, 26, 69, 1, 1): (7, ('u1', 'u2')),
+    (3, 28, 66, 2, 1): (8, ('u1', 'u2')),
+    (4, 26, 66, 3, 1): (8, ('u1', 'u2')),
+    (4, 28, 63, 4, 1): (8, ('u1', 'u2')),
+    (4, 28, 66, 1, 1): (8, ('u1', 'u2')),
+    (4, 30, 63, 2, 1): (9, ('u1', 'u2')),
+    (5, 28, 63, 3, 1): (9, ('u1', 'u2')),
+    (5, 30, 60, 4, 1): (9, ('u1', 'u2')),
+    (5, 30, 63, 1, 1): (9, ('u1', 'u2')),
+    (5, 32, 60, 2, 1): (10, ('u1', 'u2')),
+    (6, 30, 60, 3, 1): (10, ('u1', 'u2')),
+    (6, 32, 57, 4, 1): (10, ('u1', 'u2')),
+    (6, 32, 60, 1, 1): (10, ('u1', 'u2')),
+    (6, 34, 57, 2, 1): (11, ('u1', 'u2')),
+    (4, 2, 69, 24, 1): (2, ('u1', 'u2')),
+    (4, 2, 72, 21, 1): (2, ('u1', 'u2')),
+    (4, 4, 69, 22, 1): (3, ('u1', 'u2')),
+    (2, 2, 75, 20, 1): (1, ('u1', 'u2')),
+    (2, 2, 78, 17, 1): (1, ('u1', 'u2')),
+    (3, 6, 72, 18, 1): (2, ('u1', 'u2')),
+    (4, 4, 72, 19, 1): (3, ('u1', 'u2')),
+    (4, 6, 69, 20, 1): (3, ('u1', 'u2')),
+    (4, 6, 72, 17, 1): (3, ('u1', 'u2')),
+    (4, 8, 69, 18, 1): (3, ('u1', 'u2')),
+    (3, 6, 75, 15, 1): (2, ('u1', 'u2')),
+    (3, 10, 72, 14, 1): (3, ('u1', 'u2')),
+    (4, 8, 72, 15, 1): (3, ('u1', 'u2')),
+    (4, 10, 69, 16, 1): (4, ('u1', 'u2')),
+    (4, 10, 72, 13, 1): (4, ('u1', 'u2')),
+    (4, 12, 69, 14, 1): (4, ('u1', 'u2')),
+    (5, 14, 66, 14, 1): (5, ('u1', 'u2')),
+    (3, 10, 75, 11, 1): (3, ('u1', 'u2')),
+    (3, 12, 72, 12, 1): (4, ('u1', 'u2')),
+    (3, 12, 75, 9, 1): (4, ('u1', 'u2')),
+    (3, 14, 72, 10, 1): (4, ('u1', 'u2')),
+    (4, 12, 72, 11, 1): (4, ('u1', 'u2')),
+    (4, 14, 69, 12, 1): (5, ('u1', 'u2')),
+    (4, 14, 72, 9, 1): (5, ('u1', 'u2')),
+    (4, 16, 69, 10, 1): (5, ('u1', 'u2')),
+    (5, 14, 69, 11, 1): (5, ('u1', 'u2')),
+    (5, 18, 66, 10, 1): (6, ('u1', 'u2')),
+    (6, 20, 63, 10, 1): (7, ('u1', 'u2')),
+    (3, 14, 75, 7, 1): (4, ('u1', 'u2')),
+    (3, 16, 72, 8, 1): (5, ('u1', 'u2')),
+    (3, 16, 75, 5, 1): (5, ('u1', 'u2')),
+    (3, 18, 72, 6, 1): (5, ('u1', 'u2')),
+    (4, 16, 72, 7, 1): (5, ('u1', 'u2')),
+    (4, 18, 69, 8, 1): (6, ('u1', 'u2')),
+    (4, 18, 72, 5, 1): (6, ('u1', 'u2')),
+    (4, 20, 69, 6, 1): (6, ('u1', 'u2')),
+    (5, 18, 69, 7, 1): (6, ('u1', 'u2')),
+    (5, 22, 66, 6, 1): (7, ('u1', 'u2')),
+    (6, 20, 66, 7, 1): (7, ('u1', 'u2')),
+    (6, 24, 63, 6, 1): (8, ('u1', 'u2')),
+    (3, 18, 75, 3, 1): (5, ('u1', 'u2')),
+    (3, 20, 72, 4, 1): (6, ('u1', 'u2')),
+    (3, 20, 75, 1, 1): (6, ('u1', 'u2')),
+    (3, 22, 72, 2, 1): (6, ('u1', 'u2')),
+    (4, 20, 72, 3, 1): (6, ('u1', 'u2')),
+    (4, 22, 69, 4, 1): (7, ('u1', 'u2')),
+    (4, 22, 72, 1, 1): (7, ('u1', 'u2')),
+    (4, 24, 69, 2, 1): (7, ('u1', 'u2')),
+    (5, 22, 69, 3, 1): (7, ('u1', 'u2')),
+    (5, 24, 66, 4, 1): (8, ('u1', 'u2')),
+    (5, 24, 69, 1, 1): (8, ('u1', 'u2')),
+    (5, 26, 66, 2, 1): (8, ('u1', 'u2')),
+    (6, 24, 66, 3, 1): (8, ('u1', 'u2')),
+    (6, 28, 63, 2, 1): (9, ('u1', 'u2')),
+    (4, 2, 75, 18, 1): (2, ('u1', 'u2')),
+    (2, 2, 81, 14, 1): (1, ('u1', 'u2')),
+    (4, 2, 78, 15, 1): (2, ('u1', 'u2')),
+    (4, 4, 75, 16, 1): (3, ('u1', 'u2')),
+    (4, 4, 78, 13, 1): (3, ('u1', 'u2')),
+    (4, 6, 75, 14, 1): (3, ('u1', 'u2')),
+    (2, 2, 84, 11, 1): (1, ('u1', 'u2')),
+    (3, 6, 78, 12, 1): (2, ('u1', 'u2')),
+    (3, 6, 81, 9, 1): (2, ('u1', 'u2')),
+    (4, 6, 78, 11, 1): (3, ('u1', 'u2')),
+    (4, 8, 75, 12, 1): (3, ('u1', 'u2')),
+    (4, 8, 78, 9, 1): (3, ('u1', 'u2')),
+    (4, 10, 75, 10, 1): (4, ('u1', 'u2')),
+    (3, 10, 78, 8, 1): (3, ('u1', 'u2')),
+    (3, 10, 81, 5, 1): (3, ('u1', 'u2')),
+    (3, 12, 78, 6, 1): (4, ('u1', 'u2')),
+    (4, 10, 78, 7, 1): (4, ('u1', 'u2')),
+    (4, 12, 75, 8, 1): (4, ('u1', 'u2')),
+    (4, 12, 78, 5, 1): (4, ('u1', 'u2')),
+    (4, 14, 75, 6, 1): (5, ('u1', 'u2')),
+    (5, 14, 72, 8, 1): (5, ('u1', 'u2')),
+    (5, 14, 75, 5, 1): (5, ('u1', 'u2')),
+    (3, 12, 81, 3, 1): (4, ('u1', 'u2')),
+    (3, 14, 78, 4, 1): (4, ('u1', 'u2')),
+    (3, 14, 81, 1, 1): (4, ('u1', 'u2')),
+    (3, 16, 78, 2, 1): (5, ('u1', 'u2')),
+    (4, 14, 78, 3, 1): (5, ('u1', 'u2')),
+    (4, 16, 75, 4, 1): (5, ('u1', 'u2')),
+    (4, 16, 78, 1, 1): (5, ('u1', 'u2')),
+    (4, 18, 75, 2, 1): (6, ('u1', 'u2')),
+    (5, 18, 72, 4, 1): (6, ('u1', 'u2')),
+    (5, 18, 75, 1, 1): (6, ('u1', 'u2')),
+    (6, 20, 69, 4, 1): (7, ('u1', 'u2')),
+    (6, 20, 72, 1, 1): (7, ('u1', 'u2')),
+    (4, 2, 81, 12, 1): (2, ('u1', 'u2')),
+    (4, 2, 84, 9, 1): (2, ('u1', 'u2')),
+    (4, 4, 81, 10, 1): (3, ('u1', 'u2')),
+    (2, 2, 87, 8, 1): (1, ('u1', 'u2')),
+    (2, 2, 90, 5, 1): (1, ('u1', 'u2')),
+    (3, 6, 84, 6, 1): (2, ('u1', 'u2')),
+    (4, 4, 84, 7, 1): (3, ('u1', 'u2')),
+    (4, 6, 81, 8, 1): (3, ('u1', 'u2')),
+    (4, 6, 84, 5, 1): (3, ('u1', 'u2')),
+    (4, 8, 81, 6, 1): (3, ('u1', 'u2')),
+    (3, 6, 87, 3, 1): (2, ('u1', 'u2')),
+    (3, 10, 84, 2, 1): (3, ('u1', 'u2')),
+    (4, 8, 84, 3, 1): (3, ('u1', 'u2')),
+    (4, 10, 81, 4, 1): (4, ('u1', 'u2')),
+    (4, 10, 84, 1, 1): (4, ('u1', 'u2')),
+    (4, 12, 81, 2, 1): (4, ('u1', 'u2')),
+    (5, 14, 78, 2, 1): (5, ('u1', 'u2')),
+    (4, 2, 87, 6, 1): (2, ('u1', 'u2')),
+    (2, 2, 93, 2, 1): (1, ('u1', 'u2')),
+    (4, 2, 90, 3, 1): (2, ('u1', 'u2')),
+    (4, 4, 87, 4, 1): (3, ('u1', 'u2')),
+    (4, 4, 90, 1, 1): (3, ('u1', 'u2')),
+    (4, 6, 87, 2, 1): (3, ('u1', 'u2')),
+    (3, 94, 0, 2, 1): (24, ('u1', 'u2')),
+    (4, 92, 0, 3, 1): (24, ('u1', 'u2')),
+    (4, 94, 0, 1, 1): (25, ('u1', 'u2')),
+    (5, 92, 0, 2, 1): (25, ('u1', 'u2')),
+    (6, 90, 0, 3, 1): (25, ('u1', 'u2')),
+    (6, 92, 0, 1, 1): (25, ('u1', 'u2')),
+    (7, 90, 0, 2, 1): (25, ('u1', 'u2')),
+    (8, 88, 0, 3, 1): (25, ('u1', 'u2')),
+    (8, 90, 0, 1, 1): (26, ('u1', 'u2')),
+    (0, 0, 6, 94, 0): (1, ('u3', 'u3')),
+    (0, 2, 6, 92, 0): (1, ('u3', 'u3')),
+    (0, 4, 6, 90, 0): (1, ('u3', 'u3')),
+    (0, 6, 6, 88, 0): (1, ('u3', 'u3')),
+    (0, 8, 6, 86, 0): (1, ('u3', 'u3')),
+    (0, 10, 6, 84, 0): (1, ('u3', 'u3')),
+    (0, 12, 6, 82, 0): (1, ('u3', 'u3')),
+    (0, 14, 6, 80, 0): (1, ('u3', 'u3')),
+    (0, 16, 6, 78, 0): (1, ('u3', 'u3')),
+    (0, 18, 6, 76, 0): (1, ('u3', 'u3')),
+    (0, 20, 6, 74, 0): (1, ('u3', 'u3')),
+    (0, 22, 6, 72, 0): (1, ('u3', 'u3')),
+    (0, 24, 6, 70, 0): (1, ('u3', 'u3')),
+    (0, 0, 9, 91, 0): (1, ('u3', 'u3')),
+    (0, 2, 9, 89, 0): (1, ('u3', 'u3')),
+    (0, 4, 9, 87, 0): (1, ('u3', 'u3')),
+    (0, 6, 9, 85, 0): (1, ('u3', 'u3')),
+    (0, 8, 9, 83, 0): (1, ('u3', 'u3')),
+    (0, 10, 9, 81, 0): (1, ('u3', 'u3')),
+    (0, 12, 9, 79, 0): (1, ('u3', 'u3')),
+    (0, 14, 9, 77, 0): (1, ('u3', 'u3')),
+    (0, 16, 9, 75, 0): (1, ('u3', 'u3')),
+    (0, 18, 9, 73, 0): (1, ('u3', 'u3')),
+    (0, 20, 9, 71, 0): (1, ('u3', 'u3')),
+    (0, 22, 9, 69, 0): (1, ('u3', 'u3')),
+    (0, 24, 9, 67, 0): (1, ('u3', 'u3')),
+    (0, 0, 12, 88, 0): (2, ('u3', 'u3')),
+    (0, 2, 12, 86, 0): (2, ('u3', 'u3')),
+    (0, 4, 12, 84, 0): (2, ('u3', 'u3')),
+    (0, 6, 12, 82, 0): (2, ('u3', 'u3')),
+    (0, 8, 12, 80, 0): (2, ('u3', 'u3')),
+    (0, 10, 12, 78, 0): (2, ('u3', 'u3')),
+    (0, 12, 12, 76, 0): (2, ('u3', 'u3')),
+    (0, 14, 12, 74, 0): (2, ('u3', 'u3')),
+    (0, 16, 12, 72, 0): (2, ('u3', 'u3')),
+    (0, 18, 12, 70, 0): (2, ('u3', 'u3')),
+    (0, 20, 12, 68, 0): (2, ('u3', 'u3')),
+    (0, 22, 12, 66, 0): (2, ('u3', 'u3')),
+    (0, 24, 12, 64, 0): (2, ('u3', 'u3')),
+    (0, 0, 15, 85, 0): (2, ('u3', 'u3')),
+    (0, 2, 15, 83, 0): (2, ('u3', 'u3')),
+    (0, 4, 15, 81, 0): (2, ('u3', 'u3')),
+    (0, 6, 15, 79, 0): (2, ('u3', 'u3')),
+    (0, 8, 15, 77, 0): (2, ('u3', 'u3')),
+    (0, 10, 15, 75, 0): (2, ('u3', 'u3')),
+    (0, 12, 15, 73, 0): (2, ('u3', 'u3')),
+    (0, 14, 15, 71, 0): (2, ('u3', 'u3')),
+    (0, 16, 15, 69, 0): (2, ('u3', 'u3')),
+    (0, 18, 15, 67, 0): (2, ('u3', 'u3')),
+    (0, 20, 15, 65, 0): (2, ('u3', 'u3')),
+    (0, 22, 15, 63, 0): (2, ('u3', 'u3')),
+    (0, 24, 15, 61, 0): (2, ('u3', 'u3')),
+    (0, 0, 18, 82, 0): (3, ('u3', 'u3')),
+    (0, 2, 18, 80, 0): (3, ('u3', 'u3')),
+    (0, 4, 18, 78, 0): (3, ('u3', 'u3')),
+    (0, 6, 18, 76, 0): (3, ('u3', 'u3')),
+    (0, 8, 18, 74, 0): (3, ('u3', 'u3')),
+    (0, 10, 18, 72, 0): (3, ('u3', 'u3')),
+    (0, 12, 18, 70, 0): (3, ('u3', 'u3')),
+    (0, 14, 18, 68, 0): (3, ('u3', 'u3')),
+    (0, 16, 18, 66, 0): (3, ('u3', 'u3')),
+    (0, 18, 18, 64, 0): (3, ('u3', 'u3')),
+    (0, 20, 18, 62, 0): (3, ('u3', 'u3')),
+    (0, 22, 18, 60, 0): (3, ('u3', 'u3')),
+    (0, 24, 18, 58, 0): (3, ('u3', 'u3')),
+    (0, 0, 21, 79, 0): (3, ('u3', 'u3')),
+    (0, 2, 21, 77, 0): (3, ('u3', 'u3')),
+    (0, 4, 21, 75, 0): (3, ('u3', 'u3')),
+    (0, 6, 21, 73, 0): (3, ('u3', 'u3')),
+    (0, 8, 21, 71, 0): (3, ('u3', 'u3')),
+    (0, 10, 21, 69, 0): (3, ('u3', 'u3')),
+    (0, 12, 21, 67, 0): (3, ('u3', 'u3')),
+    (0, 14, 21, 65, 0): (3, ('u3', 'u3')),
+    (0, 16, 21, 63, 0): (3, ('u3', 'u3')),
+    (0, 18, 21, 61, 0): (3, ('u3', 'u3')),
+    (0, 20, 21, 59, 0): (3, ('u3', 'u3')),
+    (0, 22, 21, 57, 0): (3, ('u3', 'u3')),
+    (0, 24, 21, 55, 0): (3, ('u3', 'u3')),
+    (0, 0, 24, 76, 0): (4, ('u3', 'u3')),
+    (0, 2, 24, 74, 0): (4, ('u3', 'u3')),
+    (0, 4, 24, 72, 0): (4, ('u3', 'u3')),
+    (0, 6, 24, 70, 0): (4, ('u3', 'u3')),
+    (0, 8, 24, 68, 0): (4, ('u3', 'u3')),
+    (0, 10, 24, 66, 0): (4, ('u3', 'u3')),
+    (0, 12, 24, 64, 0): (4, ('u3', 'u3')),
+    (0, 14, 24, 62, 0): (4, ('u3', 'u3')),
+    (0, 16, 24, 60, 0): (4, ('u3', 'u3')),
+    (0, 18, 24, 58, 0): (4, ('u3', 'u3')),
+    (0, 20, 24, 56, 0): (4, ('u3', 'u3')),
+    (0, 22, 24, 54, 0): (4, ('u3', 'u3')),
+    (0, 24, 24, 52, 0): (4, ('u3', 'u3')),
+    (1, 0, 6, 93, 0): (1, ('u3', 'u3')),
+    (1, 0, 9, 90, 0): (1, ('u3', 'u3')),
+    (2, 0, 6, 92, 0): (1, ('u3', 'u3')),
+    (2, 0, 9, 89, 0): (1, ('u3', 'u3')),
+    (1, 2, 3, 94, 0): (1, ('u1', 'u3')),
+    (1, 2, 6, 91, 0): (1, ('u3', 'u3')),
+    (1, 0, 12, 87, 0): (2, ('u3', 'u3')),
+    (1, 0, 15, 84, 0): (2, ('u3', 'u3')),
+    (1, 2, 9, 88, 0): (2, ('u3', 'u3')),
+    (1, 2, 12, 85, 0): (2, ('u3', 'u3')),
+    (2, 0, 12, 86, 0): (2, ('u3', 'u3')),
+    (2, 2, 12, 84, 0): (2, ('u2', 'u3')),
+    (2, 4, 0, 94, 0): (2, ('u1', 'u2')),
+    (2, 6, 0, 92, 0): (2, ('u1', 'u2')),
+    (2, 4, 3, 91, 0): (2, ('u1', 'u2')),
+    (2, 4, 6, 88, 0): (2, ('u1', 'u3')),
+    (1, 6, 9, 84, 0): (2, ('u1', 'u3')),
+    (1, 4, 12, 83, 0): (2, ('u1', 'u3')),
+    (1, 6, 12, 81, 0): (2, ('u1', 'u3')),
+    (1, 2, 15, 82, 0): (3, ('u3', 'u3')),
+    (2, 8, 0, 90, 0): (3, ('u1', 'u2')),
+    (2, 10, 0, 88, 0): (3, ('u1', 'u2')),
+    (1, 8, 6, 85, 0): (2, ('u1', 'u2')),
+    (2, 8, 3, 87, 0): (3, ('u1', 'u2')),
+    (1, 6, 15, 78, 0): (3, ('u1', 'u3')),
+    (1, 8, 12, 79, 0): (3, ('u1', 'u3')),
+    (1, 8, 15, 76, 0): (3, ('u1', 'u3')),
+    (1, 10, 9, 80, 0): (3, ('u1', 'u3')),
+    (1, 10, 12, 77, 0): (3, ('u1', 'u3')),
+    (1, 10, 15, 74, 0): (3, ('u1', 'u3')),
+    (2, 0, 15, 83, 0): (2, ('u3', 'u3')),
+    (1, 0, 18, 81, 0): (3, ('u3', 'u3')),
+    (1, 2, 18, 79, 0): (3, ('u3', 'u3')),
+    (1, 4, 18, 77, 0): (3, ('u1', 'u3')),
+    (1, 6, 18, 75, 0): (3, ('u1', 'u3')),
+    (1, 8, 18, 73, 0): (3, ('u1', 'u3')),
+    (1, 10, 18, 71, 0): (3, ('u1', 'u3')),
+    (1, 0, 21, 78, 0): (3, ('u3', 'u3')),
+    (2, 0, 18, 80, 0): (3, ('u3', 'u3')),
+    (2, 2, 18, 78, 0): (3, ('u2', 'u3')),
+    (1, 2, 21, 76, 0): (4, ('u3', 'u3')),
+    (1, 4, 21, 74, 0): (4, ('u1', 'u3')),
+    (1, 6, 21, 72, 0): (4, ('u1', 'u3')),
+    (1, 8, 21, 70, 0): (4, ('u1', 'u3')),
+    (1, 12, 6, 81, 0): (3, ('u1', 'u2')),
+    (1, 12, 9, 78, 0): (3, ('u1', 'u2')),
+    (2, 12, 0, 86, 0): (4, ('u1', 'u2')),
+    (2, 14, 0, 84, 0): (4, ('u1', 'u2')),
+    (2, 12, 3, 83, 0): (4, ('u1', 'u2')),
+    (1, 12, 12, 75, 0): (4, ('u1', 'u3')),
+    (1, 12, 15, 72, 0): (4, ('u1', 'u3')),
+    (1, 14, 9, 76, 0): (4, ('u1', 'u3')),
+    (1, 14, 12, 73, 0): (4, ('u1', 'u3')),
+    (1, 10, 21, 68, 0): (4, ('u1', 'u3')),
+    (1, 12, 18, 69, 0): (4, ('u1', 'u3')),
+    (1, 12, 21, 66, 0): (4, ('u1', 'u3')),
+    (1, 14, 15, 70, 0): (4, ('u1', 'u3')),
+    (1, 14, 18, 67, 0): (4, ('u1', 'u3')),
+    (1, 14, 21, 64, 0): (4, ('u1', 'u3')),
+    (2, 0, 21, 77, 0): (3, ('u3', 'u3')),
+    (0, 0, 27, 73, 0): (4, ('u3', 'u3')),
+    (1, 0, 24, 75, 0): (4, ('u3', 'u3')),
+    (1, 2, 24, 73, 0): (4, ('u3', 'u3')),
+    (2, 2, 21, 75, 0): (4, ('u2', 'u3')),
+    (0, 2, 27, 71, 0): (4, ('u3', 'u3')),
+    (0, 4, 27, 69, 0): (4, ('u3', 'u3')),
+    (1, 4, 24, 71, 0): (4, ('u1', 'u3')),
+    (1, 6, 24, 69, 0): (4, ('u1', 'u3')),
+    (0, 6, 27, 67, 0): (4, ('u3', 'u3')),
+    (0, 8, 27, 65, 0): (4, ('u3', 'u3')),
+    (1, 8, 24, 67, 0): (4, ('u1', 'u3')),
+    (1, 10, 24, 65, 0): (4, ('u1', 'u3')),
+    (0, 10, 27, 63, 0): (4, ('u3', 'u3')),
+    (0, 12, 27, 61, 0): (4, ('u3', 'u3')),
+    (1, 12, 24, 63, 0): (4, ('u1', 'u3')),
+    (1, 14, 24, 61, 0): (4, ('u1', 'u3')),
+    (1, 0, 27, 72, 0): (4, ('u3', 'u3')),
+    (2, 0, 24, 74, 0): (4, ('u3', 'u3')),
+    (2, 2, 24, 72, 0): (4, ('u2', 'u3')),
+    (0, 0, 30, 70, 0): (5, ('u3', 'u3')),
+    (0, 2, 30, 68, 0): (5, ('u3', 'u3')),
+    (1, 2, 27, 70, 0): (5, ('u3', 'u3')),
+    (1, 4, 27, 68, 0): (5, ('u1', 'u3')),
+    (0, 4, 30, 66, 0): (5, ('u3', 'u3')),
+    (0, 6, 30, 64, 0): (5, ('u3', 'u3')),
+    (1, 6, 27, 66, 0): (5, ('u1', 'u3')),
+    (1, 8, 27, 64, 0): (5, ('u1', 'u3')),
+    (0, 8, 30, 62, 0): (5, ('u3', 'u3')),
+    (0, 10, 30, 60, 0): (5, ('u3', 'u3')),
+    (1, 10, 27, 62, 0): (5, ('u1', 'u3')),
+    (1, 12, 27, 60, 0): (5, ('u1', 'u3')),
+    (1, 16, 6, 77, 0): (4, ('u1', 'u2')),
+    (1, 16, 9, 74, 0): (4, ('u1', 'u2')),
+    (2, 16, 0, 82, 0): (5, ('u1', 'u2')),
+    (2, 18, 0, 80, 0): (5, ('u1', 'u2')),
+    (2, 16, 3, 79, 0): (5, ('u1', 'u2')),
+    (1, 18, 6, 75, 0): (5, ('u1', 'u2')),
+    (1, 16, 12, 71, 0): (4, ('u1', 'u2')),
+    (1, 16, 15, 68, 0): (5, ('u1', 'u3')),
+    (1, 18, 9, 72, 0): (5, ('u1', 'u2')),
+    (1, 18, 12, 69, 0): (5, ('u1', 'u3')),
+    (1, 16, 18, 65, 0): (5, ('u1', 'u3')),
+    (1, 16, 21, 62, 0): (5, ('u1', 'u3')),
+    (1, 18, 15, 66, 0): (5, ('u1', 'u3')),
+    (1, 18, 18, 63, 0): (5, ('u1', 'u3')),
+    (0, 14, 27, 59, 0): (4, ('u3', 'u3')),
+    (0, 16, 27, 57, 0): (4, ('u3', 'u3')),
+    (0, 12, 30, 58, 0): (5, ('u3', 'u3')),
+    (0, 14, 30, 56, 0): (5, ('u3', 'u3')),
+    (1, 14, 27, 58, 0): (5, ('u1', 'u3')),
+    (1, 16, 24, 59, 0): (5, ('u1', 'u3')),
+    (1, 16, 27, 56, 0): (5, ('u1', 'u3')),
+    (1, 18, 21, 60, 0): (5, ('u1', 'u3')),
+    (1, 18, 24, 57, 0): (5, ('u1', 'u3')),
+    (1, 20, 6, 73, 0): (5, ('u1', 'u2')),
+    (1, 20, 9, 70, 0): (5, ('u1', 'u2')),
+    (1, 20, 12, 67, 0): (5, ('u1', 'u2')),
+    (1, 20, 15, 64, 0): (5, ('u1', 'u2')),
+    (2, 20, 0, 78, 0): (6, ('u1', 'u2')),
+    (2, 22, 0, 76, 0): (6, ('u1', 'u2')),
+    (2, 20, 3, 75, 0): (6, ('u1', 'u2')),
+    (1, 22, 6, 71, 0): (6, ('u1', 'u2')),
+    (2, 22, 3, 73, 0): (6, ('u1', 'u2')),
+    (1, 22, 9, 68, 0): (6, ('u1', 'u2')),
+    (1, 22, 12, 65, 0): (6, ('u1', 'u2')),
+    (1, 20, 18, 61, 0): (6, ('u1', 'u3')),
+    (1, 20, 21, 58, 0): (6, ('u1', 'u3')),
+    (1, 22, 15, 62, 0): (6, ('u1', 'u3')),
+    (1, 22, 18, 59, 0): (6, ('u1', 'u3')),
+    (0, 18, 27, 55, 0): (4, ('u3', 'u3')),
+    (0, 16, 30, 54, 0): (5, ('u3', 'u3')),
+    (0, 18, 30, 52, 0): (5, ('u3', 'u3')),
+    (0, 20, 27, 53, 0): (4, ('u3', 'u3')),
+    (1, 18, 27, 54, 0): (5, ('u1', 'u3')),
+    (1, 20, 24, 55, 0): (6, ('u1', 'u3')),
+    (1, 20, 27, 52, 0): (6, ('u1', 'u3')),
+    (1, 22, 21, 56, 0): (6, ('u1', 'u3')),
+    (1, 22, 24, 53, 0): (6, ('u1', 'u3')),
+    (0, 26, 6, 68, 0): (1, ('u3', 'u3')),
+    (0, 26, 9, 65, 0): (1, ('u3', 'u3')),
+    (0, 26, 12, 62, 0): (2, ('u3', 'u3')),
+    (0, 26, 15, 59, 0): (2, ('u3', 'u3')),
+    (0, 26, 18, 56, 0): (3, ('u3', 'u3')),
+    (1, 24, 6, 69, 0): (6, ('u1', 'u2')),
+    (1, 24, 9, 66, 0): (6, ('u1', 'u2')),
+    (1, 24, 12, 63, 0): (6, ('u1', 'u2')),
+    (1, 24, 15, 60, 0): (6, ('u1', 'u2')),
+    (1, 24, 18, 57, 0): (6, ('u1', 'u2')),
+    (0, 26, 21, 53, 0): (3, ('u3', 'u3')),
+    (1, 26, 6, 67, 0): (7, ('u1', 'u2')),
+    (1, 26, 9, 64, 0): (7, ('u1', 'u2')),
+    (1, 26, 12, 61, 0): (7, ('u1', 'u2')),
+    (1, 26, 15, 58, 0): (7, ('u1', 'u2')),
+    (1, 24, 21, 54, 0): (7, ('u1', 'u3')),
+    (1, 26, 18, 55, 0): (7, ('u1', 'u3')),
+    (1, 26, 21, 52, 0): (7, ('u1', 'u3')),
+    (3, 0, 3, 94, 0): (1, ('u1', 'u3')),
+    (3, 0, 6, 91, 0): (1, ('u3', 'u3')),
+    (3, 0, 9, 88, 0): (2, ('u3', 'u3')),
+    (3, 0, 12, 85, 0): (2, ('u3', 'u3')),
+    (3, 0, 15, 82, 0): (3, ('u3', 'u3')),
+    (3, 4, 0, 93, 0): (2, ('u2', 'u2')),
+    (3, 4, 3, 90, 0): (2, ('u2', 'u2')),
+    (3, 2, 6, 89, 0): (2, ('u1', 'u2')),
+    (3, 2, 9, 86, 0): (2, ('u2', 'u3')),
+    (3, 4, 6, 87, 0): (2, ('u2', 'u2')),
+    (3, 4, 9, 84, 0): (3, ('u2', 'u2')),
+    (3, 2, 12, 83, 0): (3, ('u2', 'u3')),
+    (3, 2, 15, 80, 0): (3, ('u2', 'u3')),
+    (3, 4, 12, 81, 0): (3, ('u2', 'u2')),
+    (3, 4, 15, 78, 0): (4, ('u2', 'u2')),
+    (3, 8, 0, 89, 0): (3, ('u2', 'u2')),
+    (3, 8, 3, 86, 0): (3, ('u2', 'u2')),
+    (3, 6, 6, 85, 0): (3, ('u2', 'u2')),
+    (3, 6, 9, 82, 0): (3, ('u2', 'u2')),
+    (3, 8, 6, 83, 0): (3, ('u2', 'u2')),
+    (3, 8, 9, 80, 0): (4, ('u2', 'u2')),
+    (3, 6, 15, 76, 0): (4, ('u2', 'u2')),
+    (3, 8, 12, 77, 0): (4, ('u2', 'u2')),
+    (3, 0, 18, 79, 0): (3, ('u3', 'u3')),
+    (3, 2, 18, 77, 0): (4, ('u2', 'u3')),
+    (3, 4, 18, 75, 0): (4, ('u2', 'u2')),
+    (3, 0, 21, 76, 0): (4, ('u3', 'u3')),
+    (3, 2, 21, 74, 0): (4, ('u2', 'u3')),
+    (3, 4, 21, 72, 0): (5, ('u2', 'u2')),
+    (3, 12, 0, 85, 0): (4, ('u2', 'u2')),
+    (3, 12, 3, 82, 0): (4, ('u2', 'u2')),
+    (3, 10, 9, 78, 0): (4, ('u2', 'u2')),
+    (3, 12, 6, 79, 0): (4, ('u2', 'u2')),
+    (3, 12, 9, 76, 0): (4, ('u1', 'u2')),
+    (3, 12, 12, 73, 0): (4, ('u1', 'u2')),
+    (3, 16, 0, 81, 0): (5, ('u2', 'u2')),
+    (3, 16, 3, 78, 0): (5, ('u2', 'u2')),
+    (3, 16, 6, 75, 0): (5, ('u2', 'u2')),
+    (3, 16, 9, 72, 0): (5, ('u1', 'u2')),
+    (3, 16, 12, 69, 0): (5, ('u1', 'u2')),
+    (3, 16, 15, 66, 0): (5, ('u1', 'u2')),
+    (3, 20, 0, 77, 0): (6, ('u2', 'u2')),
+    (3, 20, 3, 74, 0): (6, ('u2', 'u2')),
+    (3, 20, 6, 71, 0): (6, ('u1', 'u2')),
+    (3, 20, 9, 68, 0): (6, ('u1', 'u2')),
+    (3, 20, 12, 65, 0): (6, ('u1', 'u2')),
+    (3, 20, 15, 62, 0): (6, ('u1', 'u2')),
+    (3, 20, 18, 59, 0): (6, ('u1', 'u2')),
+    (2, 24, 0, 74, 0): (7, ('u1', 'u2')),
+    (2, 24, 3, 71, 0): (7, ('u1', 'u2')),
+    (3, 24, 0, 73, 0): (7, ('u2', 'u2')),
+    (3, 24, 3, 70, 0): (7, ('u2', 'u2')),
+    (2, 24, 6, 68, 0): (7, ('u1', 'u2')),
+    (3, 24, 6, 67, 0): (7, ('u1', 'u2')),
+    (3, 24, 9, 64, 0): (7, ('u1', 'u2')),
+    (3, 24, 12, 61, 0): (7, ('u1', 'u2')),
+    (3, 24, 15, 58, 0): (7, ('u1', 'u2')),
+    (3, 24, 18, 55, 0): (7, ('u1', 'u2')),
+    (3, 24, 21, 52, 0): (7, ('u1', 'u2')),
+    (0, 28, 6, 66, 0): (1, ('u3', 'u3')),
+    (0, 30, 6, 64, 0): (1, ('u3', 'u3')),
+    (0, 28, 9, 63, 0): (1, ('u3', 'u3')),
+    (0, 30, 9, 61, 0): (1, ('u3', 'u3')),
+    (0, 28, 12, 60, 0): (2, ('u3', 'u3')),
+    (0, 30, 12, 58, 0): (2, ('u3', 'u3')),
+    (0, 28, 15, 57, 0): (2, ('u3', 'u3')),
+    (0, 30, 15, 55, 0): (2, ('u3', 'u3')),
+    (0, 28, 18, 54, 0): (3, ('u3', 'u3')),
+    (0, 30, 18, 52, 0): (3, ('u3', 'u3')),
+    (1, 28, 6, 65, 0): (7, ('u1', 'u2')),
+    (1, 28, 9, 62, 0): (7, ('u1', 'u2')),
+    (1, 28, 12, 59, 0): (7, ('u1', 'u2')),
+    (1, 28, 15, 56, 0): (7, ('u1', 'u2')),
+    (2, 26, 0, 72, 0): (7, ('u1', 'u2')),
+    (2, 26, 3, 69, 0): (7, ('u1', 'u2')),
+    (1, 28, 18, 53, 0): (7, ('u1', 'u2')),
+    (2, 28, 0, 70, 0): (8, ('u1', 'u2')),
+    (2, 28, 3, 67, 0): (8, ('u1', 'u2')),
+    (2, 28, 6, 64, 0): (8, ('u1', 'u2')),
+    (4, 0, 6, 90, 0): (2, ('u1', 'u3')),
+    (4, 0, 9, 87, 0): (2, ('u1', 'u3')),
+    (4, 0, 12, 84, 0): (3, ('u1', 'u3')),
+    (4, 0, 15, 81, 0): (3, ('u1', 'u3')),
+    (4, 2, 0, 94, 0): (2, ('u1', 'u2')),
+    (4, 2, 3, 91, 0): (2, ('u1', 'u2')),
+    (4, 2, 6, 88, 0): (3, ('u1', 'u2')),
+    (4, 2, 9, 85, 0): (3, ('u1', 'u2')),
+    (4, 2, 12, 82, 0): (4, ('u1', 'u2')),
+    (4, 2, 15, 79, 0): (4, ('u1', 'u2')),
+    (4, 6, 0, 90, 0): (3, ('u1', 'u2')),
+    (4, 6, 3, 87, 0): (3, ('u1', 'u2')),
+    (4, 8, 0, 88, 0): (4, ('u1', 'u2')),
+    (4, 6, 6, 84, 0): (4, ('u1', 'u2')),
+    (4, 6, 9, 81, 0): (4, ('u1', 'u2')),
+    (4, 6, 12, 78, 0): (5, ('u1', 'u2')),
+    (4, 0, 18, 78, 0): (4, ('u1', 'u3')),
+    (4, 2, 18, 76, 0): (4, ('u1', 'u3')),
+    (4, 10, 0, 86, 0): (4, ('u1', 'u2')),
+    (4, 10, 3, 83, 0): (4, ('u1', 'u2')),
+    (4, 10, 6, 80, 0): (5, ('u1', 'u2')),
+    (4, 12, 0, 84, 0): (5, ('u1', 'u2')),
+    (4, 12, 3, 81, 0): (5, ('u1', 'u2')),
+    (4, 14, 0, 82, 0): (5, ('u1', 'u2')),
+    (4, 14, 3, 79, 0): (5, ('u1', 'u2')),
+    (4, 14, 6, 76, 0): (5, ('u1', 'u2')),
+    (4, 14, 9, 73, 0): (5, ('u1', 'u2')),
+    (4, 16, 0, 80, 0): (6, ('u1', 'u2')),
+    (4, 18, 0, 78, 0): (6, ('u1', 'u2')),
+    (4, 16, 3, 77, 0): (6, ('u1', 'u2')),
+    (4, 16, 6, 74, 0): (6, ('u1', 'u2')),
+    (4, 18, 3, 75, 0): (6, ('u1', 'u2')),
+    (4, 18, 6, 72, 0): (6, ('u1', 'u2')),
+    (4, 18, 9, 69, 0): (6, ('u1', 'u2')),
+    (4, 18, 12, 66, 0): (6, ('u1', 'u2')),
+    (4, 20, 0, 76, 0): (7, ('u1', 'u2')),
+    (4, 22, 0, 74, 0): (7, ('u1', 'u2')),
+    (4, 20, 3, 73, 0): (7, ('u1', 'u2')),
+    (4, 20, 6, 70, 0): (7, ('u1', 'u2')),
+    (4, 22, 3, 71, 0): (7, ('u1', 'u2')),
+    (4, 22, 6, 68, 0): (7, ('u1', 'u2')),
+    (4, 20, 9, 67, 0): (7, ('u1', 'u2')),
+    (4, 22, 9, 65, 0): (7, ('u1', 'u2')),
+    (4, 22, 12, 62, 0): (7, ('u1', 'u2')),
+    (4, 22, 15, 59, 0): (7, ('u1', 'u2')),
+    (4, 24, 0, 72, 0): (8, ('u1', 'u2')),
+    (4, 26, 0, 70, 0): (8, ('u1', 'u2')),
+    (4, 24, 3, 69, 0): (8, ('u1', 'u2')),
+    (4, 24, 6, 66, 0): (8, ('u1', 'u2')),
+    (4, 26, 3, 67, 0): (8, ('u1', 'u2')),
+    (4, 26, 6, 64, 0): (8, ('u1', 'u2')),
+    (4, 24, 9, 63, 0): (8, ('u1', 'u2')),
+    (4, 24, 12, 60, 0): (8, ('u1', 'u2')),
+    (4, 26, 9, 61, 0): (8, ('u1', 'u2')),
+    (4, 26, 12, 58, 0): (8, ('u1', 'u2')),
+    (4, 26, 15, 55, 0): (8, ('u1', 'u2')),
+    (4, 26, 18, 52, 0): (8, ('u1', 'u2')),
+    (0, 32, 6, 62, 0): (1, ('u3', 'u3')),
+    (1, 30, 6, 63, 0): (8, ('u1', 'u2')),
+    (0, 32, 9, 59, 0): (1, ('u3', 'u3')),
+    (1, 30, 9, 60, 0): (8, ('u1', 'u2')),
+    (1, 32, 6, 61, 0): (8, ('u1', 'u2')),
+    (1, 32, 9, 58, 0): (8, ('u1', 'u2')),
+    (0, 32, 12, 56, 0): (2, ('u3', 'u3')),
+    (1, 30, 12, 57, 0): (8, ('u1', 'u2')),
+    (0, 32, 15, 53, 0): (2, ('u3', 'u3')),
+    (1, 30, 15, 54, 0): (8, ('u1', 'u2')),
+    (1, 32, 12, 55, 0): (8, ('u1', 'u2')),
+    (1, 32, 15, 52, 0): (8, ('u1', 'u2')),
+    (2, 30, 0, 68, 0): (8, ('u1', 'u2')),
+    (2, 30, 3, 65, 0): (8, ('u1', 'u2')),
+    (2, 30, 6, 62, 0): (8, ('u1', 'u2')),
+    (3, 28, 0, 69, 0): (8, ('u2', 'u2')),
+    (3, 28, 3, 66, 0): (8, ('u2', 'u2')),
+    (3, 28, 6, 63, 0): (8, ('u1', 'u2')),
+    (3, 28, 9, 60, 0): (8, ('u1', 'u2')),
+    (3, 28, 12, 57, 0): (8, ('u1', 'u2')),
+    (3, 28, 15, 54, 0): (8, ('u1', 'u2')),
+    (5, 4, 0, 91, 0): (3, ('u1', 'u2')),
+    (5, 4, 6, 85, 0): (4, ('u1', 'u2')),
+    (5, 8, 0, 87, 0): (4, ('u1', 'u2')),
+    (5, 8, 3, 84, 0): (5, ('u1', 'u2')),
+    (5, 8, 6, 81, 0): (5, ('u1', 'u2')),
+    (5, 10, 6, 79, 0): (5, ('u1', 'u2')),
+    (5, 10, 9, 76, 0): (5, ('u1', 'u2')),
+    (5, 10, 12, 73, 0): (5, ('u1', 'u2')),
+    (5, 12, 0, 83, 0): (5, ('u1', 'u2')),
+    (5, 14, 3, 78, 0): (6, ('u1', 'u2')),
+    (5, 14, 6, 75, 0): (6, ('u1', 'u2')),
+    (5, 14, 9, 72, 0): (6, ('u1', 'u2')),
+    (5, 14, 12, 69, 0): (6, ('u1', 'u2')),
+    (5, 10, 15, 70, 0): (6, ('u1', 'u2')),
+    (5, 14, 15, 66, 0): (6, ('u1', 'u2')),
+    (5, 16, 0, 79, 0): (6, ('u1', 'u2')),
+    (5, 16, 3, 76, 0): (6, ('u1', 'u2')),
+    (5, 16, 6, 73, 0): (6, ('u1', 'u2')),
+    (5, 16, 9, 70, 0): (7, ('u1', 'u2')),
+    (5, 16, 12, 67, 0): (7, ('u1', 'u2')),
+    (5, 16, 15, 64, 0): (7, ('u1', 'u2')),
+    (5, 18, 0, 77, 0): (7, ('u1', 'u2')),
+    (5, 18, 3, 74, 0): (7, ('u1', 'u2')),
+    (5, 20, 0, 75, 0): (7, ('u1', 'u2')),
+    (5, 20, 3, 72, 0): (7, ('u1', 'u2')),
+    (5, 18, 6, 71, 0): (7, ('u1', 'u2')),
+    (5, 18, 9, 68, 0): (7, ('u1', 'u2')),
+    (5, 20, 6, 69, 0): (7, ('u1', 'u2')),
+    (5, 20, 9, 66, 0): (7, ('u1', 'u2')),
+    (5, 18, 12, 65, 0): (7, ('u1', 'u2')),
+    (5, 18, 15, 62, 0): (7, ('u1', 'u2')),
+    (5, 20, 12, 63, 0): (8, ('u1', 'u2')),
+    (5, 20, 15, 60, 0): (8, ('u1', 'u2')),
+    (5, 22, 0, 73, 0): (8, ('u1', 'u2')),
+    (5, 22, 3, 70, 0): (8, ('u1', 'u2')),
+    (5, 24, 0, 71, 0): (8, ('u1', 'u2')),
+    (5, 24, 3, 68, 0): (8, ('u1', 'u2')),
+    (5, 22, 6, 67, 0): (8, ('u1', 'u2')),
+    (5, 22, 9, 64, 0): (8, ('u1', 'u2')),
+    (5, 24, 6, 65, 0): (8, ('u1', 'u2')),
+    (5, 24, 9, 62, 0): (8, ('u1', 'u2')),
+    (5, 22, 12, 61, 0): (8, ('u1', 'u2')),
+    (5, 22, 15, 58, 0): (8, ('u1', 'u2')),
+    (5, 24, 12, 59, 0): (8, ('u1', 'u2')),
+    (5, 24, 15, 56, 0): (9, ('u1', 'u2')),
+    (4, 28, 0, 68, 0): (9, ('u1', 'u2')),
+    (5, 26, 0, 69, 0): (9, ('u1', 'u2')),
+    (4, 28, 3, 65, 0): (9, ('u1', 'u2')),
+    (5, 26, 3, 66, 0): (9, ('u1', 'u2')),
+    (5, 28, 0, 67, 0): (9, ('u1', 'u2')),
+    (5, 28, 3, 64, 0): (9, ('u1', 'u2')),
+    (4, 28, 6, 62, 0): (9, ('u1', 'u2')),
+    (5, 26, 6, 63, 0): (9, ('u1', 'u2')),
+    (4, 28, 9, 59, 0): (9, ('u1', 'u2')),
+    (5, 26, 9, 60, 0): (9, ('u1', 'u2')),
+    (5, 28, 6, 61, 0): (9, ('u1', 'u2')),
+    (5, 28, 9, 58, 0): (9, ('u1', 'u2')),
+    (4, 28, 12, 56, 0): (9, ('u1', 'u2')),
+    (5, 26, 12, 57, 0): (9, ('u1', 'u2')),
+    (4, 28, 15, 53, 0): (9, ('u1', 'u2')),
+    (5, 26, 15, 54, 0): (9, ('u1', 'u2')),
+    (5, 28, 12, 55, 0): (9, ('u1', 'u2')),
+    (5, 28, 15, 52, 0): (9, ('u1', 'u2')),
+    (0, 34, 6, 60, 0): (1, ('u3', 'u3')),
+    (0, 36, 6, 58, 0): (1, ('u3', 'u3')),
+    (0, 34, 9, 57, 0): (1, ('u3', 'u3')),
+    (0, 36, 9, 55, 0): (1, ('u3', 'u3')),
+    (0, 34, 12, 54, 0): (2, ('u3', 'u3')),
+    (0, 36, 12, 52, 0): (2, ('u3', 'u3')),
+    (2, 32, 0, 66, 0): (9, ('u1', 'u2')),
+    (2, 34, 0, 64, 0): (9, ('u1', 'u2')),
+    (2, 32, 3, 63, 0): (9, ('u1', 'u2')),
+    (1, 34, 6, 59, 0): (9, ('u1', 'u2')),
+    (2, 32, 6, 60, 0): (9, ('u1', 'u2')),
+    (2, 34, 3, 61, 0): (9, ('u1', 'u2')),
+    (2, 34, 6, 58, 0): (9, ('u1', 'u2')),
+    (1, 34, 9, 56, 0): (9, ('u1', 'u2')),
+    (2, 32, 9, 57, 0): (9, ('u1', 'u2')),
+    (1, 34, 12, 53, 0): (9, ('u1', 'u2')),
+    (3, 32, 0, 65, 0): (9, ('u2', 'u2')),
+    (3, 32, 3, 62, 0): (9, ('u2', 'u2')),
+    (3, 32, 6, 59, 0): (9, ('u1', 'u2')),
+    (3, 32, 9, 56, 0): (9, ('u1', 'u2')),
+    (4, 30, 0, 66, 0): (9, ('u1', 'u2')),
+    (4, 30, 3, 63, 0): (9, ('u1', 'u2')),
+    (4, 30, 6, 60, 0): (9, ('u1', 'u2')),
+    (4, 30, 9, 57, 0): (9, ('u1', 'u2')),
+    (3, 32, 12, 53, 0): (9, ('u1', 'u2')),
+    (4, 30, 12, 54, 0): (9, ('u1', 'u2')),
+    (4, 32, 0, 64, 0): (10, ('u1', 'u2')),
+    (4, 32, 3, 61, 0): (10, ('u1', 'u2')),
+    (4, 32, 6, 58, 0): (10, ('u1', 'u2')),
+    (4, 32, 9, 55, 0): (10, ('u1', 'u2')),
+    (4, 32, 12, 52, 0): (10, ('u1', 'u2')),
+    (6, 0, 12, 82, 0): (4, ('u1', 'u3')),
+    (6, 6, 3, 85, 0): (5, ('u1', 'u2')),
+    (6, 10, 0, 84, 0): (6, ('u1', 'u2')),
+    (6, 10, 3, 81, 0): (6, ('u1', 'u2')),
+    (6, 12, 3, 79, 0): (6, ('u1', 'u2')),
+    (6, 12, 6, 76, 0): (6, ('u1', 'u2')),
+    (6, 12, 9, 73, 0): (6, ('u1', 'u2')),
+    (6, 16, 0, 78, 0): (7, ('u1', 'u2')),
+    (6, 16, 3, 75, 0): (7, ('u1', 'u2')),
+    (6, 16, 6, 72, 0): (7, ('u1', 'u2')),
+    (6, 16, 9, 69, 0): (7, ('u1', 'u2')),
+    (6, 16, 12, 66, 0): (7, ('u1', 'u2')),
+    (6, 18, 0, 76, 0): (7, ('u1', 'u2')),
+    (6, 18, 3, 73, 0): (7, ('u1', 'u2')),
+    (6, 18, 6, 70, 0): (8, ('u1', 'u2')),
+    (6, 18, 9, 67, 0): (8, ('u1', 'u2')),
+    (6, 20, 0, 74, 0): (8, ('u1', 'u2')),
+    (6, 22, 0, 72, 0): (8, ('u1', 'u2')),
+    (6, 20, 3, 71, 0): (8, ('u1', 'u2')),
+    (6, 20, 6, 68, 0): (8, ('u1', 'u2')),
+    (6, 22, 3, 69, 0): (8, ('u1', 'u2')),
+    (6, 22, 6, 66, 0): (8, ('u1', 'u2')),
+    (6, 20, 9, 65, 0): (8, ('u1', 'u2')),
+    (6, 20, 12, 62, 0): (8, ('u1', 'u2')),
+    (6, 22, 9, 63, 0): (9, ('u1', 'u2')),
+    (6, 22, 12, 60, 0): (9, ('u1', 'u2')),
+    (6, 24, 0, 70, 0): (9, ('u1', 'u2')),
+    (6, 26, 0, 68, 0): (9, ('u1', 'u2')),
+    (6, 24, 3, 67, 0): (9, ('u1', 'u2')),
+    (6, 24, 6, 64, 0): (9, ('u1', 'u2')),
+    (6, 26, 3, 65, 0): (9, ('u1', 'u2')),
+    (6, 26, 6, 62, 0): (9, ('u1', 'u2')),
+    (6, 24, 9, 61, 0): (9, ('u1', 'u2')),
+    (6, 24, 12, 58, 0): (9, ('u1', 'u2')),
+    (6, 26, 9, 59, 0): (9, ('u1', 'u2')),
+    (6, 26, 12, 56, 0): (10, ('u1', 'u2')),
+    (5, 30, 0, 65, 0): (10, ('u1', 'u2')),
+    (6, 28, 0, 66, 0): (10, ('u1', 'u2')),
+    (6, 30, 0, 64, 0): (10, ('u1', 'u2')),
+    (5, 30, 3, 62, 0): (10, ('u1', 'u2')),
+    (6, 28, 3, 63, 0): (10, ('u1', 'u2')),
+    (5, 30, 6, 59, 0): (10, ('u1', 'u2')),
+    (6, 28, 6, 60, 0): (10, ('u1', 'u2')),
+    (6, 30, 3, 61, 0): (10, ('u1', 'u2')),
+    (6, 30, 6, 58, 0): (10, ('u1', 'u2')),
+    (5, 30, 9, 56, 0): (10, ('u1', 'u2')),
+    (6, 28, 9, 57, 0): (10, ('u1', 'u2')),
+    (5, 30, 12, 53, 0): (10, ('u1', 'u2')),
+    (6, 28, 12, 54, 0): (10, ('u1', 'u2')),
+    (6, 30, 9, 55, 0): (10, ('u1', 'u2')),
+    (6, 30, 12, 52, 0): (10, ('u1', 'u2')),
+    (0, 38, 6, 56, 0): (1, ('u3', 'u3')),
+    (1, 36, 6, 57, 0): (9, ('u1', 'u2')),
+    (0, 38, 9, 53, 0): (1, ('u3', 'u3')),
+    (1, 36, 9, 54, 0): (9, ('u1', 'u2')),
+    (1, 38, 6, 55, 0): (10, ('u1', 'u2')),
+    (1, 38, 9, 52, 0): (10, ('u1', 'u2')),
+    (2, 36, 0, 62, 0): (10, ('u1', 'u2')),
+    (2, 36, 3, 59, 0): (10, ('u1', 'u2')),
+    (3, 36, 0, 61, 0): (10, ('u2', 'u2')),
+    (3, 36, 3, 58, 0): (10, ('u2', 'u2')),
+    (2, 36, 6, 56, 0): (10, ('u1', 'u2')),
+    (2, 36, 9, 53, 0): (10, ('u1', 'u2')),
+    (3, 36, 6, 55, 0): (10, ('u1', 'u2')),
+    (3, 36, 9, 52, 0): (10, ('u1', 'u2')),
+    (4, 34, 0, 62, 0): (10, ('u1', 'u2')),
+    (4, 34, 3, 59, 0): (10, ('u1', 'u2')),
+    (4, 34, 6, 56, 0): (10, ('u1', 'u2')),
+    (5, 32, 0, 63, 0): (10, ('u1', 'u2')),
+    (5, 32, 3, 60, 0): (10, ('u1', 'u2')),
+    (5, 32, 6, 57, 0): (10, ('u1', 'u2')),
+    (4, 34, 9, 53, 0): (10, ('u1', 'u2')),
+    (5, 32, 9, 54, 0): (10, ('u1', 'u2')),
+    (5, 34, 0, 61, 0): (11, ('u1', 'u2')),
+    (5, 34, 3, 58, 0): (11, ('u1', 'u2')),
+    (5, 34, 6, 55, 0): (11, ('u1', 'u2')),
+    (5, 34, 9, 52, 0): (11, ('u1', 'u2')),
+    (7, 14, 0, 79, 0): (7, ('u1', 'u2')),
+    (7, 14, 3, 76, 0): (7, ('u1', 'u2')),
+    (7, 14, 6, 73, 0): (7, ('u1', 'u2')),
+    (7, 18, 0, 75, 0): (8, ('u1', 'u2')),
+    (7, 18, 3, 72, 0): (8, ('u1', 'u2')),
+    (7, 18, 6, 69, 0): (8, ('u1', 'u2')),
+    (7, 18, 9, 66, 0): (8, ('u1', 'u2')),
+    (7, 20, 0, 73, 0): (8, ('u1', 'u2')),
+    (7, 20, 3, 70, 0): (9, ('u1', 'u2')),
+    (7, 20, 6, 67, 0): (9, ('u1', 'u2')),
+    (7, 22, 0, 71, 0): (9, ('u1', 'u2')),
+    (7, 22, 3, 68, 0): (9, ('u1', 'u2')),
+    (7, 24, 0, 69, 0): (9, ('u1', 'u2')),
+    (7, 24, 3, 66, 0): (9, ('u1', 'u2')),
+    (7, 22, 6, 65, 0): (9, ('u1', 'u2')),
+    (7, 22, 9, 62, 0): (9, ('u1', 'u2')),
+    (7, 24, 6, 63, 0): (10, ('u1', 'u2')),
+    (7, 24, 9, 60, 0): (10, ('u1', 'u2')),
+    (7, 26, 0, 67, 0): (10, ('u1', 'u2')),
+    (7, 26, 3, 64, 0): (10, ('u1', 'u2')),
+    (7, 28, 0, 65, 0): (10, ('u1', 'u2')),
+    (7, 28, 3, 62, 0): (10, ('u1', 'u2')),
+    (7, 26, 6, 61, 0): (10, ('u1', 'u2')),
+    (7, 26, 9, 58, 0): (10, ('u1', 'u2')),
+    (7, 28, 6, 59, 0): (10, ('u1', 'u2')),
+    (7, 28, 9, 56, 0): (11, ('u1', 'u2')),
+    (6, 32, 0, 62, 0): (11, ('u1', 'u2')),
+    (7, 30, 0, 63, 0): (11, ('u1', 'u2')),
+    (6, 32, 3, 59, 0): (11, ('u1', 'u2')),
+    (7, 30, 3, 60, 0): (11, ('u1', 'u2')),
+    (7, 32, 0, 61, 0): (11, ('u1', 'u2')),
+    (7, 32, 3, 58, 0): (11, ('u1', 'u2')),
+    (6, 32, 6, 56, 0): (11, ('u1', 'u2')),
+    (7, 30, 6, 57, 0): (11, ('u1', 'u2')),
+    (6, 32, 9, 53, 0): (11, ('u1', 'u2')),
+    (7, 30, 9, 54, 0): (11, ('u1', 'u2')),
+    (7, 32, 6, 55, 0): (11, ('u1', 'u2')),
+    (7, 32, 9, 52, 0): (11, ('u1', 'u2')),
+    (0, 40, 6, 54, 0): (1, ('u3', 'u3')),
+    (0, 42, 6, 52, 0): (1, ('u3', 'u3')),
+    (2, 38, 0, 60, 0): (10, ('u1', 'u2')),
+    (2, 38, 3, 57, 0): (10, ('u1', 'u2')),
+    (1, 40, 6, 53, 0): (10, ('u1', 'u2')),
+    (2, 38, 6, 54, 0): (10, ('u1', 'u2')),
+    (2, 40, 0, 58, 0): (11, ('u1', 'u2')),
+    (2, 40, 3, 55, 0): (11, ('u1', 'u2')),
+    (2, 40, 6, 52, 0): (11, ('u1', 'u2')),
+    (4, 36, 0, 60, 0): (11, ('u1', 'u2')),
+    (4, 38, 0, 58, 0): (11, ('u1', 'u2')),
+    (3, 38, 3, 56, 0): (11, ('u1', 'u2')),
+    (4, 36, 3, 57, 0): (11, ('u1', 'u2')),
+    (3, 38, 6, 53, 0): (11, ('u1', 'u2')),
+    (4, 36, 6, 54, 0): (11, ('u1', 'u2')),
+    (4, 38, 3, 55, 0): (11, ('u1', 'u2')),
+    (4, 38, 6, 52, 0): (11, ('u1', 'u2')),
+    (5, 36, 0, 59, 0): (11, ('u1', 'u2')),
+    (5, 36, 3, 56, 0): (11, ('u1', 'u2')),
+    (6, 34, 0, 60, 0): (11, ('u1', 'u2')),
+    (6, 34, 3, 57, 0): (11, ('u1', 'u2')),
+    (5, 36, 6, 53, 0): (11, ('u1', 'u2')),
+    (6, 34, 6, 54, 0): (11, ('u1', 'u2')),
+    (6, 36, 0, 58, 0): (12, ('u1', 'u2')),
+    (6, 36, 3, 55, 0): (12, ('u1', 'u2')),
+    (6, 36, 6, 52, 0): (12, ('u1', 'u2')),
+    (8, 20, 0, 72, 0): (9, ('u1', 'u2')),
+    (8, 20, 3, 69, 0): (9, ('u1', 'u2')),
+    (8, 20, 6, 66, 0): (9, ('u1', 'u2')),
+    (8, 24, 0, 68, 0): (10, ('u1', 'u2')),
+    (8, 26, 0, 66, 0): (10, ('u1', 'u2')),
+    (8, 24, 3, 65, 0): (10, ('u1', 'u2')),
+    (8, 24, 6, 62, 0): (10, ('u1', 'u2')),
+    (8, 26, 3, 63, 0): (11, ('u1', 'u2')),
+    (8, 26, 6, 60, 0): (11, ('u1', 'u2')),
+    (8, 28, 0, 64, 0): (11, ('u1', 'u2')),
+    (8, 30, 0, 62, 0): (11, ('u1', 'u2')),
+    (8, 28, 3, 61, 0): (11, ('u1', 'u2')),
+    (8, 28, 6, 58, 0): (11, ('u1', 'u2')),
+    (8, 30, 3, 59, 0): (11, ('u1', 'u2')),
+    (8, 30, 6, 56, 0): (12, ('u1', 'u2')),
+    (7, 34, 0, 59, 0): (12, ('u1', 'u2')),
+    (8, 32, 0, 60, 0): (12, ('u1', 'u2')),
+    (8, 34, 0, 58, 0): (12, ('u1', 'u2')),
+    (7, 34, 3, 56, 0): (12, ('u1', 'u2')),
+    (8, 32, 3, 57, 0): (12, ('u1', 'u2')),
+    (7, 34, 6, 53, 0): (12, ('u1', 'u2')),
+    (8, 32, 6, 54, 0): (12, ('u1', 'u2')),
+    (8, 34, 3, 55, 0): (12, ('u1', 'u2')),
+    (8, 34, 6, 52, 0): (12, ('u1', 'u2')),
+    (2, 42, 0, 56, 0): (11, ('u1', 'u2')),
+    (3, 40, 0, 57, 0): (11, ('u2', 'u2')),
+    (2, 42, 3, 53, 0): (11, ('u1', 'u2')),
+    (3, 40, 3, 54, 0): (11, ('u1', 'u2')),
+    (3, 42, 3, 52, 0): (12, ('u1', 'u2')),
+    (4, 40, 0, 56, 0): (12, ('u1', 'u2')),
+    (5, 38, 0, 57, 0): (12, ('u1', 'u2')),
+    (4, 40, 3, 53, 0): (12, ('u1', 'u2')),
+    (5, 38, 3, 54, 0): (12, ('u1', 'u2')),
+    (5, 40, 0, 55, 0): (12, ('u1', 'u2')),
+    (5, 40, 3, 52, 0): (12, ('u1', 'u2')),
+    (6, 38, 0, 56, 0): (12, ('u1', 'u2')),
+    (7, 36, 0, 57, 0): (12, ('u1', 'u2')),
+    (6, 38, 3, 53, 0): (12, ('u1', 'u2')),
+    (7, 36, 3, 54, 0): (12, ('u1', 'u2')),
+    (7, 38, 0, 55, 0): (13, ('u1', 'u2')),
+    (7, 38, 3, 52, 0): (13, ('u1', 'u2')),
+    (9, 30, 0, 61, 0): (12, ('u1', 'u2')),
+    (9, 30, 3, 58, 0): (12, ('u1', 'u2')),
+    (8, 36, 0, 56, 0): (13, ('u1', 'u2')),
+    (9, 34, 0, 57, 0): (13, ('u1', 'u2')),
+    (8, 36, 3, 53, 0): (13, ('u1', 'u2')),
+    (9, 34, 3, 54, 0): (13, ('u1', 'u2')),
+    (9, 36, 0, 55, 0): (13, ('u1', 'u2')),
+    (9, 36, 3, 52, 0): (13, ('u1', 'u2')),
+    (0, 28, 21, 51, 0): (3, ('u3', 'u3')),
+    (0, 26, 24, 50, 0): (4, ('u3', 'u3')),
+    (0, 28, 24, 48, 0): (4, ('u3', 'u3')),
+    (0, 22, 27, 51, 0): (4, ('u3', 'u3')),
+    (0, 20, 30, 50, 0): (5, ('u3', 'u3')),
+    (0, 22, 30, 48, 0): (5, ('u3', 'u3')),
+    (0, 24, 27, 49, 0): (4, ('u3', 'u3')),
+    (1, 22, 27, 50, 0): (6, ('u1', 'u3')),
+    (1, 24, 24, 51, 0): (7, ('u1', 'u3')),
+    (1, 24, 27, 48, 0): (7, ('u1', 'u3')),
+    (1, 26, 24, 49, 0): (7, ('u1', 'u3')),
+    (0, 30, 21, 49, 0): (3, ('u3', 'u3')),
+    (1, 28, 21, 50, 0): (7, ('u1', 'u2')),
+    (1, 30, 18, 51, 0): (8, ('u1', 'u2')),
+    (1, 30, 21, 48, 0): (8, ('u1', 'u3')),
+    (3, 28, 18, 51, 0): (8, ('u1', 'u2')),
+    (3, 28, 21, 48, 0): (8, ('u1', 'u2')),
+    (0, 34, 15, 51, 0): (2, ('u3', 'u3')),
+    (0, 32, 18, 50, 0): (3, ('u3', 'u3')),
+    (0, 34, 18, 48, 0): (3, ('u3', 'u3')),
+    (1, 32, 18, 49, 0): (8, ('u1', 'u2')),
+    (4, 30, 15, 51, 0): (9, ('u1', 'u2')),
+    (4, 30, 18, 48, 0): (9, ('u1', 'u2')),
+    (0, 36, 15, 49, 0): (2, ('u3', 'u3')),
+    (1, 34, 15, 50, 0): (9, ('u1', 'u2')),
+    (1, 36, 12, 51, 0): (9, ('u1', 'u2')),
+    (1, 36, 15, 48, 0): (9, ('u1', 'u2')),
+    (3, 32, 15, 50, 0): (9, ('u1', 'u2')),
+    (4, 32, 15, 49, 0): (10, ('u1', 'u2')),
+    (5, 30, 15, 50, 0): (10, ('u1', 'u2')),
+    (5, 32, 12, 51, 0): (10, ('u1', 'u2')),
+    (5, 32, 15, 48, 0): (10, ('u1', 'u2')),
+    (0, 40, 9, 51, 0): (1, ('u3', 'u3')),
+    (0, 38, 12, 50, 0): (2, ('u3', 'u3')),
+    (0, 40, 12, 48, 0): (2, ('u3', 'u3')),
+    (1, 38, 12, 49, 0): (10, ('u1', 'u2')),
+    (2, 38, 9, 51, 0): (10, ('u1', 'u2')),
+    (3, 36, 12, 49, 0): (10, ('u1', 'u2')),
+    (4, 34, 12, 50, 0): (10, ('u1', 'u2')),
+    (4, 36, 9, 51, 0): (11, ('u1', 'u2')),
+    (4, 36, 12, 48, 0): (11, ('u1', 'u2')),
+    (5, 34, 12, 49, 0): (11, ('u1', 'u2')),
+    (6, 32, 12, 50, 0): (11, ('u1', 'u2')),
+    (6, 34, 9, 51, 0): (11, ('u1', 'u2')),
+    (6, 34, 12, 48, 0): (11, ('u1', 'u2')),
+    (0, 42, 9, 49, 0): (1, ('u3', 'u3')),
+    (1, 40, 9, 50, 0): (10, ('u1', 'u2')),
+    (1, 42, 6, 51, 0): (11, ('u1', 'u2')),
+    (1, 42, 9, 48, 0): (11, ('u1', 'u2')),
+    (2, 40, 9, 49, 0): (11, ('u1', 'u2')),
+    (3, 40, 6, 51, 0): (11, ('u1', 'u2')),
+    (3, 40, 9, 48, 0): (11, ('u1', 'u2')),
+    (4, 38, 9, 49, 0): (11, ('u1', 'u2')),
+    (5, 36, 9, 50, 0): (11, ('u1', 'u2')),
+    (5, 38, 6, 51, 0): (12, ('u1', 'u2')),
+    (5, 38, 9, 48, 0): (12, ('u1', 'u2')),
+    (6, 36, 9, 49, 0): (12, ('u1', 'u2')),
+    (7, 34, 9, 50, 0): (12, ('u1', 'u2')),
+    (7, 36, 6, 51, 0): (12, ('u1', 'u2')),
+    (7, 36, 9, 48, 0): (12, ('u1', 'u2')),
+    (0, 44, 6, 50, 0): (1, ('u3', 'u3')),
+    (0, 46, 6, 48, 0): (1, ('u3', 'u3')),
+    (1, 44, 6, 49, 0): (11, ('u1', 'u2')),
+    (2, 42, 6, 50, 0): (11, ('u1', 'u2')),
+    (2, 44, 0, 54, 0): (12, ('u1', 'u2')),
+    (2, 44, 3, 51, 0): (12, ('u1', 'u2')),
+    (2, 44, 6, 48, 0): (12, ('u1', 'u2')),
+    (4, 42, 0, 54, 0): (12, ('u1', 'u2')),
+    (3, 42, 6, 49, 0): (12, ('u1', 'u2')),
+    (4, 40, 6, 50, 0): (12, ('u1', 'u2')),
+    (4, 42, 3, 51, 0): (12, ('u1', 'u2')),
+    (4, 42, 6, 48, 0): (12, ('u1', 'u2')),
+    (5, 40, 6, 49, 0): (12, ('u1', 'u2')),
+    (6, 38, 6, 50, 0): (12, ('u1', 'u2')),
+    (6, 40, 0, 54, 0): (13, ('u1', 'u2')),
+    (6, 40, 3, 51, 0): (13, ('u1', 'u2')),
+    (6, 40, 6, 48, 0): (13, ('u1', 'u2')),
+    (8, 38, 0, 54, 0): (13, ('u1', 'u2')),
+    (7, 38, 6, 49, 0): (13, ('u1', 'u2')),
+    (8, 36, 6, 50, 0): (13, ('u1', 'u2')),
+    (8, 38, 3, 51, 0): (13, ('u1', 'u2')),
+    (8, 38, 6, 48, 0): (13, ('u1', 'u2')),
+    (2, 46, 0, 52, 0): (12, ('u1', 'u2')),
+    (3, 44, 0, 53, 0): (12, ('u2', 'u2')),
+    (2, 46, 3, 49, 0): (12, ('u1', 'u2')),
+    (3, 44, 3, 50, 0): (12, ('u1', 'u2')),
+    (3, 46, 3, 48, 0): (13, ('u1', 'u2')),
+    (4, 44, 0, 52, 0): (13, ('u1', 'u2')),
+    (5, 42, 0, 53, 0): (13, ('u1', 'u2')),
+    (4, 44, 3, 49, 0): (13, ('u1', 'u2')),
+    (5, 42, 3, 50, 0): (13, ('u1', 'u2')),
+    (5, 44, 0, 51, 0): (13, ('u1', 'u2')),
+    (5, 44, 3, 48, 0): (13, ('u1', 'u2')),
+    (6, 42, 0, 52, 0): (13, ('u1', 'u2')),
+    (7, 40, 0, 53, 0): (13, ('u1', 'u2')),
+    (6, 42, 3, 49, 0): (13, ('u1', 'u2')),
+    (7, 40, 3, 50, 0): (13, ('u1', 'u2')),
+    (7, 42, 0, 51, 0): (14, ('u1', 'u2')),
+    (7, 42, 3, 48, 0): (14, ('u1', 'u2')),
+    (8, 40, 0, 52, 0): (14, ('u1', 'u2')),
+    (9, 38, 0, 53, 0): (14, ('u1', 'u2')),
+    (8, 40, 3, 49, 0): (14, ('u1', 'u2')),
+    (9, 38, 3, 50, 0): (14, ('u1', 'u2')),
+    (9, 40, 0, 51, 0): (14, ('u1', 'u2')),
+    (9, 40, 3, 48, 0): (14, ('u1', 'u2')),
+    (2, 48, 0, 50, 0): (13, ('u1', 'u2')),
+    (2, 50, 0, 48, 0): (13, ('u1', 'u2')),
+    (3, 48, 0, 49, 0): (13, ('u2', 'u2')),
+    (4, 46, 0, 50, 0): (13, ('u1', 'u2')),
+    (4, 48, 0, 48, 0): (14, ('u1', 'u2')),
+    (5, 46, 0, 49, 0): (14, ('u1', 'u2')),
+    (6, 44, 0, 50, 0): (14, ('u1', 'u2')),
+    (6, 46, 0, 48, 0): (14, ('u1', 'u2')),
+    (7, 44, 0, 49, 0): (14, ('u1', 'u2')),
+    (8, 42, 0, 50, 0): (14, ('u1', 'u2')),
+    (8, 44, 0, 48, 0): (15, ('u1', 'u2')),
+    (10, 36, 0, 54, 0): (14, ('u1', 'u2')),
+    (9, 42, 0, 49, 0): (15, ('u1', 'u2')),
+    (10, 40, 0, 50, 0): (15, ('u1', 'u2')),
+    (10, 42, 0, 48, 0): (15, ('u1', 'u2')),
+    (0, 32, 21, 47, 0): (3, ('u3', 'u3')),
+    (0, 30, 24, 46, 0): (4, ('u3', 'u3')),
+    (0, 32, 24, 44, 0): (4, ('u3', 'u3')),
+    (0, 26, 27, 47, 0): (4, ('u3', 'u3')),
+    (0, 24, 30, 46, 0): (5, ('u3', 'u3')),
+    (0, 26, 30, 44, 0): (5, ('u3', 'u3')),
+    (0, 28, 27, 45, 0): (4, ('u3', 'u3')),
+    (1, 26, 27, 46, 0): (7, ('u1', 'u3')),
+    (1, 28, 24, 47, 0): (8, ('u1', 'u3')),
+    (1, 28, 27, 44, 0): (8, ('u1', 'u3')),
+    (1, 30, 24, 45, 0): (8, ('u1', 'u3')),
+    (0, 34, 21, 45, 0): (3, ('u3', 'u3')),
+    (1, 32, 21, 46, 0): (8, ('u1', 'u2')),
+    (1, 34, 18, 47, 0): (9, ('u1', 'u2')),
+    (1, 34, 21, 44, 0): (9, ('u1', 'u2')),
+    (3, 32, 18, 47, 0): (9, ('u1', 'u2')),
+    (3, 32, 21, 44, 0): (9, ('u1', 'u2')),
+    (0, 38, 15, 47, 0): (2, ('u3', 'u3')),
+    (0, 36, 18, 46, 0): (3, ('u3', 'u3')),
+    (0, 38, 18, 44, 0): (3, ('u3', 'u3')),
+    (1, 36, 18, 45, 0): (9, ('u1', 'u2')),
+    (4, 32, 18, 46, 0): (10, ('u1', 'u2')),
+    (4, 34, 15, 47, 0): (10, ('u1', 'u2')),
+    (4, 34, 18, 44, 0): (10, ('u1', 'u2')),
+    (0, 40, 15, 45, 0): (2, ('u3', 'u3')),
+    (1, 38, 15, 46, 0): (10, ('u1', 'u2')),
+    (1, 40, 12, 47, 0): (10, ('u1', 'u2')),
+    (1, 40, 15, 44, 0): (10, ('u1', 'u2')),
+    (3, 36, 15, 46, 0): (10, ('u1', 'u2')),
+    (4, 36, 15, 45, 0): (11, ('u1', 'u2')),
+    (5, 34, 15, 46, 0): (11, ('u1', 'u2')),
+    (5, 36, 12, 47, 0): (11, ('u1', 'u2')),
+    (5, 36, 15, 44, 0): (11, ('u1', 'u2')),
+    (0, 44, 9, 47, 0): (1, ('u3', 'u3')),
+    (0, 42, 12, 46, 0): (2, ('u3', 'u3')),
+    (0, 44, 12, 44, 0): (2, ('u3', 'u3')),
+    (1, 42, 12, 45, 0): (11, ('u1', 'u2')),
+    (2, 40, 12, 46, 0): (11, ('u1', 'u2')),
+    (2, 42, 9, 47, 0): (11, ('u1', 'u2')),
+    (3, 40, 12, 45, 0): (11, ('u1', 'u2')),
+    (4, 38, 12, 46, 0): (11, ('u1', 'u2')),
+    (4, 40, 9, 47, 0): (12, ('u1', 'u2')),
+    (4, 40, 12, 44, 0): (12, ('u1', 'u2')),
+    (5, 38, 12, 45, 0): (12, ('u1', 'u2')),
+    (6, 36, 12, 46, 0): (12, ('u1', 'u2')),
+    (6, 38, 9, 47, 0): (12, ('u1', 'u2')),
+    (6, 38, 12, 44, 0): (12, ('u1', 'u2')),
+    (0, 46, 9, 45, 0): (1, ('u3', 'u3')),
+    (1, 44, 9, 46, 0): (11, ('u1', 'u2')),
+    (1, 46, 6, 47, 0): (12, ('u1', 'u2')),
+    (1, 46, 9, 44, 0): (12, ('u1', 'u2')),
+    (2, 44, 9, 45, 0): (12, ('u1', 'u2')),
+    (3, 44, 6, 47, 0): (12, ('u1', 'u2')),
+    (3, 44, 9, 44, 0): (12, ('u1', 'u2')),
+    (4, 42, 9, 45, 0): (12, ('u1', 'u2')),
+    (5, 40, 9, 46, 0): (12, ('u1', 'u2')),
+    (5, 42, 6, 47, 0): (13, ('u1', 'u2')),
+    (5, 42, 9, 44, 0): (13, ('u1', 'u2')),
+    (6, 40, 9, 45, 0): (13, ('u1', 'u2')),
+    (7, 38, 9, 46, 0): (13, ('u1', 'u2')),
+    (7, 40, 6, 47, 0): (13, ('u1', 'u2')),
+    (7, 40, 9, 44, 0): (13, ('u1', 'u2')),
+    (0, 48, 6, 46, 0): (1, ('u3', 'u3')),
+    (0, 50, 6, 44, 0): (1, ('u3', 'u3')),
+    (1, 48, 6, 45, 0): (12, ('u1', 'u2')),
+    (2, 46, 6, 46, 0): (12, ('u1', 'u2')),
+    (2, 48, 3, 47, 0): (13, ('u1', 'u2')),
+    (2, 48, 6, 44, 0): (13, ('u1', 'u2')),
+    (3, 46, 6, 45, 0): (13, ('u1', 'u2')),
+    (4, 44, 6, 46, 0): (13, ('u1', 'u2')),
+    (4, 46, 3, 47, 0): (13, ('u1', 'u2')),
+    (4, 46, 6, 44, 0): (13, ('u1', 'u2')),
+    (5, 44, 6, 45, 0): (13, ('u1', 'u2')),
+    (6, 42, 6, 46, 0): (13, ('u1', 'u2')),
+    (6, 44, 3, 47, 0): (14, ('u1', 'u2')),
+    (6, 44, 6, 44, 0): (14, ('u1', 'u2')),
+    (7, 42, 6, 45, 0): (14, ('u1', 'u2')),
+    (8, 40, 6, 46, 0): (14, ('u1', 'u2')),
+    (8, 42, 3, 47, 0): (14, ('u1', 'u2')),
+    (8, 42, 6, 44, 0): (14, ('u1', 'u2')),
+    (2, 50, 3, 45, 0): (13, ('u1', 'u2')),
+    (3, 48, 3, 46, 0): (13, ('u1', 'u2')),
+    (3, 50, 3, 44, 0): (14, ('u1', 'u2')),
+    (4, 48, 3, 45, 0): (14, ('u1', 'u2')),
+    (5, 46, 3, 46, 0): (14, ('u1', 'u2')),
+    (5, 48, 0, 47, 0): (14, ('u1', 'u2')),
+    (5, 48, 3, 44, 0): (14, ('u1', 'u2')),
+    (6, 46, 3, 45, 0): (14, ('u1', 'u2')),
+    (7, 44, 3, 46, 0): (14, ('u1', 'u2')),
+    (7, 46, 0, 47, 0): (15, ('u1', 'u2')),
+    (7, 46, 3, 44, 0): (15, ('u1', 'u2')),
+    (8, 44, 3, 45, 0): (15, ('u1', 'u2')),
+    (9, 42, 3, 46, 0): (15, ('u1', 'u2')),
+    (9, 44, 0, 47, 0): (15, ('u1', 'u2')),
+    (9, 44, 3, 44, 0): (15, ('u1', 'u2')),
+    (2, 52, 0, 46, 0): (14, ('u1', 'u2')),
+    (2, 54, 0, 44, 0): (14, ('u1', 'u2')),
+    (3, 52, 0, 45, 0): (14, ('u2', 'u2')),
+    (4, 50, 0, 46, 0): (14, ('u1', 'u2')),
+    (4, 52, 0, 44, 0): (15, ('u1', 'u2')),
+    (5, 50, 0, 45, 0): (15, ('u1', 'u2')),
+    (6, 48, 0, 46, 0): (15, ('u1', 'u2')),
+    (6, 50, 0, 44, 0): (15, ('u1', 'u2')),
+    (7, 48, 0, 45, 0): (15, ('u1', 'u2')),
+    (8, 46, 0, 46, 0): (15, ('u1', 'u2')),
+    (8, 48, 0, 44, 0): (16, ('u1', 'u2')),
+    (9, 46, 0, 45, 0): (16, ('u1', 'u2')),
+    (10, 44, 0, 46, 0): (16, ('u1', 'u2')),
+    (10, 46, 0, 44, 0): (16, ('u1', 'u2')),
+    (0, 36, 21, 43, 0): (3, ('u3', 'u3')),
+    (0, 34, 24, 42, 0): (4, ('u3', 'u3')),
+    (0, 36, 24, 40, 0): (4, ('u3', 'u3')),
+    (0, 30, 27, 43, 0): (4, ('u3', 'u3')),
+    (0, 28, 30, 42, 0): (5, ('u3', 'u3')),
+    (0, 30, 30, 40, 0): (5, ('u3', 'u3')),
+    (0, 32, 27, 41, 0): (4, ('u3', 'u3')),
+    (1, 30, 27, 42, 0): (8, ('u1', 'u3')),
+    (1, 32, 24, 43, 0): (8, ('u1', 'u2')),
+    (1, 32, 27, 40, 0): (9, ('u1', 'u3')),
+    (1, 34, 24, 41, 0): (9, ('u1', 'u3')),
+    (0, 38, 21, 41, 0): (3, ('u3', 'u3')),
+    (1, 36, 21, 42, 0): (9, ('u1', 'u2')),
+    (1, 38, 18, 43, 0): (10, ('u1', 'u2')),
+    (1, 38, 21, 40, 0): (10, ('u1', 'u2')),
+    (3, 36, 18, 43, 0): (10, ('u1', 'u2')),
+    (3, 36, 21, 40, 0): (10, ('u1', 'u2')),
+    (0, 42, 15, 43, 0): (2, ('u3', 'u3')),
+    (0, 40, 18, 42, 0): (3, ('u3', 'u3')),
+    (0, 42, 18, 40, 0): (3, ('u3', 'u3')),
+    (1, 40, 18, 41, 0): (10, ('u1', 'u2')),
+    (4, 36, 18, 42, 0): (11, ('u1', 'u2')),
+    (4, 38, 15, 43, 0): (11, ('u1', 'u2')),
+    (4, 38, 18, 40, 0): (11, ('u1', 'u2')),
+    (0, 44, 15, 41, 0): (2, ('u3', 'u3')),
+    (1, 42, 15, 42, 0): (11, ('u1', 'u2')),
+    (1, 44, 12, 43, 0): (11, ('u1', 'u2')),
+    (1, 44, 15, 40, 0): (11, ('u1', 'u2')),
+    (3, 40, 15, 42, 0): (11, ('u1', 'u2')),
+    (4, 40, 15, 41, 0): (12, ('u1', 'u2')),
+    (5, 38, 15, 42, 0): (12, ('u1', 'u2')),
+    (5, 40, 12, 43, 0): (12, ('u1', 'u2')),
+    (5, 40, 15, 40, 0): (12, ('u1', 'u2')),
+    (0, 48, 9, 43, 0): (1, ('u3', 'u3')),
+    (0, 46, 12, 42, 0): (2, ('u3', 'u3')),
+    (0, 48, 12, 40, 0): (2, ('u3', 'u3')),
+    (1, 46, 12, 41, 0): (12, ('u1', 'u2')),
+    (2, 44, 12, 42, 0): (12, ('u1', 'u2')),
+    (2, 46, 9, 43, 0): (12, ('u1', 'u2')),
+    (2, 46, 12, 40, 0): (12, ('u1', 'u2')),
+    (3, 44, 12, 41, 0): (12, ('u1', 'u2')),
+    (4, 42, 12, 42, 0): (12, ('u1', 'u2')),
+    (4, 44, 9, 43, 0): (13, ('u1', 'u2')),
+    (4, 44, 12, 40, 0): (13, ('u1', 'u2')),
+    (5, 42, 12, 41, 0): (13, ('u1', 'u2')),
+    (6, 40, 12, 42, 0): (13, ('u1', 'u2')),
+    (6, 42, 9, 43, 0): (13, ('u1', 'u2')),
+    (6, 42, 12, 40, 0): (13, ('u1', 'u2')),
+    (0, 50, 9, 41, 0): (1, ('u3', 'u3')),
+    (1, 48, 9, 42, 0): (12, ('u1', 'u2')),
+    (1, 50, 6, 43, 0): (13, ('u1', 'u2')),
+    (1, 50, 9, 40, 0): (13, ('u1', 'u2')),
+    (2, 48, 9, 41, 0): (13, ('u1', 'u2')),
+    (3, 46, 9, 42, 0): (13, ('u1', 'u2')),
+    (3, 48, 6, 43, 0): (13, ('u1', 'u2')),
+    (3, 48, 9, 40, 0): (13, ('u1', 'u2')),
+    (4, 46, 9, 41, 0): (13, ('u1', 'u2')),
+    (5, 44, 9, 42, 0): (13, ('u1', 'u2')),
+    (5, 46, 6, 43, 0): (14, ('u1', 'u2')),
+    (5, 46, 9, 40, 0): (14, ('u1', 'u2')),
+    (6, 44, 9, 41, 0): (14, ('u1', 'u2')),
+    (7, 42, 9, 42, 0): (14, ('u1', 'u2')),
+    (7, 44, 6, 43, 0): (14, ('u1', 'u2')),
+    (7, 44, 9, 40, 0): (14, ('u1', 'u2')),
+    (0, 52, 6, 42, 0): (1, ('u3', 'u3')),
+    (0, 54, 6, 40, 0): (1, ('u3', 'u3')),
+    (1, 52, 6, 41, 0): (13, ('u1', 'u2')),
+    (2, 50, 6, 42, 0): (13, ('u1', 'u2')),
+    (2, 52, 3, 43, 0): (14, ('u1', 'u2')),
+    (2, 52, 6, 40, 0): (14, ('u1', 'u2')),
+    (3, 50, 6, 41, 0): (14, ('u1', 'u2')),
+    (4, 48, 6, 42, 0): (14, ('u1', 'u2')),
+    (4, 50, 3, 43, 0): (14, ('u1', 'u2')),
+    (4, 50, 6, 40, 0): (14, ('u1', 'u2')),
+    (5, 48, 6, 41, 0): (14, ('u1', 'u2')),
+    (6, 46, 6, 42, 0): (14, ('u1', 'u2')),
+    (6, 48, 3, 43, 0): (15, ('u1', 'u2')),
+    (6, 48, 6, 40, 0): (15, ('u1', 'u2')),
+    (7, 46, 6, 41, 0): (15, ('u1', 'u2')),
+    (8, 44, 6, 42, 0): (15, ('u1', 'u2')),
+    (8, 46, 3, 43, 0): (15, ('u1', 'u2')),
+    (8, 46, 6, 40, 0): (15, ('u1', 'u2')),
+    (2, 54, 3, 41, 0): (14, ('u1', 'u2')),
+    (3, 52, 3, 42, 0): (14, ('u1', 'u2')),
+    (3, 54, 3, 40, 0): (15, ('u1', 'u2')),
+    (4, 52, 3, 41, 0): (15, ('u1', 'u2')),
+    (5, 50, 3, 42, 0): (15, ('u1', 'u2')),
+    (5, 52, 0, 43, 0): (15, ('u1', 'u2')),
+    (5, 52, 3, 40, 0): (15, ('u1', 'u2')),
+    (6, 50, 3, 41, 0): (15, ('u1', 'u2')),
+    (7, 48, 3, 42, 0): (15, ('u1', 'u2')),
+    (7, 50, 0, 43, 0): (16, ('u1', 'u2')),
+    (7, 50, 3, 40, 0): (16, ('u1', 'u2')),
+    (8, 48, 3, 41, 0): (16, ('u1', 'u2')),
+    (9, 46, 3, 42, 0): (16, ('u1', 'u2')),
+    (9, 48, 0, 43, 0): (16, ('u1', 'u2')),
+    (9, 48, 3, 40, 0): (16, ('u1', 'u2')),
+    (2, 56, 0, 42, 0): (15, ('u1', 'u2')),
+    (2, 58, 0, 40, 0): (15, ('u1', 'u2')),
+    (3, 56, 0, 41, 0): (15, ('u2', 'u2')),
+    (4, 54, 0, 42, 0): (15, ('u1', 'u2')),
+    (4, 56, 0, 40, 0): (16, ('u1', 'u2')),
+    (5, 54, 0, 41, 0): (16, ('u1', 'u2')),
+    (6, 52, 0, 42, 0): (16, ('u1', 'u2')),
+    (6, 54, 0, 40, 0): (16, ('u1', 'u2')),
+    (7, 52, 0, 41, 0): (16, ('u1', 'u2')),
+    (8, 50, 0, 42, 0): (16, ('u1', 'u2')),
+    (8, 52, 0, 40, 0): (17, ('u1', 'u2')),
+    (9, 50, 0, 41, 0): (17, ('u1', 'u2')),
+    (10, 48, 0, 42, 0): (17, ('u1', 'u2')),
+    (10, 50, 0, 40, 0): (17, ('u1', 'u2')),
+    (0, 40, 21, 39, 0): (3, ('u3', 'u3')),
+    (0, 38, 24, 38, 0): (4, ('u3', 'u3')),
+    (0, 40, 24, 36, 0): (4, ('u3', 'u3')),
+    (0, 34, 27, 39, 0): (4, ('u3', 'u3')),
+    (0, 32, 30, 38, 0): (5, ('u3', 'u3')),
+    (0, 34, 30, 36, 0): (5, ('u3', 'u3')),
+    (0, 36, 27, 37, 0): (4, ('u3', 'u3')),
+    (1, 34, 27, 38, 0): (9, ('u1', 'u3')),
+    (1, 36, 24, 39, 0): (9, ('u1', 'u2')),
+    (1, 36, 27, 36, 0): (9, ('u1', 'u2')),
+    (1, 38, 24, 37, 0): (10, ('u1', 'u2')),
+    (0, 42, 21, 37, 0): (3, ('u3', 'u3')),
+    (1, 40, 21, 38, 0): (10, ('u1', 'u2')),
+    (1, 42, 18, 39, 0): (11, ('u1', 'u2')),
+    (1, 42, 21, 36, 0): (11, ('u1', 'u2')),
+    (3, 40, 18, 39, 0): (11, ('u1', 'u2')),
+    (3, 40, 21, 36, 0): (11, ('u1', 'u2')),
+    (0, 46, 15, 39, 0): (2, ('u3', 'u3')),
+    (0, 44, 18, 38, 0): (3, ('u3', 'u3')),
+    (0, 46, 18, 36, 0): (3, ('u3', 'u3')),
+    (1, 44, 18, 37, 0): (11, ('u1', 'u2')),
+    (4, 40, 18, 38, 0): (12, ('u1', 'u2')),
+    (4, 42, 15, 39, 0): (12, ('u1', 'u2')),
+    (4, 42, 18, 36, 0): (12, ('u1', 'u2')),
+    (0, 48, 15, 37, 0): (2, ('u3', 'u3')),
+    (1, 46, 15, 38, 0): (12, ('u1', 'u2')),
+    (1, 48, 12, 39, 0): (12, ('u1', 'u2')),
+    (1, 48, 15, 36, 0): (12, ('u1', 'u2')),
+    (3, 44, 15, 38, 0): (12, ('u1', 'u2')),
+    (4, 44, 15, 37, 0): (13, ('u1', 'u2')),
+    (5, 42, 15, 38, 0): (13, ('u1', 'u2')),
+    (5, 44, 12, 39, 0): (13, ('u1', 'u2')),
+    (5, 44, 15, 36, 0): (13, ('u1', 'u2')),
+    (0, 52, 9, 39, 0): (1, ('u3', 'u3')),
+    (0, 50, 12, 38, 0): (2, ('u3', 'u3')),
+    (0, 52, 12, 36, 0): (2, ('u3', 'u3')),
+    (1, 50, 12, 37, 0): (13, ('u1', 'u2')),
+    (2, 48, 12, 38, 0): (13, ('u1', 'u2')),
+    (2, 50, 9, 39, 0): (13, ('u1', 'u2')),
+    (2, 50, 12, 36, 0): (13, ('u1', 'u2')),
+    (3, 48, 12, 37, 0): (13, ('u1', 'u2')),
+    (4, 46, 12, 38, 0): (13, ('u1', 'u2')),
+    (4, 48, 9, 39, 0): (14, ('u1', 'u2')),
+    (4, 48, 12, 36, 0): (14, ('u1', 'u2')),
+    (5, 46, 12, 37, 0): (14, ('u1', 'u2')),
+    (6, 44, 12, 38, 0): (14, ('u1', 'u2')),
+    (6, 46, 9, 39, 0): (14, ('u1', 'u2')),
+    (6, 46, 12, 36, 0): (14, ('u1', 'u2')),
+    (0, 54, 9, 37, 0): (1, ('u3', 'u3')),
+    (1, 52, 9, 38, 0): (13, ('u1', 'u2')),
+    (1, 54, 6, 39, 0): (14, ('u1', 'u2')),
+    (1, 54, 9, 36, 0): (14, ('u1', 'u2')),
+    (2, 52, 9, 37, 0): (14, ('u1', 'u2')),
+    (3, 50, 9, 38, 0): (14, ('u1', 'u2')),
+    (3, 52, 6, 39, 0): (14, ('u1', 'u2')),
+    (3, 52, 9, 36, 0): (14, ('u1', 'u2')),
+    (4, 50, 9, 37, 0): (14, ('u1', 'u2')),
+    (5, 48, 9, 38, 0): (14, ('u1', 'u2')),
+    (5, 50, 6, 39, 0): (15, ('u1', 'u2')),
+    (5, 50, 9, 36, 0): (15, ('u1', 'u2')),
+    (6, 48, 9, 37, 0): (15, ('u1', 'u2')),
+    (7, 46, 9, 38, 0): (15, ('u1', 'u2')),
+    (7, 48, 6, 39, 0): (15, ('u1', 'u2')),
+    (7, 48, 9, 36, 0): (15, ('u1', 'u2')),
+    (0, 56, 6, 38, 0): (1, ('u3', 'u3')),
+    (0, 58, 6, 36, 0): (1, ('u3', 'u3')),
+    (1, 56, 6, 37, 0): (14, ('u1', 'u2')),
+    (2, 54, 6, 38, 0): (14, ('u1', 'u2')),
+    (2, 56, 3, 39, 0): (15, ('u1', 'u2')),
+    (2, 56, 6, 36, 0): (15, ('u1', 'u2')),
+    (3, 54, 6, 37, 0): (15, ('u1', 'u2')),
+    (4, 52, 6, 38, 0): (15, ('u1', 'u2')),
+    (4, 54, 3, 39, 0): (15, ('u1', 'u2')),
+    (4, 54, 6, 36, 0): (15, ('u1', 'u2')),
+    (5, 52, 6, 37, 0): (15, ('u1', 'u2')),
+    (6, 50, 6, 38, 0): (15, ('u1', 'u2')),
+    (6, 52, 3, 39, 0): (16, ('u1', 'u2')),
+    (6, 52, 6, 36, 0): (16, ('u1', 'u2')),
+    (7, 50, 6, 37, 0): (16, ('u1', 'u2')),
+    (8, 48, 6, 38, 0): (16, ('u1', 'u2')),
+    (8, 50, 3, 39, 0): (16, ('u1', 'u2')),
+    (8, 50, 6, 36, 0): (16, ('u1', 'u2')),
+    (2, 58, 3, 37, 0): (15, ('u1', 'u2')),
+    (3, 56, 3, 38, 0): (15, ('u1', 'u2')),
+    (3, 58, 3, 36, 0): (16, ('u1', 'u2')),
+    (4, 56, 3, 37, 0): (16, ('u1', 'u2')),
+    (5, 54, 3, 38, 0): (16, ('u1', 'u2')),
+    (5, 56, 0, 39, 0): (16, ('u1', 'u2')),
+    (5, 56, 3, 36, 0): (16, ('u1', 'u2')),
+    (6, 54, 3, 37, 0): (16, ('u1', 'u2')),
+    (7, 52, 3, 38, 0): (16, ('u1', 'u2')),
+    (7, 54, 0, 39, 0): (17, ('u1', 'u2')),
+    (7, 54, 3, 36, 0): (17, ('u1', 'u2')),
+    (8, 52, 3, 37, 0): (17, ('u1', 'u2')),
+    (9, 50, 3, 38, 0): (17, ('u1', 'u2')),
+    (9, 52, 0, 39, 0): (17, ('u1', 'u2')),
+    (9, 52, 3, 36, 0): (17, ('u1', 'u2')),
+    (2, 60, 0, 38, 0): (16, ('u1', 'u2')),
+    (2, 62, 0, 36, 0): (16, ('u1', 'u2')),
+    (3, 60, 0, 37, 0): (16, ('u2', 'u2')),
+    (4, 58, 0, 38, 0): (16, ('u1', 'u2')),
+    (4, 60, 0, 36, 0): (17, ('u1', 'u2')),
+    (5, 58, 0, 37, 0): (17, ('u1', 'u2')),
+    (6, 56, 0, 38, 0): (17, ('u1', 'u2')),
+    (6, 58, 0, 36, 0): (17, ('u1', 'u2')),
+    (7, 56, 0, 37, 0): (17, ('u1', 'u2')),
+    (8, 54, 0, 38, 0): (17, ('u1', 'u2')),
+    (8, 56, 0, 36, 0): (18, ('u1', 'u2')),
+    (9, 54, 0, 37, 0): (18, ('u1', 'u2')),
+    (10, 52, 0, 38, 0): (18, ('u1', 'u2')),
+    (10, 54, 0, 36, 0): (18, ('u1', 'u2')),
+    (0, 44, 21, 35, 0): (3, ('u3', 'u3')),
+    (0, 42, 24, 34, 0): (4, ('u3', 'u3')),
+    (0, 44, 24, 32, 0): (4, ('u3', 'u3')),
+    (0, 38, 27, 35, 0): (4, ('u3', 'u3')),
+    (0, 36, 30, 34, 0): (5, ('u3', 'u3')),
+    (0, 38, 30, 32, 0): (5, ('u3', 'u3')),
+    (0, 40, 27, 33, 0): (4, ('u3', 'u3')),
+    (1, 38, 27, 34, 0): (10, ('u1', 'u3')),
+    (1, 40, 24, 35, 0): (10, ('u1', 'u2')),
+    (1, 40, 27, 32, 0): (10, ('u1', 'u2')),
+    (1, 42, 24, 33, 0): (11, ('u1', 'u2')),
+    (0, 46, 21, 33, 0): (3, ('u3', 'u3')),
+    (1, 44, 21, 34, 0): (11, ('u1', 'u2')),
+    (1, 46, 18, 35, 0): (12, ('u1', 'u2')),
+    (1, 46, 21, 32, 0): (12, ('u1', 'u2')),
+    (3, 44, 18, 35, 0): (12, ('u1', 'u2')),
+    (3, 44, 21, 32, 0): (12, ('u1', 'u2')),
+    (0, 50, 15, 35, 0): (2, ('u3', 'u3')),
+    (0, 48, 18, 34, 0): (3, ('u3', 'u3')),
+    (0, 50, 18, 32, 0): (3, ('u3', 'u3')),
+    (1, 48, 18, 33, 0): (12, ('u1', 'u2')),
+    (2, 48, 15, 35, 0): (13, ('u1', 'u2')),
+    (4, 44, 18, 34, 0): (13, ('u1', 'u2')),
+    (4, 46, 15, 35, 0): (13, ('u1', 'u2')),
+    (4, 46, 18, 32, 0): (13, ('u1', 'u2')),
+    (0, 52, 15, 33, 0): (2, ('u3', 'u3')),
+    (1, 50, 15, 34, 0): (13, ('u1', 'u2')),
+    (1, 52, 12, 35, 0): (13, ('u1', 'u2')),
+    (1, 52, 15, 32, 0): (13, ('u1', 'u2')),
+    (3, 48, 15, 34, 0): (13, ('u1', 'u2')),
+    (4, 48, 15, 33, 0): (14, ('u1', 'u2')),
+    (5, 46, 15, 34, 0): (14, ('u1', 'u2')),
+    (5, 48, 12, 35, 0): (14, ('u1', 'u2')),
+    (5, 48, 15, 32, 0): (14, ('u1', 'u2')),
+    (0, 56, 9, 35, 0): (1, ('u3', 'u3')),
+    (0, 54, 12, 34, 0): (2, ('u3', 'u3')),
+    (0, 56, 12, 32, 0): (2, ('u3', 'u3')),
+    (1, 54, 12, 33, 0): (14, ('u1', 'u2')),
+    (2, 52, 12, 34, 0): (14, ('u1', 'u2')),
+    (2, 54, 9, 35, 0): (14, ('u1', 'u2')),
+    (2, 54, 12, 32, 0): (14, ('u1', 'u2')),
+    (3, 52, 12, 33, 0): (14, ('u1', 'u2')),
+    (4, 50, 12, 34, 0): (14, ('u1', 'u2')),
+    (4, 52, 9, 35, 0): (15, ('u1', 'u2')),
+    (4, 52, 12, 32, 0): (15, ('u1', 'u2')),
+    (5, 50, 12, 33, 0): (15, ('u1', 'u2')),
+    (6, 48, 12, 34, 0): (15, ('u1', 'u2')),
+    (6, 50, 9, 35, 0): (15, ('u1', 'u2')),
+    (6, 50, 12, 32, 0): (15, ('u1', 'u2')),
+    (0, 58, 9, 33, 0): (1, ('u3', 'u3')),
+    (1, 56, 9, 34, 0): (14, ('u1', 'u2')),
+    (1, 58, 6, 35, 0): (15, ('u1', 'u2')),
+    (1, 58, 9, 32, 0): (15, ('u1', 'u2')),
+    (2, 56, 9, 33, 0): (15, ('u1', 'u2')),
+    (3, 54, 9, 34, 0): (15, ('u1', 'u2')),
+    (3, 56, 6, 35, 0): (15, ('u1', 'u2')),
+    (3, 56, 9, 32, 0): (15, ('u1', 'u2')),
+    (4, 54, 9, 33, 0): (15, ('u1', 'u2')),
+    (5, 52, 9, 34, 0): (15, ('u1', 'u2')),
+    (5, 54, 6, 35, 0): (16, ('u1', 'u2')),
+    (5, 54, 9, 32, 0): (16, ('u1', 'u2')),
+    (6, 52, 9, 33, 0): (16, ('u1', 'u2')),
+    (7, 50, 9, 34, 0): (16, ('u1', 'u2')),
+    (7, 52, 6, 35, 0): (16, ('u1', 'u2')),
+    (7, 52, 9, 32, 0): (16, ('u1', 'u2')),
+    (0, 60, 6, 34, 0): (1, ('u3', 'u3')),
+    (0, 62, 6, 32, 0): (1, ('u3', 'u3')),
+    (1, 60, 6, 33, 0): (15, ('u1', 'u2')),
+    (2, 58, 6, 34, 0): (15, ('u1', 'u2')),
+    (2, 60, 3, 35, 0): (16, ('u1', 'u2')),
+    (2, 60, 6, 32, 0): (16, ('u1', 'u2')),
+    (3, 58, 6, 33, 0): (16, ('u1', 'u2')),
+    (4, 56, 6, 34, 0): (16, ('u1', 'u2')),
+    (4, 58, 3, 35, 0): (16, ('u1', 'u2')),
+    (4, 58, 6, 32, 0): (16, ('u1', 'u2')),
+    (5, 56, 6, 33, 0): (16, ('u1', 'u2')),
+    (6, 54, 6, 34, 0): (16, ('u1', 'u2')),
+    (6, 56, 3, 35, 0): (17, ('u1', 'u2')),
+    (6, 56, 6, 32, 0): (17, ('u1', 'u2')),
+    (7, 54, 6, 33, 0): (17, ('u1', 'u2')),
+    (8, 52, 6, 34, 0): (17, ('u1', 'u2')),
+    (8, 54, 3, 35, 0): (17, ('u1', 'u2')),
+    (8, 54, 6, 32, 0): (17, ('u1', 'u2')),
+    (2, 62, 3, 33, 0): (16, ('u1', 'u2')),
+    (3, 60, 3, 34, 0): (16, ('u1', 'u2')),
+    (3, 62, 3, 32, 0): (17, ('u1', 'u2')),
+    (4, 60, 3, 33, 0): (17, ('u1', 'u2')),
+    (5, 58, 3, 34, 0): (17, ('u1', 'u2')),
+    (5, 60, 0, 35, 0): (17, ('u1', 'u2')),
+    (5, 60, 3, 32, 0): (17, ('u1', 'u2')),
+    (6, 58, 3, 33, 0): (17, ('u1', 'u2')),
+    (7, 56, 3, 34, 0): (17, ('u1', 'u2')),
+    (7, 58, 0, 35, 0): (18, ('u1', 'u2')),
+    (7, 58, 3, 32, 0): (18, ('u1', 'u2')),
+    (8, 56, 3, 33, 0): (18, ('u1', 'u2')),
+    (9, 54, 3, 34, 0): (18, ('u1', 'u2')),
+    (9, 56, 0, 35, 0): (18, ('u1', 'u2')),
+    (9, 56, 3, 32, 0): (18, ('u1', 'u2')),
+    (2, 64, 0, 34, 0): (17, ('u1', 'u2')),
+    (2, 66, 0, 32, 0): (17, ('u1', 'u2')),
+    (3, 64, 0, 33, 0): (17, ('u2', 'u2')),
+    (4, 62, 0, 34, 0): (17, ('u1', 'u2')),
+    (4, 64, 0, 32, 0): (18, ('u1', 'u2')),
+    (5, 62, 0, 33, 0): (18, ('u1', 'u2')),
+    (6, 60, 0, 34, 0): (18, ('u1', 'u2')),
+    (6, 62, 0, 32, 0): (18, ('u1', 'u2')),
+    (7, 60, 0, 33, 0): (18, ('u1', 'u2')),
+    (8, 58, 0, 34, 0): (18, ('u1', 'u2')),
+    (8, 60, 0, 32, 0): (19, ('u1', 'u2')),
+    (9, 58, 0, 33, 0): (19, ('u1', 'u2')),
+    (10, 56, 0, 34, 0): (19, ('u1', 'u2')),
+    (10, 58, 0, 32, 0): (19, ('u1', 'u2')),
+    (0, 48, 21, 31, 0): (3, ('u3', 'u3')),
+    (0, 46, 24, 30, 0): (4, ('u3', 'u3')),
+    (0, 48, 24, 28, 0): (4, ('u3', 'u3')),
+    (0, 42, 27, 31, 0): (4, ('u3', 'u3')),
+    (0, 40, 30, 30, 0): (5, ('u3', 'u3')),
+    (0, 42, 30, 28, 0): (5, ('u3', 'u3')),
+    (0, 44, 27, 29, 0): (4, ('u3', 'u3')),
+    (1, 42, 27, 30, 0): (11, ('u1', 'u2')),
+    (1, 44, 24, 31, 0): (11, ('u1', 'u2')),
+    (1, 44, 27, 28, 0): (11, ('u1', 'u2')),
+    (1, 46, 24, 29, 0): (12, ('u1', 'u2')),
+    (0, 50, 21, 29, 0): (3, ('u3', 'u3')),
+    (1, 48, 21, 30, 0): (12, ('u1', 'u2')),
+    (1, 50, 18, 31, 0): (13, ('u1', 'u2')),
+    (1, 50, 21, 28, 0): (13, ('u1', 'u2')),
+    (3, 48, 18, 31, 0): (13, ('u1', 'u2')),
+    (3, 48, 21, 28, 0): (13, ('u1', 'u2')),
+    (0, 54, 15, 31, 0): (2, ('u3', 'u3')),
+    (0, 52, 18, 30, 0): (3, ('u3', 'u3')),
+    (0, 54, 18, 28, 0): (3, ('u3', 'u3')),
+    (1, 52, 18, 29, 0): (13, ('u1', 'u2')),
+    (2, 52, 15, 31, 0): (14, ('u1', 'u2')),
+    (4, 48, 18, 30, 0): (14, ('u1', 'u2')),
+    (4, 50, 15, 31, 0): (14, ('u1', 'u2')),
+    (4, 50, 18, 28, 0): (14, ('u1', 'u2')),
+    (0, 56, 15, 29, 0): (2, ('u3', 'u3')),
+    (1, 54, 15, 30, 0): (14, ('u1', 'u2')),
+    (1, 56, 12, 31, 0): (14, ('u1', 'u2')),
+    (1, 56, 15, 28, 0): (14, ('u1', 'u2')),
+    (2, 54, 15, 29, 0): (14, ('u1', 'u2')),
+    (3, 52, 15, 30, 0): (14, ('u1', 'u2')),
+    (3, 54, 12, 31, 0): (15, ('u1', 'u2')),
+    (4, 52, 15, 29, 0): (15, ('u1', 'u2')),
+    (5, 50, 15, 30, 0): (15, ('u1', 'u2')),
+    (5, 52, 12, 31, 0): (15, ('u1', 'u2')),
+    (5, 52, 15, 28, 0): (15, ('u1', 'u2')),
+    (0, 60, 9, 31, 0): (1, ('u3', 'u3')),
+    (0, 58, 12, 30, 0): (2, ('u3', 'u3')),
+    (0, 60, 12, 28, 0): (2, ('u3', 'u3')),
+    (1, 58, 12, 29, 0): (15, ('u1', 'u2')),
+    (2, 56, 12, 30, 0): (15, ('u1', 'u2')),
+    (2, 58, 9, 31, 0): (15, ('u1', 'u2')),
+    (2, 58, 12, 28, 0): (15, ('u1', 'u2')),
+    (3, 56, 12, 29, 0): (15, ('u1', 'u2')),
+    (4, 54, 12, 30, 0): (15, ('u1', 'u2')),
+    (4, 56, 9, 31, 0): (16, ('u1', 'u2')),
+    (4, 56, 12, 28, 0): (16, ('u1', 'u2')),
+    (5, 54, 12, 29, 0): (16, ('u1', 'u2')),
+    (6, 52, 12, 30, 0): (16, ('u1', 'u2')),
+    (6, 54, 9, 31, 0): (16, ('u1', 'u2')),
+    (6, 54, 12, 28, 0): (16, ('u1', 'u2')),
+    (0, 62, 9, 29, 0): (1, ('u3', 'u3')),
+    (1, 60, 9, 30, 0): (15, ('u1', 'u2')),
+    (1, 62, 6, 31, 0): (16, ('u1', 'u2')),
+    (1, 62, 9, 28, 0): (16, ('u1', 'u2')),
+    (2, 60, 9, 29, 0): (16, ('u1', 'u2')),
+    (3, 58, 9, 30, 0): (16, ('u1', 'u2')),
+    (3, 60, 6, 31, 0): (16, ('u1', 'u2')),
+    (3, 60, 9, 28, 0): (16, ('u1', 'u2')),
+    (4, 58, 9, 29, 0): (16, ('u1', 'u2')),
+    (5, 56, 9, 30, 0): (16, ('u1', 'u2')),
+    (5, 58, 6, 31, 0): (17, ('u1', 'u2')),
+    (5, 58, 9, 28, 0): (17, ('u1', 'u2')),
+    (6, 56, 9, 29, 0): (17, ('u1', 'u2')),
+    (7, 54, 9, 30, 0): (17, ('u1', 'u2')),
+    (7, 56, 6, 31, 0): (17, ('u1', 'u2')),
+    (7, 56, 9, 28, 0): (17, ('u1', 'u2')),
+    (0, 64, 6, 30, 0): (1, ('u3', 'u3')),
+    (0, 66, 6, 28, 0): (1, ('u3', 'u3')),
+    (1, 64, 6, 29, 0): (16, ('u1', 'u2')),
+    (2, 62, 6, 30, 0): (16, ('u1', 'u2')),
+    (2, 64, 3, 31, 0): (17, ('u1', 'u2')),
+    (2, 64, 6, 28, 0): (17, ('u1', 'u2')),
+    (3, 62, 6, 29, 0): (17, ('u1', 'u2')),
+    (4, 60, 6, 30, 0): (17, ('u1', 'u2')),
+    (4, 62, 3, 31, 0): (17, ('u1', 'u2')),
+    (4, 62, 6, 28, 0): (17, ('u1', 'u2')),
+    (5, 60, 6, 29, 0): (17, ('u1', 'u2')),
+    (6, 58, 6, 30, 0): (17, ('u1', 'u2')),
+    (6, 60, 3, 31, 0): (18, ('u1', 'u2')),
+    (6, 60, 6, 28, 0): (18, ('u1', 'u2')),
+    (7, 58, 6, 29, 0): (18, ('u1', 'u2')),
+    (8, 56, 6, 30, 0): (18, ('u1', 'u2')),
+    (8, 58, 3, 31, 0): (18, ('u1', 'u2')),
+    (8, 58, 6, 28, 0): (18, ('u1', 'u2')),
+    (2, 66, 3, 29, 0): (17, ('u1', 'u2')),
+    (3, 64, 3, 30, 0): (17, ('u1', 'u2')),
+    (3, 66, 3, 28, 0): (18, ('u1', 'u2')),
+    (4, 64, 3, 29, 0): (18, ('u1', 'u2')),
+    (5, 62, 3, 30, 0): (18, ('u1', 'u2')),
+    (5, 64, 0, 31, 0): (18, ('u1', 'u2')),
+    (5, 64, 3, 28, 0): (18, ('u1', 'u2')),
+    (6, 62, 3, 29, 0): (18, ('u1', 'u2')),
+    (7, 60, 3, 30, 0): (18, ('u1', 'u2')),
+    (7, 62, 0, 31, 0): (19, ('u1', 'u2')),
+    (7, 62, 3, 28, 0): (19, ('u1', 'u2')),
+    (8, 60, 3, 29, 0): (19, ('u1', 'u2')),
+    (9, 58, 3, 30, 0): (19, ('u1', 'u2')),
+    (9, 60, 0, 31, 0): (19, ('u1', 'u2')),
+    (9, 60, 3, 28, 0): (19, ('u1', 'u2')),
+    (2, 68, 0, 30, 0): (18, ('u1', 'u2')),
+    (2, 70, 0, 28, 0): (18, ('u1', 'u2')),
+    (3, 68, 0, 29, 0): (18, ('u2', 'u2')),
+    (4, 66, 0, 30, 0): (18, ('u1', 'u2')),
+    (4, 68, 0, 28, 0): (19, ('u1', 'u2')),
+    (5, 66, 0, 29, 0): (19, ('u1', 'u2')),
+    (6, 64, 0, 30, 0): (19, ('u1', 'u2')),
+    (6, 66, 0, 28, 0): (19, ('u1', 'u2')),
+    (7, 64, 0, 29, 0): (19, ('u1', 'u2')),
+    (8, 62, 0, 30, 0): (19, ('u1', 'u2')),
+    (8, 64, 0, 28, 0): (20, ('u1', 'u2')),
+    (9, 62, 0, 29, 0): (20, ('u1', 'u2')),
+    (10, 60, 0, 30, 0): (20, ('u1', 'u2')),
+    (10, 62, 0, 28, 0): (20, ('u1', 'u2')),
+    (0, 52, 21, 27, 0): (3, ('u3', 'u3')),
+    (0, 50, 24, 26, 0): (4, ('u3', 'u3')),
+    (0, 52, 24, 24, 0): (4, ('u3', 'u3')),
+    (0, 46, 27, 27, 0): (4, ('u3', 'u3')),
+    (0, 44, 30, 26, 0): (5, ('u3', 'u3')),
+    (0, 46, 30, 24, 0): (5, ('u3', 'u3')),
+    (0, 48, 27, 25, 0): (4, ('u3', 'u3')),
+    (1, 46, 27, 26, 0): (12, ('u1', 'u2')),
+    (1, 48, 24, 27, 0): (12, ('u1', 'u2')),
+    (1, 48, 27, 24, 0): (12, ('u1', 'u2')),
+    (1, 50, 24, 25, 0): (13, ('u1', 'u2')),
+    (0, 54, 21, 25, 0): (3, ('u3', 'u3')),
+    (1, 52, 21, 26, 0): (13, ('u1', 'u2')),
+    (1, 54, 18, 27, 0): (14, ('u1', 'u2')),
+    (1, 54, 21, 24, 0): (14, ('u1', 'u2')),
+    (3, 52, 18, 27, 0): (14, ('u1', 'u2')),
+    (3, 52, 21, 24, 0): (14, ('u1', 'u2')),
+    (0, 58, 15, 27, 0): (2, ('u3', 'u3')),
+    (0, 56, 18, 26, 0): (3, ('u3', 'u3')),
+    (0, 58, 18, 24, 0): (3, ('u3', 'u3')),
+    (1, 56, 18, 25, 0): (14, ('u1', 'u2')),
+    (2, 56, 15, 27, 0): (15, ('u1', 'u2')),
+    (2, 56, 18, 24, 0): (15, ('u1', 'u2')),
+    (4, 52, 18, 26, 0): (15, ('u1', 'u2')),
+    (4, 54, 15, 27, 0): (15, ('u1', 'u2')),
+    (4, 54, 18, 24, 0): (15, ('u1', 'u2')),
+    (0, 60, 15, 25, 0): (2, ('u3', 'u3')),
+    (1, 58, 15, 26, 0): (15, ('u1', 'u2')),
+    (1, 60, 12, 27, 0): (15, ('u1', 'u2')),
+    (1, 60, 15, 24, 0): (15, ('u1', 'u2')),
+    (2, 58, 15, 25, 0): (15, ('u1', 'u2')),
+    (3, 56, 15, 26, 0): (15, ('u1', 'u2')),
+    (3, 58, 12, 27, 0): (16, ('u1', 'u2')),
+    (4, 56, 15, 25, 0): (16, ('u1', 'u2')),
+    (5, 54, 15, 26, 0): (16, ('u1', 'u2')),
+    (5, 56, 12, 27, 0): (16, ('u1', 'u2')),
+    (5, 56, 15, 24, 0): (16, ('u1', 'u2')),
+    (0, 64, 9, 27, 0): (1, ('u3', 'u3')),
+    (0, 62, 12, 26, 0): (2, ('u3', 'u3')),
+    (0, 64, 12, 24, 0): (2, ('u3', 'u3')),
+    (1, 62, 12, 25, 0): (16, ('u1', 'u2')),
+    (2, 60, 12, 26, 0): (16, ('u1', 'u2')),
+    (2, 62, 9, 27, 0): (16, ('u1', 'u2')),
+    (2, 62, 12, 24, 0): (16, ('u1', 'u2')),
+    (3, 60, 12, 25, 0): (16, ('u1', 'u2')),
+    (4, 58, 12, 26, 0): (16, ('u1', 'u2')),
+    (4, 60, 9, 27, 0): (17, ('u1', 'u2')),
+    (4, 60, 12, 24, 0): (17, ('u1', 'u2')),
+    (5, 58, 12, 25, 0): (17, ('u1', 'u2')),
+    (6, 56, 12, 26, 0): (17, ('u1', 'u2')),
+    (6, 58, 9, 27, 0): (17, ('u1', 'u2')),
+    (6, 58, 12, 24, 0): (17, ('u1', 'u2')),
+    (0, 66, 9, 25, 0): (1, ('u3', 'u3')),
+    (1, 64, 9, 26, 0): (16, ('u1', 'u2')),
+    (1, 66, 6, 27, 0): (17, ('u1', 'u2')),
+    (1, 66, 9, 24, 0): (17, ('u1', 'u2')),
+    (2, 64, 9, 25, 0): (17, ('u1', 'u2')),
+    (3, 62, 9, 26, 0): (17, ('u1', 'u2')),
+    (3, 64, 6, 27, 0): (17, ('u1', 'u2')),
+    (3, 64, 9, 24, 0): (17, ('u1', 'u2')),
+    (4, 62, 9, 25, 0): (17, ('u1', 'u2')),
+    (5, 60, 9, 26, 0): (17, ('u1', 'u2')),
+    (5, 62, 6, 27, 0): (18, ('u1', 'u2')),
+    (5, 62, 9, 24, 0): (18, ('u1', 'u2')),
+    (6, 60, 9, 25, 0): (18, ('u1', 'u2')),
+    (7, 58, 9, 26, 0): (18, ('u1', 'u2')),
+    (7, 60, 6, 27, 0): (18, ('u1', 'u2')),
+    (7, 60, 9, 24, 0): (18, ('u1', 'u2')),
+    (0, 68, 6, 26, 0): (1, ('u3', 'u3')),
+    (0, 70, 6, 24, 0): (1, ('u3', 'u3')),
+    (1, 68, 6, 25, 0): (17, ('u1', 'u2')),
+    (2, 66, 6, 26, 0): (17, ('u1', 'u2')),
+    (2, 68, 3, 27, 0): (18, ('u1', 'u2')),
+    (2, 68, 6, 24, 0): (18, ('u1', 'u2')),
+    (3, 66, 6, 25, 0): (18, ('u1', 'u2')),
+    (4, 64, 6, 26, 0): (18, ('u1', 'u2')),
+    (4, 66, 3, 27, 0): (18, ('u1', 'u2')),
+    (4, 66, 6, 24, 0): (18, ('u1', 'u2')),
+    (5, 64, 6, 25, 0): (18, ('u1', 'u2')),
+    (6, 62, 6, 26, 0): (18, ('u1', 'u2')),
+    (6, 64, 3, 27, 0): (19, ('u1', 'u2')),
+    (6, 64, 6, 24, 0): (19, ('u1', 'u2')),
+    (7, 62, 6, 25, 0): (19, ('u1', 'u2')),
+    (8, 60, 6, 26, 0): (19, ('u1', 'u2')),
+    (8, 62, 3, 27, 0): (19, ('u1', 'u2')),
+    (8, 62, 6, 24, 0): (19, ('u1', 'u2')),
+    (2, 70, 3, 25, 0): (18, ('u1', 'u2')),
+    (3, 68, 3, 26, 0): (18, ('u1', 'u2')),
+    (3, 70, 3, 24, 0): (19, ('u1', 'u2')),
+    (4, 68, 3, 25, 0): (19, ('u1', 'u2')),
+    (5, 66, 3, 26, 0): (19, ('u1', 'u2')),
+    (5, 68, 0, 27, 0): (19, ('u1', 'u2')),
+    (5, 68, 3, 24, 0): (19, ('u1', 'u2')),
+    (6, 66, 3, 25, 0): (19, ('u1', 'u2')),
+    (7, 64, 3, 26, 0): (19, ('u1', 'u2')),
+    (7, 66, 0, 27, 0): (20, ('u1', 'u2')),
+    (7, 66, 3, 24, 0): (20, ('u1', 'u2')),
+    (8, 64, 3, 25, 0): (20, ('u1', 'u2')),
+    (9, 62, 3, 26, 0): (20, ('u1', 'u2')),
+    (9, 64, 0, 27, 0): (20, ('u1', 'u2')),
+    (9, 64, 3, 24, 0): (20, ('u1', 'u2')),
+    (2, 72, 0, 26, 0): (19, ('u1', 'u2')),
+    (2, 74, 0, 24, 0): (19, ('u1', 'u2')),
+    (3, 72, 0, 25, 0): (19, ('u2', 'u2')),
+    (4, 70, 0, 26, 0): (19, ('u1', 'u2')),
+    (4, 72, 0, 24, 0): (20, ('u1', 'u2')),
+    (5, 70, 0, 25, 0): (20, ('u1', 'u2')),
+    (6, 68, 0, 26, 0): (20, ('u1', 'u2')),
+    (6, 70, 0, 24, 0): (20, ('u1', 'u2')),
+    (7, 68, 0, 25, 0): (20, ('u1', 'u2')),
+    (8, 66, 0, 26, 0): (20, ('u1', 'u2')),
+    (8, 68, 0, 24, 0): (21, ('u1', 'u2')),
+    (9, 66, 0, 25, 0): (21, ('u1', 'u2')),
+    (10, 64, 0, 26, 0): (21, ('u1', 'u2')),
+    (10, 66, 0, 24, 0): (21, ('u1', 'u2')),
+    (0, 56, 21, 23, 0): (3, ('u3', 'u3')),
+    (0, 54, 24, 22, 0): (4, ('u3', 'u3')),
+    (0, 56, 24, 20, 0): (4, ('u3', 'u3')),
+    (0, 50, 27, 23, 0): (4, ('u3', 'u3')),
+    (0, 48, 30, 22, 0): (5, ('u3', 'u3')),
+    (0, 50, 30, 20, 0): (5, ('u3', 'u3')),
+    (0, 52, 27, 21, 0): (4, ('u3', 'u3')),
+    (1, 50, 27, 22, 0): (13, ('u1', 'u2')),
+    (1, 52, 24, 23, 0): (13, ('u1', 'u2')),
+    (1, 52, 27, 20, 0): (13, ('u1', 'u2')),
+    (1, 54, 24, 21, 0): (14, ('u1', 'u2')),
+    (0, 58, 21, 21, 0): (3, ('u3', 'u3')),
+    (1, 56, 21, 22, 0): (14, ('u1', 'u2')),
+    (1, 58, 18, 23, 0): (15, ('u1', 'u2')),
+    (1, 58, 21, 20, 0): (15, ('u1', 'u2')),
+    (3, 56, 18, 23, 0): (15, ('u1', 'u2')),
+    (3, 56, 21, 20, 0): (15, ('u1', 'u2')),
+    (0, 62, 15, 23, 0): (2, ('u3', 'u3')),
+    (0, 60, 18, 22, 0): (3, ('u3', 'u3')),
+    (0, 62, 18, 20, 0): (3, ('u3', 'u3')),
+    (1, 60, 18, 21, 0): (15, ('u1', 'u2')),
+    (2, 60, 15, 23, 0): (16, ('u1', 'u2')),
+    (2, 60, 18, 20, 0): (16, ('u1', 'u2')),
+    (4, 56, 18, 22, 0): (16, ('u1', 'u2')),
+    (4, 58, 15, 23, 0): (16, ('u1', 'u2')),
+    (4, 58, 18, 20, 0): (16, ('u1', 'u2')),
+    (0, 64, 15, 21, 0): (2, ('u3', 'u3')),
+    (1, 62, 15, 22, 0): (16, ('u1', 'u2')),
+    (1, 64, 12, 23, 0): (16, ('u1', 'u2')),
+    (1, 64, 15, 20, 0): (16, ('u1', 'u2')),
+    (2, 62, 15, 21, 0): (16, ('u1', 'u2')),
+    (3, 60, 15, 22, 0): (16, ('u1', 'u2')),
+    (3, 62, 12, 23, 0): (17, ('u1', 'u2')),
+    (3, 62, 15, 20, 0): (17, ('u1', 'u2')),
+    (4, 60, 15, 21, 0): (17, ('u1', 'u2')),
+    (5, 58, 15, 22, 0): (17, ('u1', 'u2')),
+    (5, 60, 12, 23, 0): (17, ('u1', 'u2')),
+    (5, 60, 15, 20, 0): (17, ('u1', 'u2')),
+    (0, 68, 9, 23, 0): (1, ('u3', 'u3')),
+    (0, 66, 12, 22, 0): (2, ('u3', 'u3')),
+    (0, 68, 12, 20, 0): (2, ('u3', 'u3')),
+    (1, 66, 12, 21, 0): (17, ('u1', 'u2')),
+    (2, 64, 12, 22, 0): (17, ('u1', 'u2')),
+    (2, 66, 9, 23, 0): (17, ('u1', 'u2')),
+    (2, 66, 12, 20, 0): (17, ('u1', 'u2')),
+    (3, 64, 12, 21, 0): (17, ('u1', 'u2')),
+    (4, 62, 12, 22, 0): (17, ('u1', 'u2')),
+    (4, 64, 9, 23, 0): (18, ('u1', 'u2')),
+    (4, 64, 12, 20, 0): (18, ('u1', 'u2')),
+    (5, 62, 12, 21, 0): (18, ('u1', 'u2')),
+    (6, 60, 12, 22, 0): (18, ('u1', 'u2')),
+    (6, 62, 9, 23, 0): (18, ('u1', 'u2')),
+    (6, 62, 12, 20, 0): (18, ('u1', 'u2')),
+    (0, 70, 9, 21, 0): (1, ('u3', 'u3')),
+    (1, 68, 9, 22, 0): (17, ('u1', 'u2')),
+    (1, 70, 6, 23, 0): (18, ('u1', 'u2')),
+    (1, 70, 9, 20, 0): (18, ('u1', 'u2')),
+    (2, 68, 9, 21, 0): (18, ('u1', 'u2')),
+    (3, 66, 9, 22, 0): (18, ('u1', 'u2')),
+    (3, 68, 6, 23, 0): (18, ('u1', 'u2')),
+    (3, 68, 9, 20, 0): (18, ('u1', 'u2')),
+    (4, 66, 9, 21, 0): (18, ('u1', 'u2')),
+    (5, 64, 9, 22, 0): (18, ('u1', 'u2')),
+    (5, 66, 6, 23, 0): (19, ('u1', 'u2')),
+    (5, 66, 9, 20, 0): (19, ('u1', 'u2')),
+    (6, 64, 9, 21, 0): (19, ('u1', 'u2')),
+    (7, 62, 9, 22, 0): (19, ('u1', 'u2')),
+    (7, 64, 6, 23, 0): (19, ('u1', 'u2')),
+    (7, 64, 9, 20, 0): (19, ('u1', 'u2')),
+    (0, 72, 6, 22, 0): (1, ('u3', 'u3')),
+    (0, 74, 6, 20, 0): (1, ('u3', 'u3')),
+    (1, 72, 6, 21, 0): (18, ('u1', 'u2')),
+    (2, 70, 6, 22, 0): (18, ('u1', 'u2')),
+    (2, 72, 3, 23, 0): (19, ('u1', 'u2')),
+    (2, 72, 6, 20, 0): (19, ('u1', 'u2')),
+    (3, 70, 6, 21, 0): (19, ('u1', 'u2')),
+    (4, 68, 6, 22, 0): (19, ('u1', 'u2')),
+    (4, 70, 3, 23, 0): (19, ('u1', 'u2')),
+    (4, 70, 6, 20, 0): (19, ('u1', 'u2')),
+    (5, 68, 6, 21, 0): (19, ('u1', 'u2')),
+    (6, 66, 6, 22, 0): (19, ('u1', 'u2')),
+    (6, 68, 3, 23, 0): (20, ('u1', 'u2')),
+    (6, 68, 6, 20, 0): (20, ('u1', 'u2')),
+    (7, 66, 6, 21, 0): (20, ('u1', 'u2')),
+    (8, 64, 6, 22, 0): (20, ('u1', 'u2')),
+    (8, 66, 3, 23, 0): (20, ('u1', 'u2')),
+    (8, 66, 6, 20, 0): (20, ('u1', 'u2')),
+    (2, 74, 3, 21, 0): (19, ('u1', 'u2')),
+    (3, 72, 3, 22, 0): (19, ('u1', 'u2')),
+    (3, 74, 3, 20, 0): (20, ('u1', 'u2')),
+    (4, 72, 3, 21, 0): (20, ('u1', 'u2')),
+    (5, 70, 3, 22, 0): (20, ('u1', 'u2')),
+    (5, 72, 0, 23, 0): (20, ('u1', 'u2')),
+    (5, 72, 3, 20, 0): (20, ('u1', 'u2')),
+    (6, 70, 3, 21, 0): (20, ('u1', 'u2')),
+    (7, 68, 3, 22, 0): (20, ('u1', 'u2')),
+    (7, 70, 0, 23, 0): (21, ('u1', 'u2')),
+    (7, 70, 3, 20, 0): (21, ('u1', 'u2')),
+    (8, 68, 3, 21, 0): (21, ('u1', 'u2')),
+    (9, 66, 3, 22, 0): (21, ('u1', 'u2')),
+    (9, 68, 0, 23, 0): (21, ('u1', 'u2')),
+    (9, 68, 3, 20, 0): (21, ('u1', 'u2')),
+    (2, 76, 0, 22, 0): (20, ('u1', 'u2')),
+    (2, 78, 0, 20, 0): (20, ('u1', 'u2')),
+    (3, 76, 0, 21, 0): (20, ('u2', 'u2')),
+    (4, 74, 0, 22, 0): (20, ('u1', 'u2')),
+    (4, 76, 0, 20, 0): (21, ('u1', 'u2')),
+    (5, 74, 0, 21, 0): (21, ('u1', 'u2')),
+    (6, 72, 0, 22, 0): (21, ('u1', 'u2')),
+    (6, 74, 0, 20, 0): (21, ('u1', 'u2')),
+    (7, 72, 0, 21, 0): (21, ('u1', 'u2')),
+    (8, 70, 0, 22, 0): (21, ('u1', 'u2')),
+    (8, 72, 0, 20, 0): (22, ('u1', 'u2')),
+    (9, 70, 0, 21, 0): (22, ('u1', 'u2')),
+    (10, 68, 0, 22, 0): (22, ('u1', 'u2')),
+    (10, 70, 0, 20, 0): (22, ('u1', 'u2')),
+    (0, 60, 21, 19, 0): (3, ('u3', 'u3')),
+    (0, 58, 24, 18, 0): (4, ('u3', 'u3')),
+    (0, 60, 24, 16, 0): (4, ('u3', 'u3')),
+    (0, 54, 27, 19, 0): (4, ('u3', 'u3')),
+    (0, 52, 30, 18, 0): (5, ('u3', 'u3')),
+    (0, 54, 30, 16, 0): (5, ('u3', 'u3')),
+    (0, 56, 27, 17, 0): (4, ('u3', 'u3')),
+    (1, 54, 27, 18, 0): (14, ('u1', 'u2')),
+    (1, 56, 24, 19, 0): (14, ('u1', 'u2')),
+    (1, 56, 27, 16, 0): (14, ('u1', 'u2')),
+    (1, 58, 24, 17, 0): (15, ('u1', 'u2')),
+    (0, 62, 21, 17, 0): (3, ('u3', 'u3')),
+    (1, 60, 21, 18, 0): (15, ('u1', 'u2')),
+    (1, 62, 18, 19, 0): (16, ('u1', 'u2')),
+    (1, 62, 21, 16, 0): (16, ('u1', 'u2')),
+    (3, 60, 18, 19, 0): (16, ('u1', 'u2')),
+    (3, 60, 21, 16, 0): (16, ('u1', 'u2')),
+    (0, 66, 15, 19, 0): (2, ('u3', 'u3')),
+    (0, 64, 18, 18, 0): (3, ('u3', 'u3')),
+    (0, 66, 18, 16, 0): (3, ('u3', 'u3')),
+    (1, 64, 18, 17, 0): (16, ('u1', 'u2')),
+    (2, 62, 18, 18, 0): (16, ('u1', 'u2')),
+    (2, 64, 15, 19, 0): (17, ('u1', 'u2')),
+    (2, 64, 18, 16, 0): (17, ('u1', 'u2')),
+    (4, 60, 18, 18, 0): (17, ('u1', 'u2')),
+    (4, 62, 15, 19, 0): (17, ('u1', 'u2')),
+    (4, 62, 18, 16, 0): (17, ('u1', 'u2')),
+    (0, 68, 15, 17, 0): (2, ('u3', 'u3')),
+    (1, 66, 15, 18, 0): (17, ('u1', 'u2')),
+    (1, 68, 12, 19, 0): (17, ('u1', 'u2')),
+    (1, 68, 15, 16, 0): (17, ('u1', 'u2')),
+    (2, 66, 15, 17, 0): (17, ('u1', 'u2')),
+    (3, 64, 15, 18, 0): (17, ('u1', 'u2')),
+    (3, 66, 12, 19, 0): (18, ('u1', 'u2')),
+    (3, 66, 15, 16, 0): (18, ('u1', 'u2')),
+    (4, 64, 15, 17, 0): (18, ('u1', 'u2')),
+    (5, 62, 15, 18, 0): (18, ('u1', 'u2')),
+    (5, 64, 12, 19, 0): (18, ('u1', 'u2')),
+    (5, 64, 15, 16, 0): (18, ('u1', 'u2')),
+    (0, 72, 9, 19, 0): (1, ('u3', 'u3')),
+    (0, 70, 12, 18, 0): (2, ('u3', 'u3')),
+    (0, 72, 12, 16, 0): (2, ('u3', 'u3')),
+    (1, 70, 12, 17, 0): (18, ('u1', 'u2')),
+    (2, 68, 12, 18, 0): (18, ('u1', 'u2')),
+    (2, 70, 9, 19, 0): (18, ('u1', 'u2')),
+    (2, 70, 12, 16, 0): (18, ('u1', 'u2')),
+    (3, 68, 12, 17, 0): (18, ('u1', 'u2')),
+    (4, 66, 12, 18, 0): (18, ('u1', 'u2')),
+    (4, 68, 9, 19, 0): (19, ('u1', 'u2')),
+    (4, 68, 12, 16, 0): (19, ('u1', 'u2')),
+    (5, 66, 12, 17, 0): (19, ('u1', 'u2')),
+    (6, 64, 12, 18, 0): (19, ('u1', 'u2')),
+    (6, 66, 9, 19, 0): (19, ('u1', 'u2')),
+    (6, 66, 12, 16, 0): (19, ('u1', 'u2')),
+    (0, 74, 9, 17, 0): (1, ('u3', 'u3')),
+    (1, 72, 9, 18, 0): (18, ('u1', 'u2')),
+    (1, 74, 6, 19, 0): (19, ('u1', 'u2')),
+    (1, 74, 9, 16, 0): (19, ('u1', 'u2')),
+    (2, 72, 9, 17, 0): (19, ('u1', 'u2')),
+    (3, 70, 9, 18, 0): (19, ('u1', 'u2')),
+    (3, 72, 6, 19, 0): (19, ('u1', 'u2')),
+    (3, 72, 9, 16, 0): (19, ('u1', 'u2')),
+    (4, 70, 9, 17, 0): (19, ('u1', 'u2')),
+    (5, 68, 9, 18, 0): (19, ('u1', 'u2')),
+    (5, 70, 6, 19, 0): (20, ('u1', 'u2')),
+    (5, 70, 9, 16, 0): (20, ('u1', 'u2')),
+    (6, 68, 9, 17, 0): (20, ('u1', 'u2')),
+    (7, 66, 9, 18, 0): (20, ('u1', 'u2')),
+    (7, 68, 6, 19, 0): (20, ('u1', 'u2')),
+    (7, 68, 9, 16, 0): (20, ('u1', 'u2')),
+    (0, 76, 6, 18, 0): (1, ('u3', 'u3')),
+    (0, 78, 6, 16, 0): (1, ('u3', 'u3')),
+    (1, 76, 6, 17, 0): (19, ('u1', 'u2')),
+    (2, 74, 6, 18, 0): (19, ('u1', 'u2')),
+    (2, 76, 3, 19, 0): (20, ('u1', 'u2')),
+    (2, 76, 6, 16, 0): (20, ('u1', 'u2')),
+    (3, 74, 6, 17, 0): (20, ('u1', 'u2')),
+    (4, 72, 6, 18, 0): (20, ('u1', 'u2')),
+    (4, 74, 3, 19, 0): (20, ('u1', 'u2')),
+    (4, 74, 6, 16, 0): (20, ('u1', 'u2')),
+    (5, 72, 6, 17, 0): (20, ('u1', 'u2')),
+    (6, 70, 6, 18, 0): (20, ('u1', 'u2')),
+    (6, 72, 3, 19, 0): (21, ('u1', 'u2')),
+    (6, 72, 6, 16, 0): (21, ('u1', 'u2')),
+    (7, 70, 6, 17, 0): (21, ('u1', 'u2')),
+    (8, 68, 6, 18, 0): (21, ('u1', 'u2')),
+    (8, 70, 3, 19, 0): (21, ('u1', 'u2')),
+    (8, 70, 6, 16, 0): (21, ('u1', 'u2')),
+    (2, 78, 3, 17, 0): (20, ('u1', 'u2')),
+    (3, 76, 3, 18, 0): (20, ('u1', 'u2')),
+    (3, 78, 3, 16, 0): (21, ('u1', 'u2')),
+    (4, 76, 3, 17, 0): (21, ('u1', 'u2')),
+    (5, 74, 3, 18, 0): (21, ('u1', 'u2')),
+    (5, 76, 0, 19, 0): (21, ('u1', 'u2')),
+    (5, 76, 3, 16, 0): (21, ('u1', 'u2')),
+    (6, 74, 3, 17, 0): (21, ('u1', 'u2')),
+    (7, 72, 3, 18, 0): (21, ('u1', 'u2')),
+    (7, 74, 0, 19, 0): (22, ('u1', 'u2')),
+    (7, 74, 3, 16, 0): (22, ('u1', 'u2')),
+    (8, 72, 3, 17, 0): (22, ('u1', 'u2')),
+    (9, 70, 3, 18, 0): (22, ('u1', 'u2')),
+    (9, 72, 0, 19, 0): (22, ('u1', 'u2')),
+    (9, 72, 3, 16, 0): (22, ('u1', 'u2')),
+    (2, 80, 0, 18, 0): (21, ('u1', 'u2')),
+    (2, 82, 0, 16, 0): (21, ('u1', 'u2')),
+    (3, 80, 0, 17, 0): (21, ('u2', 'u2')),
+    (4, 78, 0, 18, 0): (21, ('u1', 'u2')),
+    (4, 80, 0, 16, 0): (22, ('u1', 'u2')),
+    (5, 78, 0, 17, 0): (22, ('u1', 'u2')),
+    (6, 76, 0, 18, 0): (22, ('u1', 'u2')),
+    (6, 78, 0, 16, 0): (22, ('u1', 'u2')),
+    (7, 76, 0, 17, 0): (22, ('u1', 'u2')),
+    (8, 74, 0, 18, 0): (22, ('u1', 'u2')),
+    (8, 76, 0, 16, 0): (23, ('u1', 'u2')),
+    (9, 74, 0, 17, 0): (23, ('u1', 'u2')),
+    (10, 72, 0, 18, 0): (23, ('u1', 'u2')),
+    (10, 74, 0, 16, 0): (23, ('u1', 'u2')),
+    (0, 64, 21, 15, 0): (3, ('u3', 'u3')),
+    (0, 62, 24, 14, 0): (4, ('u3', 'u3')),
+    (0, 64, 24, 12, 0): (4, ('u3', 'u3')),
+    (0, 58, 27, 15, 0): (4, ('u3', 'u3')),
+    (0, 56, 30, 14, 0): (5, ('u3', 'u3')),
+    (0, 58, 30, 12, 0): (5, ('u3', 'u3')),
+    (0, 60, 27, 13, 0): (4, ('u3', 'u3')),
+    (1, 58, 27, 14, 0): (15, ('u1', 'u2')),
+    (1, 60, 24, 15, 0): (15, ('u1', 'u2')),
+    (1, 60, 27, 12, 0): (15, ('u1', 'u2')),
+    (1, 62, 24, 13, 0): (16, ('u1', 'u2')),
+    (0, 66, 21, 13, 0): (3, ('u3', 'u3')),
+    (1, 64, 21, 14, 0): (16, ('u1', 'u2')),
+    (1, 66, 18, 15, 0): (17, ('u1', 'u2')),
+    (1, 66, 21, 12, 0): (17, ('u1', 'u2')),
+    (2, 64, 21, 13, 0): (17, ('u1', 'u2')),
+    (3, 64, 18, 15, 0): (17, ('u1', 'u2')),
+    (3, 64, 21, 12, 0): (17, ('u1', 'u2')),
+    (0, 70, 15, 15, 0): (2, ('u3', 'u3')),
+    (0, 68, 18, 14, 0): (3, ('u3', 'u3')),
+    (0, 70, 18, 12, 0): (3, ('u3', 'u3')),
+    (1, 68, 18, 13, 0): (17, ('u1', 'u2')),
+    (2, 66, 18, 14, 0): (17, ('u1', 'u2')),
+    (2, 68, 15, 15, 0): (18, ('u1', 'u2')),
+    (2, 68, 18, 12, 0): (18, ('u1', 'u2')),
+    (4, 64, 18, 14, 0): (18, ('u1', 'u2')),
+    (4, 66, 15, 15, 0): (18, ('u1', 'u2')),
+    (4, 66, 18, 12, 0): (18, ('u1', 'u2')),
+    (0, 72, 15, 13, 0): (2, ('u3', 'u3')),
+    (1, 70, 15, 14, 0): (18, ('u1', 'u2')),
+    (1, 72, 12, 15, 0): (18, ('u1', 'u2')),
+    (1, 72, 15, 12, 0): (18, ('u1', 'u2')),
+    (2, 70, 15, 13, 0): (18, ('u1', 'u2')),
+    (3, 68, 15, 14, 0): (18, ('u1', 'u2')),
+    (3, 70, 12, 15, 0): (19, ('u1', 'u2')),
+    (3, 70, 15, 12, 0): (19, ('u1', 'u2')),
+    (4, 68, 15, 13, 0): (19, ('u1', 'u2')),
+    (5, 66, 15, 14, 0): (19, ('u1', 'u2')),
+    (5, 68, 12, 15, 0): (19, ('u1', 'u2')),
+    (5, 68, 15, 12, 0): (19, ('u1', 'u2')),
+    (0, 76, 9, 15, 0): (1, ('u3', 'u3')),
+    (0, 74, 12, 14, 0): (2, ('u3', 'u3')),
+    (0, 76, 12, 12, 0): (2, ('u3', 'u3')),
+    (1, 74, 12, 13, 0): (19, ('u1', 'u2')),
+    (2, 72, 12, 14, 0): (19, ('u1', 'u2')),
+    (2, 74, 9, 15, 0): (19, ('u1', 'u2')),
+    (2, 74, 12, 12, 0): (19, ('u1', 'u2')),
+    (3, 72, 12, 13, 0): (19, ('u1', 'u2')),
+    (4, 70, 12, 14, 0): (19, ('u1', 'u2')),
+    (4, 72, 9, 15, 0): (20, ('u1', 'u2')),
+    (4, 72, 12, 12, 0): (20, ('u1', 'u2')),
+    (5, 70, 12, 13, 0): (20, ('u1', 'u2')),
+    (6, 68, 12, 14, 0): (20, ('u1', 'u2')),
+    (6, 70, 9, 15, 0): (20, ('u1', 'u2')),
+    (6, 70, 12, 12, 0): (20, ('u1', 'u2')),
+    (0, 78, 9, 13, 0): (1, ('u3', 'u3')),
+    (1, 76, 9, 14, 0): (19, ('u1', 'u2')),
+    (1, 78, 6, 15, 0): (20, ('u1', 'u2')),
+    (1, 78, 9, 12, 0): (20, ('u1', 'u2')),
+    (2, 76, 9, 13, 0): (20, ('u1', 'u2')),
+    (3, 74, 9, 14, 0): (20, ('u1', 'u2')),
+    (3, 76, 6, 15, 0): (20, ('u1', 'u2')),
+    (3, 76, 9, 12, 0): (20, ('u1', 'u2')),
+    (4, 74, 9, 13, 0): (20, ('u1', 'u2')),
+    (5, 72, 9, 14, 0): (20, ('u1', 'u2')),
+    (5, 74, 6, 15, 0): (21, ('u1', 'u2')),
+    (5, 74, 9, 12, 0): (21, ('u1', 'u2')),
+    (6, 72, 9, 13, 0): (21, ('u1', 'u2')),
+    (7, 70, 9, 14, 0): (21, ('u1', 'u2')),
+    (7, 72, 6, 15, 0): (21, ('u1', 'u2')),
+    (7, 72, 9, 12, 0): (21, ('u1', 'u2')),
+    (0, 80, 6, 14, 0): (1, ('u3', 'u3')),
+    (0, 82, 6, 12, 0): (1, ('u3', 'u3')),
+    (1, 80, 6, 13, 0): (20, ('u1', 'u2')),
+    (2, 78, 6, 14, 0): (20, ('u1', 'u2')),
+    (2, 80, 3, 15, 0): (21, ('u1', 'u2')),
+    (2, 80, 6, 12, 0): (21, ('u1', 'u2')),
+    (3, 78, 6, 13, 0): (21, ('u1', 'u2')),
+    (4, 76, 6, 14, 0): (21, ('u1', 'u2')),
+    (4, 78, 3, 15, 0): (21, ('u1', 'u2')),
+    (4, 78, 6, 12, 0): (21, ('u1', 'u2')),
+    (5, 76, 6, 13, 0): (21, ('u1', 'u2')),
+    (6, 74, 6, 14, 0): (21, ('u1', 'u2')),
+    (6, 76, 3, 15, 0): (22, ('u1', 'u2')),
+    (6, 76, 6, 12, 0): (22, ('u1', 'u2')),
+    (7, 74, 6, 13, 0): (22, ('u1', 'u2')),
+    (8, 72, 6, 14, 0): (22, ('u1', 'u2')),
+    (8, 74, 3, 15, 0): (22, ('u1', 'u2')),
+    (8, 74, 6, 12, 0): (22, ('u1', 'u2')),
+    (2, 82, 3, 13, 0): (21, ('u1', 'u2')),
+    (3, 80, 3, 14, 0): (21, ('u1', 'u2')),
+    (3, 82, 3, 12, 0): (22, ('u1', 'u2')),
+    (4, 80, 3, 13, 0): (22, ('u1', 'u2')),
+    (5, 78, 3, 14, 0): (22, ('u1', 'u2')),
+    (5, 80, 0, 15, 0): (22, ('u1', 'u2')),
+    (5, 80, 3, 12, 0): (22, ('u1', 'u2')),
+    (6, 78, 3, 13, 0): (22, ('u1', 'u2')),
+    (7, 76, 3, 14, 0): (22, ('u1', 'u2')),
+    (7, 78, 0, 15, 0): (23, ('u1', 'u2')),
+    (7, 78, 3, 12, 0): (23, ('u1', 'u2')),
+    (8, 76, 3, 13, 0): (23, ('u1', 'u2')),
+    (9, 74, 3, 14, 0): (23, ('u1', 'u2')),
+    (9, 76, 0, 15, 0): (23, ('u1', 'u2')),
+    (9, 76, 3, 12, 0): (23, ('u1', 'u2')),
+    (2, 84, 0, 14, 0): (22, ('u1', 'u2')),
+    (2, 86, 0, 12, 0): (22, ('u1', 'u2')),
+    (3, 84, 0, 13, 0): (22, ('u2', 'u2')),
+    (4, 82, 0, 14, 0): (22, ('u1', 'u2')),
+    (4, 84, 0, 12, 0): (23, ('u1', 'u2')),
+    (5, 82, 0, 13, 0): (23, ('u1', 'u2')),
+    (6, 80, 0, 14, 0): (23, ('u1', 'u2')),
+    (6, 82, 0, 12, 0): (23, ('u1', 'u2')),
+    (7, 80, 0, 13, 0): (23, ('u1', 'u2')),
+    (8, 78, 0, 14, 0): (23, ('u1', 'u2')),
+    (8, 80, 0, 12, 0): (24, ('u1', 'u2')),
+    (9, 78, 0, 13, 0): (24, ('u1', 'u2')),
+    (10, 76, 0, 14, 0): (24, ('u1', 'u2')),
+    (10, 78, 0, 12, 0): (24, ('u1', 'u2')),
+    (0, 68, 21, 11, 0): (3, ('u3', 'u3')),
+    (0, 66, 24, 10, 0): (4, ('u3', 'u3')),
+    (0, 68, 24, 8, 0): (4, ('u3', 'u3')),
+    (0, 62, 27, 11, 0): (4, ('u3', 'u3')),
+    (0, 60, 30, 10, 0): (5, ('u3', 'u3')),
+    (0, 62, 30, 8, 0): (5, ('u3', 'u3')),
+    (0, 64, 27, 9, 0): (4, ('u3', 'u3')),
+    (1, 62, 27, 10, 0): (16, ('u1', 'u2')),
+    (1, 64, 24, 11, 0): (16, ('u1', 'u2')),
+    (1, 64, 27, 8, 0): (16, ('u1', 'u2')),
+    (1, 66, 24, 9, 0): (17, ('u1', 'u2')),
+    (0, 70, 21, 9, 0): (3, ('u3', 'u3')),
+    (1, 68, 21, 10, 0): (17, ('u1', 'u2')),
+    (1, 70, 18, 11, 0): (18, ('u1', 'u2')),
+    (1, 70, 21, 8, 0): (18, ('u1', 'u2')),
+    (2, 68, 21, 9, 0): (18, ('u1', 'u2')),
+    (3, 68, 18, 11, 0): (18, ('u1', 'u2')),
+    (3, 68, 21, 8, 0): (18, ('u1', 'u2')),
+    (0, 74, 15, 11, 0): (2, ('u3', 'u3')),
+    (0, 72, 18, 10, 0): (3, ('u3', 'u3')),
+    (0, 74, 18, 8, 0): (3, ('u3', 'u3')),
+    (1, 72, 18, 9, 0): (18, ('u1', 'u2')),
+    (2, 70, 18, 10, 0): (18, ('u1', 'u2')),
+    (2, 72, 15, 11, 0): (19, ('u1', 'u2')),
+    (2, 72, 18, 8, 0): (19, ('u1', 'u2')),
+    (3, 70, 18, 9, 0): (19, ('u1', 'u2')),
+    (4, 68, 18, 10, 0): (19, ('u1', 'u2')),
+    (4, 70, 15, 11, 0): (19, ('u1', 'u2')),
+    (4, 70, 18, 8, 0): (19, ('u1', 'u2')),
+    (0, 76, 15, 9, 0): (2, ('u3', 'u3')),
+    (1, 74, 15, 10, 0): (19, ('u1', 'u2')),
+    (1, 76, 12, 11, 0): (19, ('u1', 'u2')),
+    (1, 76, 15, 8, 0): (19, ('u1', 'u2')),
+    (2, 74, 15, 9, 0): (19, ('u1', 'u2')),
+    (3, 72, 15, 10, 0): (19, ('u1', 'u2')),
+    (3, 74, 12, 11, 0): (20, ('u1', 'u2')),
+    (3, 74, 15, 8, 0): (20, ('u1', 'u2')),
+    (4, 72, 15, 9, 0): (20, ('u1', 'u2')),
+    (5, 70, 15, 10, 0): (20, ('u1', 'u2')),
+    (5, 72, 12, 11, 0): (20, ('u1', 'u2')),
+    (5, 72, 15, 8, 0): (20, ('u1', 'u2')),
+    (0, 80, 9, 11, 0): (1, ('u3', 'u3')),
+    (0, 78, 12, 10, 0): (2, ('u3', 'u3')),
+    (0, 80, 12, 8, 0): (2, ('u3', 'u3')),
+    (1, 78, 12, 9, 0): (20, ('u1', 'u2')),
+    (2, 76, 12, 10, 0): (20, ('u1', 'u2')),
+    (2, 78, 9, 11, 0): (20, ('u1', 'u2')),
+    (2, 78, 12, 8, 0): (20, ('u1', 'u2')),
+    (3, 76, 12, 9, 0): (20, ('u1', 'u2')),
+    (4, 74, 12, 10, 0): (20, ('u1', 'u2')),
+    (4, 76, 9, 11, 0): (21, ('u1', 'u2')),
+    (4, 76, 12, 8, 0): (21, ('u1', 'u2')),
+    (5, 74, 12, 9, 0): (21, ('u1', 'u2')),
+    (6, 72, 12, 10, 0): (21, ('u1', 'u2')),
+    (6, 74, 9, 11, 0): (21, ('u1', 'u2')),
+    (6, 74, 12, 8, 0): (21, ('u1', 'u2')),
+    (0, 82, 9, 9, 0): (1, ('u3', 'u3')),
+    (1, 80, 9, 10, 0): (20, ('u1', 'u2')),
+    (1, 82, 6, 11, 0): (21, ('u1', 'u2')),
+    (1, 82, 9, 8, 0): (21, ('u1', 'u2')),
+    (2, 80, 9, 9, 0): (21, ('u1', 'u2')),
+    (3, 78, 9, 10, 0): (21, ('u1', 'u2')),
+    (3, 80, 6, 11, 0): (21, ('u1', 'u2')),
+    (3, 80, 9, 8, 0): (21, ('u1', 'u2')),
+    (4, 78, 9, 9, 0): (21, ('u1', 'u2')),
+    (5, 76, 9, 10, 0): (21, ('u1', 'u2')),
+    (5, 78, 6, 11, 0): (22, ('u1', 'u2')),
+    (5, 78, 9, 8, 0): (22, ('u1', 'u2')),
+    (6, 76, 9, 9, 0): (22, ('u1', 'u2')),
+    (7, 74, 9, 10, 0): (22, ('u1', 'u2')),
+    (7, 76, 6, 11, 0): (22, ('u1', 'u2')),
+    (7, 76, 9, 8, 0): (22, ('u1', 'u2')),
+    (0, 84, 6, 10, 0): (1, ('u3', 'u3')),
+    (0, 86, 6, 8, 0): (1, ('u3', 'u3')),
+    (1, 84, 6, 9, 0): (21, ('u1', 'u2')),
+    (2, 82, 6, 10, 0): (21, ('u1', 'u2')),
+    (2, 84, 3, 11, 0): (22, ('u1', 'u2')),
+    (2, 84, 6, 8, 0): (22, ('u1', 'u2')),
+    (3, 82, 6, 9, 0): (22, ('u1', 'u2')),
+    (4, 80, 6, 10, 0): (22, ('u1', 'u2')),
+    (4, 82, 3, 11, 0): (22, ('u1', 'u2')),
+    (4, 82, 6, 8, 0): (22, ('u1', 'u2')),
+    (5, 80, 6, 9, 0): (22, ('u1', 'u2')),
+    (6, 78, 6, 10, 0): (22, ('u1', 'u2')),
+    (6, 80, 3, 11, 0): (23, ('u1', 'u2')),
+    (6, 80, 6, 8, 0): (23, ('u1', 'u2')),
+    (7, 78, 6, 9, 0): (23, ('u1', 'u2')),
+    (8, 76, 6, 10, 0): (23, ('u1', 'u2')),
+    (8, 78, 3, 11, 0): (23, ('u1', 'u2')),
+    (8, 78, 6, 8, 0): (23, ('u1', 'u2')),
+    (2, 86, 3, 9, 0): (22, ('u1', 'u2')),
+    (3, 84, 3, 10, 0): (22, ('u1', 'u2')),
+    (3, 86, 3, 8, 0): (23, ('u1', 'u2')),
+    (4, 84, 3, 9, 0): (23, ('u1', 'u2')),
+    (5, 82, 3, 10, 0): (23, ('u1', 'u2')),
+    (5, 84, 0, 11, 0): (23, ('u1', 'u2')),
+    (5, 84, 3, 8, 0): (23, ('u1', 'u2')),
+    (6, 82, 3, 9, 0): (23, ('u1', 'u2')),
+    (7, 80, 3, 10, 0): (23, ('u1', 'u2')),
+    (7, 82, 0, 11, 0): (24, ('u1', 'u2')),
+    (7, 82, 3, 8, 0): (24, ('u1', 'u2')),
+    (8, 80, 3, 9, 0): (24, ('u1', 'u2')),
+    (9, 78, 3, 10, 0): (24, ('u1', 'u2')),
+    (9, 80, 0, 11, 0): (24, ('u1', 'u2')),
+    (9, 80, 3, 8, 0): (24, ('u1', 'u2')),
+    (2, 88, 0, 10, 0): (23, ('u1', 'u2')),
+    (2, 90, 0, 8, 0): (23, ('u1', 'u2')),
+    (3, 88, 0, 9, 0): (23, ('u2', 'u2')),
+    (4, 86, 0, 10, 0): (23, ('u1', 'u2')),
+    (4, 88, 0, 8, 0): (24, ('u1', 'u2')),
+    (5, 86, 0, 9, 0): (24, ('u1', 'u2')),
+    (6, 84, 0, 10, 0): (24, ('u1', 'u2')),
+    (6, 86, 0, 8, 0): (24, ('u1', 'u2')),
+    (7, 84, 0, 9, 0): (24, ('u1', 'u2')),
+    (8, 82, 0, 10, 0): (24, ('u1', 'u2')),
+    (8, 84, 0, 8, 0): (25, ('u1', 'u2')),
+    (9, 82, 0, 9, 0): (25, ('u1', 'u2')),
+    (10, 80, 0, 10, 0): (25, ('u1', 'u2')),
+    (10, 82, 0, 8, 0): (25, ('u1', 'u2')),
+    (0, 72, 21, 7, 0): (3, ('u3', 'u3')),
+    (0, 70, 24, 6, 0): (4, ('u3', 'u3')),
+    (0, 72, 24, 4, 0): (4, ('u3', 'u3')),
+    (0, 66, 27, 7, 0): (4, ('u3', 'u3')),
+    (0, 64, 30, 6, 0): (5, ('u3', 'u3')),
+    (0, 66, 30, 4, 0): (5, ('u3', 'u3')),
+    (0, 68, 27, 5, 0): (4, ('u3', 'u3')),
+    (1, 66, 27, 6, 0): (17, ('u1', 'u2')),
+    (1, 68, 24, 7, 0): (17, ('u1', 'u2')),
+    (1, 68, 27, 4, 0): (17, ('u1', 'u2')),
+    (1, 70, 24, 5, 0): (18, ('u1', 'u2')),
+    (2, 70, 21, 7, 0): (18, ('u1', 'u2')),
+    (0, 74, 21, 5, 0): (3, ('u3', 'u3')),
+    (1, 72, 21, 6, 0): (18, ('u1', 'u2')),
+    (1, 74, 18, 7, 0): (19, ('u1', 'u2')),
+    (1, 74, 21, 4, 0): (19, ('u1', 'u2')),
+    (2, 72, 21, 5, 0): (19, ('u1', 'u2')),
+    (3, 72, 18, 7, 0): (19, ('u1', 'u2')),
+    (3, 72, 21, 4, 0): (19, ('u1', 'u2')),
+    (0, 78, 15, 7, 0): (2, ('u3', 'u3')),
+    (0, 76, 18, 6, 0): (3, ('u3', 'u3')),
+    (0, 78, 18, 4, 0): (3, ('u3', 'u3')),
+    (1, 76, 18, 5, 0): (19, ('u1', 'u2')),
+    (2, 74, 18, 6, 0): (19, ('u1', 'u2')),
+    (2, 76, 15, 7, 0): (20, ('u1', 'u2')),
+    (2, 76, 18, 4, 0): (20, ('u1', 'u2')),
+    (3, 74, 18, 5, 0): (20, ('u1', 'u2')),
+    (4, 72, 18, 6, 0): (20, ('u1', 'u2')),
+    (4, 74, 15, 7, 0): (20, ('u1', 'u2')),
+    (4, 74, 18, 4, 0): (20, ('u1', 'u2')),
+    (0, 80, 15, 5, 0): (2, ('u3', 'u3')),
+    (1, 78, 15, 6, 0): (20, ('u1', 'u2')),
+    (1, 80, 12, 7, 0): (20, ('u1', 'u2')),
+    (1, 80, 15, 4, 0): (20, ('u1', 'u2')),
+    (2, 78, 15, 5, 0): (20, ('u1', 'u2')),
+    (3, 76, 15, 6, 0): (20, ('u1', 'u2')),
+    (3, 78, 12, 7, 0): (21, ('u1', 'u2')),
+    (3, 78, 15, 4, 0): (21, ('u1', 'u2')),
+    (4, 76, 15, 5, 0): (21, ('u1', 'u2')),
+    (5, 74, 15, 6, 0): (21, ('u1', 'u2')),
+    (5, 76, 12, 7, 0): (21, ('u1', 'u2')),
+    (5, 76, 15, 4, 0): (21, ('u1', 'u2')),
+    (0, 84, 9, 7, 0): (1, ('u3', 'u3')),
+    (0, 82, 12, 6, 0): (2, ('u3', 'u3')),
+    (0, 84, 12, 4, 0): (2, ('u3', 'u3')),
+    (1, 82, 12, 5, 0): (21, ('u1', 'u2')),
+    (2, 80, 12, 6, 0): (21, ('u1', 'u2')),
+    (2, 82, 9, 7, 0): (21, ('u1', 'u2')),
+    (2, 82, 12, 4, 0): (21, ('u1', 'u2')),
+    (3, 80, 12, 5, 0): (21, ('u1', 'u2')),
+    (4, 78, 12, 6, 0): (21, ('u1', 'u2')),
+    (4, 80, 9, 7, 0): (22, ('u1', 'u2')),
+    (4, 80, 12, 4, 0): (22, ('u1', 'u2')),
+    (5, 78, 12, 5, 0): (22, ('u1', 'u2')),
+    (6, 76, 12, 6, 0): (22, ('u1', 'u2')),
+    (6, 78, 9, 7, 0): (22, ('u1', 'u2')),
+    (6, 78, 12, 4, 0): (22, ('u1', 'u2')),
+    (0, 86, 9, 5, 0): (1, ('u3', 'u3')),
+    (1, 84, 9, 6, 0): (21, ('u1', 'u2')),
+    (1, 86, 6, 7, 0): (22, ('u1', 'u2')),
+    (1, 86, 9, 4, 0): (22, ('u1', 'u2')),
+    (2, 84, 9, 5, 0): (22, ('u1', 'u2')),
+    (3, 82, 9, 6, 0): (22, ('u1', 'u2')),
+    (3, 84, 6, 7, 0): (22, ('u1', 'u2')),
+    (3, 84, 9, 4, 0): (22, ('u1', 'u2')),
+    (4, 82, 9, 5, 0): (22, ('u1', 'u2')),
+    (5, 80, 9, 6, 0): (22, ('u1', 'u2')),
+    (5, 82, 6, 7, 0): (23, ('u1', 'u2')),
+    (5, 82, 9, 4, 0): (23, ('u1', 'u2')),
+    (6, 80, 9, 5, 0): (23, ('u1', 'u2')),
+    (7, 78, 9, 6, 0): (23, ('u1', 'u2')),
+    (7, 80, 6, 7, 0): (23, ('u1', 'u2')),
+    (7, 80, 9, 4, 0): (23, ('u1', 'u2')),
+    (0, 88, 6, 6, 0): (1, ('u3', 'u3')),
+    (0, 90, 6, 4, 0): (1, ('u3', 'u3')),
+    (1, 88, 6, 5, 0): (22, ('u1', 'u2')),
+    (2, 86, 6, 6, 0): (22, ('u1', 'u2')),
+    (2, 88, 3, 7, 0): (23, ('u1', 'u2')),
+    (2, 88, 6, 4, 0): (23, ('u1', 'u2')),
+    (3, 86, 6, 5, 0): (23, ('u1', 'u2')),
+    (4, 84, 6, 6, 0): (23, ('u1', 'u2')),
+    (4, 86, 3, 7, 0): (23, ('u1', 'u2')),
+    (4, 86, 6, 4, 0): (23, ('u1', 'u2')),
+    (5, 84, 6, 5, 0): (23, ('u1', 'u2')),
+    (6, 82, 6, 6, 0): (23, ('u1', 'u2')),
+    (6, 84, 3, 7, 0): (24, ('u1', 'u2')),
+    (6, 84, 6, 4, 0): (24, ('u1', 'u2')),
+    (7, 82, 6, 5, 0): (24, ('u1', 'u2')),
+    (8, 80, 6, 6, 0): (24, ('u1', 'u2')),
+    (8, 82, 3, 7, 0): (24, ('u1', 'u2')),
+    (8, 82, 6, 4, 0): (24, ('u1', 'u2')),
+    (2, 90, 3, 5, 0): (23, ('u1', 'u2')),
+    (3, 88, 3, 6, 0): (23, ('u1', 'u2')),
+    (3, 90, 3, 4, 0): (24, ('u1', 'u2')),
+    (4, 88, 3, 5, 0): (24, ('u1', 'u2')),
+    (5, 86, 3, 6, 0): (24, ('u1', 'u2')),
+    (5, 88, 0, 7, 0): (24, ('u1', 'u2')),
+    (5, 88, 3, 4, 0): (24, ('u1', 'u2')),
+    (6, 86, 3, 5, 0): (24, ('u1', 'u2')),
+    (7, 84, 3, 6, 0): (24, ('u1', 'u2')),
+    (7, 86, 0, 7, 0): (25, ('u1', 'u2')),
+    (7, 86, 3, 4, 0): (25, ('u1', 'u2')),
+    (8, 84, 3, 5, 0): (25, ('u1', 'u2')),
+    (9, 82, 3, 6, 0): (25, ('u1', 'u2')),
+    (9, 84, 0, 7, 0): (25, ('u1', 'u2')),
+    (9, 84, 3, 4, 0): (25, ('u1', 'u2')),
+    (2, 92, 0, 6, 0): (24, ('u1', 'u2')),
+    (2, 94, 0, 4, 0): (24, ('u1', 'u2')),
+    (3, 92, 0, 5, 0): (24, ('u2', 'u2')),
+    (4, 90, 0, 6, 0): (24, ('u1', 'u2')),
+    (4, 92, 0, 4, 0): (25, ('u1', 'u2')),
+    (5, 90, 0, 5, 0): (25, ('u1', 'u2')),
+    (6, 88, 0, 6, 0): (25, ('u1', 'u2')),
+    (6, 90, 0, 4, 0): (25, ('u1', 'u2')),
+    (7, 88, 0, 5, 0): (25, ('u1', 'u2')),
+    (8, 86, 0, 6, 0): (25, ('u1', 'u2')),
+    (8, 88, 0, 4, 0): (26, ('u1', 'u2')),
+    (9, 86, 0, 5, 0): (26, ('u1', 'u2')),
+    (10, 84, 0, 6, 0): (26, ('u1', 'u2')),
+    (10, 86, 0, 4, 0): (26, ('u1', 'u2')),
+    (0, 76, 24, 0, 0): (4, ('u3', 'u3')),
+    (0, 70, 30, 0, 0): (5, ('u3', 'u3')),
+    (1, 72, 27, 0, 0): (18, ('u1', 'u2')),
+    (1, 78, 21, 0, 0): (20, ('u1', 'u2')),
+    (3, 76, 21, 0, 0): (20, ('u1', 'u2')),
+    (0, 82, 18, 0, 0): (3, ('u3', 'u3')),
+    (2, 80, 18, 0, 0): (21, ('u1', 'u2')),
+    (4, 78, 18, 0, 0): (21, ('u1', 'u2')),
+    (1, 84, 15, 0, 0): (21, ('u1', 'u2')),
+    (3, 82, 15, 0, 0): (22, ('u1', 'u2')),
+    (5, 80, 15, 0, 0): (22, ('u1', 'u2')),
+    (0, 88, 12, 0, 0): (2, ('u3', 'u3')),
+    (2, 86, 12, 0, 0): (22, ('u1', 'u2')),
+    (4, 84, 12, 0, 0): (23, ('u1', 'u2')),
+    (6, 82, 12, 0, 0): (23, ('u1', 'u2')),
+    (1, 90, 9, 0, 0): (23, ('u1', 'u2')),
+    (3, 88, 9, 0, 0): (23, ('u1', 'u2')),
+    (5, 86, 9, 0, 0): (24, ('u1', 'u2')),
+    (7, 84, 9, 0, 0): (24, ('u1', 'u2')),
+    (0, 94, 6, 0, 0): (1, ('u3', 'u3')),
+    (2, 92, 6, 0, 0): (24, ('u1', 'u2')),
+    (4, 90, 6, 0, 0): (24, ('u1', 'u2')),
+    (6, 88, 6, 0, 0): (25, ('u1', 'u2')),
+    (8, 86, 6, 0, 0): (25, ('u1', 'u2')),
+    (3, 94, 3, 0, 0): (25, ('u1', 'u2')),
+    (5, 92, 3, 0, 0): (25, ('u1', 'u2')),
+    (7, 90, 3, 0, 0): (26, ('u1', 'u2')),
+    (9, 88, 3, 0, 0): (26, ('u1', 'u2')),
+    (2, 98, 0, 0, 0): (25, ('u1', 'u2')),
+    (4, 96, 0, 0, 0): (26, ('u1', 'u2')),
+    (6, 94, 0, 0, 0): (26, ('u1', 'u2')),
+    (8, 92, 0, 0, 0): (27, ('u1', 'u2')),
+    (10, 90, 0, 0, 0): (27, ('u1', 'u2')),
+    (3, 0, 24, 73, 0): (4, ('u3', 'u3')),
+    (4, 0, 21, 75, 0): (4, ('u1', 'u3')),
+    (4, 2, 21, 73, 0): (5, ('u1', 'u2')),
+    (2, 0, 27, 71, 0): (4, ('u3', 'u3')),
+    (1, 0, 30, 69, 0): (5, ('u3', 'u3')),
+    (2, 2, 27, 69, 0): (5, ('u2', 'u3')),
+    (3, 2, 24, 71, 0): (5, ('u2', 'u3')),
+    (3, 4, 24, 69, 0): (5, ('u2', 'u2')),
+    (0, 0, 33, 67, 0): (5, ('u3', 'u3')),
+    (0, 2, 33, 65, 0): (5, ('u3', 'u3')),
+    (1, 2, 30, 67, 0): (5, ('u3', 'u3')),
+    (1, 4, 30, 65, 0): (5, ('u1', 'u3')),
+    (0, 4, 33, 63, 0): (5, ('u3', 'u3')),
+    (0, 6, 33, 61, 0): (5, ('u3', 'u3')),
+    (1, 6, 30, 63, 0): (5, ('u1', 'u3')),
+    (1, 8, 30, 61, 0): (5, ('u1', 'u3')),
+    (4, 0, 24, 72, 0): (5, ('u1', 'u3')),
+    (2, 0, 30, 68, 0): (5, ('u3', 'u3')),
+    (3, 0, 27, 70, 0): (5, ('u3', 'u3')),
+    (3, 2, 27, 68, 0): (5, ('u2', 'u3')),
+    (4, 2, 24, 70, 0): (5, ('u1', 'u3')),
+    (1, 0, 33, 66, 0): (5, ('u3', 'u3')),
+    (2, 2, 30, 66, 0): (5, ('u2', 'u3')),
+    (0, 0, 36, 64, 0): (6, ('u3', 'u3')),
+    (1, 2, 33, 64, 0): (6, ('u3', 'u3')),
+    (3, 4, 27, 66, 0): (6, ('u2', 'u2')),
+    (0, 2, 36, 62, 0): (6, ('u3', 'u3')),
+    (0, 4, 36, 60, 0): (6, ('u3', 'u3')),
+    (1, 4, 33, 62, 0): (6, ('u1', 'u3')),
+    (1, 6, 33, 60, 0): (6, ('u1', 'u3')),
+    (0, 8, 33, 59, 0): (5, ('u3', 'u3')),
+    (0, 10, 33, 57, 0): (5, ('u3', 'u3')),
+    (1, 10, 30, 59, 0): (5, ('u1', 'u3')),
+    (1, 12, 30, 57, 0): (5, ('u1', 'u3')),
+    (0, 6, 36, 58, 0): (6, ('u3', 'u3')),
+    (0, 8, 36, 56, 0): (6, ('u3', 'u3')),
+    (1, 8, 33, 58, 0): (6, ('u1', 'u3')),
+    (1, 10, 33, 56, 0): (6, ('u1', 'u3')),
+    (5, 14, 18, 63, 0): (6, ('u1', 'u2')),
+    (5, 14, 21, 60, 0): (7, ('u1', 'u2')),
+    (5, 16, 18, 61, 0): (7, ('u1', 'u2')),
+    (5, 18, 18, 59, 0): (7, ('u1', 'u2')),
+    (5, 18, 21, 56, 0): (7, ('u1', 'u2')),
+    (6, 0, 18, 76, 0): (5, ('u1', 'u3')),
+    (6, 16, 15, 63, 0): (7, ('u1', 'u2')),
+    (5, 20, 18, 57, 0): (8, ('u1', 'u2')),
+    (6, 20, 15, 59, 0): (8, ('u1', 'u2')),
+    (6, 20, 18, 56, 0): (8, ('u1', 'u2')),
+    (7, 18, 12, 63, 0): (8, ('u1', 'u2')),
+    (6, 22, 15, 57, 0): (9, ('u1', 'u2')),
+    (7, 22, 12, 59, 0): (9, ('u1', 'u2')),
+    (7, 22, 15, 56, 0): (9, ('u1', 'u2')),
+    (8, 20, 9, 63, 0): (9, ('u1', 'u2')),
+    (7, 24, 12, 57, 0): (10, ('u1', 'u2')),
+    (8, 24, 9, 59, 0): (10, ('u1', 'u2')),
+    (8, 24, 12, 56, 0): (10, ('u1', 'u2')),
+    (0, 12, 33, 55, 0): (5, ('u3', 'u3')),
+    (0, 14, 33, 53, 0): (5, ('u3', 'u3')),
+    (1, 14, 30, 55, 0): (5, ('u1', 'u3')),
+    (1, 16, 30, 53, 0): (5, ('u1', 'u3')),
+    (0, 10, 36, 54, 0): (6, ('u3', 'u3')),
+    (0, 12, 36, 52, 0): (6, ('u3', 'u3')),
+    (1, 12, 33, 54, 0): (6, ('u1', 'u3')),
+    (1, 14, 33, 52, 0): (6, ('u1', 'u3')),
+    (5, 20, 21, 54, 0): (8, ('u1', 'u2')),
+    (5, 22, 18, 55, 0): (8, ('u1', 'u2')),
+    (5, 22, 21, 52, 0): (8, ('u1', 'u2')),
+    (5, 24, 18, 53, 0): (9, ('u1', 'u2')),
+    (6, 24, 15, 55, 0): (9, ('u1', 'u2')),
+    (6, 24, 18, 52, 0): (9, ('u1', 'u2')),
+    (6, 26, 15, 53, 0): (10, ('u1', 'u2')),
+    (7, 26, 12, 55, 0): (10, ('u1', 'u2')),
+    (7, 26, 15, 52, 0): (10, ('u1', 'u2')),
+    (8, 26, 9, 57, 0): (11, ('u1', 'u2')),
+    (7, 28, 12, 53, 0): (11, ('u1', 'u2')),
+    (8, 28, 9, 55, 0): (11, ('u1', 'u2')),
+    (8, 28, 12, 52, 0): (11, ('u1', 'u2')),
+    (8, 30, 9, 53, 0): (12, ('u1', 'u2')),
+    (9, 30, 6, 55, 0): (12, ('u1', 'u2')),
+    (9, 30, 9, 52, 0): (12, ('u1', 'u2')),
+    (0, 16, 33, 51, 0): (5, ('u3', 'u3')),
+    (0, 18, 33, 49, 0): (5, ('u3', 'u3')),
+    (1, 18, 30, 51, 0): (5, ('u1', 'u3')),
+    (0, 14, 36, 50, 0): (6, ('u3', 'u3')),
+    (0, 16, 36, 48, 0): (6, ('u3', 'u3')),
+    (1, 16, 33, 50, 0): (6, ('u1', 'u3')),
+    (1, 18, 33, 48, 0): (6, ('u1', 'u3')),
+    (1, 20, 30, 49, 0): (6, ('u1', 'u3')),
+    (5, 24, 21, 50, 0): (9, ('u1', 'u2')),
+    (5, 26, 18, 51, 0): (9, ('u1', 'u2')),
+    (5, 26, 21, 48, 0): (9, ('u1', 'u2')),
+    (5, 28, 18, 49, 0): (10, ('u1', 'u2')),
+    (6, 26, 18, 50, 0): (10, ('u1', 'u2')),
+    (6, 28, 15, 51, 0): (10, ('u1', 'u2')),
+    (6, 28, 18, 48, 0): (10, ('u1', 'u2')),
+    (6, 30, 15, 49, 0): (11, ('u1', 'u2')),
+    (7, 28, 15, 50, 0): (11, ('u1', 'u2')),
+    (7, 30, 12, 51, 0): (11, ('u1', 'u2')),
+    (7, 30, 15, 48, 0): (11, ('u1', 'u2')),
+    (7, 32, 12, 49, 0): (12, ('u1', 'u2')),
+    (8, 30, 12, 50, 0): (12, ('u1', 'u2')),
+    (8, 32, 9, 51, 0): (12, ('u1', 'u2')),
+    (8, 32, 12, 48, 0): (12, ('u1', 'u2')),
+    (8, 34, 9, 49, 0): (13, ('u1', 'u2')),
+    (9, 34, 6, 51, 0): (13, ('u1', 'u2')),
+    (9, 34, 9, 48, 0): (13, ('u1', 'u2')),
+    (9, 36, 6, 49, 0): (14, ('u1', 'u2')),
+    (10, 36, 3, 51, 0): (14, ('u1', 'u2')),
+    (10, 36, 6, 48, 0): (14, ('u1', 'u2')),
+    (0, 20, 33, 47, 0): (5, ('u3', 'u3')),
+    (0, 22, 33, 45, 0): (5, ('u3', 'u3')),
+    (1, 22, 30, 47, 0): (6, ('u1', 'u3')),
+    (1, 24, 30, 45, 0): (7, ('u1', 'u3')),
+    (3, 28, 24, 45, 0): (8, ('u1', 'u2')),
+    (0, 18, 36, 46, 0): (6, ('u3', 'u3')),
+    (0, 20, 36, 44, 0): (6, ('u3', 'u3')),
+    (1, 20, 33, 46, 0): (6, ('u1', 'u3')),
+    (1, 22, 33, 44, 0): (6, ('u1', 'u3')),
+    (4, 30, 21, 45, 0): (9, ('u1', 'u2')),
+    (5, 28, 21, 46, 0): (10, ('u1', 'u2')),
+    (5, 30, 18, 47, 0): (10, ('u1', 'u2')),
+    (5, 30, 21, 44, 0): (10, ('u1', 'u2')),
+    (5, 32, 18, 45, 0): (10, ('u1', 'u2')),
+    (6, 30, 18, 46, 0): (11, ('u1', 'u2')),
+    (6, 32, 15, 47, 0): (11, ('u1', 'u2')),
+    (6, 32, 18, 44, 0): (11, ('u1', 'u2')),
+    (6, 34, 15, 45, 0): (11, ('u1', 'u2')),
+    (7, 32, 15, 46, 0): (12, ('u1', 'u2')),
+    (7, 34, 12, 47, 0): (12, ('u1', 'u2')),
+    (7, 34, 15, 44, 0): (12, ('u1', 'u2')),
+    (7, 36, 12, 45, 0): (12, ('u1', 'u2')),
+    (8, 34, 12, 46, 0): (13, ('u1', 'u2')),
+    (8, 36, 9, 47, 0): (13, ('u1', 'u2')),
+    (8, 36, 12, 44, 0): (13, ('u1', 'u2')),
+    (8, 38, 9, 45, 0): (13, ('u1', 'u2')),
+    (9, 36, 9, 46, 0): (14, ('u1', 'u2')),
+    (9, 38, 6, 47, 0): (14, ('u1', 'u2')),
+    (9, 38, 9, 44, 0): (14, ('u1', 'u2')),
+    (9, 40, 6, 45, 0): (14, ('u1', 'u2')),
+    (10, 40, 3, 47, 0): (15, ('u1', 'u2')),
+    (10, 40, 6, 44, 0): (15, ('u1', 'u2')),
+    (10, 42, 3, 45, 0): (15, ('u1', 'u2')),
+    (0, 24, 33, 43, 0): (5, ('u3', 'u3')),
+    (0, 26, 33, 41, 0): (5, ('u3', 'u3')),
+    (1, 26, 30, 43, 0): (7, ('u1', 'u3')),
+    (1, 28, 30, 41, 0): (8, ('u1', 'u3')),
+    (3, 32, 24, 41, 0): (9, ('u1', 'u2')),
+    (0, 22, 36, 42, 0): (6, ('u3', 'u3')),
+    (0, 24, 36, 40, 0): (6, ('u3', 'u3')),
+    (1, 24, 33, 42, 0): (7, ('u1', 'u3')),
+    (1, 26, 33, 40, 0): (7, ('u1', 'u3')),
+    (4, 34, 21, 41, 0): (10, ('u1', 'u2')),
+    (5, 32, 21, 42, 0): (11, ('u1', 'u2')),
+    (5, 34, 18, 43, 0): (11, ('u1', 'u2')),
+    (5, 34, 21, 40, 0): (11, ('u1', 'u2')),
+    (5, 36, 18, 41, 0): (11, ('u1', 'u2')),
+    (6, 34, 18, 42, 0): (12, ('u1', 'u2')),
+    (6, 36, 15, 43, 0): (12, ('u1', 'u2')),
+    (6, 36, 18, 40, 0): (12, ('u1', 'u2')),
+    (6, 38, 15, 41, 0): (12, ('u1', 'u2')),
+    (7, 36, 15, 42, 0): (13, ('u1', 'u2')),
+    (7, 38, 12, 43, 0): (13, ('u1', 'u2')),
+    (7, 38, 15, 40, 0): (13, ('u1', 'u2')),
+    (7, 40, 12, 41, 0): (13, ('u1', 'u2')),
+    (8, 38, 12, 42, 0): (14, ('u1', 'u2')),
+    (8, 40, 9, 43, 0): (14, ('u1', 'u2')),
+    (8, 40, 12, 40, 0): (14, ('u1', 'u2')),
+    (8, 42, 9, 41, 0): (14, ('u1', 'u2')),
+    (9, 40, 9, 42, 0): (15, ('u1', 'u2')),
+    (9, 42, 6, 43, 0): (15, ('u1', 'u2')),
+    (9, 42, 9, 40, 0): (15, ('u1', 'u2')),
+    (9, 44, 6, 41, 0): (15, ('u1', 'u2')),
+    (10, 44, 3, 43, 0): (16, ('u1', 'u2')),
+    (10, 44, 6, 40, 0): (16, ('u1', 'u2')),
+    (10, 46, 3, 41, 0): (16, ('u1', 'u2')),
+    (0, 28, 33, 39, 0): (5, ('u3', 'u3')),
+    (0, 26, 36, 38, 0): (6, ('u3', 'u3')),
+    (0, 28, 36, 36, 0): (6, ('u3', 'u3')),
+    (0, 30, 33, 37, 0): (5, ('u3', 'u3')),
+    (1, 28, 33, 38, 0): (8, ('u1', 'u3')),
+    (1, 30, 30, 39, 0): (8, ('u1', 'u3')),
+    (1, 30, 33, 36, 0): (8, ('u1', 'u3')),
+    (1, 32, 30, 37, 0): (9, ('u1', 'u3')),
+    (3, 32, 27, 38, 0): (9, ('u1', 'u2')),
+    (3, 36, 24, 37, 0): (10, ('u1', 'u2')),
+    (4, 34, 24, 38, 0): (10, ('u1', 'u2')),
+    (4, 36, 21, 39, 0): (11, ('u1', 'u2')),
+    (4, 38, 21, 37, 0): (11, ('u1', 'u2')),
+    (5, 36, 21, 38, 0): (11, ('u1', 'u2')),
+    (5, 38, 18, 39, 0): (12, ('u1', 'u2')),
+    (5, 38, 21, 36, 0): (12, ('u1', 'u2')),
+    (5, 40, 18, 37, 0): (12, ('u1', 'u2')),
+    (6, 38, 18, 38, 0): (12, ('u1', 'u2')),
+    (6, 40, 15, 39, 0): (13, ('u1', 'u2')),
+    (6, 40, 18, 36, 0): (13, ('u1', 'u2')),
+    (6, 42, 15, 37, 0): (13, ('u1', 'u2')),
+    (7, 40, 15, 38, 0): (13, ('u1', 'u2')),
+    (7, 42, 12, 39, 0): (14, ('u1', 'u2')),
+    (7, 42, 15, 36, 0): (14, ('u1', 'u2')),
+    (7, 44, 12, 37, 0): (14, ('u1', 'u2')),
+    (8, 42, 12, 38, 0): (14, ('u1', 'u2')),
+    (8, 44, 9, 39, 0): (15, ('u1', 'u2')),
+    (8, 44, 12, 36, 0): (15, ('u1', 'u2')),
+    (8, 46, 9, 37, 0): (15, ('u1', 'u2')),
+    (9, 44, 9, 38, 0): (15, ('u1', 'u2')),
+    (9, 46, 6, 39, 0): (16, ('u1', 'u2')),
+    (9, 46, 9, 36, 0): (16, ('u1', 'u2')),
+    (9, 48, 6, 37, 0): (16, ('u1', 'u2')),
+    (10, 46, 6, 38, 0): (16, ('u1', 'u2')),
+    (10, 48, 3, 39, 0): (17, ('u1', 'u2')),
+    (10, 48, 6, 36, 0): (17, ('u1', 'u2')),
+    (10, 50, 3, 37, 0): (17, ('u1', 'u2')),
+    (11, 50, 0, 39, 0): (18, ('u1', 'u2')),
+    (11, 50, 3, 36, 0): (18, ('u1', 'u2')),
+    (0, 32, 33, 35, 0): (5, ('u3', 'u3')),
+    (0, 30, 36, 34, 0): (6, ('u3', 'u3')),
+    (0, 32, 36, 32, 0): (6, ('u3', 'u3')),
+    (0, 34, 33, 33, 0): (5, ('u3', 'u3')),
+    (1, 32, 33, 34, 0): (9, ('u1', 'u3')),
+    (1, 34, 30, 35, 0): (9, ('u1', 'u3')),
+    (1, 34, 33, 32, 0): (9, ('u1', 'u3')),
+    (1, 36, 30, 33, 0): (10, ('u1', 'u3')),
+    (3, 36, 27, 34, 0): (10, ('u1', 'u2')),
+    (3, 40, 24, 33, 0): (11, ('u1', 'u2')),
+    (4, 38, 24, 34, 0): (11, ('u1', 'u2')),
+    (4, 40, 21, 35, 0): (12, ('u1', 'u2')),
+    (4, 40, 24, 32, 0): (12, ('u1', 'u2')),
+    (4, 42, 21, 33, 0): (12, ('u1', 'u2')),
+    (5, 40, 21, 34, 0): (12, ('u1', 'u2')),
+    (5, 42, 18, 35, 0): (13, ('u1', 'u2')),
+    (5, 42, 21, 32, 0): (13, ('u1', 'u2')),
+    (5, 44, 18, 33, 0): (13, ('u1', 'u2')),
+    (6, 42, 18, 34, 0): (13, ('u1', 'u2')),
+    (6, 44, 15, 35, 0): (14, ('u1', 'u2')),
+    (6, 44, 18, 32, 0): (14, ('u1', 'u2')),
+    (6, 46, 15, 33, 0): (14, ('u1', 'u2')),
+    (7, 44, 15, 34, 0): (14, ('u1', 'u2')),
+    (7, 46, 12, 35, 0): (15, ('u1', 'u2')),
+    (7, 46, 15, 32, 0): (15, ('u1', 'u2')),
+    (7, 48, 12, 33, 0): (15, ('u1', 'u2')),
+    (8, 46, 12, 34, 0): (15, ('u1', 'u2')),
+    (8, 48, 9, 35, 0): (16, ('u1', 'u2')),
+    (8, 48, 12, 32, 0): (16, ('u1', 'u2')),
+    (8, 50, 9, 33, 0): (16, ('u1', 'u2')),
+    (9, 48, 9, 34, 0): (16, ('u1', 'u2')),
+    (9, 50, 6, 35, 0): (17, ('u1', 'u2')),
+    (9, 50, 9, 32, 0): (17, ('u1', 'u2')),
+    (9, 52, 6, 33, 0): (17, ('u1', 'u2')),
+    (10, 50, 6, 34, 0): (17, ('u1', 'u2')),
+    (10, 52, 3, 35, 0): (18, ('u1', 'u2')),
+    (10, 52, 6, 32, 0): (18, ('u1', 'u2')),
+    (10, 54, 3, 33, 0): (18, ('u1', 'u2')),
+    (11, 54, 0, 35, 0): (19, ('u1', 'u2')),
+    (11, 54, 3, 32, 0): (19, ('u1', 'u2')),
+    (11, 56, 0, 33, 0): (19, ('u1', 'u2')),
+    (0, 36, 33, 31, 0): (5, ('u3', 'u3')),
+    (0, 34, 36, 30, 0): (6, ('u3', 'u3')),
+    (0, 36, 36, 28, 0): (6, ('u3', 'u3')),
+    (0, 38, 33, 29, 0): (5, ('u3', 'u3')),
+    (1, 36, 33, 30, 0): (10, ('u1', 'u3')),
+    (1, 38, 30, 31, 0): (10, ('u1', 'u3')),
+    (1, 38, 33, 28, 0): (10, ('u1', 'u3')),
+    (1, 40, 30, 29, 0): (10, ('u1', 'u2')),
+    (3, 40, 27, 30, 0): (11, ('u1', 'u2')),
+    (3, 44, 24, 29, 0): (12, ('u1', 'u2')),
+    (4, 42, 24, 30, 0): (12, ('u1', 'u2')),
+    (4, 44, 21, 31, 0): (13, ('u1', 'u2')),
+    (4, 44, 24, 28, 0): (13, ('u1', 'u2')),
+    (4, 46, 21, 29, 0): (13, ('u1', 'u2')),
+    (5, 44, 21, 30, 0): (13, ('u1', 'u2')),
+    (5, 46, 18, 31, 0): (14, ('u1', 'u2')),
+    (5, 46, 21, 28, 0): (14, ('u1', 'u2')),
+    (5, 48, 18, 29, 0): (14, ('u1', 'u2')),
+    (6, 46, 18, 30, 0): (14, ('u1', 'u2')),
+    (6, 48, 15, 31, 0): (15, ('u1', 'u2')),
+    (6, 48, 18, 28, 0): (15, ('u1', 'u2')),
+    (6, 50, 15, 29, 0): (15, ('u1', 'u2')),
+    (7, 48, 15, 30, 0): (15, ('u1', 'u2')),
+    (7, 50, 12, 31, 0): (16, ('u1', 'u2')),
+    (7, 50, 15, 28, 0): (16, ('u1', 'u2')),
+    (7, 52, 12, 29, 0): (16, ('u1', 'u2')),
+    (8, 50, 12, 30, 0): (16, ('u1', 'u2')),
+    (8, 52, 9, 31, 0): (17, ('u1', 'u2')),
+    (8, 52, 12, 28, 0): (17, ('u1', 'u2')),
+    (8, 54, 9, 29, 0): (17, ('u1', 'u2')),
+    (9, 52, 9, 30, 0): (17, ('u1', 'u2')),
+    (9, 54, 6, 31, 0): (18, ('u1', 'u2')),
+    (9, 54, 9, 28, 0): (18, ('u1', 'u2')),
+    (9, 56, 6, 29, 0): (18, ('u1', 'u2')),
+    (10, 54, 6, 30, 0): (18, ('u1', 'u2')),
+    (10, 56, 3, 31, 0): (19, ('u1', 'u2')),
+    (10, 56, 6, 28, 0): (19, ('u1', 'u2')),
+    (10, 58, 3, 29, 0): (19, ('u1', 'u2')),
+    (11, 56, 3, 30, 0): (19, ('u1', 'u2')),
+    (11, 58, 0, 31, 0): (20, ('u1', 'u2')),
+    (11, 58, 3, 28, 0): (20, ('u1', 'u2')),
+    (11, 60, 0, 29, 0): (20, ('u1', 'u2')),
+    (12, 60, 0, 28, 0): (21, ('u1', 'u2')),
+    (0, 40, 33, 27, 0): (5, ('u3', 'u3')),
+    (0, 38, 36, 26, 0): (6, ('u3', 'u3')),
+    (0, 40, 36, 24, 0): (6, ('u3', 'u3')),
+    (0, 42, 33, 25, 0): (5, ('u3', 'u3')),
+    (1, 40, 33, 26, 0): (11, ('u1', 'u3')),
+    (1, 42, 30, 27, 0): (11, ('u1', 'u3')),
+    (1, 42, 33, 24, 0): (11, ('u1', 'u3')),
+    (1, 44, 30, 25, 0): (11, ('u1', 'u2')),
+    (3, 44, 27, 26, 0): (12, ('u1', 'u2')),
+    (3, 48, 24, 25, 0): (13, ('u1', 'u2')),
+    (4, 46, 24, 26, 0): (13, ('u1', 'u2')),
+    (4, 48, 21, 27, 0): (14, ('u1', 'u2')),
+    (4, 48, 24, 24, 0): (14, ('u1', 'u2')),
+    (4, 50, 21, 25, 0): (14, ('u1', 'u2')),
+    (5, 48, 21, 26, 0): (14, ('u1', 'u2')),
+    (5, 50, 18, 27, 0): (15, ('u1', 'u2')),
+    (5, 50, 21, 24, 0): (15, ('u1', 'u2')),
+    (5, 52, 18, 25, 0): (15, ('u1', 'u2')),
+    (6, 50, 18, 26, 0): (15, ('u1', 'u2')),
+    (6, 52, 15, 27, 0): (16, ('u1', 'u2')),
+    (6, 52, 18, 24, 0): (16, ('u1', 'u2')),
+    (6, 54, 15, 25, 0): (16, ('u1', 'u2')),
+    (7, 52, 15, 26, 0): (16, ('u1', 'u2')),
+    (7, 54, 12, 27, 0): (17, ('u1', 'u2')),
+    (7, 54, 15, 24, 0): (17, ('u1', 'u2')),
+    (7, 56, 12, 25, 0): (17, ('u1', 'u2')),
+    (8, 54, 12, 26, 0): (17, ('u1', 'u2')),
+    (8, 56, 9, 27, 0): (18, ('u1', 'u2')),
+    (8, 56, 12, 24, 0): (18, ('u1', 'u2')),
+    (8, 58, 9, 25, 0): (18, ('u1', 'u2')),
+    (9, 56, 9, 26, 0): (18, ('u1', 'u2')),
+    (9, 58, 6, 27, 0): (19, ('u1', 'u2')),
+    (9, 58, 9, 24, 0): (19, ('u1', 'u2')),
+    (9, 60, 6, 25, 0): (19, ('u1', 'u2')),
+    (10, 58, 6, 26, 0): (19, ('u1', 'u2')),
+    (10, 60, 3, 27, 0): (20, ('u1', 'u2')),
+    (10, 60, 6, 24, 0): (20, ('u1', 'u2')),
+    (10, 62, 3, 25, 0): (20, ('u1', 'u2')),
+    (11, 60, 3, 26, 0): (20, ('u1', 'u2')),
+    (11, 62, 0, 27, 0): (21, ('u1', 'u2')),
+    (11, 62, 3, 24, 0): (21, ('u1', 'u2')),
+    (11, 64, 0, 25, 0): (21, ('u1', 'u2')),
+    (12, 62, 0, 26, 0): (22, ('u1', 'u2')),
+    (12, 64, 0, 24, 0): (22, ('u1', 'u2')),
+    (0, 44, 33, 23, 0): (5, ('u3', 'u3')),
+    (0, 42, 36, 22, 0): (6, ('u3', 'u3')),
+    (0, 44, 36, 20, 0): (6, ('u3', 'u3')),
+    (0, 46, 33, 21, 0): (5, ('u3', 'u3')),
+    (1, 44, 33, 22, 0): (11, ('u1', 'u2')),
+    (1, 46, 30, 23, 0): (12, ('u1', 'u2')),
+    (1, 46, 33, 20, 0): (12, ('u1', 'u3')),
+    (1, 48, 30, 21, 0): (12, ('u1', 'u2')),
+    (3, 48, 27, 22, 0): (13, ('u1', 'u2')),
+    (3, 52, 24, 21, 0): (14, ('u1', 'u2')),
+    (4, 50, 24, 22, 0): (14, ('u1', 'u2')),
+    (4, 52, 21, 23, 0): (15, ('u1', 'u2')),
+    (4, 52, 24, 20, 0): (15, ('u1', 'u2')),
+    (4, 54, 21, 21, 0): (15, ('u1', 'u2')),
+    (5, 52, 21, 22, 0): (15, ('u1', 'u2')),
+    (5, 54, 18, 23, 0): (16, ('u1', 'u2')),
+    (5, 54, 21, 20, 0): (16, ('u1', 'u2')),
+    (5, 56, 18, 21, 0): (16, ('u1', 'u2')),
+    (6, 54, 18, 22, 0): (16, ('u1', 'u2')),
+    (6, 56, 15, 23, 0): (17, ('u1', 'u2')),
+    (6, 56, 18, 20, 0): (17, ('u1', 'u2')),
+    (6, 58, 15, 21, 0): (17, ('u1', 'u2')),
+    (7, 56, 15, 22, 0): (17, ('u1', 'u2')),
+    (7, 58, 12, 23, 0): (18, ('u1', 'u2')),
+    (7, 58, 15, 20, 0): (18, ('u1', 'u2')),
+    (7, 60, 12, 21, 0): (18, ('u1', 'u2')),
+    (8, 58, 12, 22, 0): (18, ('u1', 'u2')),
+    (8, 60, 9, 23, 0): (19, ('u1', 'u2')),
+    (8, 60, 12, 20, 0): (19, ('u1', 'u2')),
+    (8, 62, 9, 21, 0): (19, ('u1', 'u2')),
+    (9, 60, 9, 22, 0): (19, ('u1', 'u2')),
+    (9, 62, 6, 23, 0): (20, ('u1', 'u2')),
+    (9, 62, 9, 20, 0): (20, ('u1', 'u2')),
+    (9, 64, 6, 21, 0): (20, ('u1', 'u2')),
+    (10, 62, 6, 22, 0): (20, ('u1', 'u2')),
+    (10, 64, 3, 23, 0): (21, ('u1', 'u2')),
+    (10, 64, 6, 20, 0): (21, ('u1', 'u2')),
+    (10, 66, 3, 21, 0): (21, ('u1', 'u2')),
+    (11, 64, 3, 22, 0): (21, ('u1', 'u2')),
+    (11, 66, 0, 23, 0): (22, ('u1', 'u2')),
+    (11, 66, 3, 20, 0): (22, ('u1', 'u2')),
+    (11, 68, 0, 21, 0): (22, ('u1', 'u2')),
+    (12, 66, 0, 22, 0): (23, ('u1', 'u2')),
+    (12, 68, 0, 20, 0): (23, ('u1', 'u2')),
+    (0, 48, 33, 19, 0): (5, ('u3', 'u3')),
+    (0, 46, 36, 18, 0): (6, ('u3', 'u3')),
+    (0, 48, 36, 16, 0): (6, ('u3', 'u3')),
+    (0, 50, 33, 17, 0): (5, ('u3', 'u3')),
+    (1, 48, 33, 18, 0): (12, ('u1', 'u2')),
+    (1, 50, 30, 19, 0): (13, ('u1', 'u2')),
+    (1, 50, 33, 16, 0): (13, ('u1', 'u2')),
+    (1, 52, 30, 17, 0): (13, ('u1', 'u2')),
+    (3, 52, 27, 18, 0): (14, ('u1', 'u2')),
+    (3, 56, 24, 17, 0): (15, ('u1', 'u2')),
+    (4, 54, 24, 18, 0): (15, ('u1', 'u2')),
+    (4, 56, 21, 19, 0): (16, ('u1', 'u2')),
+    (4, 56, 24, 16, 0): (16, ('u1', 'u2')),
+    (4, 58, 21, 17, 0): (16, ('u1', 'u2')),
+    (5, 56, 21, 18, 0): (16, ('u1', 'u2')),
+    (5, 58, 18, 19, 0): (17, ('u1', 'u2')),
+    (5, 58, 21, 16, 0): (17, ('u1', 'u2')),
+    (5, 60, 18, 17, 0): (17, ('u1', 'u2')),
+    (6, 58, 18, 18, 0): (17, ('u1', 'u2')),
+    (6, 60, 15, 19, 0): (18, ('u1', 'u2')),
+    (6, 60, 18, 16, 0): (18, ('u1', 'u2')),
+    (6, 62, 15, 17, 0): (18, ('u1', 'u2')),
+    (7, 60, 15, 18, 0): (18, ('u1', 'u2')),
+    (7, 62, 12, 19, 0): (19, ('u1', 'u2')),
+    (7, 62, 15, 16, 0): (19, ('u1', 'u2')),
+    (7, 64, 12, 17, 0): (19, ('u1', 'u2')),
+    (8, 62, 12, 18, 0): (19, ('u1', 'u2')),
+    (8, 64, 9, 19, 0): (20, ('u1', 'u2')),
+    (8, 64, 12, 16, 0): (20, ('u1', 'u2')),
+    (8, 66, 9, 17, 0): (20, ('u1', 'u2')),
+    (9, 64, 9, 18, 0): (20, ('u1', 'u2')),
+    (9, 66, 6, 19, 0): (21, ('u1', 'u2')),
+    (9, 66, 9, 16, 0): (21, ('u1', 'u2')),
+    (9, 68, 6, 17, 0): (21, ('u1', 'u2')),
+    (10, 66, 6, 18, 0): (21, ('u1', 'u2')),
+    (10, 68, 3, 19, 0): (22, ('u1', 'u2')),
+    (10, 68, 6, 16, 0): (22, ('u1', 'u2')),
+    (10, 70, 3, 17, 0): (22, ('u1', 'u2')),
+    (11, 68, 3, 18, 0): (22, ('u1', 'u2')),
+    (11, 70, 0, 19, 0): (23, ('u1', 'u2')),
+    (11, 70, 3, 16, 0): (23, ('u1', 'u2')),
+    (11, 72, 0, 17, 0): (23, ('u1', 'u2')),
+    (12, 70, 0, 18, 0): (24, ('u1', 'u2')),
+    (12, 72, 0, 16, 0): (24, ('u1', 'u2')),
+    (0, 52, 33, 15, 0): (5, ('u3', 'u3')),
+    (0, 50, 36, 14, 0): (6, ('u3', 'u3')),
+    (0, 52, 36, 12, 0): (6, ('u3', 'u3')),
+    (0, 54, 33, 13, 0): (5, ('u3', 'u3')),
+    (1, 52, 33, 14, 0): (13, ('u1', 'u2')),
+    (1, 54, 30, 15, 0): (14, ('u1', 'u2')),
+    (1, 54, 33, 12, 0): (14, ('u1', 'u2')),
+    (1, 56, 30, 13, 0): (14, ('u1', 'u2')),
+    (3, 56, 27, 14, 0): (15, ('u1', 'u2')),
+    (3, 60, 24, 13, 0): (16, ('u1', 'u2')),
+    (4, 58, 24, 14, 0): (16, ('u1', 'u2')),
+    (4, 60, 21, 15, 0): (17, ('u1', 'u2')),
+    (4, 60, 24, 12, 0): (17, ('u1', 'u2')),
+    (4, 62, 21, 13, 0): (17, ('u1', 'u2')),
+    (5, 60, 21, 14, 0): (17, ('u1', 'u2')),
+    (5, 62, 18, 15, 0): (18, ('u1', 'u2')),
+    (5, 62, 21, 12, 0): (18, ('u1', 'u2')),
+    (5, 64, 18, 13, 0): (18, ('u1', 'u2')),
+    (6, 62, 18, 14, 0): (18, ('u1', 'u2')),
+    (6, 64, 15, 15, 0): (19, ('u1', 'u2')),
+    (6, 64, 18, 12, 0): (19, ('u1', 'u2')),
+    (6, 66, 15, 13, 0): (19, ('u1', 'u2')),
+    (7, 64, 15, 14, 0): (19, ('u1', 'u2')),
+    (7, 66, 12, 15, 0): (20, ('u1', 'u2')),
+    (7, 66, 15, 12, 0): (20, ('u1', 'u2')),
+    (7, 68, 12, 13, 0): (20, ('u1', 'u2')),
+    (8, 66, 12, 14, 0): (20, ('u1', 'u2')),
+    (8, 68, 9, 15, 0): (21, ('u1', 'u2')),
+    (8, 68, 12, 12, 0): (21, ('u1', 'u2')),
+    (8, 70, 9, 13, 0): (21, ('u1', 'u2')),
+    (9, 68, 9, 14, 0): (21, ('u1', 'u2')),
+    (9, 70, 6, 15, 0): (22, ('u1', 'u2')),
+    (9, 70, 9, 12, 0): (22, ('u1', 'u2')),
+    (9, 72, 6, 13, 0): (22, ('u1', 'u2')),
+    (10, 70, 6, 14, 0): (22, ('u1', 'u2')),
+    (10, 72, 3, 15, 0): (23, ('u1', 'u2')),
+    (10, 72, 6, 12, 0): (23, ('u1', 'u2')),
+    (10, 74, 3, 13, 0): (23, ('u1', 'u2')),
+    (11, 72, 3, 14, 0): (23, ('u1', 'u2')),
+    (11, 74, 0, 15, 0): (24, ('u1', 'u2')),
+    (11, 74, 3, 12, 0): (24, ('u1', 'u2')),
+    (11, 76, 0, 13, 0): (24, ('u1', 'u2')),
+    (12, 74, 0, 14, 0): (25, ('u1', 'u2')),
+    (12, 76, 0, 12, 0): (25, ('u1', 'u2')),
+    (0, 56, 33, 11, 0): (5, ('u3', 'u3')),
+    (0, 54, 36, 10, 0): (6, ('u3', 'u3')),
+    (0, 56, 36, 8, 0): (6, ('u3', 'u3')),
+    (0, 58, 33, 9, 0): (5, ('u3', 'u3')),
+    (1, 56, 33, 10, 0): (14, ('u1', 'u2')),
+    (1, 58, 30, 11, 0): (15, ('u1', 'u2')),
+    (1, 58, 33, 8, 0): (15, ('u1', 'u2')),
+    (1, 60, 30, 9, 0): (15, ('u1', 'u2')),
+    (3, 60, 27, 10, 0): (16, ('u1', 'u2')),
+    (3, 64, 24, 9, 0): (17, ('u1', 'u2')),
+    (4, 62, 24, 10, 0): (17, ('u1', 'u2')),
+    (4, 64, 21, 11, 0): (18, ('u1', 'u2')),
+    (4, 64, 24, 8, 0): (18, ('u1', 'u2')),
+    (4, 66, 21, 9, 0): (18, ('u1', 'u2')),
+    (5, 64, 21, 10, 0): (18, ('u1', 'u2')),
+    (5, 66, 18, 11, 0): (19, ('u1', 'u2')),
+    (5, 66, 21, 8, 0): (19, ('u1', 'u2')),
+    (5, 68, 18, 9, 0): (19, ('u1', 'u2')),
+    (6, 66, 18, 10, 0): (19, ('u1', 'u2')),
+    (6, 68, 15, 11, 0): (20, ('u1', 'u2')),
+    (6, 68, 18, 8, 0): (20, ('u1', 'u2')),
+    (6, 70, 15, 9, 0): (20, ('u1', 'u2')),
+    (7, 68, 15, 10, 0): (20, ('u1', 'u2')),
+    (7, 70, 12, 11, 0): (21, ('u1', 'u2')),
+    (7, 70, 15, 8, 0): (21, ('u1', 'u2')),
+    (7, 72, 12, 9, 0): (21, ('u1', 'u2')),
+    (8, 70, 12, 10, 0): (21, ('u1', 'u2')),
+    (8, 72, 9, 11, 0): (22, ('u1', 'u2')),
+    (8, 72, 12, 8, 0): (22, ('u1', 'u2')),
+    (8, 74, 9, 9, 0): (22, ('u1', 'u2')),
+    (9, 72, 9, 10, 0): (22, ('u1', 'u2')),
+    (9, 74, 6, 11, 0): (23, ('u1', 'u2')),
+    (9, 74, 9, 8, 0): (23, ('u1', 'u2')),
+    (9, 76, 6, 9, 0): (23, ('u1', 'u2')),
+    (10, 74, 6, 10, 0): (23, ('u1', 'u2')),
+    (10, 76, 3, 11, 0): (24, ('u1', 'u2')),
+    (10, 76, 6, 8, 0): (24, ('u1', 'u2')),
+    (10, 78, 3, 9, 0): (24, ('u1', 'u2')),
+    (11, 76, 3, 10, 0): (24, ('u1', 'u2')),
+    (11, 78, 0, 11, 0): (25, ('u1', 'u2')),
+    (11, 78, 3, 8, 0): (25, ('u1', 'u2')),
+    (11, 80, 0, 9, 0): (25, ('u1', 'u2')),
+    (12, 78, 0, 10, 0): (26, ('u1', 'u2')),
+    (12, 80, 0, 8, 0): (26, ('u1', 'u2')),
+    (0, 60, 33, 7, 0): (5, ('u3', 'u3')),
+    (0, 58, 36, 6, 0): (6, ('u3', 'u3')),
+    (0, 60, 36, 4, 0): (6, ('u3', 'u3')),
+    (0, 62, 33, 5, 0): (5, ('u3', 'u3')),
+    (1, 60, 33, 6, 0): (15, ('u1', 'u2')),
+    (1, 62, 30, 7, 0): (16, ('u1', 'u2')),
+    (1, 62, 33, 4, 0): (16, ('u1', 'u2')),
+    (1, 64, 30, 5, 0): (16, ('u1', 'u2')),
+    (3, 64, 27, 6, 0): (17, ('u1', 'u2')),
+    (3, 68, 24, 5, 0): (18, ('u1', 'u2')),
+    (4, 66, 24, 6, 0): (18, ('u1', 'u2')),
+    (4, 68, 21, 7, 0): (19, ('u1', 'u2')),
+    (4, 68, 24, 4, 0): (19, ('u1', 'u2')),
+    (4, 70, 21, 5, 0): (19, ('u1', 'u2')),
+    (5, 68, 21, 6, 0): (19, ('u1', 'u2')),
+    (5, 70, 18, 7, 0): (20, ('u1', 'u2')),
+    (5, 70, 21, 4, 0): (20, ('u1', 'u2')),
+    (5, 72, 18, 5, 0): (20, ('u1', 'u2')),
+    (6, 70, 18, 6, 0): (20, ('u1', 'u2')),
+    (6, 72, 15, 7, 0): (21, ('u1', 'u2')),
+    (6, 72, 18, 4, 0): (21, ('u1', 'u2')),
+    (6, 74, 15, 5, 0): (21, ('u1', 'u2')),
+    (7, 72, 15, 6, 0): (21, ('u1', 'u2')),
+    (7, 74, 12, 7, 0): (22, ('u1', 'u2')),
+    (7, 74, 15, 4, 0): (22, ('u1', 'u2')),
+    (7, 76, 12, 5, 0): (22, ('u1', 'u2')),
+    (8, 74, 12, 6, 0): (22, ('u1', 'u2')),
+    (8, 76, 9, 7, 0): (23, ('u1', 'u2')),
+    (8, 76, 12, 4, 0): (23, ('u1', 'u2')),
+    (8, 78, 9, 5, 0): (23, ('u1', 'u2')),
+    (9, 76, 9, 6, 0): (23, ('u1', 'u2')),
+    (9, 78, 6, 7, 0): (24, ('u1', 'u2')),
+    (9, 78, 9, 4, 0): (24, ('u1', 'u2')),
+    (9, 80, 6, 5, 0): (24, ('u1', 'u2')),
+    (10, 78, 6, 6, 0): (24, ('u1', 'u2')),
+    (10, 80, 3, 7, 0): (25, ('u1', 'u2')),
+    (10, 80, 6, 4, 0): (25, ('u1', 'u2')),
+    (10, 82, 3, 5, 0): (25, ('u1', 'u2')),
+    (11, 80, 3, 6, 0): (25, ('u1', 'u2')),
+    (11, 82, 0, 7, 0): (26, ('u1', 'u2')),
+    (11, 82, 3, 4, 0): (26, ('u1', 'u2')),
+    (11, 84, 0, 5, 0): (26, ('u1', 'u2')),
+    (12, 82, 0, 6, 0): (27, ('u1', 'u2')),
+    (12, 84, 0, 4, 0): (27, ('u1', 'u2')),
+    (0, 64, 36, 0, 0): (6, ('u3', 'u3')),
+    (1, 66, 33, 0, 0): (17, ('u1', 'u2')),
+    (4, 72, 24, 0, 0): (20, ('u1', 'u2')),
+    (5, 74, 21, 0, 0): (21, ('u1', 'u2')),
+    (6, 76, 18, 0, 0): (22, ('u1', 'u2')),
+    (7, 78, 15, 0, 0): (23, ('u1', 'u2')),
+    (8, 80, 12, 0, 0): (24, ('u1', 'u2')),
+    (9, 82, 9, 0, 0): (25, ('u1', 'u2')),
+    (10, 84, 6, 0, 0): (26, ('u1', 'u2')),
+    (11, 86, 3, 0, 0): (27, ('u1', 'u2')),
+    (12, 88, 0, 0, 0): (28, ('u1', 'u2')),
+    (4, 0, 27, 69, 0): (5, ('u1', 'u3')),
+    (5, 0, 24, 71, 0): (5, ('u1', 'u3')),
+    (2, 0, 33, 65, 0): (5, ('u3', 'u3')),
+    (3, 0, 30, 67, 0): (5, ('u3', 'u3')),
+    (3, 2, 30, 65, 0): (6, ('u2', 'u3')),
+    (4, 2, 27, 67, 0): (6, ('u1', 'u2')),
+    (0, 0, 39, 61, 0): (6, ('u3', 'u3')),
+    (1, 0, 36, 63, 0): (6, ('u3', 'u3')),
+    (1, 2, 36, 61, 0): (6, ('u3', 'u3')),
+    (2, 2, 33, 63, 0): (6, ('u2', 'u3')),
+    (3, 4, 30, 63, 0): (6, ('u2', 'u2')),
+    (6, 0, 24, 70, 0): (6, ('u1', 'u3')),
+    (3, 0, 33, 64, 0): (6, ('u3', 'u3')),
+    (4, 0, 30, 66, 0): (6, ('u1', 'u3')),
+    (4, 2, 30, 64, 0): (6, ('u1', 'u3')),
+    (5, 2, 27, 66, 0): (6, ('u1', 'u3')),
+    (1, 0, 39, 60, 0): (6, ('u3', 'u3')),
+    (2, 0, 36, 62, 0): (6, ('u3', 'u3')),
+    (2, 2, 36, 60, 0): (6, ('u2', 'u3')),
+    (3, 2, 33, 62, 0): (6, ('u2', 'u3')),
+    (3, 4, 33, 60, 0): (7, ('u2', 'u2')),
+    (0, 2, 39, 59, 0): (6, ('u3', 'u3')),
+    (0, 4, 39, 57, 0): (6, ('u3', 'u3')),
+    (1, 4, 36, 59, 0): (6, ('u1', 'u3')),
+    (1, 6, 36, 57, 0): (6, ('u1', 'u3')),
+    (0, 0, 42, 58, 0): (7, ('u3', 'u3')),
+    (0, 2, 42, 56, 0): (7, ('u3', 'u3')),
+    (1, 2, 39, 58, 0): (7, ('u3', 'u3')),
+    (1, 4, 39, 56, 0): (7, ('u1', 'u3')),
+    (0, 6, 39, 55, 0): (6, ('u3', 'u3')),
+    (0, 8, 39, 53, 0): (6, ('u3', 'u3')),
+    (1, 8, 36, 55, 0): (6, ('u1', 'u3')),
+    (1, 10, 36, 53, 0): (6, ('u1', 'u3')),
+    (5, 18, 24, 53, 0): (7, ('u1', 'u2')),
+    (0, 4, 42, 54, 0): (7, ('u3', 'u3')),
+    (0, 6, 42, 52, 0): (7, ('u3', 'u3')),
+    (1, 6, 39, 54, 0): (7, ('u1', 'u3')),
+    (1, 8, 39, 52, 0): (7, ('u1', 'u3')),
+    (6, 20, 21, 53, 0): (8, ('u1', 'u2')),
+    (7, 22, 18, 53, 0): (9, ('u1', 'u2')),
+    (8, 24, 15, 53, 0): (10, ('u1', 'u2')),
+    (0, 10, 39, 51, 0): (6, ('u3', 'u3')),
+    (0, 12, 39, 49, 0): (6, ('u3', 'u3')),
+    (1, 12, 36, 51, 0): (6, ('u1', 'u3')),
+    (1, 14, 36, 49, 0): (6, ('u1', 'u3')),
+    (5, 20, 24, 51, 0): (8, ('u1', 'u2')),
+    (5, 22, 24, 49, 0): (8, ('u1', 'u2')),
+    (0, 8, 42, 50, 0): (7, ('u3', 'u3')),
+    (0, 10, 42, 48, 0): (7, ('u3', 'u3')),
+    (1, 10, 39, 50, 0): (7, ('u1', 'u3')),
+    (1, 12, 39, 48, 0): (7, ('u1', 'u3')),
+    (5, 18, 27, 50, 0): (8, ('u1', 'u2')),
+    (6, 24, 21, 49, 0): (9, ('u1', 'u2')),
+    (7, 26, 18, 49, 0): (10, ('u1', 'u2')),
+    (8, 28, 15, 49, 0): (11, ('u1', 'u2')),
+    (9, 30, 12, 49, 0): (12, ('u1', 'u2')),
+    (0, 14, 39, 47, 0): (6, ('u3', 'u3')),
+    (0, 16, 39, 45, 0): (6, ('u3', 'u3')),
+    (1, 16, 36, 47, 0): (6, ('u1', 'u3')),
+    (1, 18, 36, 45, 0): (6, ('u1', 'u3')),
+    (0, 12, 42, 46, 0): (7, ('u3', 'u3')),
+    (0, 14, 42, 44, 0): (7, ('u3', 'u3')),
+    (1, 14, 39, 46, 0): (7, ('u1', 'u3')),
+    (1, 16, 39, 44, 0): (7, ('u1', 'u3')),
+    (5, 22, 27, 46, 0): (8, ('u1', 'u2')),
+    (5, 24, 24, 47, 0): (9, ('u1', 'u2')),
+    (5, 24, 27, 44, 0): (9, ('u1', 'u2')),
+    (5, 26, 24, 45, 0): (9, ('u1', 'u2')),
+    (6, 24, 24, 46, 0): (9, ('u1', 'u2')),
+    (6, 26, 21, 47, 0): (10, ('u1', 'u2')),
+    (6, 28, 21, 45, 0): (10, ('u1', 'u2')),
+    (7, 26, 21, 46, 0): (10, ('u1', 'u2')),
+    (7, 28, 18, 47, 0): (11, ('u1', 'u2')),
+    (7, 30, 18, 45, 0): (11, ('u1', 'u2')),
+    (8, 28, 18, 46, 0): (11, ('u1', 'u2')),
+    (8, 30, 15, 47, 0): (12, ('u1', 'u2')),
+    (8, 32, 15, 45, 0): (12, ('u1', 'u2')),
+    (9, 34, 12, 45, 0): (13, ('u1', 'u2')),
+    (10, 36, 9, 45, 0): (14, ('u1', 'u2')),
+    (0, 18, 39, 43, 0): (6, ('u3', 'u3')),
+    (0, 20, 39, 41, 0): (6, ('u3', 'u3')),
+    (1, 20, 36, 43, 0): (6, ('u1', 'u3')),
+    (1, 22, 36, 41, 0): (6, ('u1', 'u3')),
+    (0, 16, 42, 42, 0): (7, ('u3', 'u3')),
+    (0, 18, 42, 40, 0): (7, ('u3', 'u3')),
+    (1, 18, 39, 42, 0): (7, ('u1', 'u3')),
+    (1, 20, 39, 40, 0): (7, ('u1', 'u3')),
+    (5, 26, 27, 42, 0): (9, ('u1', 'u2')),
+    (5, 28, 24, 43, 0): (10, ('u1', 'u2')),
+    (5, 28, 27, 40, 0): (10, ('u1', 'u2')),
+    (5, 30, 24, 41, 0): (10, ('u1', 'u2')),
+    (6, 28, 24, 42, 0): (10, ('u1', 'u2')),
+    (6, 30, 21, 43, 0): (11, ('u1', 'u2')),
+    (6, 30, 24, 40, 0): (11, ('u1', 'u2')),
+    (6, 32, 21, 41, 0): (11, ('u1', 'u2')),
+    (7, 30, 21, 42, 0): (11, ('u1', 'u2')),
+    (7, 32, 18, 43, 0): (12, ('u1', 'u2')),
+    (7, 32, 21, 40, 0): (12, ('u1', 'u2')),
+    (7, 34, 18, 41, 0): (12, ('u1', 'u2')),
+    (8, 32, 18, 42, 0): (12, ('u1', 'u2')),
+    (8, 34, 15, 43, 0): (13, ('u1', 'u2')),
+    (8, 34, 18, 40, 0): (13, ('u1', 'u2')),
+    (8, 36, 15, 41, 0): (13, ('u1', 'u2')),
+    (9, 34, 15, 42, 0): (13, ('u1', 'u2')),
+    (9, 38, 12, 41, 0): (14, ('u1', 'u2')),
+    (10, 40, 9, 41, 0): (15, ('u1', 'u2')),
+    (0, 22, 39, 39, 0): (6, ('u3', 'u3')),
+    (0, 24, 39, 37, 0): (6, ('u3', 'u3')),
+    (0, 20, 42, 38, 0): (7, ('u3', 'u3')),
+    (0, 22, 42, 36, 0): (7, ('u3', 'u3')),
+    (1, 22, 39, 38, 0): (7, ('u1', 'u3')),
+    (1, 24, 36, 39, 0): (7, ('u1', 'u3')),
+    (1, 24, 39, 36, 0): (7, ('u1', 'u3')),
+    (1, 26, 36, 37, 0): (7, ('u1', 'u3')),
+    (5, 30, 27, 38, 0): (10, ('u1', 'u2')),
+    (5, 32, 24, 39, 0): (11, ('u1', 'u2')),
+    (5, 32, 27, 36, 0): (11, ('u1', 'u2')),
+    (5, 34, 24, 37, 0): (11, ('u1', 'u2')),
+    (6, 32, 24, 38, 0): (11, ('u1', 'u2')),
+    (6, 34, 21, 39, 0): (12, ('u1', 'u2')),
+    (6, 34, 24, 36, 0): (12, ('u1', 'u2')),
+    (6, 36, 21, 37, 0): (12, ('u1', 'u2')),
+    (7, 34, 21, 38, 0): (12, ('u1', 'u2')),
+    (7, 36, 18, 39, 0): (13, ('u1', 'u2')),
+    (7, 36, 21, 36, 0): (13, ('u1', 'u2')),
+    (7, 38, 18, 37, 0): (13, ('u1', 'u2')),
+    (8, 36, 18, 38, 0): (13, ('u1', 'u2')),
+    (8, 38, 15, 39, 0): (14, ('u1', 'u2')),
+    (8, 38, 18, 36, 0): (14, ('u1', 'u2')),
+    (8, 40, 15, 37, 0): (14, ('u1', 'u2')),
+    (9, 38, 15, 38, 0): (14, ('u1', 'u2')),
+    (9, 40, 12, 39, 0): (15, ('u1', 'u2')),
+    (9, 40, 15, 36, 0): (15, ('u1', 'u2')),
+    (9, 42, 12, 37, 0): (15, ('u1', 'u2')),
+    (10, 40, 12, 38, 0): (15, ('u1', 'u2')),
+    (10, 44, 9, 37, 0): (16, ('u1', 'u2')),
+    (0, 26, 39, 35, 0): (6, ('u3', 'u3')),
+    (0, 24, 42, 34, 0): (7, ('u3', 'u3')),
+    (0, 26, 42, 32, 0): (7, ('u3', 'u3')),
+    (0, 28, 39, 33, 0): (6, ('u3', 'u3')),
+    (1, 26, 39, 34, 0): (7, ('u1', 'u3')),
+    (1, 28, 36, 35, 0): (8, ('u1', 'u3')),
+    (1, 28, 39, 32, 0): (8, ('u1', 'u3')),
+    (1, 30, 36, 33, 0): (8, ('u1', 'u3')),
+    (5, 34, 27, 34, 0): (11, ('u1', 'u2')),
+    (5, 36, 24, 35, 0): (12, ('u1', 'u2')),
+    (5, 36, 27, 32, 0): (12, ('u1', 'u2')),
+    (5, 38, 24, 33, 0): (12, ('u1', 'u2')),
+    (6, 36, 24, 34, 0): (12, ('u1', 'u2')),
+    (6, 38, 21, 35, 0): (13, ('u1', 'u2')),
+    (6, 38, 24, 32, 0): (13, ('u1', 'u2')),
+    (6, 40, 21, 33, 0): (13, ('u1', 'u2')),
+    (7, 38, 21, 34, 0): (13, ('u1', 'u2')),
+    (7, 40, 18, 35, 0): (14, ('u1', 'u2')),
+    (7, 40, 21, 32, 0): (14, ('u1', 'u2')),
+    (7, 42, 18, 33, 0): (14, ('u1', 'u2')),
+    (8, 40, 18, 34, 0): (14, ('u1', 'u2')),
+    (8, 42, 15, 35, 0): (15, ('u1', 'u2')),
+    (8, 42, 18, 32, 0): (15, ('u1', 'u2')),
+    (8, 44, 15, 33, 0): (15, ('u1', 'u2')),
+    (9, 42, 15, 34, 0): (15, ('u1', 'u2')),
+    (9, 44, 12, 35, 0): (16, ('u1', 'u2')),
+    (9, 44, 15, 32, 0): (16, ('u1', 'u2')),
+    (9, 46, 12, 33, 0): (16, ('u1', 'u2')),
+    (10, 44, 12, 34, 0): (16, ('u1', 'u2')),
+    (10, 46, 9, 35, 0): (17, ('u1', 'u2')),
+    (10, 46, 12, 32, 0): (17, ('u1', 'u2')),
+    (10, 48, 9, 33, 0): (17, ('u1', 'u2')),
+    (11, 50, 6, 33, 0): (18, ('u1', 'u2')),
+    (0, 30, 39, 31, 0): (6, ('u3', 'u3')),
+    (0, 28, 42, 30, 0): (7, ('u3', 'u3')),
+    (0, 30, 42, 28, 0): (7, ('u3', 'u3')),
+    (0, 32, 39, 29, 0): (6, ('u3', 'u3')),
+    (1, 30, 39, 30, 0): (8, ('u1', 'u3')),
+    (1, 32, 36, 31, 0): (9, ('u1', 'u3')),
+    (1, 32, 39, 28, 0): (9, ('u1', 'u3')),
+    (1, 34, 36, 29, 0): (9, ('u1', 'u3')),
+    (3, 36, 30, 31, 0): (10, ('u1', 'u2')),
+    (4, 38, 27, 31, 0): (11, ('u1', 'u2')),
+    (5, 38, 27, 30, 0): (12, ('u1', 'u2')),
+    (5, 40, 24, 31, 0): (12, ('u1', 'u2')),
+    (5, 40, 27, 28, 0): (13, ('u1', 'u2')),
+    (5, 42, 24, 29, 0): (13, ('u1', 'u2')),
+    (6, 40, 24, 30, 0): (13, ('u1', 'u2')),
+    (6, 42, 21, 31, 0): (13, ('u1', 'u2')),
+    (6, 42, 24, 28, 0): (14, ('u1', 'u2')),
+    (6, 44, 21, 29, 0): (14, ('u1', 'u2')),
+    (7, 42, 21, 30, 0): (14, ('u1', 'u2')),
+    (7, 44, 18, 31, 0): (14, ('u1', 'u2')),
+    (7, 44, 21, 28, 0): (15, ('u1', 'u2')),
+    (7, 46, 18, 29, 0): (15, ('u1', 'u2')),
+    (8, 44, 18, 30, 0): (15, ('u1', 'u2')),
+    (8, 46, 15, 31, 0): (15, ('u1', 'u2')),
+    (8, 46, 18, 28, 0): (16, ('u1', 'u2')),
+    (8, 48, 15, 29, 0): (16, ('u1', 'u2')),
+    (9, 46, 15, 30, 0): (16, ('u1', 'u2')),
+    (9, 48, 12, 31, 0): (16, ('u1', 'u2')),
+    (9, 48, 15, 28, 0): (17, ('u1', 'u2')),
+    (9, 50, 12, 29, 0): (17, ('u1', 'u2')),
+    (10, 48, 12, 30, 0): (17, ('u1', 'u2')),
+    (10, 50, 9, 31, 0): (17, ('u1', 'u2')),
+    (10, 50, 12, 28, 0): (18, ('u1', 'u2')),
+    (10, 52, 9, 29, 0): (18, ('u1', 'u2')),
+    (11, 50, 9, 30, 0): (18, ('u1', 'u2')),
+    (11, 54, 6, 29, 0): (19, ('u1', 'u2')),
+    (0, 34, 39, 27, 0): (6, ('u3', 'u3')),
+    (0, 32, 42, 26, 0): (7, ('u3', 'u3')),
+    (0, 34, 42, 24, 0): (7, ('u3', 'u3')),
+    (0, 36, 39, 25, 0): (6, ('u3', 'u3')),
+    (1, 34, 39, 26, 0): (9, ('u1', 'u3')),
+    (1, 36, 36, 27, 0): (10, ('u1', 'u3')),
+    (1, 36, 39, 24, 0): (10, ('u1', 'u3')),
+    (1, 38, 36, 25, 0): (10, ('u1', 'u3')),
+    (3, 40, 30, 27, 0): (11, ('u1', 'u2')),
+    (3, 40, 33, 24, 0): (11, ('u1', 'u2')),
+    (4, 42, 27, 27, 0): (12, ('u1', 'u2')),
+    (4, 42, 30, 24, 0): (12, ('u1', 'u2')),
+    (4, 44, 27, 25, 0): (13, ('u1', 'u2')),
+    (5, 42, 27, 26, 0): (13, ('u1', 'u2')),
+    (5, 44, 24, 27, 0): (13, ('u1', 'u2')),
+    (5, 44, 27, 24, 0): (13, ('u1', 'u2')),
+    (5, 46, 24, 25, 0): (14, ('u1', 'u2')),
+    (6, 44, 24, 26, 0): (14, ('u1', 'u2')),
+    (6, 46, 21, 27, 0): (14, ('u1', 'u2')),
+    (6, 46, 24, 24, 0): (14, ('u1', 'u2')),
+    (6, 48, 21, 25, 0): (15, ('u1', 'u2')),
+    (7, 46, 21, 26, 0): (15, ('u1', 'u2')),
+    (7, 48, 18, 27, 0): (15, ('u1', 'u2')),
+    (7, 48, 21, 24, 0): (15, ('u1', 'u2')),
+    (7, 50, 18, 25, 0): (16, ('u1', 'u2')),
+    (8, 48, 18, 26, 0): (16, ('u1', 'u2')),
+    (8, 50, 15, 27, 0): (16, ('u1', 'u2')),
+    (8, 50, 18, 24, 0): (16, ('u1', 'u2')),
+    (8, 52, 15, 25, 0): (17, ('u1', 'u2')),
+    (9, 50, 15, 26, 0): (17, ('u1', 'u2')),
+    (9, 52, 12, 27, 0): (17, ('u1', 'u2')),
+    (9, 52, 15, 24, 0): (17, ('u1', 'u2')),
+    (9, 54, 12, 25, 0): (18, ('u1', 'u2')),
+    (10, 52, 12, 26, 0): (18, ('u1', 'u2')),
+    (10, 54, 9, 27, 0): (18, ('u1', 'u2')),
+    (10, 54, 12, 24, 0): (18, ('u1', 'u2')),
+    (10, 56, 9, 25, 0): (19, ('u1', 'u2')),
+    (11, 54, 9, 26, 0): (19, ('u1', 'u2')),
+    (11, 56, 6, 27, 0): (19, ('u1', 'u2')),
+    (11, 56, 9, 24, 0): (19, ('u1', 'u2')),
+    (11, 58, 6, 25, 0): (20, ('u1', 'u2')),
+    (12, 60, 3, 25, 0): (21, ('u1', 'u2')),
+    (0, 38, 39, 23, 0): (6, ('u3', 'u3')),
+    (0, 36, 42, 22, 0): (7, ('u3', 'u3')),
+    (0, 38, 42, 20, 0): (7, ('u3', 'u3')),
+    (0, 40, 39, 21, 0): (6, ('u3', 'u3')),
+    (1, 38, 39, 22, 0): (10, ('u1', 'u3')),
+    (1, 40, 36, 23, 0): (11, ('u1', 'u3')),
+    (1, 40, 39, 20, 0): (11, ('u1', 'u3')),
+    (1, 42, 36, 21, 0): (11, ('u1', 'u3')),
+    (3, 44, 30, 23, 0): (12, ('u1', 'u2')),
+    (3, 44, 33, 20, 0): (12, ('u1', 'u2')),
+    (4, 46, 27, 23, 0): (13, ('u1', 'u2')),
+    (4, 46, 30, 20, 0): (13, ('u1', 'u2')),
+    (4, 48, 27, 21, 0): (14, ('u1', 'u2')),
+    (5, 46, 27, 22, 0): (14, ('u1', 'u2')),
+    (5, 48, 24, 23, 0): (14, ('u1', 'u2')),
+    (5, 48, 27, 20, 0): (14, ('u1', 'u2')),
+    (5, 50, 24, 21, 0): (15, ('u1', 'u2')),
+    (6, 48, 24, 22, 0): (15, ('u1', 'u2')),
+    (6, 50, 21, 23, 0): (15, ('u1', 'u2')),
+    (6, 50, 24, 20, 0): (15, ('u1', 'u2')),
+    (6, 52, 21, 21, 0): (16, ('u1', 'u2')),
+    (7, 50, 21, 22, 0): (16, ('u1', 'u2')),
+    (7, 52, 18, 23, 0): (16, ('u1', 'u2')),
+    (7, 52, 21, 20, 0): (16, ('u1', 'u2')),
+    (7, 54, 18, 21, 0): (17, ('u1', 'u2')),
+    (8, 52, 18, 22, 0): (17, ('u1', 'u2')),
+    (8, 54, 15, 23, 0): (17, ('u1', 'u2')),
+    (8, 54, 18, 20, 0): (17, ('u1', 'u2')),
+    (8, 56, 15, 21, 0): (18, ('u1', 'u2')),
+    (9, 54, 15, 22, 0): (18, ('u1', 'u2')),
+    (9, 56, 12, 23, 0): (18, ('u1', 'u2')),
+    (9, 56, 15, 20, 0): (18, ('u1', 'u2')),
+    (9, 58, 12, 21, 0): (19, ('u1', 'u2')),
+    (10, 56, 12, 22, 0): (19, ('u1', 'u2')),
+    (10, 58, 9, 23, 0): (19, ('u1', 'u2')),
+    (10, 58, 12, 20, 0): (19, ('u1', 'u2')),
+    (10, 60, 9, 21, 0): (20, ('u1', 'u2')),
+    (11, 58, 9, 22, 0): (20, ('u1', 'u2')),
+    (11, 60, 6, 23, 0): (20, ('u1', 'u2')),
+    (11, 60, 9, 20, 0): (20, ('u1', 'u2')),
+    (11, 62, 6, 21, 0): (21, ('u1', 'u2')),
+    (12, 60, 6, 22, 0): (21, ('u1', 'u2')),
+    (12, 62, 3, 23, 0): (22, ('u1', 'u2')),
+    (12, 64, 3, 21, 0): (22, ('u1', 'u2')),
+    (0, 42, 39, 19, 0): (6, ('u3', 'u3')),
+    (0, 40, 42, 18, 0): (7, ('u3', 'u3')),
+    (0, 42, 42, 16, 0): (7, ('u3', 'u3')),
+    (0, 44, 39, 17, 0): (6, ('u3', 'u3')),
+    (1, 42, 39, 18, 0): (11, ('u1', 'u3')),
+    (1, 44, 36, 19, 0): (12, ('u1', 'u3')),
+    (1, 44, 39, 16, 0): (12, ('u1', 'u3')),
+    (1, 46, 36, 17, 0): (12, ('u1', 'u3')),
+    (3, 48, 30, 19, 0): (13, ('u1', 'u2')),
+    (3, 48, 33, 16, 0): (13, ('u1', 'u2')),
+    (4, 48, 30, 18, 0): (14, ('u1', 'u2')),
+    (4, 50, 27, 19, 0): (14, ('u1', 'u2')),
+    (4, 50, 30, 16, 0): (14, ('u1', 'u2')),
+    (4, 52, 27, 17, 0): (15, ('u1', 'u2')),
+    (5, 50, 27, 18, 0): (15, ('u1', 'u2')),
+    (5, 52, 24, 19, 0): (15, ('u1', 'u2')),
+    (5, 52, 27, 16, 0): (15, ('u1', 'u2')),
+    (5, 54, 24, 17, 0): (16, ('u1', 'u2')),
+    (6, 52, 24, 18, 0): (16, ('u1', 'u2')),
+    (6, 54, 21, 19, 0): (16, ('u1', 'u2')),
+    (6, 54, 24, 16, 0): (16, ('u1', 'u2')),
+    (6, 56, 21, 17, 0): (17, ('u1', 'u2')),
+    (7, 54, 21, 18, 0): (17, ('u1', 'u2')),
+    (7, 56, 18, 19, 0): (17, ('u1', 'u2')),
+    (7, 56, 21, 16, 0): (17, ('u1', 'u2')),
+    (7, 58, 18, 17, 0): (18, ('u1', 'u2')),
+    (8, 56, 18, 18, 0): (18, ('u1', 'u2')),
+    (8, 58, 15, 19, 0): (18, ('u1', 'u2')),
+    (8, 58, 18, 16, 0): (18, ('u1', 'u2')),
+    (8, 60, 15, 17, 0): (19, ('u1', 'u2')),
+    (9, 58, 15, 18, 0): (19, ('u1', 'u2')),
+    (9, 60, 12, 19, 0): (19, ('u1', 'u2')),
+    (9, 60, 15, 16, 0): (19, ('u1', 'u2')),
+    (9, 62, 12, 17, 0): (20, ('u1', 'u2')),
+    (10, 60, 12, 18, 0): (20, ('u1', 'u2')),
+    (10, 62, 9, 19, 0): (20, ('u1', 'u2')),
+    (10, 62, 12, 16, 0): (20, ('u1', 'u2')),
+    (10, 64, 9, 17, 0): (21, ('u1', 'u2')),
+    (11, 62, 9, 18, 0): (21, ('u1', 'u2')),
+    (11, 64, 6, 19, 0): (21, ('u1', 'u2')),
+    (11, 64, 9, 16, 0): (21, ('u1', 'u2')),
+    (11, 66, 6, 17, 0): (22, ('u1', 'u2')),
+    (12, 64, 6, 18, 0): (22, ('u1', 'u2')),
+    (12, 66, 3, 19, 0): (23, ('u1', 'u2')),
+    (12, 66, 6, 16, 0): (23, ('u1', 'u2')),
+    (12, 68, 3, 17, 0): (23, ('u1', 'u2')),
+    (0, 46, 39, 15, 0): (6, ('u3', 'u3')),
+    (0, 44, 42, 14, 0): (7, ('u3', 'u3')),
+    (0, 46, 42, 12, 0): (7, ('u3', 'u3')),
+    (0, 48, 39, 13, 0): (6, ('u3', 'u3')),
+    (1, 46, 39, 14, 0): (12, ('u1', 'u3')),
+    (1, 48, 36, 15, 0): (12, ('u1', 'u2')),
+    (1, 48, 39, 12, 0): (13, ('u1', 'u3')),
+    (1, 50, 36, 13, 0): (13, ('u1', 'u3')),
+    (3, 52, 30, 15, 0): (14, ('u1', 'u2')),
+    (3, 52, 33, 12, 0): (14, ('u1', 'u2')),
+    (4, 52, 30, 14, 0): (15, ('u1', 'u2')),
+    (4, 54, 27, 15, 0): (15, ('u1', 'u2')),
+    (4, 54, 30, 12, 0): (15, ('u1', 'u2')),
+    (4, 56, 27, 13, 0): (16, ('u1', 'u2')),
+    (5, 54, 27, 14, 0): (16, ('u1', 'u2')),
+    (5, 56, 24, 15, 0): (16, ('u1', 'u2')),
+    (5, 56, 27, 12, 0): (16, ('u1', 'u2')),
+    (5, 58, 24, 13, 0): (17, ('u1', 'u2')),
+    (6, 56, 24, 14, 0): (17, ('u1', 'u2')),
+    (6, 58, 21, 15, 0): (17, ('u1', 'u2')),
+    (6, 58, 24, 12, 0): (17, ('u1', 'u2')),
+    (6, 60, 21, 13, 0): (18, ('u1', 'u2')),
+    (7, 58, 21, 14, 0): (18, ('u1', 'u2')),
+    (7, 60, 18, 15, 0): (18, ('u1', 'u2')),
+    (7, 60, 21, 12, 0): (18, ('u1', 'u2')),
+    (7, 62, 18, 13, 0): (19, ('u1', 'u2')),
+    (8, 60, 18, 14, 0): (19, ('u1', 'u2')),
+    (8, 62, 15, 15, 0): (19, ('u1', 'u2')),
+    (8, 62, 18, 12, 0): (19, ('u1', 'u2')),
+    (8, 64, 15, 13, 0): (20, ('u1', 'u2')),
+    (9, 62, 15, 14, 0): (20, ('u1', 'u2')),
+    (9, 64, 12, 15, 0): (20, ('u1', 'u2')),
+    (9, 64, 15, 12, 0): (20, ('u1', 'u2')),
+    (9, 66, 12, 13, 0): (21, ('u1', 'u2')),
+    (10, 64, 12, 14, 0): (21, ('u1', 'u2')),
+    (10, 66, 9, 15, 0): (21, ('u1', 'u2')),
+    (10, 66, 12, 12, 0): (21, ('u1', 'u2')),
+    (10, 68, 9, 13, 0): (22, ('u1', 'u2')),
+    (11, 66, 9, 14, 0): (22, ('u1', 'u2')),
+    (11, 68, 6, 15, 0): (22, ('u1', 'u2')),
+    (11, 68, 9, 12, 0): (22, ('u1', 'u2')),
+    (11, 70, 6, 13, 0): (23, ('u1', 'u2')),
+    (12, 68, 6, 14, 0): (23, ('u1', 'u2')),
+    (12, 70, 3, 15, 0): (24, ('u1', 'u2')),
+    (12, 70, 6, 12, 0): (24, ('u1', 'u2')),
+    (12, 72, 3, 13, 0): (24, ('u1', 'u2')),
+    (13, 74, 0, 13, 0): (25, ('u1', 'u2')),
+    (0, 50, 39, 11, 0): (6, ('u3', 'u3')),
+    (0, 48, 42, 10, 0): (7, ('u3', 'u3')),
+    (0, 50, 42, 8, 0): (7, ('u3', 'u3')),
+    (0, 52, 39, 9, 0): (6, ('u3', 'u3')),
+    (1, 50, 39, 10, 0): (13, ('u1', 'u3')),
+    (1, 52, 36, 11, 0): (13, ('u1', 'u2')),
+    (1, 52, 39, 8, 0): (13, ('u1', 'u2')),
+    (1, 54, 36, 9, 0): (14, ('u1', 'u2')),
+    (3, 56, 30, 11, 0): (15, ('u1', 'u2')),
+    (3, 56, 33, 8, 0): (15, ('u1', 'u2')),
+    (4, 56, 30, 10, 0): (16, ('u1', 'u2')),
+    (4, 58, 27, 11, 0): (16, ('u1', 'u2')),
+    (4, 58, 30, 8, 0): (16, ('u1', 'u2')),
+    (4, 60, 27, 9, 0): (17, ('u1', 'u2')),
+    (5, 58, 27, 10, 0): (17, ('u1', 'u2')),
+    (5, 60, 24, 11, 0): (17, ('u1', 'u2')),
+    (5, 60, 27, 8, 0): (17, ('u1', 'u2')),
+    (5, 62, 24, 9, 0): (18, ('u1', 'u2')),
+    (6, 60, 24, 10, 0): (18, ('u1', 'u2')),
+    (6, 62, 21, 11, 0): (18, ('u1', 'u2')),
+    (6, 62, 24, 8, 0): (18, ('u1', 'u2')),
+    (6, 64, 21, 9, 0): (19, ('u1', 'u2')),
+    (7, 62, 21, 10, 0): (19, ('u1', 'u2')),
+    (7, 64, 18, 11, 0): (19, ('u1', 'u2')),
+    (7, 64, 21, 8, 0): (19, ('u1', 'u2')),
+    (7, 66, 18, 9, 0): (20, ('u1', 'u2')),
+    (8, 64, 18, 10, 0): (20, ('u1', 'u2')),
+    (8, 66, 15, 11, 0): (20, ('u1', 'u2')),
+    (8, 66, 18, 8, 0): (20, ('u1', 'u2')),
+    (8, 68, 15, 9, 0): (21, ('u1', 'u2')),
+    (9, 66, 15, 10, 0): (21, ('u1', 'u2')),
+    (9, 68, 12, 11, 0): (21, ('u1', 'u2')),
+    (9, 68, 15, 8, 0): (21, ('u1', 'u2')),
+    (9, 70, 12, 9, 0): (22, ('u1', 'u2')),
+    (10, 68, 12, 10, 0): (22, ('u1', 'u2')),
+    (10, 70, 9, 11, 0): (22, ('u1', 'u2')),
+    (10, 70, 12, 8, 0): (22, ('u1', 'u2')),
+    (10, 72, 9, 9, 0): (23, ('u1', 'u2')),
+    (11, 70, 9, 10, 0): (23, ('u1', 'u2')),
+    (11, 72, 6, 11, 0): (23, ('u1', 'u2')),
+    (11, 72, 9, 8, 0): (23, ('u1', 'u2')),
+    (11, 74, 6, 9, 0): (24, ('u1', 'u2')),
+    (12, 72, 6, 10, 0): (24, ('u1', 'u2')),
+    (12, 74, 3, 11, 0): (25, ('u1', 'u2')),
+    (12, 74, 6, 8, 0): (25, ('u1', 'u2')),
+    (12, 76, 3, 9, 0): (25, ('u1', 'u2')),
+    (13, 74, 3, 10, 0): (25, ('u1', 'u2')),
+    (13, 76, 0, 11, 0): (26, ('u1', 'u2')),
+    (13, 76, 3, 8, 0): (26, ('u1', 'u2')),
+    (13, 78, 0, 9, 0): (26, ('u1', 'u2')),
+    (0, 54, 39, 7, 0): (6, ('u3', 'u3')),
+    (0, 52, 42, 6, 0): (7, ('u3', 'u3')),
+    (0, 54, 42, 4, 0): (7, ('u3', 'u3')),
+    (0, 56, 39, 5, 0): (6, ('u3', 'u3')),
+    (1, 54, 39, 6, 0): (14, ('u1', 'u3')),
+    (1, 56, 36, 7, 0): (14, ('u1', 'u2')),
+    (1, 56, 39, 4, 0): (14, ('u1', 'u2')),
+    (1, 58, 36, 5, 0): (15, ('u1', 'u2')),
+    (3, 60, 30, 7, 0): (16, ('u1', 'u2')),
+    (3, 60, 33, 4, 0): (16, ('u1', 'u2')),
+    (4, 60, 30, 6, 0): (17, ('u1', 'u2')),
+    (4, 62, 27, 7, 0): (17, ('u1', 'u2')),
+    (4, 62, 30, 4, 0): (17, ('u1', 'u2')),
+    (4, 64, 27, 5, 0): (18, ('u1', 'u2')),
+    (5, 62, 27, 6, 0): (18, ('u1', 'u2')),
+    (5, 64, 24, 7, 0): (18, ('u1', 'u2')),
+    (5, 64, 27, 4, 0): (18, ('u1', 'u2')),
+    (5, 66, 24, 5, 0): (19, ('u1', 'u2')),
+    (6, 64, 24, 6, 0): (19, ('u1', 'u2')),
+    (6, 66, 21, 7, 0): (19, ('u1', 'u2')),
+    (6, 66, 24, 4, 0): (19, ('u1', 'u2')),
+    (6, 68, 21, 5, 0): (20, ('u1', 'u2')),
+    (7, 66, 21, 6, 0): (20, ('u1', 'u2')),
+    (7, 68, 18, 7, 0): (20, ('u1', 'u2')),
+    (7, 68, 21, 4, 0): (20, ('u1', 'u2')),
+    (7, 70, 18, 5, 0): (21, ('u1', 'u2')),
+    (8, 68, 18, 6, 0): (21, ('u1', 'u2')),
+    (8, 70, 15, 7, 0): (21, ('u1', 'u2')),
+    (8, 70, 18, 4, 0): (21, ('u1', 'u2')),
+    (8, 72, 15, 5, 0): (22, ('u1', 'u2')),
+    (9, 70, 15, 6, 0): (22, ('u1', 'u2')),
+    (9, 72, 12, 7, 0): (22, ('u1', 'u2')),
+    (9, 72, 15, 4, 0): (22, ('u1', 'u2')),
+    (9, 74, 12, 5, 0): (23, ('u1', 'u2')),
+    (10, 72, 12, 6, 0): (23, ('u1', 'u2')),
+    (10, 74, 9, 7, 0): (23, ('u1', 'u2')),
+    (10, 74, 12, 4, 0): (23, ('u1', 'u2')),
+    (10, 76, 9, 5, 0): (24, ('u1', 'u2')),
+    (11, 74, 9, 6, 0): (24, ('u1', 'u2')),
+    (11, 76, 6, 7, 0): (24, ('u1', 'u2')),
+    (11, 76, 9, 4, 0): (24, ('u1', 'u2')),
+    (11, 78, 6, 5, 0): (25, ('u1', 'u2')),
+    (12, 76, 6, 6, 0): (25, ('u1', 'u2')),
+    (12, 78, 3, 7, 0): (26, ('u1', 'u2')),
+    (12, 78, 6, 4, 0): (26, ('u1', 'u2')),
+    (12, 80, 3, 5, 0): (26, ('u1', 'u2')),
+    (13, 78, 3, 6, 0): (26, ('u1', 'u2')),
+    (13, 80, 0, 7, 0): (27, ('u1', 'u2')),
+    (13, 80, 3, 4, 0): (27, ('u1', 'u2')),
+    (13, 82, 0, 5, 0): (27, ('u1', 'u2')),
+    (0, 58, 42, 0, 0): (7, ('u3', 'u3')),
+    (1, 60, 39, 0, 0): (15, ('u1', 'u2')),
+    (3, 64, 33, 0, 0): (17, ('u1', 'u2')),
+    (4, 66, 30, 0, 0): (18, ('u1', 'u2')),
+    (5, 68, 27, 0, 0): (19, ('u1', 'u2')),
+    (6, 70, 24, 0, 0): (20, ('u1', 'u2')),
+    (7, 72, 21, 0, 0): (21, ('u1', 'u2')),
+    (8, 74, 18, 0, 0): (22, ('u1', 'u2')),
+    (9, 76, 15, 0, 0): (23, ('u1', 'u2')),
+    (10, 78, 12, 0, 0): (24, ('u1', 'u2')),
+    (11, 80, 9, 0, 0): (25, ('u1', 'u2')),
+    (12, 82, 6, 0, 0): (27, ('u1', 'u2')),
+    (13, 84, 3, 0, 0): (28, ('u1', 'u2')),
+    (5, 0, 30, 65, 0): (6, ('u1', 'u3')),
+    (6, 0, 27, 67, 0): (6, ('u1', 'u3')),
+    (3, 0, 36, 61, 0): (6, ('u3', 'u3')),
+    (4, 0, 33, 63, 0): (6, ('u1', 'u3')),
+    (4, 2, 33, 61, 0): (7, ('u1', 'u3')),
+    (6, 0, 30, 64, 0): (7, ('u1', 'u3')),
+    (4, 0, 36, 60, 0): (7, ('u1', 'u3')),
+    (5, 2, 33, 60, 0): (7, ('u1', 'u3')),
+    (2, 0, 39, 59, 0): (6, ('u3', 'u3')),
+    (1, 0, 42, 57, 0): (7, ('u3', 'u3')),
+    (2, 2, 39, 57, 0): (7, ('u2', 'u3')),
+    (3, 2, 36, 59, 0): (7, ('u2', 'u3')),
+    (3, 4, 36, 57, 0): (7, ('u2', 'u2')),
+    (2, 0, 42, 56, 0): (7, ('u3', 'u3')),
+    (3, 0, 39, 58, 0): (7, ('u3', 'u3')),
+    (3, 2, 39, 56, 0): (7, ('u2', 'u3')),
+    (4, 2, 36, 58, 0): (7, ('u1', 'u3')),
+    (0, 0, 45, 55, 0): (7, ('u3', 'u3')),
+    (0, 2, 45, 53, 0): (7, ('u3', 'u3')),
+    (1, 2, 42, 55, 0): (7, ('u3', 'u3')),
+    (1, 4, 42, 53, 0): (7, ('u1', 'u3')),
+    (1, 0, 45, 54, 0): (7, ('u3', 'u3')),
+    (2, 2, 42, 54, 0): (7, ('u2', 'u3')),
+    (0, 0, 48, 52, 0): (8, ('u3', 'u3')),
+    (1, 2, 45, 52, 0): (8, ('u3', 'u3')),
+    (3, 4, 39, 54, 0): (8, ('u2', 'u2')),
+    (0, 4, 45, 51, 0): (7, ('u3', 'u3')),
+    (0, 6, 45, 49, 0): (7, ('u3', 'u3')),
+    (1, 6, 42, 51, 0): (7, ('u1', 'u3')),
+    (1, 8, 42, 49, 0): (7, ('u1', 'u3')),
+    (0, 2, 48, 50, 0): (8, ('u3', 'u3')),
+    (0, 4, 48, 48, 0): (8, ('u3', 'u3')),
+    (1, 4, 45, 50, 0): (8, ('u1', 'u3')),
+    (1, 6, 45, 48, 0): (8, ('u1', 'u3')),
+    (0, 8, 45, 47, 0): (7, ('u3', 'u3')),
+    (0, 10, 45, 45, 0): (7, ('u3', 'u3')),
+    (1, 10, 42, 47, 0): (7, ('u1', 'u3')),
+    (1, 12, 42, 45, 0): (7, ('u1', 'u3')),
+    (0, 6, 48, 46, 0): (8, ('u3', 'u3')),
+    (0, 8, 48, 44, 0): (8, ('u3', 'u3')),
+    (1, 8, 45, 46, 0): (8, ('u1', 'u3')),
+    (1, 10, 45, 44, 0): (8, ('u1', 'u3')),
+    (0, 12, 45, 43, 0): (7, ('u3', 'u3')),
+    (0, 14, 45, 41, 0): (7, ('u3', 'u3')),
+    (1, 14, 42, 43, 0): (7, ('u1', 'u3')),
+    (1, 16, 42, 41, 0): (7, ('u1', 'u3')),
+    (0, 10, 48, 42, 0): (8, ('u3', 'u3')),
+    (0, 12, 48, 40, 0): (8, ('u3', 'u3')),
+    (1, 12, 45, 42, 0): (8, ('u1', 'u3')),
+    (1, 14, 45, 40, 0): (8, ('u1', 'u3')),
+    (5, 22, 30, 43, 0): (8, ('u1', 'u2')),
+    (5, 22, 33, 40, 0): (9, ('u1', 'u2')),
+    (5, 24, 30, 41, 0): (9, ('u1', 'u2')),
+    (6, 24, 27, 43, 0): (9, ('u1', 'u2')),
+    (7, 26, 24, 43, 0): (10, ('u1', 'u2')),
+    (7, 26, 27, 40, 0): (11, ('u1', 'u2')),
+    (8, 28, 21, 43, 0): (11, ('u1', 'u2')),
+    (8, 28, 24, 40, 0): (12, ('u1', 'u2')),
+    (0, 16, 45, 39, 0): (7, ('u3', 'u3')),
+    (0, 18, 45, 37, 0): (7, ('u3', 'u3')),
+    (1, 18, 42, 39, 0): (7, ('u1', 'u3')),
+    (1, 20, 42, 37, 0): (7, ('u1', 'u3')),
+    (0, 14, 48, 38, 0): (8, ('u3', 'u3')),
+    (0, 16, 48, 36, 0): (8, ('u3', 'u3')),
+    (1, 16, 45, 38, 0): (8, ('u1', 'u3')),
+    (1, 18, 45, 36, 0): (8, ('u1', 'u3')),
+    (5, 26, 30, 39, 0): (9, ('u1', 'u2')),
+    (5, 26, 33, 36, 0): (9, ('u1', 'u2')),
+    (5, 28, 30, 37, 0): (10, ('u1', 'u2')),
+    (6, 28, 27, 39, 0): (10, ('u1', 'u2')),
+    (6, 28, 30, 36, 0): (10, ('u1', 'u2')),
+    (6, 30, 27, 37, 0): (11, ('u1', 'u2')),
+    (7, 30, 24, 39, 0): (11, ('u1', 'u2')),
+    (7, 30, 27, 36, 0): (11, ('u1', 'u2')),
+    (7, 32, 24, 37, 0): (12, ('u1', 'u2')),
+    (8, 32, 21, 39, 0): (12, ('u1', 'u2')),
+    (8, 32, 24, 36, 0): (12, ('u1', 'u2')),
+    (8, 34, 21, 37, 0): (13, ('u1', 'u2')),
+    (9, 34, 18, 39, 0): (13, ('u1', 'u2')),
+    (9, 34, 21, 36, 0): (13, ('u1', 'u2')),
+    (0, 20, 45, 35, 0): (7, ('u3', 'u3')),
+    (0, 22, 45, 33, 0): (7, ('u3', 'u3')),
+    (1, 22, 42, 35, 0): (7, ('u1', 'u3')),
+    (1, 24, 42, 33, 0): (7, ('u1', 'u3')),
+    (0, 18, 48, 34, 0): (8, ('u3', 'u3')),
+    (0, 20, 48, 32, 0): (8, ('u3', 'u3')),
+    (1, 20, 45, 34, 0): (8, ('u1', 'u3')),
+    (1, 22, 45, 32, 0): (8, ('u1', 'u3')),
+    (5, 28, 33, 34, 0): (10, ('u1', 'u2')),
+    (5, 30, 30, 35, 0): (10, ('u1', 'u2')),
+    (5, 30, 33, 32, 0): (10, ('u1', 'u2')),
+    (5, 32, 30, 33, 0): (11, ('u1', 'u2')),
+    (6, 32, 27, 35, 0): (11, ('u1', 'u2')),
+    (6, 32, 30, 32, 0): (11, ('u1', 'u2')),
+    (6, 34, 27, 33, 0): (12, ('u1', 'u2')),
+    (7, 32, 27, 34, 0): (12, ('u1', 'u2')),
+    (7, 34, 24, 35, 0): (12, ('u1', 'u2')),
+    (7, 34, 27, 32, 0): (12, ('u1', 'u2')),
+    (7, 36, 24, 33, 0): (13, ('u1', 'u2')),
+    (8, 34, 24, 34, 0): (13, ('u1', 'u2')),
+    (8, 36, 21, 35, 0): (13, ('u1', 'u2')),
+    (8, 36, 24, 32, 0): (13, ('u1', 'u2')),
+    (8, 38, 21, 33, 0): (14, ('u1', 'u2')),
+    (9, 38, 18, 35, 0): (14, ('u1', 'u2')),
+    (9, 38, 21, 32, 0): (14, ('u1', 'u2')),
+    (9, 40, 18, 33, 0): (15, ('u1', 'u2')),
+    (10, 40, 15, 35, 0): (15, ('u1', 'u2')),
+    (10, 40, 18, 32, 0): (15, ('u1', 'u2')),
+    (0, 24, 45, 31, 0): (7, ('u3', 'u3')),
+    (0, 26, 45, 29, 0): (7, ('u3', 'u3')),
+    (1, 26, 42, 31, 0): (7, ('u1', 'u3')),
+    (0, 22, 48, 30, 0): (8, ('u3', 'u3')),
+    (0, 24, 48, 28, 0): (8, ('u3', 'u3')),
+    (1, 24, 45, 30, 0): (8, ('u1', 'u3')),
+    (1, 26, 45, 28, 0): (8, ('u1', 'u3')),
+    (1, 28, 42, 29, 0): (8, ('u1', 'u3')),
+    (5, 32, 33, 30, 0): (11, ('u1', 'u2')),
+    (5, 34, 30, 31, 0): (11, ('u1', 'u2')),
+    (5, 34, 33, 28, 0): (11, ('u1', 'u2')),
+    (5, 36, 30, 29, 0): (12, ('u1', 'u2')),
+    (6, 34, 30, 30, 0): (12, ('u1', 'u2')),
+    (6, 36, 27, 31, 0): (12, ('u1', 'u2')),
+    (6, 36, 30, 28, 0): (12, ('u1', 'u2')),
+    (6, 38, 27, 29, 0): (13, ('u1', 'u2')),
+    (7, 36, 27, 30, 0): (13, ('u1', 'u2')),
+    (7, 38, 24, 31, 0): (13, ('u1', 'u2')),
+    (7, 38, 27, 28, 0): (13, ('u1', 'u2')),
+    (7, 40, 24, 29, 0): (14, ('u1', 'u2')),
+    (8, 38, 24, 30, 0): (14, ('u1', 'u2')),
+    (8, 40, 21, 31, 0): (14, ('u1', 'u2')),
+    (8, 40, 24, 28, 0): (14, ('u1', 'u2')),
+    (8, 42, 21, 29, 0): (15, ('u1', 'u2')),
+    (9, 40, 21, 30, 0): (15, ('u1', 'u2')),
+    (9, 42, 18, 31, 0): (15, ('u1', 'u2')),
+    (9, 42, 21, 28, 0): (15, ('u1', 'u2')),
+    (9, 44, 18, 29, 0): (16, ('u1', 'u2')),
+    (10, 44, 15, 31, 0): (16, ('u1', 'u2')),
+    (10, 44, 18, 28, 0): (16, ('u1', 'u2')),
+    (10, 46, 15, 29, 0): (17, ('u1', 'u2')),
+    (0, 28, 45, 27, 0): (7, ('u3', 'u3')),
+    (0, 30, 45, 25, 0): (7, ('u3', 'u3')),
+    (0, 26, 48, 26, 0): (8, ('u3', 'u3')),
+    (0, 28, 48, 24, 0): (8, ('u3', 'u3')),
+    (1, 28, 45, 26, 0): (8, ('u1', 'u3')),
+    (1, 30, 42, 27, 0): (8, ('u1', 'u3')),
+    (1, 30, 45, 24, 0): (8, ('u1', 'u3')),
+    (1, 32, 42, 25, 0): (9, ('u1', 'u3')),
+    (5, 36, 33, 26, 0): (12, ('u1', 'u2')),
+    (5, 38, 30, 27, 0): (12, ('u1', 'u2')),
+    (5, 38, 33, 24, 0): (12, ('u1', 'u2')),
+    (5, 40, 30, 25, 0): (13, ('u1', 'u2')),
+    (6, 38, 30, 26, 0): (13, ('u1', 'u2')),
+    (6, 40, 27, 27, 0): (13, ('u1', 'u2')),
+    (6, 40, 30, 24, 0): (13, ('u1', 'u2')),
+    (6, 42, 27, 25, 0): (14, ('u1', 'u2')),
+    (7, 40, 27, 26, 0): (14, ('u1', 'u2')),
+    (7, 42, 24, 27, 0): (14, ('u1', 'u2')),
+    (7, 42, 27, 24, 0): (14, ('u1', 'u2')),
+    (7, 44, 24, 25, 0): (15, ('u1', 'u2')),
+    (8, 42, 24, 26, 0): (15, ('u1', 'u2')),
+    (8, 44, 21, 27, 0): (15, ('u1', 'u2')),
+    (8, 44, 24, 24, 0): (15, ('u1', 'u2')),
+    (8, 46, 21, 25, 0): (16, ('u1', 'u2')),
+    (9, 44, 21, 26, 0): (16, ('u1', 'u2')),
+    (9, 46, 18, 27, 0): (16, ('u1', 'u2')),
+    (9, 46, 21, 24, 0): (16, ('u1', 'u2')),
+    (9, 48, 18, 25, 0): (17, ('u1', 'u2')),
+    (10, 46, 18, 26, 0): (17, ('u1', 'u2')),
+    (10, 48, 15, 27, 0): (17, ('u1', 'u2')),
+    (10, 48, 18, 24, 0): (17, ('u1', 'u2')),
+    (10, 50, 15, 25, 0): (18, ('u1', 'u2')),
+    (11, 50, 12, 27, 0): (18, ('u1', 'u2')),
+    (11, 50, 15, 24, 0): (18, ('u1', 'u2')),
+    (0, 32, 45, 23, 0): (7, ('u3', 'u3')),
+    (0, 30, 48, 22, 0): (8, ('u3', 'u3')),
+    (0, 32, 48, 20, 0): (8, ('u3', 'u3')),
+    (0, 34, 45, 21, 0): (7, ('u3', 'u3')),
+    (1, 32, 45, 22, 0): (9, ('u1', 'u3')),
+    (1, 34, 42, 23, 0): (9, ('u1', 'u3')),
+    (1, 34, 45, 20, 0): (9, ('u1', 'u3')),
+    (1, 36, 42, 21, 0): (10, ('u1', 'u3')),
+    (5, 40, 33, 22, 0): (13, ('u1', 'u2')),
+    (5, 42, 30, 23, 0): (13, ('u1', 'u2')),
+    (5, 42, 33, 20, 0): (13, ('u1', 'u2')),
+    (5, 44, 30, 21, 0): (14, ('u1', 'u2')),
+    (6, 42, 30, 22, 0): (14, ('u1', 'u2')),
+    (6, 44, 27, 23, 0): (14, ('u1', 'u2')),
+    (6, 44, 30, 20, 0): (14, ('u1', 'u2')),
+    (6, 46, 27, 21, 0): (15, ('u1', 'u2')),
+    (7, 44, 27, 22, 0): (15, ('u1', 'u2')),
+    (7, 46, 24, 23, 0): (15, ('u1', 'u2')),
+    (7, 46, 27, 20, 0): (15, ('u1', 'u2')),
+    (7, 48, 24, 21, 0): (16, ('u1', 'u2')),
+    (8, 46, 24, 22, 0): (16, ('u1', 'u2')),
+    (8, 48, 21, 23, 0): (16, ('u1', 'u2')),
+    (8, 48, 24, 20, 0): (16, ('u1', 'u2')),
+    (8, 50, 21, 21, 0): (17, ('u1', 'u2')),
+    (9, 48, 21, 22, 0): (17, ('u1', 'u2')),
+    (9, 50, 18, 23, 0): (17, ('u1', 'u2')),
+    (9, 50, 21, 20, 0): (17, ('u1', 'u2')),
+    (9, 52, 18, 21, 0): (18, ('u1', 'u2')),
+    (10, 50, 18, 22, 0): (18, ('u1', 'u2')),
+    (10, 52, 15, 23, 0): (18, ('u1', 'u2')),
+    (10, 52, 18, 20, 0): (18, ('u1', 'u2')),
+    (10, 54, 15, 21, 0): (19, ('u1', 'u2')),
+    (11, 54, 12, 23, 0): (19, ('u1', 'u2')),
+    (11, 54, 15, 20, 0): (19, ('u1', 'u2')),
+    (11, 56, 12, 21, 0): (20, ('u1', 'u2')),
+    (0, 36, 45, 19, 0): (7, ('u3', 'u3')),
+    (0, 38, 45, 17, 0): (7, ('u3', 'u3')),
+    (1, 38, 42, 19, 0): (10, ('u1', 'u3')),
+    (1, 40, 42, 17, 0): (11, ('u1', 'u3')),
+    (3, 44, 36, 17, 0): (12, ('u1', 'u2')),
+    (0, 34, 48, 18, 0): (8, ('u3', 'u3')),
+    (0, 36, 48, 16, 0): (8, ('u3', 'u3')),
+    (1, 36, 45, 18, 0): (10, ('u1', 'u3')),
+    (1, 38, 45, 16, 0): (10, ('u1', 'u3')),
+    (4, 46, 33, 17, 0): (13, ('u1', 'u2')),
+    (5, 44, 33, 18, 0): (14, ('u1', 'u2')),
+    (5, 46, 30, 19, 0): (14, ('u1', 'u2')),
+    (5, 46, 33, 16, 0): (14, ('u1', 'u2')),
+    (5, 48, 30, 17, 0): (14, ('u1', 'u2')),
+    (6, 46, 30, 18, 0): (15, ('u1', 'u2')),
+    (6, 48, 27, 19, 0): (15, ('u1', 'u2')),
+    (6, 48, 30, 16, 0): (15, ('u1', 'u2')),
+    (6, 50, 27, 17, 0): (15, ('u1', 'u2')),
+    (7, 48, 27, 18, 0): (16, ('u1', 'u2')),
+    (7, 50, 24, 19, 0): (16, ('u1', 'u2')),
+    (7, 50, 27, 16, 0): (16, ('u1', 'u2')),
+    (7, 52, 24, 17, 0): (16, ('u1', 'u2')),
+    (8, 50, 24, 18, 0): (17, ('u1', 'u2')),
+    (8, 52, 21, 19, 0): (17, ('u1', 'u2')),
+    (8, 52, 24, 16, 0): (17, ('u1', 'u2')),
+    (8, 54, 21, 17, 0): (17, ('u1', 'u2')),
+    (9, 52, 21, 18, 0): (18, ('u1', 'u2')),
+    (9, 54, 18, 19, 0): (18, ('u1', 'u2')),
+    (9, 54, 21, 16, 0): (18, ('u1', 'u2')),
+    (9, 56, 18, 17, 0): (18, ('u1', 'u2')),
+    (10, 54, 18, 18, 0): (19, ('u1', 'u2')),
+    (10, 56, 15, 19, 0): (19, ('u1', 'u2')),
+    (10, 56, 18, 16, 0): (19, ('u1', 'u2')),
+    (10, 58, 15, 17, 0): (19, ('u1', 'u2')),
+    (11, 56, 15, 18, 0): (20, ('u1', 'u2')),
+    (11, 58, 12, 19, 0): (20, ('u1', 'u2')),
+    (11, 58, 15, 16, 0): (20, ('u1', 'u2')),
+    (11, 60, 12, 17, 0): (20, ('u1', 'u2')),
+    (12, 60, 9, 19, 0): (21, ('u1', 'u2')),
+    (12, 60, 12, 16, 0): (21, ('u1', 'u2')),
+    (0, 40, 45, 15, 0): (7, ('u3', 'u3')),
+    (0, 42, 45, 13, 0): (7, ('u3', 'u3')),
+    (1, 42, 42, 15, 0): (11, ('u1', 'u3')),
+    (1, 44, 42, 13, 0): (12, ('u1', 'u3')),
+    (3, 48, 36, 13, 0): (13, ('u1', 'u2')),
+    (0, 38, 48, 14, 0): (8, ('u3', 'u3')),
+    (0, 40, 48, 12, 0): (8, ('u3', 'u3')),
+    (1, 40, 45, 14, 0): (11, ('u1', 'u3')),
+    (1, 42, 45, 12, 0): (11, ('u1', 'u3')),
+    (4, 50, 33, 13, 0): (14, ('u1', 'u2')),
+    (5, 48, 33, 14, 0): (15, ('u1', 'u2')),
+    (5, 50, 30, 15, 0): (15, ('u1', 'u2')),
+    (5, 50, 33, 12, 0): (15, ('u1', 'u2')),
+    (5, 52, 30, 13, 0): (15, ('u1', 'u2')),
+    (6, 50, 30, 14, 0): (16, ('u1', 'u2')),
+    (6, 52, 27, 15, 0): (16, ('u1', 'u2')),
+    (6, 52, 30, 12, 0): (16, ('u1', 'u2')),
+    (6, 54, 27, 13, 0): (16, ('u1', 'u2')),
+    (7, 52, 27, 14, 0): (17, ('u1', 'u2')),
+    (7, 54, 24, 15, 0): (17, ('u1', 'u2')),
+    (7, 54, 27, 12, 0): (17, ('u1', 'u2')),
+    (7, 56, 24, 13, 0): (17, ('u1', 'u2')),
+    (8, 54, 24, 14, 0): (18, ('u1', 'u2')),
+    (8, 56, 21, 15, 0): (18, ('u1', 'u2')),
+    (8, 56, 24, 12, 0): (18, ('u1', 'u2')),
+    (8, 58, 21, 13, 0): (18, ('u1', 'u2')),
+    (9, 56, 21, 14, 0): (19, ('u1', 'u2')),
+    (9, 58, 18, 15, 0): (19, ('u1', 'u2')),
+    (9, 58, 21, 12, 0): (19, ('u1', 'u2')),
+    (9, 60, 18, 13, 0): (19, ('u1', 'u2')),
+    (10, 58, 18, 14, 0): (20, ('u1', 'u2')),
+    (10, 60, 15, 15, 0): (20, ('u1', 'u2')),
+    (10, 60, 18, 12, 0): (20, ('u1', 'u2')),
+    (10, 62, 15, 13, 0): (20, ('u1', 'u2')),
+    (11, 60, 15, 14, 0): (21, ('u1', 'u2')),
+    (11, 62, 12, 15, 0): (21, ('u1', 'u2')),
+    (11, 62, 15, 12, 0): (21, ('u1', 'u2')),
+    (11, 64, 12, 13, 0): (21, ('u1', 'u2')),
+    (12, 64, 9, 15, 0): (22, ('u1', 'u2')),
+    (12, 64, 12, 12, 0): (22, ('u1', 'u2')),
+    (12, 66, 9, 13, 0): (23, ('u1', 'u2')),
+    (0, 44, 45, 11, 0): (7, ('u3', 'u3')),
+    (0, 42, 48, 10, 0): (8, ('u3', 'u3')),
+    (0, 44, 48, 8, 0): (8, ('u3', 'u3')),
+    (0, 46, 45, 9, 0): (7, ('u3', 'u3')),
+    (1, 44, 45, 10, 0): (12, ('u1', 'u3')),
+    (1, 46, 42, 11, 0): (12, ('u1', 'u3')),
+    (1, 46, 45, 8, 0): (12, ('u1', 'u3')),
+    (1, 48, 42, 9, 0): (13, ('u1', 'u3')),
+    (3, 48, 39, 10, 0): (13, ('u1', 'u2')),
+    (3, 52, 36, 9, 0): (14, ('u1', 'u2')),
+    (4, 50, 36, 10, 0): (14, ('u1', 'u2')),
+    (4, 52, 33, 11, 0): (15, ('u1', 'u2')),
+    (4, 54, 33, 9, 0): (15, ('u1', 'u2')),
+    (5, 52, 33, 10, 0): (15, ('u1', 'u2')),
+    (5, 54, 30, 11, 0): (16, ('u1', 'u2')),
+    (5, 54, 33, 8, 0): (16, ('u1', 'u2')),
+    (5, 56, 30, 9, 0): (16, ('u1', 'u2')),
+    (6, 54, 30, 10, 0): (16, ('u1', 'u2')),
+    (6, 56, 27, 11, 0): (17, ('u1', 'u2')),
+    (6, 56, 30, 8, 0): (17, ('u1', 'u2')),
+    (6, 58, 27, 9, 0): (17, ('u1', 'u2')),
+    (7, 56, 27, 10, 0): (17, ('u1', 'u2')),
+    (7, 58, 24, 11, 0): (18, ('u1', 'u2')),
+    (7, 58, 27, 8, 0): (18, ('u1', 'u2')),
+    (7, 60, 24, 9, 0): (18, ('u1', 'u2')),
+    (8, 58, 24, 10, 0): (18, ('u1', 'u2')),
+    (8, 60, 21, 11, 0): (19, ('u1', 'u2')),
+    (8, 60, 24, 8, 0): (19, ('u1', 'u2')),
+    (8, 62, 21, 9, 0): (19, ('u1', 'u2')),
+    (9, 60, 21, 10, 0): (19, ('u1', 'u2')),
+    (9, 62, 18, 11, 0): (20, ('u1', 'u2')),
+    (9, 62, 21, 8, 0): (20, ('u1', 'u2')),
+    (9, 64, 18, 9, 0): (20, ('u1', 'u2')),
+    (10, 62, 18, 10, 0): (20, ('u1', 'u2')),
+    (10, 64, 15, 11, 0): (21, ('u1', 'u2')),
+    (10, 64, 18, 8, 0): (21, ('u1', 'u2')),
+    (10, 66, 15, 9, 0): (21, ('u1', 'u2')),
+    (11, 64, 15, 10, 0): (21, ('u1', 'u2')),
+    (11, 66, 12, 11, 0): (22, ('u1', 'u2')),
+    (11, 66, 15, 8, 0): (22, ('u1', 'u2')),
+    (11, 68, 12, 9, 0): (22, ('u1', 'u2')),
+    (12, 66, 12, 10, 0): (23, ('u1', 'u2')),
+    (12, 68, 9, 11, 0): (23, ('u1', 'u2')),
+    (12, 68, 12, 8, 0): (23, ('u1', 'u2')),
+    (12, 70, 9, 9, 0): (24, ('u1', 'u2')),
+    (0, 48, 45, 7, 0): (7, ('u3', 'u3')),
+    (0, 46, 48, 6, 0): (8, ('u3', 'u3')),
+    (0, 48, 48, 4, 0): (8, ('u3', 'u3')),
+    (0, 50, 45, 5, 0): (7, ('u3', 'u3')),
+    (1, 48, 45, 6, 0): (13, ('u1', 'u3')),
+    (1, 50, 42, 7, 0): (13, ('u1', 'u3')),
+    (1, 50, 45, 4, 0): (13, ('u1', 'u3')),
+    (1, 52, 42, 5, 0): (14, ('u1', 'u3')),
+    (3, 52, 39, 6, 0): (14, ('u1', 'u2')),
+    (3, 56, 36, 5, 0): (15, ('u1', 'u2')),
+    (4, 54, 36, 6, 0): (15, ('u1', 'u2')),
+    (4, 56, 33, 7, 0): (16, ('u1', 'u2')),
+    (4, 56, 36, 4, 0): (16, ('u1', 'u2')),
+    (4, 58, 33, 5, 0): (16, ('u1', 'u2')),
+    (5, 56, 33, 6, 0): (16, ('u1', 'u2')),
+    (5, 58, 30, 7, 0): (17, ('u1', 'u2')),
+    (5, 58, 33, 4, 0): (17, ('u1', 'u2')),
+    (5, 60, 30, 5, 0): (17, ('u1', 'u2')),
+    (6, 58, 30, 6, 0): (17, ('u1', 'u2')),
+    (6, 60, 27, 7, 0): (18, ('u1', 'u2')),
+    (6, 60, 30, 4, 0): (18, ('u1', 'u2')),
+    (6, 62, 27, 5, 0): (18, ('u1', 'u2')),
+    (7, 60, 27, 6, 0): (18, ('u1', 'u2')),
+    (7, 62, 24, 7, 0): (19, ('u1', 'u2')),
+    (7, 62, 27, 4, 0): (19, ('u1', 'u2')),
+    (7, 64, 24, 5, 0): (19, ('u1', 'u2')),
+    (8, 62, 24, 6, 0): (19, ('u1', 'u2')),
+    (8, 64, 21, 7, 0): (20, ('u1', 'u2')),
+    (8, 64, 24, 4, 0): (20, ('u1', 'u2')),
+    (8, 66, 21, 5, 0): (20, ('u1', 'u2')),
+    (9, 64, 21, 6, 0): (20, ('u1', 'u2')),
+    (9, 66, 18, 7, 0): (21, ('u1', 'u2')),
+    (9, 66, 21, 4, 0): (21, ('u1', 'u2')),
+    (9, 68, 18, 5, 0): (21, ('u1', 'u2')),
+    (10, 66, 18, 6, 0): (21, ('u1', 'u2')),
+    (10, 68, 15, 7, 0): (22, ('u1', 'u2')),
+    (10, 68, 18, 4, 0): (22, ('u1', 'u2')),
+    (10, 70, 15, 5, 0): (22, ('u1', 'u2')),
+    (11, 68, 15, 6, 0): (22, ('u1', 'u2')),
+    (11, 70, 12, 7, 0): (23, ('u1', 'u2')),
+    (11, 70, 15, 4, 0): (23, ('u1', 'u2')),
+    (11, 72, 12, 5, 0): (23, ('u1', 'u2')),
+    (12, 70, 12, 6, 0): (24, ('u1', 'u2')),
+    (12, 72, 9, 7, 0): (24, ('u1', 'u2')),
+    (12, 72, 12, 4, 0): (24, ('u1', 'u2')),
+    (12, 74, 9, 5, 0): (25, ('u1', 'u2')),
+    (13, 74, 6, 7, 0): (25, ('u1', 'u2')),
+    (0, 52, 48, 0, 0): (8, ('u3', 'u3')),
+    (1, 54, 45, 0, 0): (14, ('u1', 'u3')),
+    (4, 60, 36, 0, 0): (17, ('u1', 'u2')),
+    (5, 62, 33, 0, 0): (18, ('u1', 'u2')),
+    (6, 64, 30, 0, 0): (19, ('u1', 'u2')),
+    (7, 66, 27, 0, 0): (20, ('u1', 'u2')),
+    (8, 68, 24, 0, 0): (21, ('u1', 'u2')),
+    (9, 70, 21, 0, 0): (22, ('u1', 'u2')),
+    (10, 72, 18, 0, 0): (23, ('u1', 'u2')),
+    (11, 74, 15, 0, 0): (24, ('u1', 'u2')),
+    (12, 76, 12, 0, 0): (25, ('u1', 'u2')),
+    (13, 78, 9, 0, 0): (26, ('u1', 'u2')),
+    (6, 0, 33, 61, 0): (7, ('u1', 'u3')),
+    (4, 0, 39, 57, 0): (7, ('u1', 'u3')),
+    (5, 0, 36, 59, 0): (7, ('u1', 'u3')),
+    (5, 0, 39, 56, 0): (8, ('u1', 'u3')),
+    (6, 0, 36, 58, 0): (8, ('u1', 'u3')),
+    (2, 0, 45, 53, 0): (7, ('u3', 'u3')),
+    (3, 0, 42, 55, 0): (7, ('u3', 'u3')),
+    (3, 2, 42, 53, 0): (8, ('u2', 'u3')),
+    (4, 2, 39, 55, 0): (8, ('u1', 'u3')),
+    (3, 0, 45, 52, 0): (8, ('u3', 'u3')),
+    (4, 0, 42, 54, 0): (8, ('u1', 'u3')),
+    (4, 2, 42, 52, 0): (8, ('u1', 'u3')),
+    (5, 2, 39, 54, 0): (8, ('u1', 'u3')),
+    (0, 0, 51, 49, 0): (8, ('u3', 'u3')),
+    (1, 0, 48, 51, 0): (8, ('u3', 'u3')),
+    (1, 2, 48, 49, 0): (8, ('u3', 'u3')),
+    (2, 2, 45, 51, 0): (8, ('u2', 'u3')),
+    (3, 4, 42, 51, 0): (8, ('u2', 'u2')),
+    (1, 0, 51, 48, 0): (8, ('u3', 'u3')),
+    (2, 0, 48, 50, 0): (8, ('u3', 'u3')),
+    (2, 2, 48, 48, 0): (8, ('u2', 'u3')),
+    (3, 2, 45, 50, 0): (8, ('u2', 'u3')),
+    (3, 4, 45, 48, 0): (9, ('u2', 'u2')),
+    (0, 2, 51, 47, 0): (8, ('u3', 'u3')),
+    (0, 4, 51, 45, 0): (8, ('u3', 'u3')),
+    (1, 4, 48, 47, 0): (8, ('u1', 'u3')),
+    (1, 6, 48, 45, 0): (8, ('u1', 'u3')),
+    (0, 0, 54, 46, 0): (9, ('u3', 'u3')),
+    (0, 2, 54, 44, 0): (9, ('u3', 'u3')),
+    (1, 2, 51, 46, 0): (9, ('u3', 'u3')),
+    (1, 4, 51, 44, 0): (9, ('u1', 'u3')),
+    (0, 6, 51, 43, 0): (8, ('u3', 'u3')),
+    (0, 8, 51, 41, 0): (8, ('u3', 'u3')),
+    (1, 8, 48, 43, 0): (8, ('u1', 'u3')),
+    (1, 10, 48, 41, 0): (8, ('u1', 'u3')),
+    (0, 4, 54, 42, 0): (9, ('u3', 'u3')),
+    (0, 6, 54, 40, 0): (9, ('u3', 'u3')),
+    (1, 6, 51, 42, 0): (9, ('u1', 'u3')),
+    (1, 8, 51, 40, 0): (9, ('u1', 'u3')),
+    (0, 10, 51, 39, 0): (8, ('u3', 'u3')),
+    (0, 12, 51, 37, 0): (8, ('u3', 'u3')),
+    (1, 12, 48, 39, 0): (8, ('u1', 'u3')),
+    (1, 14, 48, 37, 0): (8, ('u1', 'u3')),
+    (0, 8, 54, 38, 0): (9, ('u3', 'u3')),
+    (0, 10, 54, 36, 0): (9, ('u3', 'u3')),
+    (1, 10, 51, 38, 0): (9, ('u1', 'u3')),
+    (1, 12, 51, 36, 0): (9, ('u1', 'u3')),
+    (7, 26, 30, 37, 0): (11, ('u1', 'u2')),
+    (8, 28, 27, 37, 0): (12, ('u1', 'u2')),
+    (0, 14, 51, 35, 0): (8, ('u3', 'u3')),
+    (0, 16, 51, 33, 0): (8, ('u3', 'u3')),
+    (1, 16, 48, 35, 0): (8, ('u1', 'u3')),
+    (1, 18, 48, 33, 0): (8, ('u1', 'u3')),
+    (5, 26, 36, 33, 0): (9, ('u1', 'u2')),
+    (0, 12, 54, 34, 0): (9, ('u3', 'u3')),
+    (0, 14, 54, 32, 0): (9, ('u3', 'u3')),
+    (1, 14, 51, 34, 0): (9, ('u1', 'u3')),
+    (1, 16, 51, 32, 0): (9, ('u1', 'u3')),
+    (6, 28, 33, 33, 0): (10, ('u1', 'u2')),
+    (7, 26, 33, 34, 0): (11, ('u1', 'u2')),
+    (7, 30, 30, 33, 0): (11, ('u1', 'u2')),
+    (8, 32, 27, 33, 0): (12, ('u1', 'u2')),
+    (0, 18, 51, 31, 0): (8, ('u3', 'u3')),
+    (0, 20, 51, 29, 0): (8, ('u3', 'u3')),
+    (1, 20, 48, 31, 0): (8, ('u1', 'u3')),
+    (1, 22, 48, 29, 0): (8, ('u1', 'u3')),
+    (5, 28, 36, 31, 0): (10, ('u1', 'u2')),
+    (5, 30, 36, 29, 0): (10, ('u1', 'u2')),
+    (0, 16, 54, 30, 0): (9, ('u3', 'u3')),
+    (0, 18, 54, 28, 0): (9, ('u3', 'u3')),
+    (1, 18, 51, 30, 0): (9, ('u1', 'u3')),
+    (1, 20, 51, 28, 0): (9, ('u1', 'u3')),
+    (5, 26, 39, 30, 0): (10, ('u1', 'u2')),
+    (6, 32, 33, 29, 0): (11, ('u1', 'u2')),
+    (7, 30, 33, 30, 0): (12, ('u1', 'u2')),
+    (7, 32, 30, 31, 0): (12, ('u1', 'u2')),
+    (7, 32, 33, 28, 0): (12, ('u1', 'u2')),
+    (7, 34, 30, 29, 0): (12, ('u1', 'u2')),
+    (8, 32, 30, 30, 0): (13, ('u1', 'u2')),
+    (8, 34, 27, 31, 0): (13, ('u1', 'u2')),
+    (8, 34, 30, 28, 0): (13, ('u1', 'u2')),
+    (8, 36, 27, 29, 0): (13, ('u1', 'u2')),
+    (9, 38, 24, 29, 0): (14, ('u1', 'u2')),
+    (10, 40, 21, 29, 0): (15, ('u1', 'u2')),
+    (0, 22, 51, 27, 0): (8, ('u3', 'u3')),
+    (0, 24, 51, 25, 0): (8, ('u3', 'u3')),
+    (1, 24, 48, 27, 0): (8, ('u1', 'u3')),
+    (1, 26, 48, 25, 0): (8, ('u1', 'u3')),
+    (0, 20, 54, 26, 0): (9, ('u3', 'u3')),
+    (0, 22, 54, 24, 0): (9, ('u3', 'u3')),
+    (1, 22, 51, 26, 0): (9, ('u1', 'u3')),
+    (1, 24, 51, 24, 0): (9, ('u1', 'u3')),
+    (5, 30, 39, 26, 0): (10, ('u1', 'u2')),
+    (5, 32, 36, 27, 0): (11, ('u1', 'u2')),
+    (5, 32, 39, 24, 0): (11, ('u1', 'u2')),
+    (5, 34, 36, 25, 0): (11, ('u1', 'u2')),
+    (6, 32, 36, 26, 0): (11, ('u1', 'u2')),
+    (6, 34, 33, 27, 0): (12, ('u1', 'u2')),
+    (6, 36, 33, 25, 0): (12, ('u1', 'u2')),
+    (7, 34, 33, 26, 0): (12, ('u1', 'u2')),
+    (7, 36, 30, 27, 0): (13, ('u1', 'u2')),
+    (7, 36, 33, 24, 0): (13, ('u1', 'u2')),
+    (7, 38, 30, 25, 0): (13, ('u1', 'u2')),
+    (8, 36, 30, 26, 0): (13, ('u1', 'u2')),
+    (8, 38, 27, 27, 0): (14, ('u1', 'u2')),
+    (8, 38, 30, 24, 0): (14, ('u1', 'u2')),
+    (8, 40, 27, 25, 0): (14, ('u1', 'u2')),
+    (9, 38, 27, 26, 0): (14, ('u1', 'u2')),
+    (9, 42, 24, 25, 0): (15, ('u1', 'u2')),
+    (10, 44, 21, 25, 0): (16, ('u1', 'u2')),
+    (0, 26, 51, 23, 0): (8, ('u3', 'u3')),
+    (0, 28, 51, 21, 0): (8, ('u3', 'u3')),
+    (1, 28, 48, 23, 0): (8, ('u1', 'u3')),
+    (1, 30, 48, 21, 0): (8, ('u1', 'u3')),
+    (0, 24, 54, 22, 0): (9, ('u3', 'u3')),
+    (0, 26, 54, 20, 0): (9, ('u3', 'u3')),
+    (1, 26, 51, 22, 0): (9, ('u1', 'u3')),
+    (1, 28, 51, 20, 0): (9, ('u1', 'u3')),
+    (5, 34, 39, 22, 0): (11, ('u1', 'u2')),
+    (5, 36, 36, 23, 0): (12, ('u1', 'u2')),
+    (5, 36, 39, 20, 0): (12, ('u1', 'u2')),
+    (5, 38, 36, 21, 0): (12, ('u1', 'u2')),
+    (6, 36, 36, 22, 0): (12, ('u1', 'u2')),
+    (6, 38, 33, 23, 0): (13, ('u1', 'u2')),
+    (6, 38, 36, 20, 0): (13, ('u1', 'u2')),
+    (6, 40, 33, 21, 0): (13, ('u1', 'u2')),
+    (7, 38, 33, 22, 0): (13, ('u1', 'u2')),
+    (7, 40, 30, 23, 0): (14, ('u1', 'u2')),
+    (7, 40, 33, 20, 0): (14, ('u1', 'u2')),
+    (7, 42, 30, 21, 0): (14, ('u1', 'u2')),
+    (8, 40, 30, 22, 0): (14, ('u1', 'u2')),
+    (8, 42, 27, 23, 0): (15, ('u1', 'u2')),
+    (8, 42, 30, 20, 0): (15, ('u1', 'u2')),
+    (8, 44, 27, 21, 0): (15, ('u1', 'u2')),
+    (9, 42, 27, 22, 0): (15, ('u1', 'u2')),
+    (9, 44, 24, 23, 0): (16, ('u1', 'u2')),
+    (9, 44, 27, 20, 0): (16, ('u1', 'u2')),
+    (9, 46, 24, 21, 0): (16, ('u1', 'u2')),
+    (10, 44, 24, 22, 0): (16, ('u1', 'u2')),
+    (10, 48, 21, 21, 0): (17, ('u1', 'u2')),
+    (11, 50, 18, 21, 0): (18, ('u1', 'u2')),
+    (0, 30, 51, 19, 0): (8, ('u3', 'u3')),
+    (0, 32, 51, 17, 0): (8, ('u3', 'u3')),
+    (0, 28, 54, 18, 0): (9, ('u3', 'u3')),
+    (0, 30, 54, 16, 0): (9, ('u3', 'u3')),
+    (1, 30, 51, 18, 0): (9, ('u1', 'u3')),
+    (1, 32, 48, 19, 0): (9, ('u1', 'u3')),
+    (1, 32, 51, 16, 0): (9, ('u1', 'u3')),
+    (1, 34, 48, 17, 0): (9, ('u1', 'u3')),
+    (5, 38, 39, 18, 0): (12, ('u1', 'u2')),
+    (5, 40, 36, 19, 0): (13, ('u1', 'u2')),
+    (5, 40, 39, 16, 0): (13, ('u1', 'u2')),
+    (5, 42, 36, 17, 0): (13, ('u1', 'u2')),
+    (6, 40, 36, 18, 0): (13, ('u1', 'u2')),
+    (6, 42, 33, 19, 0): (14, ('u1', 'u2')),
+    (6, 42, 36, 16, 0): (14, ('u1', 'u2')),
+    (6, 44, 33, 17, 0): (14, ('u1', 'u2')),
+    (7, 42, 33, 18, 0): (14, ('u1', 'u2')),
+    (7, 44, 30, 19, 0): (15, ('u1', 'u2')),
+    (7, 44, 33, 16, 0): (15, ('u1', 'u2')),
+    (7, 46, 30, 17, 0): (15, ('u1', 'u2')),
+    (8, 44, 30, 18, 0): (15, ('u1', 'u2')),
+    (8, 46, 27, 19, 0): (16, ('u1', 'u2')),
+    (8, 46, 30, 16, 0): (16, ('u1', 'u2')),
+    (8, 48, 27, 17, 0): (16, ('u1', 'u2')),
+    (9, 46, 27, 18, 0): (16, ('u1', 'u2')),
+    (9, 48, 24, 19, 0): (17, ('u1', 'u2')),
+    (9, 48, 27, 16, 0): (17, ('u1', 'u2')),
+    (9, 50, 24, 17, 0): (17, ('u1', 'u2')),
+    (10, 48, 24, 18, 0): (17, ('u1', 'u2')),
+    (10, 50, 21, 19, 0): (18, ('u1', 'u2')),
+    (10, 50, 24, 16, 0): (18, ('u1', 'u2')),
+    (10, 52, 21, 17, 0): (18, ('u1', 'u2')),
+    (11, 54, 18, 17, 0): (19, ('u1', 'u2')),
+    (0, 34, 51, 15, 0): (8, ('u3', 'u3')),
+    (0, 32, 54, 14, 0): (9, ('u3', 'u3')),
+    (0, 34, 54, 12, 0): (9, ('u3', 'u3')),
+    (0, 36, 51, 13, 0): (8, ('u3', 'u3')),
+    (1, 34, 51, 14, 0): (9, ('u1', 'u3')),
+    (1, 36, 48, 15, 0): (10, ('u1', 'u3')),
+    (1, 36, 51, 12, 0): (10, ('u1', 'u3')),
+    (1, 38, 48, 13, 0): (10, ('u1', 'u3')),
+    (5, 42, 39, 14, 0): (13, ('u1', 'u2')),
+    (5, 44, 36, 15, 0): (14, ('u1', 'u2')),
+    (5, 44, 39, 12, 0): (14, ('u1', 'u2')),
+    (5, 46, 36, 13, 0): (14, ('u1', 'u2')),
+    (6, 44, 36, 14, 0): (14, ('u1', 'u2')),
+    (6, 46, 33, 15, 0): (15, ('u1', 'u2')),
+    (6, 46, 36, 12, 0): (15, ('u1', 'u2')),
+    (6, 48, 33, 13, 0): (15, ('u1', 'u2')),
+    (7, 46, 33, 14, 0): (15, ('u1', 'u2')),
+    (7, 48, 30, 15, 0): (16, ('u1', 'u2')),
+    (7, 48, 33, 12, 0): (16, ('u1', 'u2')),
+    (7, 50, 30, 13, 0): (16, ('u1', 'u2')),
+    (8, 48, 30, 14, 0): (16, ('u1', 'u2')),
+    (8, 50, 27, 15, 0): (17, ('u1', 'u2')),
+    (8, 50, 30, 12, 0): (17, ('u1', 'u2')),
+    (8, 52, 27, 13, 0): (17, ('u1', 'u2')),
+    (9, 50, 27, 14, 0): (17, ('u1', 'u2')),
+    (9, 52, 24, 15, 0): (18, ('u1', 'u2')),
+    (9, 52, 27, 12, 0): (18, ('u1', 'u2')),
+    (9, 54, 24, 13, 0): (18, ('u1', 'u2')),
+    (10, 52, 24, 14, 0): (18, ('u1', 'u2')),
+    (10, 54, 21, 15, 0): (19, ('u1', 'u2')),
+    (10, 54, 24, 12, 0): (19, ('u1', 'u2')),
+    (10, 56, 21, 13, 0): (19, ('u1', 'u2')),
+    (11, 54, 21, 14, 0): (19, ('u1', 'u2')),
+    (11, 58, 18, 13, 0): (20, ('u1', 'u2')),
+    (12, 60, 15, 13, 0): (21, ('u1', 'u2')),
+    (0, 38, 51, 11, 0): (8, ('u3', 'u3')),
+    (0, 36, 54, 10, 0): (9, ('u3', 'u3')),
+    (0, 38, 54, 8, 0): (9, ('u3', 'u3')),
+    (0, 40, 51, 9, 0): (8, ('u3', 'u3')),
+    (1, 38, 51, 10, 0): (10, ('u1', 'u3')),
+    (1, 40, 48, 11, 0): (11, ('u1', 'u3')),
+    (1, 40, 51, 8, 0): (11, ('u1', 'u3')),
+    (1, 42, 48, 9, 0): (11, ('u1', 'u3')),
+    (5, 46, 39, 10, 0): (14, ('u1', 'u2')),
+    (5, 48, 36, 11, 0): (15, ('u1', 'u2')),
+    (5, 48, 39, 8, 0): (15, ('u1', 'u2')),
+    (5, 50, 36, 9, 0): (15, ('u1', 'u2')),
+    (6, 48, 36, 10, 0): (15, ('u1', 'u2')),
+    (6, 50, 33, 11, 0): (16, ('u1', 'u2')),
+    (6, 50, 36, 8, 0): (16, ('u1', 'u2')),
+    (6, 52, 33, 9, 0): (16, ('u1', 'u2')),
+    (7, 50, 33, 10, 0): (16, ('u1', 'u2')),
+    (7, 52, 30, 11, 0): (17, ('u1', 'u2')),
+    (7, 52, 33, 8, 0): (17, ('u1', 'u2')),
+    (7, 54, 30, 9, 0): (17, ('u1', 'u2')),
+    (8, 52, 30, 10, 0): (17, ('u1', 'u2')),
+    (8, 54, 27, 11, 0): (18, ('u1', 'u2')),
+    (8, 54, 30, 8, 0): (18, ('u1', 'u2')),
+    (8, 56, 27, 9, 0): (18, ('u1', 'u2')),
+    (9, 54, 27, 10, 0): (18, ('u1', 'u2')),
+    (9, 56, 24, 11, 0): (19, ('u1', 'u2')),
+    (9, 56, 27, 8, 0): (19, ('u1', 'u2')),
+    (9, 58, 24, 9, 0): (19, ('u1', 'u2')),
+    (10, 56, 24, 10, 0): (19, ('u1', 'u2')),
+    (10, 58, 21, 11, 0): (20, ('u1', 'u2')),
+    (10, 58, 24, 8, 0): (20, ('u1', 'u2')),
+    (10, 60, 21, 9, 0): (20, ('u1', 'u2')),
+    (11, 58, 21, 10, 0): (20, ('u1', 'u2')),
+    (11, 60, 18, 11, 0): (21, ('u1', 'u2')),
+    (11, 60, 21, 8, 0): (21, ('u1', 'u2')),
+    (11, 62, 18, 9, 0): (21, ('u1', 'u2')),
+    (12, 60, 18, 10, 0): (21, ('u1', 'u2')),
+    (12, 64, 15, 9, 0): (22, ('u1', 'u2')),
+    (0, 42, 51, 7, 0): (8, ('u3', 'u3')),
+    (0, 40, 54, 6, 0): (9, ('u3', 'u3')),
+    (0, 42, 54, 4, 0): (9, ('u3', 'u3')),
+    (0, 44, 51, 5, 0): (8, ('u3', 'u3')),
+    (1, 42, 51, 6, 0): (11, ('u1', 'u3')),
+    (1, 44, 48, 7, 0): (12, ('u1', 'u3')),
+    (1, 44, 51, 4, 0): (12, ('u1', 'u3')),
+    (1, 46, 48, 5, 0): (12, ('u1', 'u3')),
+    (5, 50, 39, 6, 0): (15, ('u1', 'u2')),
+    (5, 52, 36, 7, 0): (16, ('u1', 'u2')),
+    (5, 52, 39, 4, 0): (16, ('u1', 'u2')),
+    (5, 54, 36, 5, 0): (16, ('u1', 'u2')),
+    (6, 52, 36, 6, 0): (16, ('u1', 'u2')),
+    (6, 54, 33, 7, 0): (17, ('u1', 'u2')),
+    (6, 54, 36, 4, 0): (17, ('u1', 'u2')),
+    (6, 56, 33, 5, 0): (17, ('u1', 'u2')),
+    (7, 54, 33, 6, 0): (17, ('u1', 'u2')),
+    (7, 56, 30, 7, 0): (18, ('u1', 'u2')),
+    (7, 56, 33, 4, 0): (18, ('u1', 'u2')),
+    (7, 58, 30, 5, 0): (18, ('u1', 'u2')),
+    (8, 56, 30, 6, 0): (18, ('u1', 'u2')),
+    (8, 58, 27, 7, 0): (19, ('u1', 'u2')),
+    (8, 58, 30, 4, 0): (19, ('u1', 'u2')),
+    (8, 60, 27, 5, 0): (19, ('u1', 'u2')),
+    (9, 58, 27, 6, 0): (19, ('u1', 'u2')),
+    (9, 60, 24, 7, 0): (20, ('u1', 'u2')),
+    (9, 60, 27, 4, 0): (20, ('u1', 'u2')),
+    (9, 62, 24, 5, 0): (20, ('u1', 'u2')),
+    (10, 60, 24, 6, 0): (20, ('u1', 'u2')),
+    (10, 62, 21, 7, 0): (21, ('u1', 'u2')),
+    (10, 62, 24, 4, 0): (21, ('u1', 'u2')),
+    (10, 64, 21, 5, 0): (21, ('u1', 'u2')),
+    (11, 62, 21, 6, 0): (21, ('u1', 'u2')),
+    (11, 64, 18, 7, 0): (22, ('u1', 'u2')),
+    (11, 64, 21, 4, 0): (22, ('u1', 'u2')),
+    (11, 66, 18, 5, 0): (22, ('u1', 'u2')),
+    (12, 64, 18, 6, 0): (22, ('u1', 'u2')),
+    (12, 66, 15, 7, 0): (23, ('u1', 'u2')),
+    (12, 66, 18, 4, 0): (23, ('u1', 'u2')),
+    (12, 68, 15, 5, 0): (23, ('u1', 'u2')),
+    (0, 46, 54, 0, 0): (9, ('u3', 'u3')),
+    (1, 48, 51, 0, 0): (13, ('u1', 'u3')),
+    (5, 56, 39, 0, 0): (17, ('u1', 'u2')),
+    (6, 58, 36, 0, 0): (18, ('u1', 'u2')),
+    (7, 60, 33, 0, 0): (19, ('u1', 'u2')),
+    (8, 62, 30, 0, 0): (20, ('u1', 'u2')),
+    (9, 64, 27, 0, 0): (21, ('u1', 'u2')),
+    (10, 66, 24, 0, 0): (22, ('u1', 'u2')),
+    (11, 68, 21, 0, 0): (23, ('u1', 'u2')),
+    (12, 70, 18, 0, 0): (24, ('u1', 'u2')),
+    (5, 0, 42, 53, 0): (8, ('u1', 'u3')),
+    (6, 0, 39, 55, 0): (8, ('u1', 'u3')),
+    (6, 0, 42, 52, 0): (9, ('u1', 'u3')),
+    (3, 0, 48, 49, 0): (8, ('u3', 'u3')),
+    (4, 0, 45, 51, 0): (8, ('u1', 'u3')),
+    (4, 2, 45, 49, 0): (9, ('u1', 'u3')),
+    (5, 2, 42, 51, 0): (9, ('u1', 'u3')),
+    (4, 0, 48, 48, 0): (9, ('u1', 'u3')),
+    (5, 0, 45, 50, 0): (9, ('u1', 'u3')),
+    (5, 2, 45, 48, 0): (9, ('u1', 'u3')),
+    (2, 0, 51, 47, 0): (8, ('u3', 'u3')),
+    (1, 0, 54, 45, 0): (9, ('u3', 'u3')),
+    (2, 2, 51, 45, 0): (9, ('u2', 'u3')),
+    (3, 2, 48, 47, 0): (9, ('u2', 'u3')),
+    (3, 4, 48, 45, 0): (9, ('u2', 'u2')),
+    (2, 0, 54, 44, 0): (9, ('u3', 'u3')),
+    (3, 0, 51, 46, 0): (9, ('u3', 'u3')),
+    (3, 2, 51, 44, 0): (9, ('u2', 'u3')),
+    (4, 2, 48, 46, 0): (9, ('u1', 'u3')),
+    (0, 0, 57, 43, 0): (9, ('u3', 'u3')),
+    (0, 2, 57, 41, 0): (9, ('u3', 'u3')),
+    (1, 2, 54, 43, 0): (9, ('u3', 'u3')),
+    (1, 4, 54, 41, 0): (9, ('u1', 'u3')),
+    (1, 0, 57, 42, 0): (9, ('u3', 'u3')),
+    (2, 2, 54, 42, 0): (9, ('u2', 'u3')),
+    (0, 0, 60, 40, 0): (10, ('u3', 'u3')),
+    (1, 2, 57, 40, 0): (10, ('u3', 'u3')),
+    (3, 4, 51, 42, 0): (10, ('u2', 'u2')),
+    (0, 4, 57, 39, 0): (9, ('u3', 'u3')),
+    (0, 6, 57, 37, 0): (9, ('u3', 'u3')),
+    (1, 6, 54, 39, 0): (9, ('u1', 'u3')),
+    (1, 8, 54, 37, 0): (9, ('u1', 'u3')),
+    (0, 2, 60, 38, 0): (10, ('u3', 'u3')),
+    (0, 4, 60, 36, 0): (10, ('u3', 'u3')),
+    (1, 4, 57, 38, 0): (10, ('u1', 'u3')),
+    (1, 6, 57, 36, 0): (10, ('u1', 'u3')),
+    (0, 8, 57, 35, 0): (9, ('u3', 'u3')),
+    (0, 10, 57, 33, 0): (9, ('u3', 'u3')),
+    (1, 10, 54, 35, 0): (9, ('u1', 'u3')),
+    (1, 12, 54, 33, 0): (9, ('u1', 'u3')),
+    (0, 6, 60, 34, 0): (10, ('u3', 'u3')),
+    (0, 8, 60, 32, 0): (10, ('u3', 'u3')),
+    (1, 8, 57, 34, 0): (10, ('u1', 'u3')),
+    (1, 10, 57, 32, 0): (10, ('u1', 'u3')),
+    (0, 12, 57, 31, 0): (9, ('u3', 'u3')),
+    (0, 14, 57, 29, 0): (9, ('u3', 'u3')),
+    (1, 14, 54, 31, 0): (9, ('u1', 'u3')),
+    (1, 16, 54, 29, 0): (9, ('u1', 'u3')),
+    (0, 10, 60, 30, 0): (10, ('u3', 'u3')),
+    (0, 12, 60, 28, 0): (10, ('u3', 'u3')),
+    (1, 12, 57, 30, 0): (10, ('u1', 'u3')),
+    (1, 14, 57, 28, 0): (10, ('u1', 'u3')),
+    (7, 26, 36, 31, 0): (11, ('u1', 'u2')),
+    (7, 26, 39, 28, 0): (11, ('u1', 'u2')),
+    (0, 16, 57, 27, 0): (9, ('u3', 'u3')),
+    (0, 18, 57, 25, 0): (9, ('u3', 'u3')),
+    (1, 18, 54, 27, 0): (9, ('u1', 'u3')),
+    (1, 20, 54, 25, 0): (9, ('u1', 'u3')),
+    (0, 14, 60, 26, 0): (10, ('u3', 'u3')),
+    (0, 16, 60, 24, 0): (10, ('u3', 'u3')),
+    (1, 16, 57, 26, 0): (10, ('u1', 'u3')),
+    (1, 18, 57, 24, 0): (10, ('u1', 'u3')),
+    (7, 30, 36, 27, 0): (12, ('u1', 'u2')),
+    (7, 30, 39, 24, 0): (12, ('u1', 'u2')),
+    (7, 32, 36, 25, 0): (12, ('u1', 'u2')),
+    (8, 32, 33, 27, 0): (13, ('u1', 'u2')),
+    (8, 32, 36, 24, 0): (13, ('u1', 'u2')),
+    (8, 34, 33, 25, 0): (13, ('u1', 'u2')),
+    (0, 20, 57, 23, 0): (9, ('u3', 'u3')),
+    (0, 22, 57, 21, 0): (9, ('u3', 'u3')),
+    (1, 22, 54, 23, 0): (9, ('u1', 'u3')),
+    (1, 24, 54, 21, 0): (9, ('u1', 'u3')),
+    (0, 18, 60, 22, 0): (10, ('u3', 'u3')),
+    (0, 20, 60, 20, 0): (10, ('u3', 'u3')),
+    (1, 20, 57, 22, 0): (10, ('u1', 'u3')),
+    (1, 22, 57, 20, 0): (10, ('u1', 'u3')),
+    (5, 30, 42, 23, 0): (10, ('u1', 'u2')),
+    (5, 30, 45, 20, 0): (11, ('u1', 'u2')),
+    (5, 32, 42, 21, 0): (11, ('u1', 'u2')),
+    (6, 32, 39, 23, 0): (11, ('u1', 'u2')),
+    (7, 32, 39, 22, 0): (12, ('u1', 'u2')),
+    (7, 34, 36, 23, 0): (12, ('u1', 'u2')),
+    (7, 34, 39, 20, 0): (13, ('u1', 'u2')),
+    (7, 36, 36, 21, 0): (13, ('u1', 'u2')),
+    (8, 34, 36, 22, 0): (13, ('u1', 'u2')),
+    (8, 36, 33, 23, 0): (13, ('u1', 'u2')),
+    (8, 36, 36, 20, 0): (14, ('u1', 'u2')),
+    (8, 38, 33, 21, 0): (14, ('u1', 'u2')),
+    (9, 38, 30, 23, 0): (14, ('u1', 'u2')),
+    (9, 38, 33, 20, 0): (15, ('u1', 'u2')),
+    (0, 24, 57, 19, 0): (9, ('u3', 'u3')),
+    (0, 26, 57, 17, 0): (9, ('u3', 'u3')),
+    (1, 26, 54, 19, 0): (9, ('u1', 'u3')),
+    (1, 28, 54, 17, 0): (9, ('u1', 'u3')),
+    (0, 22, 60, 18, 0): (10, ('u3', 'u3')),
+    (0, 24, 60, 16, 0): (10, ('u3', 'u3')),
+    (1, 24, 57, 18, 0): (10, ('u1', 'u3')),
+    (1, 26, 57, 16, 0): (10, ('u1', 'u3')),
+    (5, 34, 42, 19, 0): (11, ('u1', 'u2')),
+    (5, 34, 45, 16, 0): (11, ('u1', 'u2')),
+    (5, 36, 42, 17, 0): (12, ('u1', 'u2')),
+    (6, 36, 39, 19, 0): (12, ('u1', 'u2')),
+    (6, 36, 42, 16, 0): (12, ('u1', 'u2')),
+    (6, 38, 39, 17, 0): (13, ('u1', 'u2')),
+    (7, 36, 39, 18, 0): (13, ('u1', 'u2')),
+    (7, 38, 36, 19, 0): (13, ('u1', 'u2')),
+    (7, 38, 39, 16, 0): (13, ('u1', 'u2')),
+    (7, 40, 36, 17, 0): (14, ('u1', 'u2')),
+    (8, 38, 36, 18, 0): (14, ('u1', 'u2')),
+    (8, 40, 33, 19, 0): (14, ('u1', 'u2')),
+    (8, 40, 36, 16, 0): (14, ('u1', 'u2')),
+    (8, 42, 33, 17, 0): (15, ('u1', 'u2')),
+    (9, 42, 30, 19, 0): (15, ('u1', 'u2')),
+    (9, 42, 33, 16, 0): (15, ('u1', 'u2')),
+    (9, 44, 30, 17, 0): (16, ('u1', 'u2')),
+    (10, 44, 27, 19, 0): (16, ('u1', 'u2')),
+    (10, 44, 30, 16, 0): (16, ('u1', 'u2')),
+    (0, 28, 57, 15, 0): (9, ('u3', 'u3')),
+    (0, 30, 57, 13, 0): (9, ('u3', 'u3')),
+    (1, 30, 54, 15, 0): (9, ('u1', 'u3')),
+    (1, 32, 54, 13, 0): (9, ('u1', 'u3')),
+    (0, 26, 60, 14, 0): (10, ('u3', 'u3')),
+    (0, 28, 60, 12, 0): (10, ('u3', 'u3')),
+    (1, 28, 57, 14, 0): (10, ('u1', 'u3')),
+    (1, 30, 57, 12, 0): (10, ('u1', 'u3')),
+    (5, 36, 45, 14, 0): (12, ('u1', 'u2')),
+    (5, 38, 42, 15, 0): (12, ('u1', 'u2')),
+    (5, 38, 45, 12, 0): (12, ('u1', 'u2')),
+    (5, 40, 42, 13, 0): (13, ('u1', 'u2')),
+    (6, 40, 39, 15, 0): (13, ('u1', 'u2')),
+    (6, 40, 42, 12, 0): (13, ('u1', 'u2')),
+    (6, 42, 39, 13, 0): (14, ('u1', 'u2')),
+    (7, 40, 39, 14, 0): (14, ('u1', 'u2')),
+    (7, 42, 36, 15, 0): (14, ('u1', 'u2')),
+    (7, 42, 39, 12, 0): (14, ('u1', 'u2')),
+    (7, 44, 36, 13, 0): (15, ('u1', 'u2')),
+    (8, 42, 36, 14, 0): (15, ('u1', 'u2')),
+    (8, 44, 33, 15, 0): (15, ('u1', 'u2')),
+    (8, 44, 36, 12, 0): (15, ('u1', 'u2')),
+    (8, 46, 33, 13, 0): (16, ('u1', 'u2')),
+    (9, 44, 33, 14, 0): (16, ('u1', 'u2')),
+    (9, 46, 30, 15, 0): (16, ('u1', 'u2')),
+    (9, 46, 33, 12, 0): (16, ('u1', 'u2')),
+    (9, 48, 30, 13, 0): (17, ('u1', 'u2')),
+    (10, 48, 27, 15, 0): (17, ('u1', 'u2')),
+    (10, 48, 30, 12, 0): (17, ('u1', 'u2')),
+    (10, 50, 27, 13, 0): (18, ('u1', 'u2')),
+    (0, 32, 57, 11, 0): (9, ('u3', 'u3')),
+    (0, 34, 57, 9, 0): (9, ('u3', 'u3')),
+    (1, 34, 54, 11, 0): (9, ('u1', 'u3')),
+    (0, 30, 60, 10, 0): (10, ('u3', 'u3')),
+    (0, 32, 60, 8, 0): (10, ('u3', 'u3')),
+    (1, 32, 57, 10, 0): (10, ('u1', 'u3')),
+    (1, 34, 57, 8, 0): (10, ('u1', 'u3')),
+    (1, 36, 54, 9, 0): (10, ('u1', 'u3')),
+    (5, 40, 45, 10, 0): (13, ('u1', 'u2')),
+    (5, 42, 42, 11, 0): (13, ('u1', 'u2')),
+    (5, 42, 45, 8, 0): (13, ('u1', 'u2')),
+    (5, 44, 42, 9, 0): (14, ('u1', 'u2')),
+    (6, 42, 42, 10, 0): (14, ('u1', 'u2')),
+    (6, 44, 39, 11, 0): (14, ('u1', 'u2')),
+    (6, 44, 42, 8, 0): (14, ('u1', 'u2')),
+    (6, 46, 39, 9, 0): (15, ('u1', 'u2')),
+    (7, 44, 39, 10, 0): (15, ('u1', 'u2')),
+    (7, 46, 36, 11, 0): (15, ('u1', 'u2')),
+    (7, 46, 39, 8, 0): (15, ('u1', 'u2')),
+    (7, 48, 36, 9, 0): (16, ('u1', 'u2')),
+    (8, 46, 36, 10, 0): (16, ('u1', 'u2')),
+    (8, 48, 33, 11, 0): (16, ('u1', 'u2')),
+    (8, 48, 36, 8, 0): (16, ('u1', 'u2')),
+    (8, 50, 33, 9, 0): (17, ('u1', 'u2')),
+    (9, 48, 33, 10, 0): (17, ('u1', 'u2')),
+    (9, 50, 30, 11, 0): (17, ('u1', 'u2')),
+    (9, 50, 33, 8, 0): (17, ('u1', 'u2')),
+    (9, 52, 30, 9, 0): (18, ('u1', 'u2')),
+    (10, 50, 30, 10, 0): (18, ('u1', 'u2')),
+    (10, 52, 27, 11, 0): (18, ('u1', 'u2')),
+    (10, 52, 30, 8, 0): (18, ('u1', 'u2')),
+    (10, 54, 27, 9, 0): (19, ('u1', 'u2')),
+    (11, 54, 24, 11, 0): (19, ('u1', 'u2')),
+    (11, 54, 27, 8, 0): (19, ('u1', 'u2')),
+    (0, 36, 57, 7, 0): (9, ('u3', 'u3')),
+    (0, 38, 57, 5, 0): (9, ('u3', 'u3')),
+    (0, 34, 60, 6, 0): (10, ('u3', 'u3')),
+    (0, 36, 60, 4, 0): (10, ('u3', 'u3')),
+    (1, 36, 57, 6, 0): (10, ('u1', 'u3')),
+    (1, 38, 54, 7, 0): (10, ('u1', 'u3')),
+    (1, 38, 57, 4, 0): (10, ('u1', 'u3')),
+    (1, 40, 54, 5, 0): (11, ('u1', 'u3')),
+    (5, 44, 45, 6, 0): (14, ('u1', 'u2')),
+    (5, 46, 42, 7, 0): (14, ('u1', 'u2')),
+    (5, 46, 45, 4, 0): (14, ('u1', 'u2')),
+    (5, 48, 42, 5, 0): (15, ('u1', 'u2')),
+    (6, 46, 42, 6, 0): (15, ('u1', 'u2')),
+    (6, 48, 39, 7, 0): (15, ('u1', 'u2')),
+    (6, 48, 42, 4, 0): (15, ('u1', 'u2')),
+    (6, 50, 39, 5, 0): (16, ('u1', 'u2')),
+    (7, 48, 39, 6, 0): (16, ('u1', 'u2')),
+    (7, 50, 36, 7, 0): (16, ('u1', 'u2')),
+    (7, 50, 39, 4, 0): (16, ('u1', 'u2')),
+    (7, 52, 36, 5, 0): (17, ('u1', 'u2')),
+    (8, 50, 36, 6, 0): (17, ('u1', 'u2')),
+    (8, 52, 33, 7, 0): (17, ('u1', 'u2')),
+    (8, 52, 36, 4, 0): (17, ('u1', 'u2')),
+    (8, 54, 33, 5, 0): (18, ('u1', 'u2')),
+    (9, 52, 33, 6, 0): (18, ('u1', 'u2')),
+    (9, 54, 30, 7, 0): (18, ('u1', 'u2')),
+    (9, 54, 33, 4, 0): (18, ('u1', 'u2')),
+    (9, 56, 30, 5, 0): (19, ('u1', 'u2')),
+    (10, 54, 30, 6, 0): (19, ('u1', 'u2')),
+    (10, 56, 27, 7, 0): (19, ('u1', 'u2')),
+    (10, 56, 30, 4, 0): (19, ('u1', 'u2')),
+    (10, 58, 27, 5, 0): (20, ('u1', 'u2')),
+    (11, 58, 24, 7, 0): (20, ('u1', 'u2')),
+    (11, 58, 27, 4, 0): (20, ('u1', 'u2')),
+    (11, 60, 24, 5, 0): (21, ('u1', 'u2')),
+    (12, 60, 21, 7, 0): (21, ('u1', 'u2')),
+    (12, 60, 24, 4, 0): (21, ('u1', 'u2')),
+    (0, 40, 60, 0, 0): (10, ('u3', 'u3')),
+    (1, 42, 57, 0, 0): (11, ('u1', 'u3')),
+    (5, 50, 45, 0, 0): (15, ('u1', 'u2')),
+    (6, 52, 42, 0, 0): (16, ('u1', 'u2')),
+    (7, 54, 39, 0, 0): (17, ('u1', 'u2')),
+    (8, 56, 36, 0, 0): (18, ('u1', 'u2')),
+    (9, 58, 33, 0, 0): (19, ('u1', 'u2')),
+    (10, 60, 30, 0, 0): (20, ('u1', 'u2')),
+    (11, 62, 27, 0, 0): (21, ('u1', 'u2')),
+    (12, 64, 24, 0, 0): (22, ('u1', 'u2')),
+    (6, 0, 45, 49, 0): (9, ('u1', 'u3')),
+    (4, 0, 51, 45, 0): (9, ('u1', 'u3')),
+    (5, 0, 48, 47, 0): (9, ('u1', 'u3')),
+    (5, 2, 48, 45, 0): (10, ('u1', 'u3')),
+    (5, 0, 51, 44, 0): (10, ('u1', 'u3')),
+    (6, 0, 48, 46, 0): (10, ('u1', 'u3')),
+    (2, 0, 57, 41, 0): (9, ('u3', 'u3')),
+    (3, 0, 54, 43, 0): (9, ('u3', 'u3')),
+    (3, 2, 54, 41, 0): (10, ('u2', 'u3')),
+    (4, 2, 51, 43, 0): (10, ('u1', 'u3')),
+    (3, 0, 57, 40, 0): (10, ('u3', 'u3')),
+    (4, 0, 54, 42, 0): (10, ('u1', 'u3')),
+    (4, 2, 54, 40, 0): (10, ('u1', 'u3')),
+    (5, 2, 51, 42, 0): (10, ('u1', 'u3')),
+    (0, 0, 63, 37, 0): (10, ('u3', 'u3')),
+    (1, 0, 60, 39, 0): (10, ('u3', 'u3')),
+    (1, 2, 60, 37, 0): (10, ('u3', 'u3')),
+    (2, 2, 57, 39, 0): (10, ('u2', 'u3')),
+    (3, 4, 54, 39, 0): (10, ('u2', 'u2')),
+    (1, 0, 63, 36, 0): (10, ('u3', 'u3')),
+    (2, 0, 60, 38, 0): (10, ('u3', 'u3')),
+    (2, 2, 60, 36, 0): (10, ('u2', 'u3')),
+    (3, 2, 57, 38, 0): (10, ('u2', 'u3')),
+    (3, 4, 57, 36, 0): (11, ('u2', 'u2')),
+    (0, 2, 63, 35, 0): (10, ('u3', 'u3')),
+    (0, 4, 63, 33, 0): (10, ('u3', 'u3')),
+    (1, 4, 60, 35, 0): (10, ('u1', 'u3')),
+    (1, 6, 60, 33, 0): (10, ('u1', 'u3')),
+    (0, 0, 66, 34, 0): (11, ('u3', 'u3')),
+    (0, 2, 66, 32, 0): (11, ('u3', 'u3')),
+    (1, 2, 63, 34, 0): (11, ('u3', 'u3')),
+    (1, 4, 63, 32, 0): (11, ('u1', 'u3')),
+    (0, 6, 63, 31, 0): (10, ('u3', 'u3')),
+    (0, 8, 63, 29, 0): (10, ('u3', 'u3')),
+    (1, 8, 60, 31, 0): (10, ('u1', 'u3')),
+    (1, 10, 60, 29, 0): (10, ('u1', 'u3')),
+    (0, 4, 66, 30, 0): (11, ('u3', 'u3')),
+    (0, 6, 66, 28, 0): (11, ('u3', 'u3')),
+    (1, 6, 63, 30, 0): (11, ('u1', 'u3')),
+    (1, 8, 63, 28, 0): (11, ('u1', 'u3')),
+    (0, 10, 63, 27, 0): (10, ('u3', 'u3')),
+    (0, 12, 63, 25, 0): (10, ('u3', 'u3')),
+    (1, 12, 60, 27, 0): (10, ('u1', 'u3')),
+    (1, 14, 60, 25, 0): (10, ('u1', 'u3')),
+    (0, 8, 66, 26, 0): (11, ('u3', 'u3')),
+    (0, 10, 66, 24, 0): (11, ('u3', 'u3')),
+    (1, 10, 63, 26, 0): (11, ('u1', 'u3')),
+    (1, 12, 63, 24, 0): (11, ('u1', 'u3')),
+    (0, 14, 63, 23, 0): (10, ('u3', 'u3')),
+    (0, 16, 63, 21, 0): (10, ('u3', 'u3')),
+    (1, 16, 60, 23, 0): (10, ('u1', 'u3')),
+    (1, 18, 60, 21, 0): (10, ('u1', 'u3')),
+    (0, 12, 66, 22, 0): (11, ('u3', 'u3')),
+    (0, 14, 66, 20, 0): (11, ('u3', 'u3')),
+    (1, 14, 63, 22, 0): (11, ('u1', 'u3')),
+    (1, 16, 63, 20, 0): (11, ('u1', 'u3')),
+    (7, 30, 42, 21, 0): (12, ('u1', 'u2')),
+    (0, 18, 63, 19, 0): (10, ('u3', 'u3')),
+    (0, 20, 63, 17, 0): (10, ('u3', 'u3')),
+    (1, 20, 60, 19, 0): (10, ('u1', 'u3')),
+    (1, 22, 60, 17, 0): (10, ('u1', 'u3')),
+    (0, 16, 66, 18, 0): (11, ('u3', 'u3')),
+    (0, 18, 66, 16, 0): (11, ('u3', 'u3')),
+    (1, 18, 63, 18, 0): (11, ('u1', 'u3')),
+    (1, 20, 63, 16, 0): (11, ('u1', 'u3')),
+    (7, 30, 45, 18, 0): (12, ('u1', 'u2')),
+    (7, 32, 42, 19, 0): (12, ('u1', 'u2')),
+    (7, 32, 45, 16, 0): (12, ('u1', 'u2')),
+    (7, 34, 42, 17, 0): (13, ('u1', 'u2')),
+    (8, 34, 39, 19, 0): (13, ('u1', 'u2')),
+    (8, 34, 42, 16, 0): (13, ('u1', 'u2')),
+    (8, 36, 39, 17, 0): (14, ('u1', 'u2')),
+    (9, 38, 36, 17, 0): (15, ('u1', 'u2')),
+    (0, 22, 63, 15, 0): (10, ('u3', 'u3')),
+    (0, 24, 63, 13, 0): (10, ('u3', 'u3')),
+    (1, 24, 60, 15, 0): (10, ('u1', 'u3')),
+    (1, 26, 60, 13, 0): (10, ('u1', 'u3')),
+    (5, 34, 48, 13, 0): (11, ('u1', 'u2')),
+    (0, 20, 66, 14, 0): (11, ('u3', 'u3')),
+    (0, 22, 66, 12, 0): (11, ('u3', 'u3')),
+    (1, 22, 63, 14, 0): (11, ('u1', 'u3')),
+    (1, 24, 63, 12, 0): (11, ('u1', 'u3')),
+    (6, 36, 45, 13, 0): (12, ('u1', 'u2')),
+    (7, 34, 45, 14, 0): (13, ('u1', 'u2')),
+    (7, 36, 42, 15, 0): (13, ('u1', 'u2')),
+    (7, 36, 45, 12, 0): (13, ('u1', 'u2')),
+    (7, 38, 42, 13, 0): (13, ('u1', 'u2')),
+    (8, 36, 42, 14, 0): (14, ('u1', 'u2')),
+    (8, 38, 39, 15, 0): (14, ('u1', 'u2')),
+    (8, 38, 42, 12, 0): (14, ('u1', 'u2')),
+    (8, 40, 39, 13, 0): (14, ('u1', 'u2')),
+    (9, 42, 36, 13, 0): (15, ('u1', 'u2')),
+    (0, 26, 63, 11, 0): (10, ('u3', 'u3')),
+    (0, 28, 63, 9, 0): (10, ('u3', 'u3')),
+    (1, 28, 60, 11, 0): (10, ('u1', 'u3')),
+    (1, 30, 60, 9, 0): (10, ('u1', 'u3')),
+    (5, 36, 48, 11, 0): (12, ('u1', 'u2')),
+    (5, 38, 48, 9, 0): (12, ('u1', 'u2')),
+    (0, 24, 66, 10, 0): (11, ('u3', 'u3')),
+    (0, 26, 66, 8, 0): (11, ('u3', 'u3')),
+    (1, 26, 63, 10, 0): (11, ('u1', 'u3')),
+    (1, 28, 63, 8, 0): (11, ('u1', 'u3')),
+    (5, 34, 51, 10, 0): (12, ('u1', 'u2')),
+    (6, 40, 45, 9, 0): (13, ('u1', 'u2')),
+    (7, 38, 45, 10, 0): (14, ('u1', 'u2')),
+    (7, 40, 42, 11, 0): (14, ('u1', 'u2')),
+    (7, 40, 45, 8, 0): (14, ('u1', 'u2')),
+    (7, 42, 42, 9, 0): (14, ('u1', 'u2')),
+    (8, 40, 42, 10, 0): (15, ('u1', 'u2')),
+    (8, 42, 39, 11, 0): (15, ('u1', 'u2')),
+    (8, 42, 42, 8, 0): (15, ('u1', 'u2')),
+    (8, 44, 39, 9, 0): (15, ('u1', 'u2')),
+    (9, 42, 39, 10, 0): (16, ('u1', 'u2')),
+    (9, 44, 36, 11, 0): (16, ('u1', 'u2')),
+    (9, 44, 39, 8, 0): (16, ('u1', 'u2')),
+    (9, 46, 36, 9, 0): (16, ('u1', 'u2')),
+    (10, 48, 33, 9, 0): (17, ('u1', 'u2')),
+    (0, 30, 63, 7, 0): (10, ('u3', 'u3')),
+    (0, 32, 63, 5, 0): (10, ('u3', 'u3')),
+    (1, 32, 60, 7, 0): (10, ('u1', 'u3')),
+    (1, 34, 60, 5, 0): (10, ('u1', 'u3')),
+    (0, 28, 66, 6, 0): (11, ('u3', 'u3')),
+    (0, 30, 66, 4, 0): (11, ('u3', 'u3')),
+    (1, 30, 63, 6, 0): (11, ('u1', 'u3')),
+    (1, 32, 63, 4, 0): (11, ('u1', 'u3')),
+    (5, 38, 51, 6, 0): (12, ('u1', 'u2')),
+    (5, 40, 48, 7, 0): (13, ('u1', 'u2')),
+    (5, 40, 51, 4, 0): (13, ('u1', 'u2')),
+    (5, 42, 48, 5, 0): (13, ('u1', 'u2')),
+    (6, 40, 48, 6, 0): (13, ('u1', 'u2')),
+    (6, 42, 45, 7, 0): (14, ('u1', 'u2')),
+    (6, 44, 45, 5, 0): (14, ('u1', 'u2')),
+    (7, 42, 45, 6, 0): (14, ('u1', 'u2')),
+    (7, 44, 42, 7, 0): (15, ('u1', 'u2')),
+    (7, 44, 45, 4, 0): (15, ('u1', 'u2')),
+    (7, 46, 42, 5, 0): (15, ('u1', 'u2')),
+    (8, 44, 42, 6, 0): (15, ('u1', 'u2')),
+    (8, 46, 39, 7, 0): (16, ('u1', 'u2')),
+    (8, 46, 42, 4, 0): (16, ('u1', 'u2')),
+    (8, 48, 39, 5, 0): (16, ('u1', 'u2')),
+    (9, 46, 39, 6, 0): (16, ('u1', 'u2')),
+    (9, 48, 36, 7, 0): (17, ('u1', 'u2')),
+    (9, 48, 39, 4, 0): (17, ('u1', 'u2')),
+    (9, 50, 36, 5, 0): (17, ('u1', 'u2')),
+    (10, 48, 36, 6, 0): (17, ('u1', 'u2')),
+    (10, 52, 33, 5, 0): (18, ('u1', 'u2')),
+    (11, 54, 30, 5, 0): (19, ('u1', 'u2')),
+    (0, 34, 66, 0, 0): (11, ('u3', 'u3')),
+    (1, 36, 63, 0, 0): (11, ('u1', 'u3')),
+    (5, 44, 51, 0, 0): (14, ('u1', 'u2')),
+    (6, 46, 48, 0, 0): (15, ('u1', 'u2')),
+    (7, 48, 45, 0, 0): (16, ('u1', 'u2')),
+    (8, 50, 42, 0, 0): (17, ('u1', 'u2')),
+    (9, 52, 39, 0, 0): (18, ('u1', 'u2')),
+    (10, 54, 36, 0, 0): (19, ('u1', 'u2')),
+    (5, 0, 54, 41, 0): (10, ('u1', 'u3')),
+    (6, 0, 51, 43, 0): (10, ('u1', 'u3')),
+    (6, 0, 54, 40, 0): (11, ('u1', 'u3')),
+    (3, 0, 60, 37, 0): (10, ('u3', 'u3')),
+    (4, 0, 57, 39, 0): (10, ('u1', 'u3')),
+    (4, 2, 57, 37, 0): (11, ('u1', 'u3')),
+    (5, 2, 54, 39, 0): (11, ('u1', 'u3')),
+    (4, 0, 60, 36, 0): (11, ('u1', 'u3')),
+    (5, 0, 57, 38, 0): (11, ('u1', 'u3')),
+    (5, 2, 57, 36, 0): (11, ('u1', 'u3')),
+    (2, 0, 63, 35, 0): (10, ('u3', 'u3')),
+    (1, 0, 66, 33, 0): (11, ('u3', 'u3')),
+    (2, 2, 63, 33, 0): (11, ('u2', 'u3')),
+    (3, 2, 60, 35, 0): (11, ('u2', 'u3')),
+    (3, 4, 60, 33, 0): (11, ('u2', 'u2')),
+    (2, 0, 66, 32, 0): (11, ('u3', 'u3')),
+    (3, 0, 63, 34, 0): (11, ('u3', 'u3')),
+    (3, 2, 63, 32, 0): (11, ('u2', 'u3')),
+    (4, 2, 60, 34, 0): (11, ('u1', 'u3')),
+    (0, 0, 69, 31, 0): (11, ('u3', 'u3')),
+    (0, 2, 69, 29, 0): (11, ('u3', 'u3')),
+    (1, 2, 66, 31, 0): (11, ('u3', 'u3')),
+    (1, 4, 66, 29, 0): (11, ('u1', 'u3')),
+    (1, 0, 69, 30, 0): (11, ('u3', 'u3')),
+    (2, 2, 66, 30, 0): (11, ('u2', 'u3')),
+    (0, 0, 72, 28, 0): (12, ('u3', 'u3')),
+    (1, 2, 69, 28, 0): (12, ('u3', 'u3')),
+    (3, 4, 63, 30, 0): (12, ('u2', 'u2')),
+    (0, 4, 69, 27, 0): (11, ('u3', 'u3')),
+    (0, 6, 69, 25, 0): (11, ('u3', 'u3')),
+    (1, 6, 66, 27, 0): (11, ('u1', 'u3')),
+    (1, 8, 66, 25, 0): (11, ('u1', 'u3')),
+    (0, 2, 72, 26, 0): (12, ('u3', 'u3')),
+    (0, 4, 72, 24, 0): (12, ('u3', 'u3')),
+    (1, 4, 69, 26, 0): (12, ('u1', 'u3')),
+    (1, 6, 69, 24, 0): (12, ('u1', 'u3')),
+    (0, 8, 69, 23, 0): (11, ('u3', 'u3')),
+    (0, 10, 69, 21, 0): (11, ('u3', 'u3')),
+    (1, 10, 66, 23, 0): (11, ('u1', 'u3')),
+    (1, 12, 66, 21, 0): (11, ('u1', 'u3')),
+    (0, 6, 72, 22, 0): (12, ('u3', 'u3')),
+    (0, 8, 72, 20, 0): (12, ('u3', 'u3')),
+    (1, 8, 69, 22, 0): (12, ('u1', 'u3')),
+    (1, 10, 69, 20, 0): (12, ('u1', 'u3')),
+    (0, 12, 69, 19, 0): (11, ('u3', 'u3')),
+    (0, 14, 69, 17, 0): (11, ('u3', 'u3')),
+    (1, 14, 66, 19, 0): (11, ('u1', 'u3')),
+    (1, 16, 66, 17, 0): (11, ('u1', 'u3')),
+    (0, 10, 72, 18, 0): (12, ('u3', 'u3')),
+    (0, 12, 72, 16, 0): (12, ('u3', 'u3')),
+    (1, 12, 69, 18, 0): (12, ('u1', 'u3')),
+    (1, 14, 69, 16, 0): (12, ('u1', 'u3')),
+    (0, 16, 69, 15, 0): (11, ('u3', 'u3')),
+    (0, 18, 69, 13, 0): (11, ('u3', 'u3')),
+    (1, 18, 66, 15, 0): (11, ('u1', 'u3')),
+    (1, 20, 66, 13, 0): (11, ('u1', 'u3')),
+    (7, 30, 48, 15, 0): (12, ('u1', 'u2')),
+    (7, 32, 48, 13, 0): (12, ('u1', 'u2')),
+    (0, 14, 72, 14, 0): (12, ('u3', 'u3')),
+    (0, 16, 72, 12, 0): (12, ('u3', 'u3')),
+    (1, 16, 69, 14, 0): (12, ('u1', 'u3')),
+    (1, 18, 69, 12, 0): (12, ('u1', 'u3')),
+    (8, 34, 45, 13, 0): (13, ('u1', 'u2')),
+    (0, 20, 69, 11, 0): (11, ('u3', 'u3')),
+    (0, 22, 69, 9, 0): (11, ('u3', 'u3')),
+    (1, 22, 66, 11, 0): (11, ('u1', 'u3')),
+    (1, 24, 66, 9, 0): (11, ('u1', 'u3')),
+    (0, 18, 72, 10, 0): (12, ('u3', 'u3')),
+    (0, 20, 72, 8, 0): (12, ('u3', 'u3')),
+    (1, 20, 69, 10, 0): (12, ('u1', 'u3')),
+    (1, 22, 69, 8, 0): (12, ('u1', 'u3')),
+    (7, 32, 51, 10, 0): (13, ('u1', 'u2')),
+    (7, 34, 48, 11, 0): (13, ('u1', 'u2')),
+    (7, 34, 51, 8, 0): (13, ('u1', 'u2')),
+    (7, 36, 48, 9, 0): (13, ('u1', 'u2')),
+    (8, 38, 45, 9, 0): (14, ('u1', 'u2')),
+    (0, 24, 69, 7, 0): (11, ('u3', 'u3')),
+    (0, 26, 69, 5, 0): (11, ('u3', 'u3')),
+    (1, 26, 66, 7, 0): (11, ('u1', 'u3')),
+    (1, 28, 66, 5, 0): (11, ('u1', 'u3')),
+    (0, 22, 72, 6, 0): (12, ('u3', 'u3')),
+    (0, 24, 72, 4, 0): (12, ('u3', 'u3')),
+    (1, 24, 69, 6, 0): (12, ('u1', 'u3')),
+    (1, 26, 69, 4, 0): (12, ('u1', 'u3')),
+    (7, 36, 51, 6, 0): (13, ('u1', 'u2')),
+    (7, 38, 48, 7, 0): (14, ('u1', 'u2')),
+    (7, 38, 51, 4, 0): (14, ('u1', 'u2')),
+    (7, 40, 48, 5, 0): (14, ('u1', 'u2')),
+    (8, 38, 48, 6, 0): (14, ('u1', 'u2')),
+    (8, 40, 45, 7, 0): (15, ('u1', 'u2')),
+    (8, 40, 48, 4, 0): (15, ('u1', 'u2')),
+    (8, 42, 45, 5, 0): (15, ('u1', 'u2')),
+    (9, 42, 42, 7, 0): (16, ('u1', 'u2')),
+    (9, 42, 45, 4, 0): (16, ('u1', 'u2')),
+    (9, 44, 42, 5, 0): (16, ('u1', 'u2')),
+    (0, 28, 72, 0, 0): (12, ('u3', 'u3')),
+    (1, 30, 69, 0, 0): (12, ('u1', 'u3')),
+    (5, 38, 57, 0, 0): (13, ('u1', 'u2')),
+    (7, 42, 51, 0, 0): (15, ('u1', 'u2')),
+    (8, 44, 48, 0, 0): (16, ('u1', 'u2')),
+    (9, 46, 45, 0, 0): (17, ('u1', 'u2')),
+    (10, 48, 42, 0, 0): (18, ('u1', 'u2')),
+    (6, 0, 57, 37, 0): (11, ('u1', 'u3')),
+    (4, 0, 63, 33, 0): (11, ('u1', 'u3')),
+    (5, 0, 60, 35, 0): (11, ('u1', 'u3')),
+    (5, 2, 60, 33, 0): (12, ('u1', 'u3')),
+    (5, 0, 63, 32, 0): (12, ('u1', 'u3')),
+    (6, 0, 60, 34, 0): (12, ('u1', 'u3')),
+    (2, 0, 69, 29, 0): (11, ('u3', 'u3')),
+    (3, 0, 66, 31, 0): (11, ('u3', 'u3')),
+    (3, 2, 66, 29, 0): (12, ('u2', 'u3')),
+    (4, 2, 63, 31, 0): (12, ('u1', 'u3')),
+    (3, 0, 69, 28, 0): (12, ('u3', 'u3')),
+    (4, 0, 66, 30, 0): (12, ('u1', 'u3')),
+    (4, 2, 66, 28, 0): (12, ('u1', 'u3')),
+    (5, 2, 63, 30, 0): (12, ('u1', 'u3')),
+    (0, 0, 75, 25, 0): (12, ('u3', 'u3')),
+    (1, 0, 72, 27, 0): (12, ('u3', 'u3')),
+    (1, 2, 72, 25, 0): (12, ('u3', 'u3')),
+    (2, 2, 69, 27, 0): (12, ('u2', 'u3')),
+    (3, 4, 66, 27, 0): (12, ('u2', 'u2')),
+    (1, 0, 75, 24, 0): (12, ('u3', 'u3')),
+    (2, 0, 72, 26, 0): (12, ('u3', 'u3')),
+    (2, 2, 72, 24, 0): (12, ('u2', 'u3')),
+    (3, 2, 69, 26, 0): (12, ('u2', 'u3')),
+    (3, 4, 69, 24, 0): (13, ('u2', 'u2')),
+    (0, 2, 75, 23, 0): (12, ('u3', 'u3')),
+    (0, 4, 75, 21, 0): (12, ('u3', 'u3')),
+    (1, 4, 72, 23, 0): (12, ('u1', 'u3')),
+    (1, 6, 72, 21, 0): (12, ('u1', 'u3')),
+    (0, 0, 78, 22, 0): (13, ('u3', 'u3')),
+    (0, 2, 78, 20, 0): (13, ('u3', 'u3')),
+    (1, 2, 75, 22, 0): (13, ('u3', 'u3')),
+    (1, 4, 75, 20, 0): (13, ('u1', 'u3')),
+    (0, 6, 75, 19, 0): (12, ('u3', 'u3')),
+    (0, 8, 75, 17, 0): (12, ('u3', 'u3')),
+    (1, 8, 72, 19, 0): (12, ('u1', 'u3')),
+    (1, 10, 72, 17, 0): (12, ('u1', 'u3')),
+    (0, 4, 78, 18, 0): (13, ('u3', 'u3')),
+    (0, 6, 78, 16, 0): (13, ('u3', 'u3')),
+    (1, 6, 75, 18, 0): (13, ('u1', 'u3')),
+    (1, 8, 75, 16, 0): (13, ('u1', 'u3')),
+    (0, 10, 75, 15, 0): (12, ('u3', 'u3')),
+    (0, 12, 75, 13, 0): (12, ('u3', 'u3')),
+    (1, 12, 72, 15, 0): (12, ('u1', 'u3')),
+    (1, 14, 72, 13, 0): (12, ('u1', 'u3')),
+    (0, 8, 78, 14, 0): (13, ('u3', 'u3')),
+    (0, 10, 78, 12, 0): (13, ('u3', 'u3')),
+    (1, 10, 75, 14, 0): (13, ('u1', 'u3')),
+    (1, 12, 75, 12, 0): (13, ('u1', 'u3')),
+    (0, 14, 75, 11, 0): (12, ('u3', 'u3')),
+    (0, 16, 75, 9, 0): (12, ('u3', 'u3')),
+    (1, 16, 72, 11, 0): (12, ('u1', 'u3')),
+    (1, 18, 72, 9, 0): (12, ('u1', 'u3')),
+    (0, 12, 78, 10, 0): (13, ('u3', 'u3')),
+    (0, 14, 78, 8, 0): (13, ('u3', 'u3')),
+    (1, 14, 75, 10, 0): (13, ('u1', 'u3')),
+    (1, 16, 75, 8, 0): (13, ('u1', 'u3')),
+    (0, 18, 75, 7, 0): (12, ('u3', 'u3')),
+    (0, 20, 75, 5, 0): (12, ('u3', 'u3')),
+    (1, 20, 72, 7, 0): (12, ('u1', 'u3')),
+    (1, 22, 72, 5, 0): (12, ('u1', 'u3')),
+    (0, 16, 78, 6, 0): (13, ('u3', 'u3')),
+    (0, 18, 78, 4, 0): (13, ('u3', 'u3')),
+    (1, 18, 75, 6, 0): (13, ('u1', 'u3')),
+    (1, 20, 75, 4, 0): (13, ('u1', 'u3')),
+    (7, 32, 54, 7, 0): (13, ('u1', 'u2')),
+    (7, 34, 54, 5, 0): (13, ('u1', 'u2')),
+    (0, 22, 78, 0, 0): (13, ('u3', 'u3')),
+    (1, 24, 75, 0, 0): (13, ('u1', 'u3')),
+    (7, 36, 57, 0, 0): (14, ('u1', 'u2')),
+    (8, 38, 54, 0, 0): (15, ('u1', 'u2')),
+    (5, 0, 66, 29, 0): (12, ('u1', 'u3')),
+    (6, 0, 63, 31, 0): (12, ('u1', 'u3')),
+    (6, 0, 66, 28, 0): (13, ('u1', 'u3')),
+    (3, 0, 72, 25, 0): (12, ('u3', 'u3')),
+    (4, 0, 69, 27, 0): (12, ('u1', 'u3')),
+    (4, 2, 69, 25, 0): (13, ('u1', 'u3')),
+    (5, 2, 66, 27, 0): (13, ('u1', 'u3')),
+    (4, 0, 72, 24, 0): (13, ('u1', 'u3')),
+    (5, 0, 69, 26, 0): (13, ('u1', 'u3')),
+    (5, 2, 69, 24, 0): (13, ('u1', 'u3')),
+    (2, 0, 75, 23, 0): (12, ('u3', 'u3')),
+    (1, 0, 78, 21, 0): (13, ('u3', 'u3')),
+    (2, 2, 75, 21, 0): (13, ('u2', 'u3')),
+    (3, 2, 72, 23, 0): (13, ('u2', 'u3')),
+    (3, 4, 72, 21, 0): (13, ('u2', 'u2')),
+    (2, 0, 78, 20, 0): (13, ('u3', 'u3')),
+    (3, 0, 75, 22, 0): (13, ('u3', 'u3')),
+    (3, 2, 75, 20, 0): (13, ('u2', 'u3')),
+    (4, 2, 72, 22, 0): (13, ('u1', 'u3')),
+    (0, 0, 81, 19, 0): (13, ('u3', 'u3')),
+    (0, 2, 81, 17, 0): (13, ('u3', 'u3')),
+    (1, 2, 78, 19, 0): (13, ('u3', 'u3')),
+    (1, 4, 78, 17, 0): (13, ('u1', 'u3')),
+    (1, 0, 81, 18, 0): (13, ('u3', 'u3')),
+    (2, 2, 78, 18, 0): (13, ('u2', 'u3')),
+    (0, 0, 84, 16, 0): (14, ('u3', 'u3')),
+    (1, 2, 81, 16, 0): (14, ('u3', 'u3')),
+    (3, 4, 75, 18, 0): (14, ('u2', 'u2')),
+    (0, 4, 81, 15, 0): (13, ('u3', 'u3')),
+    (0, 6, 81, 13, 0): (13, ('u3', 'u3')),
+    (1, 6, 78, 15, 0): (13, ('u1', 'u3')),
+    (1, 8, 78, 13, 0): (13, ('u1', 'u3')),
+    (0, 2, 84, 14, 0): (14, ('u3', 'u3')),
+    (0, 4, 84, 12, 0): (14, ('u3', 'u3')),
+    (1, 4, 81, 14, 0): (14, ('u1', 'u3')),
+    (1, 6, 81, 12, 0): (14, ('u1', 'u3')),
+    (0, 8, 81, 11, 0): (13, ('u3', 'u3')),
+    (0, 10, 81, 9, 0): (13, ('u3', 'u3')),
+    (1, 10, 78, 11, 0): (13, ('u1', 'u3')),
+    (1, 12, 78, 9, 0): (13, ('u1', 'u3')),
+    (0, 6, 84, 10, 0): (14, ('u3', 'u3')),
+    (0, 8, 84, 8, 0): (14, ('u3', 'u3')),
+    (1, 8, 81, 10, 0): (14, ('u1', 'u3')),
+    (1, 10, 81, 8, 0): (14, ('u1', 'u3')),
+    (0, 12, 81, 7, 0): (13, ('u3', 'u3')),
+    (0, 14, 81, 5, 0): (13, ('u3', 'u3')),
+    (1, 14, 78, 7, 0): (13, ('u1', 'u3')),
+    (1, 16, 78, 5, 0): (13, ('u1', 'u3')),
+    (0, 10, 84, 6, 0): (14, ('u3', 'u3')),
+    (0, 12, 84, 4, 0): (14, ('u3', 'u3')),
+    (1, 12, 81, 6, 0): (14, ('u1', 'u3')),
+    (1, 14, 81, 4, 0): (14, ('u1', 'u3')),
+    (0, 16, 84, 0, 0): (14, ('u3', 'u3')),
+    (1, 18, 81, 0, 0): (14, ('u1', 'u3')),
+    (6, 0, 69, 25, 0): (13, ('u1', 'u3')),
+    (4, 0, 75, 21, 0): (13, ('u1', 'u3')),
+    (5, 0, 72, 23, 0): (13, ('u1', 'u3')),
+    (5, 2, 72, 21, 0): (14, ('u1', 'u3')),
+    (5, 0, 75, 20, 0): (14, ('u1', 'u3')),
+    (6, 0, 72, 22, 0): (14, ('u1', 'u3')),
+    (6, 2, 72, 20, 0): (14, ('u1', 'u3')),
+    (2, 0, 81, 17, 0): (13, ('u3', 'u3')),
+    (3, 0, 78, 19, 0): (13, ('u3', 'u3')),
+    (3, 2, 78, 17, 0): (14, ('u2', 'u3')),
+    (4, 2, 75, 19, 0): (14, ('u1', 'u3')),
+    (3, 0, 81, 16, 0): (14, ('u3', 'u3')),
+    (4, 0, 78, 18, 0): (14, ('u1', 'u3')),
+    (4, 2, 78, 16, 0): (14, ('u1', 'u3')),
+    (5, 2, 75, 18, 0): (14, ('u1', 'u3')),
+    (0, 0, 87, 13, 0): (14, ('u3', 'u3')),
+    (1, 0, 84, 15, 0): (14, ('u3', 'u3')),
+    (1, 2, 84, 13, 0): (14, ('u3', 'u3')),
+    (2, 2, 81, 15, 0): (14, ('u2', 'u3')),
+    (3, 4, 78, 15, 0): (14, ('u2', 'u2')),
+    (1, 0, 87, 12, 0): (14, ('u3', 'u3')),
+    (2, 0, 84, 14, 0): (14, ('u3', 'u3')),
+    (2, 2, 84, 12, 0): (14, ('u2', 'u3')),
+    (3, 2, 81, 14, 0): (14, ('u2', 'u3')),
+    (3, 4, 81, 12, 0): (15, ('u2', 'u2')),
+    (0, 2, 87, 11, 0): (14, ('u3', 'u3')),
+    (0, 4, 87, 9, 0): (14, ('u3', 'u3')),
+    (1, 4, 84, 11, 0): (14, ('u1', 'u3')),
+    (1, 6, 84, 9, 0): (14, ('u1', 'u3')),
+    (0, 0, 90, 10, 0): (15, ('u3', 'u3')),
+    (0, 2, 90, 8, 0): (15, ('u3', 'u3')),
+    (1, 2, 87, 10, 0): (15, ('u3', 'u3')),
+    (1, 4, 87, 8, 0): (15, ('u1', 'u3')),
+    (0, 6, 87, 7, 0): (14, ('u3', 'u3')),
+    (0, 8, 87, 5, 0): (14, ('u3', 'u3')),
+    (1, 8, 84, 7, 0): (14, ('u1', 'u3')),
+    (1, 10, 84, 5, 0): (14, ('u1', 'u3')),
+    (0, 4, 90, 6, 0): (15, ('u3', 'u3')),
+    (0, 6, 90, 4, 0): (15, ('u3', 'u3')),
+    (1, 6, 87, 6, 0): (15, ('u1', 'u3')),
+    (1, 8, 87, 4, 0): (15, ('u1', 'u3')),
+    (0, 10, 90, 0, 0): (15, ('u3', 'u3')),
+    (1, 12, 87, 0, 0): (15, ('u1', 'u3')),
+    (5, 0, 78, 17, 0): (14, ('u1', 'u3')),
+    (6, 0, 75, 19, 0): (14, ('u1', 'u3')),
+    (6, 0, 78, 16, 0): (15, ('u1', 'u3')),
+    (3, 0, 84, 13, 0): (14, ('u3', 'u3')),
+    (4, 0, 81, 15, 0): (14, ('u1', 'u3')),
+    (4, 2, 81, 13, 0): (15, ('u1', 'u3')),
+    (5, 2, 78, 15, 0): (15, ('u1', 'u3')),
+    (4, 0, 84, 12, 0): (15, ('u1', 'u3')),
+    (5, 0, 81, 14, 0): (15, ('u1', 'u3')),
+    (5, 2, 81, 12, 0): (15, ('u1', 'u3')),
+    (6, 2, 78, 14, 0): (15, ('u1', 'u3')),
+    (2, 0, 87, 11, 0): (14, ('u3', 'u3')),
+    (1, 0, 90, 9, 0): (15, ('u3', 'u3')),
+    (2, 2, 87, 9, 0): (15, ('u2', 'u3')),
+    (3, 2, 84, 11, 0): (15, ('u2', 'u3')),
+    (3, 4, 84, 9, 0): (15, ('u2', 'u2')),
+    (2, 0, 90, 8, 0): (15, ('u3', 'u3')),
+    (3, 0, 87, 10, 0): (15, ('u3', 'u3')),
+    (3, 2, 87, 8, 0): (15, ('u2', 'u3')),
+    (4, 2, 84, 10, 0): (15, ('u1', 'u3')),
+    (0, 0, 93, 7, 0): (15, ('u3', 'u3')),
+    (0, 2, 93, 5, 0): (15, ('u3', 'u3')),
+    (1, 2, 90, 7, 0): (15, ('u3', 'u3')),
+    (1, 4, 90, 5, 0): (15, ('u1', 'u3')),
+    (1, 0, 93, 6, 0): (15, ('u3', 'u3')),
+    (2, 2, 90, 6, 0): (15, ('u2', 'u3')),
+    (0, 0, 96, 4, 0): (16, ('u3', 'u3')),
+    (1, 2, 93, 4, 0): (16, ('u3', 'u3')),
+    (3, 4, 87, 6, 0): (16, ('u2', 'u2')),
+    (0, 4, 96, 0, 0): (16, ('u3', 'u3')),
+    (1, 6, 93, 0, 0): (16, ('u1', 'u3')),
+    (6, 0, 81, 13, 0): (15, ('u1', 'u3')),
+    (4, 0, 87, 9, 0): (15, ('u1', 'u3')),
+    (5, 0, 84, 11, 0): (15, ('u1', 'u3')),
+    (5, 2, 84, 9, 0): (16, ('u1', 'u3')),
+    (5, 0, 87, 8, 0): (16, ('u1', 'u3')),
+    (6, 0, 84, 10, 0): (16, ('u1', 'u3')),
+    (6, 2, 84, 8, 0): (16, ('u1', 'u3')),
+    (2, 0, 93, 5, 0): (15, ('u3', 'u3')),
+    (3, 0, 90, 7, 0): (15, ('u3', 'u3')),
+    (3, 2, 90, 5, 0): (16, ('u2', 'u3')),
+    (4, 2, 87, 7, 0): (16, ('u1', 'u3')),
+    (3, 0, 93, 4, 0): (16, ('u3', 'u3')),
+    (4, 0, 90, 6, 0): (16, ('u1', 'u3')),
+    (4, 2, 90, 4, 0): (16, ('u1', 'u3')),
+    (5, 2, 87, 6, 0): (16, ('u1', 'u3')),
+    (1, 0, 99, 0, 0): (16, ('u3', 'u3')),
+    (2, 2, 96, 0, 0): (16, ('u2', 'u3')),
+    (3, 4, 93, 0, 0): (17, ('u2', 'u2')),
+    (5, 0, 90, 5, 0): (16, ('u1', 'u3')),
+    (6, 0, 87, 7, 0): (16, ('u1', 'u3')),
+    (6, 2, 87, 5, 0): (17, ('u1', 'u3')),
+    (6, 0, 90, 4, 0): (17, ('u1', 'u3')),
+    (4, 0, 96, 0, 0): (17, ('u1', 'u3')),
+    (5, 2, 93, 0, 0): (17, ('u1', 'u3')),
+}
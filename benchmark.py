@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _python(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=HERE, check=True, capture_output=True, text=True
+    )
+
+
+def import_time(module="find_three_ones", repeat=10):
+    """
+    seconds to import module (including the modules it imports) in a fresh interpreter,
+    as reported by python -X importtime, min over repeat runs
+    """
+
+    def once():
+        stderr = _python("-X", "importtime", "-c", f"import {module}").stderr
+        for line in stderr.splitlines():
+            if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+                return int(line.split("|")[1]) / 1e6
+        raise ValueError(f"no import time reported for {module}")
+
+    return min(once() for _ in range(repeat))
+
+
+def first_call_time(n=100, repeat=3):
+    """seconds for the first find_three_ones call (which loads the table) in a fresh interpreter"""
+    code = f"""
+import time
+from find_three_ones import find_three_ones
+start = time.perf_counter()
+find_three_ones(lambda i, j: (i < 3) - (j < 3), n={n})
+print(time.perf_counter() - start)
+"""
+    return min(float(_python("-c", code).stdout) for _ in range(repeat))
+
+
+def _placements(count, n=100, seed=0):
+    rng = random.Random(seed)
+    return [frozenset(rng.sample(range(n), 3)) for _ in range(count)]
+
+
+def solve_times(find, placements):
+    """per-solve latency (seconds) of find(compare) on each placement of the ones"""
+    times = []
+    for ones in placements:
+
+        def compare(i, j):
+            return (i in ones) - (j in ones)
+
+        start = time.perf_counter()
+        find(compare)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def solve_stats(find, placements, repeat=3):
+    """latency statistics of find, from the fastest of repeat runs over placements"""
+    solve_times(find, placements[:1])  # (loads the table)
+    times = min((solve_times(find, placements) for _ in range(repeat)), key=sum)
+    times.sort()
+    return {
+        "solves_per_sec": len(times) / sum(times),
+        "mean_us": 1e6 * statistics.fmean(times),
+        "p50_us": 1e6 * times[len(times) // 2],
+        "p99_us": 1e6 * times[len(times) * 99 // 100],
+    }
+
+
+def solve_benchmarks(count=2000):
+    from find_three_ones import find_three_ones, find_three_ones_machine
+    from manual_find_three_ones import find_three_ones as manual_find_three_ones
+
+    placements = _placements(count)
+    return {
+        name: solve_stats(find, placements)
+        for name, find in (
+            ("find_three_ones", find_three_ones),
+            ("find_three_ones_machine", find_three_ones_machine),
+            ("manual_find_three_ones", manual_find_three_ones),
+        )
+    }
+
+
+def partition_benchmarks(count=2000):
+    """mean nanoseconds per call of each Partition operation, over solves of random placements"""
+    from find_three_ones import Partition, load_table
+
+    table = load_table(100)
+    totals = dict.fromkeys(("init", "done", "indices_to_compare", "register_comparison", "solution"), 0)
+    calls = dict.fromkeys(totals, 0)
+    clock = time.perf_counter_ns
+
+    def timed(name, f, *args):
+        start = clock()
+        result = f(*args)
+        totals[name] += clock() - start
+        calls[name] += 1
+        return result
+
+    for ones in _placements(count):
+        partition = timed("init", Partition, range(100), table)
+        while not timed("done", partition.done):
+            i, j = timed("indices_to_compare", partition.indices_to_compare)
+            timed("register_comparison", partition.register_comparison, i, j, (i in ones) - (j in ones))
+        timed("solution", partition.solution)
+    # less the time to call an empty function and read the clock
+    overheads = []
+    for _ in range(1000):
+        start = clock()
+        (lambda: None)()
+        overheads.append(clock() - start)
+    overhead = min(overheads)
+    return {f"{name}_ns": totals[name] / calls[name] - overhead for name in totals}
+
+
+def recompute_benchmark(n, solver=None, workers=None):
+    """wall time and peak memory of recompute_table.py --n n, run in a temporary directory"""
+    args = [sys.executable, os.path.join(HERE, "recompute_table.py"), "--n", str(n)]
+    if solver is not None:
+        args += ["--solver", solver]
+    if workers is not None:
+        args += ["--workers", str(workers)]
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.perf_counter()
+        process = subprocess.Popen(args, cwd=cwd, stdout=subprocess.DEVNULL)
+        _, status, rusage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args)
+    # (ru_maxrss is in kilobytes on Linux)
+    return {"seconds": seconds, "peak_rss_mb": rusage.ru_maxrss / 1024}
+
+
+def versions():
+    commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=HERE, capture_output=True, text=True)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit.stdout.strip() or None,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+BENCHMARKS = ("import", "solve", "partition", "recompute")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="benchmarks for find_three_ones")
+    # (not choices=BENCHMARKS: with no benchmark given, argparse checks the empty list against
+    # the choices, and fails)
+    parser.add_argument(
+        "benchmarks", nargs="*", help=f"the benchmarks to run, of {', '.join(BENCHMARKS)} (default all)"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="exit with status 1 if importing find_three_ones takes longer than this",
+    )
+    parser.add_argument("--n", type=int, nargs="+", default=[20, 50, 100], help="n for recompute")
+    parser.add_argument("--solver", help="--solver for recompute")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        help="--workers for recompute (with --solver layers): runs recompute with each, "
+        "and reports the speedup over the first",
+    )
+    parser.add_argument("--json", help="also write the results to this file, as JSON")
+    args = parser.parse_args(argv)
+    for benchmark in args.benchmarks:
+        if benchmark not in BENCHMARKS:
+            parser.error(f"no benchmark {benchmark!r} (choose from {', '.join(BENCHMARKS)})")
+    benchmarks = args.benchmarks or BENCHMARKS
+
+    results = {"versions": versions()}
+    if "import" in benchmarks:
+        results["import"] = {
+            "find_three_ones_ms": 1e3 * import_time(),
+            "_table_ms": 1e3 * import_time("_table"),
+            "first_call_ms": 1e3 * first_call_time(),
+        }
+    if "solve" in benchmarks:
+        results["solve"] = solve_benchmarks()
+    if "partition" in benchmarks:
+        results["partition"] = partition_benchmarks()
+    if "recompute" in benchmarks:
+        if args.workers is None:
+            results["recompute"] = {str(n): recompute_benchmark(n, args.solver) for n in args.n}
+        else:
+            results["recompute"] = {}
+            for n in args.n:
+                for workers in args.workers:
+                    result = recompute_benchmark(n, args.solver, workers)
+                    if workers == args.workers[0]:
+                        base = result["seconds"]
+                    result["speedup"] = base / result["seconds"]
+                    results["recompute"][f"{n} workers {workers}"] = result
+
+    for benchmark in benchmarks:
+        for name, value in results[benchmark].items():
+            if isinstance(value, dict):
+                value = ", ".join(f"{k} {v:.1f}" for k, v in value.items())
+            else:
+                value = f"{value:.1f}"
+            print(f"{benchmark} {name}: {value}")
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.budget_ms is not None and "import" in results:
+        if results["import"]["find_three_ones_ms"] > args.budget_ms:
+            sys.exit(f"import time exceeds budget of {args.budget_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
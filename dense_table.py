@@ -0,0 +1,177 @@
+"""
+A table with one row for every signature (u1, u2, u3, zero, one) of an n-element input,
+stored in two byte arrays (values and codes) directly addressed by (u1, u2 // 2, u3 // 3, one).
+(zero is determined by the others, as the signature sums to n.)
+
+The code of a row is either
+* the index in COMPARISONS of the comparison to make, or
+* TERMINAL | sizes, where bit s - 1 of sizes is set iff the unknown parts of size s are ones,
+  for a signature with exactly one consistent assignment, or
+* ILLEGAL, for a signature that no input is consistent with (or that is not in the table).
+
+Values are capped at MAX_VALUE; UNKNOWN_VALUE marks rows (recomputed by default_row)
+for which the compact table in _table.py does not record the value.
+
+A saved table records the source_hash of the _table*.py it was computed with (or zeros),
+so that find_three_ones.load_table can tell when it is out of date.
+"""
+
+import hashlib
+import mmap
+import struct
+from array import array
+
+COMPARISONS = (
+    "u1_u1",
+    "u1_u2",
+    "u1_u3",
+    "u2_u2",
+    "u2_u3",
+    "u3_u3",
+    "u1_zero",
+    "u2_zero",
+    "u3_zero",
+    "u1_one",
+    "u2_one",
+    "u3_one",
+)
+TERMINAL = 0x80
+ILLEGAL = 0xFF
+MAX_VALUE = 0xFE
+UNKNOWN_VALUE = 0xFF
+
+# code -> the pair of kinds of parts to compare, or the sizes of the parts that are ones
+COMPARED = tuple(tuple(c.split("_")) for c in COMPARISONS)
+ONE_SIZES = {
+    TERMINAL | sizes: tuple(s for s in range(1, 4) if sizes & (1 << (s - 1))) for sizes in range(8)
+}
+
+HEADER = struct.Struct("<4sI16s")
+MAGIC = b"F31T"
+NO_SOURCE = bytes(16)
+
+
+def source_hash(path):
+    """the hash of the file in path (a _table*.py), as recorded in the tables saved from it"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()[:16]
+
+
+def default_row(signature):
+    """the row for a signature that is left out of the table (see recompute_table.omit_row)"""
+    return default_rule(signature)[1]
+
+
+def default_rule(signature):
+    """(rule, row): default_row's row for the signature, and the name of the rule that gives it"""
+    from position import n_consistent_assignments, one_consistent_assignment
+
+    u1, u2, u3, zero, one = signature
+    if n_consistent_assignments(u1, u2, u3, 3 - one) == 1:
+        asst = one_consistent_assignment(u1, u2, u3, 3 - one)
+        return "terminal", (0, (asst.u1, asst.u2, asst.u3, asst.zero, asst.one + one))
+    # either (u1, u1) or (u2, u2)
+
+    if u2 < 4:                  # cannot be u2
+        rule, x = "u2 < 4", 1
+    elif u1 < 2:                  # cannot be u1
+        rule, x = "u1 < 2", 2
+    elif u1 > 31:
+        rule, x = "u1 > 31", 1
+    elif one == 2:
+        rule, x = "one == 2", 1
+    elif (u1, one) == (2, 0):
+        rule, x = "(u1, one) == (2, 0)", 1
+    elif u1 == 2:
+        rule, x = "u1 == 2", 2
+    else:
+        rule, x = "else", 1
+    x = f"u{x}"
+    return rule, (99, (x, x))
+
+
+def encode(data):
+    """the code for a row's data, as written to _table.py by recompute_table.write_rows"""
+    if isinstance(data[0], str):
+        return COMPARISONS.index("_".join(data))
+    u1, u2, u3, zero, one = data
+    return TERMINAL | (u1 > 0) | (u2 > 0) << 1 | (u3 > 0) << 2
+
+
+class DenseTable:
+    def __init__(self, n, values, codes):
+        self.n = n
+        self.values = values
+        self.codes = codes
+        self.strides = ((n // 2 + 1) * (n // 3 + 1) * 4, (n // 3 + 1) * 4, 4)
+
+    @staticmethod
+    def size(n):
+        return (n + 1) * (n // 2 + 1) * (n // 3 + 1) * 4
+
+    def index(self, u1, u2, u3, one):
+        """index of the row for signature (u1, u2, u3, n - u1 - u2 - u3 - one, one)"""
+        s1, s2, s3 = self.strides
+        return u1 * s1 + u2 // 2 * s2 + u3 // 3 * s3 + one
+
+    def row(self, signature):
+        """(value, code) for the signature"""
+        u1, u2, u3, zero, one = signature
+        i = self.index(u1, u2, u3, one)
+        return self.values[i], self.codes[i]
+
+    @classmethod
+    def from_rows(cls, n, rows):
+        """rows: iterable of (signature, value, data), as written to _table.py (value may be None)"""
+        values = array("B", bytes([UNKNOWN_VALUE])) * cls.size(n)
+        codes = array("B", bytes([ILLEGAL])) * cls.size(n)
+        table = cls(n, values, codes)
+        for (u1, u2, u3, zero, one), value, data in rows:
+            i = table.index(u1, u2, u3, one)
+            values[i] = UNKNOWN_VALUE if value is None else min(value, MAX_VALUE)
+            codes[i] = encode(data)
+        return table
+
+    @classmethod
+    def compile(cls, n, table):
+        """expand a compact table (a module _table*.py's dict) to a table with every row"""
+        from position import n_consistent_assignments
+
+        def rows():
+            for unknown in range(n + 1):
+                for one in range(min(3, n - unknown) + 1):
+                    for u3 in range(0, unknown + 1, 3):
+                        for u2 in range(0, unknown - u3 + 1, 2):
+                            u1 = unknown - u2 - u3
+                            if not n_consistent_assignments(u1, u2, u3, 3 - one):
+                                continue
+                            signature = (u1, u2, u3, n - unknown - one, one)
+                            try:
+                                yield (signature, *table[signature])
+                            except KeyError:
+                                value, data = default_row(signature)
+                                yield signature, (value if value == 0 else None), data
+
+        return cls.from_rows(n, rows())
+
+    def save(self, path, source=NO_SOURCE):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.n, source))
+            f.write(self.values)
+            f.write(self.codes)
+
+    @classmethod
+    def load(cls, path, source=None):
+        """the table saved in path; if source is given, it must be the source_hash it was saved with"""
+        with open(path, "rb") as f:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a dense table")
+        magic, n, saved_source = HEADER.unpack(buffer[: HEADER.size])
+        size = cls.size(n)
+        if magic != MAGIC or len(buffer) != HEADER.size + 2 * size:
+            raise ValueError(f"{path} is not a dense table")
+        if source is not None and saved_source != source:
+            raise ValueError(f"{path} is out of date")
+        values = buffer[HEADER.size : HEADER.size + size]
+        return cls(n, values, buffer[HEADER.size + size :])
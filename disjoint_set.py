@@ -33,3 +33,45 @@ class DisjointSet:
 
     def size(self):
         return self.find()._size
+
+
+class DisjointSets:
+    """
+    disjoint sets of the elements 0, 1, ..., n - 1, stored as flat parent and size lists
+    indexed by element, rather than as one DisjointSet per element; add_empty_set()
+    adds an empty set (like make_set()), as an extra element of size 0
+    """
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self._size = [1] * n
+
+    def add_empty_set(self):
+        x = len(self.parent)
+        self.parent.append(x)
+        self._size.append(0)
+        return x
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = x = parent[parent[x]]
+        return x
+
+    def union(self, x, y):
+        """merge the sets of x and y, returning the root of the merged set"""
+        r1, r2 = self.find(x), self.find(y)
+        if r1 != r2:
+            size = self._size
+            if size[r1] < size[r2]:
+                r1, r2 = r2, r1
+            self.parent[r2] = r1
+            size[r1] += size[r2]
+        return r1
+
+    def equiv(self, x, *others):
+        root = self.find(x)
+        return any(root == self.find(other) for other in others)
+
+    def size(self, x):
+        return self._size[self.find(x)]
@@ -0,0 +1,138 @@
+"""
+find_three_ones for k ones: find_k_ones(compare, n, k) plays the table that k_ones.py writes
+to _table_kK_N.py, with a KPartition, the Partition of find_three_ones generalized to
+signatures (u1, ..., uk, zero, one).
+"""
+
+import importlib
+
+
+def k_table_module(n, k):
+    """name of the module (written by k_ones.py --k k --n n) holding the table for n and k"""
+    return f"_table_k{k}_{n}"
+
+
+_k_tables = {}
+
+
+def load_k_table(n, k):
+    if (n, k) not in _k_tables:
+        name = k_table_module(n, k)
+        try:
+            _k_tables[n, k] = importlib.import_module(name).table
+        except ModuleNotFoundError as e:
+            if e.name != name:
+                raise
+            raise ValueError(f"no table for n={n}, k={k}, run: k_ones.py --k {k} --n {n}") from e
+    return _k_tables[n, k]
+
+
+class KPartition:
+    """
+    the partition of the indices 0, 1, ..., n - 1 into parts, by the comparisons registered
+    so far, for k ones: like find_three_ones.Partition, but with the unknown parts of each size
+    1..k kept as lists of their indices (as in find_three_ones.Parts, since the table only ever
+    compares whole parts), and with the parts too large to be ones (more than k - one
+    elements) merged into the zero part, as k_ones.py does; its row is read from the table,
+    a dict {signature: (value, data)}
+    """
+
+    def __init__(self, n, k, table):
+        self.k = k
+        self.table = table
+        self.unknown_parts_by_size = [None, [[i] for i in range(n)]] + [[] for _ in range(k - 1)]
+        self.ones = []
+        self.zero_index = None
+        self._signature = [n] + [0] * (k + 1)
+        self._row = table[tuple(self._signature)]
+
+    def _remove(self, size):
+        self._signature[size - 1] -= size
+        return self.unknown_parts_by_size[size].pop()
+
+    def _known(self, part, is_one):
+        if is_one:
+            self.ones += part
+            self._signature[-1] += len(part)
+        else:
+            if self.zero_index is None:
+                self.zero_index = part[0]
+            self._signature[-2] += len(part)
+
+    def _add(self, part):
+        size = len(part)
+        if size > self.k - len(self.ones):
+            self._known(part, False)
+        else:
+            self.unknown_parts_by_size[size].append(part)
+            self._signature[size - 1] += size
+
+    def _merge_large(self):
+        """merge the unknown parts too large to be ones into the zero part"""
+        for size in range(self.k - len(self.ones) + 1, self.k + 1):
+            while self.unknown_parts_by_size[size]:
+                self._known(self._remove(size), False)
+
+    def value(self):
+        return self._row[0]
+
+    def done(self):
+        return not isinstance(self._row[1][0], str)
+
+    def _kind(self, kind):
+        """the size of the unknown parts of kind, or the kind (zero or one)"""
+        return int(kind[1:]) if kind[0] == "u" else kind
+
+    def indices_to_compare(self):
+        """the indices to compare (an index from each of the two parts to compare)"""
+        assert not self.done()
+        a, b = map(self._kind, self._row[1])
+        parts = self.unknown_parts_by_size
+        if b == "zero":
+            return parts[a][-1][0], self.zero_index
+        if b == "one":
+            return parts[a][-1][0], self.ones[0]
+        return parts[a][-1][0], parts[b][-1 if a != b else -2][0]
+
+    def register_comparison(self, i, j, result):
+        """register the result of comparing the indices from indices_to_compare"""
+        a, b = map(self._kind, self._row[1])
+        p1 = self._remove(a)
+        if b == "zero":
+            self._known(p1, result == 1)
+        elif b == "one":
+            self._known(p1, result == 0)
+        else:
+            p2 = self._remove(b)
+            if result == 0:
+                self._add(p1 + p2)
+            else:
+                self._known(p1, result == 1)
+                self._known(p2, result == -1)
+        self._merge_large()
+        self._row = self.table[tuple(self._signature)]
+
+    def solution(self):
+        assert self.done()
+        ones = list(self.ones)
+        for size in range(1, self.k + 1):
+            if self._row[1][size - 1]:
+                for part in self.unknown_parts_by_size[size]:
+                    ones += part
+        assert len(ones) == self.k, ones
+        return ones
+
+
+def find_k_ones(compare, n, k):
+    """
+    the indices of the k ones in an n-element 0/1 array, found by comparisons, with the table
+    for n and k written by k_ones.py
+    """
+    partition = KPartition(n, k, load_k_table(n, k))
+
+    while not partition.done():
+        i, j = partition.indices_to_compare()
+        result = compare(i, j)
+        partition.register_comparison(i, j, result)
+
+    return partition.solution()
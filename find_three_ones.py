@@ -1,49 +1,244 @@
 #!/usr/bin/env python3
 
+import importlib
 import itertools
+import os
 from collections import defaultdict, namedtuple
 
-from _table import table
-from disjoint_set import make_set
-from position import Position
+import dense_table
+from dense_table import COMPARED, COMPARISONS, ONE_SIZES, TERMINAL, DenseTable, source_hash
+from disjoint_set import DisjointSets
+from state_machine import StateMachine, state_machine
+
+
+# what the algorithm minimizes (see recompute_table.solve_numpy)
+OBJECTIVES = ("worst", "expected", "worst-expected")
+
+
+def _suffix(n, objective):
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, not {objective!r}")
+    return ("" if objective == "worst" else "_" + objective.replace("-", "_")) + (
+        "" if n == 100 else f"_{n}"
+    )
+
+
+def table_module(n, objective="worst"):
+    """
+    name of the module (written by recompute_table.py --n n --objective objective)
+    holding the table for n
+    """
+    return f"_table{_suffix(n, objective)}"
+
+
+def rounds_module(n, p, objective="worst"):
+    """name of the module (written by recompute_table.py ... --rounds p) holding the rounds table"""
+    return f"_rounds_p{p}{_suffix(n, objective)}"
+
+
+def machine_file(n, objective="worst"):
+    """name of the file (written by recompute_table.py ... --machine) holding the state machine"""
+    return f"_machine{_suffix(n, objective)}.bin"
+
+
+_tables = {}
+
+
+def load_table(n, objective="worst"):
+    """
+    the DenseTable for n, read from _table*.bin if recompute_table.py --dense wrote one,
+    else the RangeTable (which is looked up like a DenseTable) in _table*.ranges if
+    recompute_table.py --ranges wrote one, else compiled from the compact table in _table*.py
+    (see _compiled_table); the .bin and .ranges files are looked for beside the _table*.py
+    found on sys.path, and only used if they were saved from it as it is now (see
+    dense_table.source_hash)
+
+    Tables are loaded on first use rather than when this module is imported.
+    """
+    if (n, objective) not in _tables:
+        name = table_module(n, objective)
+        origin = _table_source(n, objective)
+        table = _saved_table(os.path.splitext(origin)[0])
+        _tables[n, objective] = table if table is not None else _compiled_table(n, name, origin)
+    return _tables[n, objective]
+
+
+def _table_source(n, objective):
+    """the path of the _table*.py for n, found on sys.path as an import would"""
+    import importlib.util
+
+    spec = importlib.util.find_spec(table_module(n, objective))
+    if spec is None:
+        raise ValueError(
+            f"no table for n={n}, objective={objective}, run: "
+            f"recompute_table.py --n {n} --objective {objective}"
+        )
+    return spec.origin
+
+
+def _saved_table(path):
+    """the table in path.bin, else in path.ranges, if it is up to date with path.py, else None"""
+    if not os.path.exists(f"{path}.py"):
+        return None
+    source = source_hash(f"{path}.py")
+    try:
+        return DenseTable.load(f"{path}.bin", source)
+    except (OSError, ValueError):
+        pass
+    if os.path.exists(f"{path}.ranges"):
+        from range_table import RangeTable
+
+        try:
+            return RangeTable.load(f"{path}.ranges", source)
+        except ValueError:
+            pass
+    return None
+
+
+def _compiled_table(n, name, origin):
+    """
+    DenseTable.compile of the compact table in module name (in the file origin), cached in a
+    file in __pycache__ whose name contains a hash of the sources of that module,
+    dense_table.py and position.py (so that the cached file is only used while none of them
+    has changed)
+    """
+    import hashlib
+    import importlib.util
+
+    key = hashlib.sha256()
+    for source in (origin, dense_table.__file__, importlib.util.find_spec("position").origin):
+        with open(source, "rb") as f:
+            key.update(f.read())
+    cache = os.path.join(os.path.dirname(origin), "__pycache__", f"{name}.{key.hexdigest()[:16]}.bin")
+    try:
+        return DenseTable.load(cache)
+    except (OSError, ValueError):
+        pass
+
+    table = DenseTable.compile(n, importlib.import_module(name).table)
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        tmp = f"{cache}.{os.getpid()}"
+        table.save(tmp)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return table
+
+
+_rounds_tables = {}
+
+
+def load_rounds_table(n, p, objective="worst"):
+    if (n, p, objective) not in _rounds_tables:
+        name = rounds_module(n, p, objective)
+        try:
+            _rounds_tables[n, p, objective] = importlib.import_module(name).table
+        except ModuleNotFoundError as e:
+            if e.name != name:
+                raise
+            raise ValueError(
+                f"no rounds table for n={n}, p={p}, objective={objective}, run: "
+                f"recompute_table.py --n {n} --rounds {p} --objective {objective}"
+            ) from e
+    return _rounds_tables[n, p, objective]
+
+
+_machines = {}
+
+
+def load_machine(n, objective="worst"):
+    """
+    the StateMachine for n, read from _machine*.bin if recompute_table.py --machine wrote one
+    from the _table*.py beside it (see load_table) as it is now, else built from the table
+    for n
+    """
+    if (n, objective) not in _machines:
+        origin = _table_source(n, objective)
+        path = os.path.join(os.path.dirname(origin), machine_file(n, objective))
+        try:
+            machine = StateMachine.load(path, source_hash(origin))
+        except (OSError, ValueError):
+            machine = state_machine(load_table(n, objective))
+        _machines[n, objective] = machine
+    return _machines[n, objective]
 
 
 class Partition:
-    def __init__(self, indices):
-        self.parts = {i: make_set(i) for i in indices}
+    """
+    the partition of the indices 0, 1, ..., n - 1 (indices must be range(n)) into parts,
+    by the comparisons registered so far; each part is named by its root in self.sets
+    """
+
+    _disjoint_sets = DisjointSets
+
+    def __init__(self, indices, table):
+        self.table = table
+        n = len(indices)
+        self.sets = self._disjoint_sets(n)
         self.unknown_parts_by_size = defaultdict(set)
-        self.unknown_parts_by_size[1] = set(self.parts.values())
+        self.unknown_parts_by_size[1] = set(indices)
 
-        self.zero_part = make_set()
-        self.one_part = make_set()
+        self.zero_part = self.sets.add_empty_set()
+        self.one_part = self.sets.add_empty_set()
         self.known_parts = {-1: self.zero_part, 1: self.one_part}
 
+        # the indices in each unknown part and in the one part, by root, and some zero index
+        self.members = {i: [i] for i in indices}
+        self.members[self.one_part] = []
+        self.zero_index = None
+
+        # the current signature's row in the table, kept up to date by _union
+        s1, s2, s3 = table.strides
+        self._strides = {1: s1, 2: s2, 3: s3}
+        self._row = n * s1
+        self._n_one = 0
+        self._code = table.codes[self._row]
+
     def equiv(self, i, j):
-        return self.parts[i].equiv(self.parts[j])
+        return self.sets.equiv(i, j)
 
     def _known(self, part):
-        return part.equiv(self.zero_part, self.one_part)
+        return self.sets.equiv(part, self.zero_part, self.one_part)
+
+    def _discard(self, p):
+        size = self.sets.size(p)
+        parts = self.unknown_parts_by_size[size]
+        if p in parts:
+            parts.remove(p)
+            self._row -= self._strides.get(size, 0)
 
     def _union(self, p1, p2):
-        p1, p2 = p1.find(), p2.find()
-        if not p1.equiv(p2):
+        sets = self.sets
+        p1, p2 = sets.find(p1), sets.find(p2)
+        if p1 != p2:
             for p in (p1, p2):
-                self.unknown_parts_by_size[p.size()].discard(p)
+                self._discard(p)
 
-            p1.union(p2)
-            p1 = p1.find()
-            if not self._known(p1):
-                self.unknown_parts_by_size[p1.size()].add(p1)
+            members = self.members.pop(p1, []) + self.members.pop(p2, [])
+            p1 = sets.union(p1, p2)
+            if p1 == sets.find(self.zero_part):
+                if self.zero_index is None and members:
+                    self.zero_index = members[0]
+            else:
+                self.members[p1] = members
+                if not self._known(p1):
+                    self.unknown_parts_by_size[sets.size(p1)].add(p1)
+                    self._row += self._strides.get(sets.size(p1), 0)
+
+            n_one = sets.size(self.one_part)
+            self._row += n_one - self._n_one
+            self._n_one = n_one
 
     def register_comparison(self, i, j, result):
-        p1, p2 = self.parts[i], self.parts[j]
         if result == 0:
-            self._union(p1, p2)
-            if p1.size() > 3:
-                self._union(self.zero_part, p1)
+            self._union(i, j)
+            if self.sets.size(i) > 3:
+                self._union(self.zero_part, i)
         else:
-            self._union(self.known_parts[result], p1)
-            self._union(self.known_parts[-result], p2)
+            self._union(self.known_parts[result], i)
+            self._union(self.known_parts[-result], j)
+        self._code = self.table.codes[self._row]
 
     def parts_w_size(self, size, n=None):
         if n == 0:
@@ -52,52 +247,30 @@ class Partition:
         return iterator if n is None else itertools.islice(iterator, n)
 
     def parts_w_size_reps(self, size, n=None):
-        return (p.i for p in self.parts_w_size(size, n))
+        # (the root of an unknown part is one of its indices)
+        return self.parts_w_size(size, n)
 
     def _signature(self):
         return (
             len(self.unknown_parts_by_size[1]),
             2 * len(self.unknown_parts_by_size[2]),
             3 * len(self.unknown_parts_by_size[3]),
-            self.zero_part.size(),
-            self.one_part.size(),
+            self.sets.size(self.zero_part),
+            self.sets.size(self.one_part),
         )
 
     def _table_row(self):
-        sig = self._signature()
-        try:
-            return table[sig]
-        except KeyError:
-            posn = Position(*sig)
-            if posn.n_consistent_assignments == 1:
-                return (0, tuple(posn.one_consistent_assignment.values))
-            # either (u1, u1) or (u2, u2)
-
-            if posn.u2 < 4:                  # cannot be u2
-                x = 1
-            elif posn.u1 < 2:                  # cannot be u1
-                x = 2
-            elif posn.u1 > 31:
-                x = 1
-            elif posn.one == 2:
-                x = 1
-            elif (posn.u1, posn.one) == (2, 0):
-                x = 1
-            elif posn.u1 == 2:
-                x = 2
-            else:
-                x = 1
-            x = f"u{x}"
-            return (99, (x, x))
+        """(value, code) from the DenseTable"""
+        return self.table.values[self._row], self._code
 
     def _data(self):
-        return self._table_row()[1]
+        return COMPARED[self._code]
 
     def value(self):
-        return self._table_row()[0]
+        return self.table.values[self._row]
 
     def done(self):
-        return self.value() == 0
+        return self._code >= TERMINAL
 
     def indices_to_compare(self):
         assert not self.done()
@@ -106,9 +279,10 @@ class Partition:
             to_compare = self._data()
             for i, ui in zip(range(1, 4), ("u1", "u2", "u3")):
                 yield from self.parts_w_size_reps(i, to_compare.count(ui))
-            for p, name in zip((self.zero_part, self.one_part), ("zero", "one")):
-                if to_compare.count(name):
-                    yield p
+            if "zero" in to_compare:
+                yield self.zero_index
+            if "one" in to_compare:
+                yield self.members[self.sets.find(self.one_part)][0]
 
         indices = tuple(indices())
         assert len(indices) == 2, indices
@@ -117,22 +291,26 @@ class Partition:
     def solution(self):
         assert self.done()
 
-        parts = self.parts.values()
-        soln = self._data()
-        sizes = tuple(s for s in range(1, 4) if soln[s - 1])
-        ones = tuple(
-            p.i
-            for p in parts
-            if p.equiv(self.one_part) or (p.size() in sizes and not self._known(p))
+        sizes = ONE_SIZES[self._code]
+        ones = tuple(self.members[self.sets.find(self.one_part)]) + tuple(
+            i for size in sizes for p in self.unknown_parts_by_size[size] for i in self.members[p]
         )
 
-        assert len(ones) == 3, (ones, self._data())
+        assert len(ones) == 3, (ones, sizes)
         return ones
 
 
-def find_three_ones(compare):
-    indices = range(100)
-    partition = Partition(indices)
+def find_three_ones(compare, n=100, objective="worst", stats=None):
+    """
+    stats: if not None, a partition_stats.PartitionStats in which to count what the solve does
+    """
+    indices = range(n)
+    if stats is None:
+        partition = Partition(indices, load_table(n, objective))
+    else:
+        from partition_stats import InstrumentedPartition
+
+        partition = InstrumentedPartition(indices, load_table(n, objective), stats)
 
     while not partition.done():
         i, j = partition.indices_to_compare()
@@ -140,3 +318,273 @@ def find_three_ones(compare):
         partition.register_comparison(i, j, result)
 
     return partition.solution()
+
+
+async def find_three_ones_async(compare, n=100, objective="worst"):
+    """find_three_ones for a coroutine function compare, e.g. one that queries a remote service"""
+    indices = range(n)
+    partition = Partition(indices, load_table(n, objective))
+
+    while not partition.done():
+        i, j = partition.indices_to_compare()
+        result = await compare(i, j)
+        partition.register_comparison(i, j, result)
+
+    return partition.solution()
+
+
+async def find_three_ones_many(compares, n=100, limit=None, objective="worst"):
+    """
+    run find_three_ones_async(compare, n, objective) concurrently for each compare in compares,
+    with at most limit of them in progress at a time (if given); returns their solutions
+    """
+    import asyncio
+
+    if limit is None:
+        return await asyncio.gather(
+            *(find_three_ones_async(compare, n, objective) for compare in compares)
+        )
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def solve(compare):
+        async with semaphore:
+            return await find_three_ones_async(compare, n, objective)
+
+    return await asyncio.gather(*(solve(compare) for compare in compares))
+
+
+# the kinds of parts compared by each comparison code: size 1, 2 or 3, or ZERO or ONE
+ZERO, ONE = 0, 4
+KINDS = tuple(
+    tuple({"u1": 1, "u2": 2, "u3": 3, "zero": ZERO, "one": ONE}[kind] for kind in compared)
+    for compared in COMPARED
+)
+
+
+class Parts:
+    """
+    a simpler partition, for algorithms that only ever compare whole parts: a stack of the
+    unknown parts of each size (each a list of its indices), the ones, and some zero index
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.by_size = [None, [[i] for i in range(n)], [], []]
+        self.ones = []
+        self.zero = None
+
+    def signature(self):
+        u1, u2, u3 = (size * len(self.by_size[size]) for size in (1, 2, 3))
+        return (u1, u2, u3, self.n - u1 - u2 - u3 - len(self.ones), len(self.ones))
+
+    def take(self, a, b):
+        """
+        remove a part of kind a and one of kind b (see KINDS), to compare;
+        returns them (ZERO or ONE for the known parts) and the indices to compare
+        """
+        p1 = self.by_size[a].pop()
+        if b == ZERO:
+            return p1, b, p1[0], self.zero
+        if b == ONE:
+            return p1, b, p1[0], self.ones[0]
+        p2 = self.by_size[b].pop()
+        return p1, p2, p1[0], p2[0]
+
+    def settle(self, p1, p2, result):
+        """put back parts p1 and p2 from take, given the result of comparing them"""
+        if p2 == ZERO:
+            self._known(p1, result == 1)
+        elif p2 == ONE:
+            self._known(p1, result == 0)
+        elif result == 0:
+            p1 += p2
+            if len(p1) <= 3:
+                self.by_size[len(p1)].append(p1)
+            else:
+                self._known(p1, False)
+        else:
+            self._known(p1, result == 1)
+            self._known(p2, result == -1)
+
+    def _known(self, part, is_one):
+        if is_one:
+            self.ones += part
+        elif self.zero is None:
+            self.zero = part[0]
+
+    def solution(self, sizes):
+        """the ones, given that the unknown parts of the given sizes are ones"""
+        ones = list(self.ones)
+        for size in sizes:
+            for p in self.by_size[size]:
+                ones += p
+        assert len(ones) == 3, ones
+        return tuple(ones)
+
+
+def find_three_ones_machine(compare, n=100, objective="worst"):
+    """
+    same as find_three_ones, but walks the state machine for n (see load_machine),
+    keeping just a stack of the unknown parts of each size instead of a Partition
+    (this is Parts, inlined, as this loop is the fastest way to run the algorithm)
+    """
+    machine = load_machine(n, objective)
+    codes, transitions = machine.codes, machine.transitions
+    parts = [None, [[i] for i in range(n)], [], []]
+    ones = []
+    zero = None
+
+    state = 0
+    while (code := codes[state]) < TERMINAL:
+        a, b = KINDS[code]
+        p1 = parts[a].pop()
+        if b == ZERO:
+            p2 = None
+            result = compare(p1[0], zero)
+            p1_is_one = result == 1
+        elif b == ONE:
+            p2 = None
+            result = compare(p1[0], ones[0])
+            p1_is_one = result == 0
+        else:
+            p2 = parts[b].pop()
+            result = compare(p1[0], p2[0])
+            p1_is_one = result == 1
+        state = transitions[3 * state + result + 1]
+
+        if p2 is not None and result == 0:
+            p1 += p2
+            if len(p1) <= 3:
+                parts[len(p1)].append(p1)
+            elif zero is None:
+                zero = p1[0]
+        else:
+            if p1_is_one:
+                ones += p1
+            elif zero is None:
+                zero = p1[0]
+            if p2 is not None:
+                if p1_is_one:
+                    zero = p2[0] if zero is None else zero
+                else:
+                    ones += p2
+
+    for size in ONE_SIZES[code]:
+        for p in parts[size]:
+            ones += p
+    assert len(ones) == 3, ones
+    return tuple(ones)
+
+
+def find_three_ones_rounds(compare_round, n=100, p=2, objective="worst"):
+    """
+    find the ones making up to p comparisons at a time, in as few rounds as possible
+    (see recompute_table.py --rounds): compare_round is given a list of (i, j) pairs
+    and returns the list of the results of comparing each i to its j
+    """
+    table = load_rounds_table(n, p, objective)
+    parts = Parts(n)
+
+    while (row := table[parts.signature()])[0] != 0:
+        taken = [parts.take(*KINDS[COMPARISONS.index(comparison)]) for comparison in row[1]]
+        results = compare_round([(i, j) for _, _, i, j in taken])
+        for (p1, p2, _, _), result in zip(taken, results):
+            parts.settle(p1, p2, result)
+
+    return parts.solution(tuple(s for s in range(1, 4) if row[1][s - 1]))
+
+
+def find_three_ones_batch(X, chunk=1 << 16, objective="worst"):
+    """
+    find_three_ones for each row of the (m, n) 0/1 numpy array X, comparing in lockstep:
+    at each step, the rows whose state machine (see find_three_ones_machine) is in a state
+    with the same comparison code are advanced together, with array operations.
+    Returns an (m, 3) array whose row k holds the indices of the ones in X[k], sorted.
+    """
+    import numpy as np
+
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError(f"expected an (m, n) array, got shape {X.shape}")
+    m, n = X.shape
+    machine = load_machine(n, objective)
+    codes = np.frombuffer(machine.codes, dtype=np.uint8)
+    transitions = np.asarray(machine.transitions, dtype=np.int32)
+    index = np.int16 if n < 1 << 15 else np.int32
+
+    ones = np.empty((m, 3), dtype=index)
+    for start in range(0, m, chunk):
+        x = X[start : start + chunk].astype(np.int8)
+        k = len(x)
+        rows = np.arange(k)
+
+        # stacks[size][row, :counts[size][row]] are the unknown parts of that size,
+        # each an array of its indices
+        stacks = [None] + [np.zeros((k, n // size, size), dtype=index) for size in (1, 2, 3)]
+        stacks[1][:, :, 0] = np.arange(n)
+        counts = [None, np.full(k, n), np.zeros(k, dtype=np.intp), np.zeros(k, dtype=np.intp)]
+        found = np.zeros((k, 3), dtype=index)
+        n_found = np.zeros(k, dtype=np.intp)
+        zero = np.full(k, -1, dtype=index)
+        state = np.zeros(k, dtype=np.int32)
+
+        def pop(size, rows):
+            counts[size][rows] -= 1
+            return stacks[size][rows, counts[size][rows]]
+
+        def push(size, rows, part):
+            stacks[size][rows, counts[size][rows]] = part
+            counts[size][rows] += 1
+
+        def to_one(rows, part):
+            for t in range(part.shape[1]):
+                found[rows, n_found[rows] + t] = part[:, t]
+            n_found[rows] += part.shape[1]
+
+        def to_zero(rows, part):
+            zero[rows] = np.where(zero[rows] < 0, part[:, 0], zero[rows])
+
+        while True:
+            code = codes[state]
+            live = code < TERMINAL
+            if not live.any():
+                break
+            for c in np.unique(code[live]):
+                r = rows[code == c]
+                a, b = KINDS[c]
+                p1 = pop(a, r)
+                if b == ZERO:
+                    result = x[r, p1[:, 0]] - x[r, zero[r]]
+                    is_one = result == 1
+                    to_one(r[is_one], p1[is_one])
+                    to_zero(r[~is_one], p1[~is_one])
+                elif b == ONE:
+                    result = x[r, p1[:, 0]] - x[r, found[r, 0]]
+                    is_one = result == 0
+                    to_one(r[is_one], p1[is_one])
+                    to_zero(r[~is_one], p1[~is_one])
+                else:
+                    p2 = pop(b, r)
+                    result = x[r, p1[:, 0]] - x[r, p2[:, 0]]
+                    equal, greater, less = result == 0, result == 1, result == -1
+                    merged = np.concatenate((p1[equal], p2[equal]), axis=1)
+                    if a + b <= 3:
+                        push(a + b, r[equal], merged)
+                    else:
+                        to_zero(r[equal], merged)
+                    to_one(r[greater], p1[greater])
+                    to_zero(r[greater], p2[greater])
+                    to_one(r[less], p2[less])
+                    to_zero(r[less], p1[less])
+                state[r] = transitions[3 * state[r] + result + 1]
+
+        for c in np.unique(code):
+            r = rows[code == c]
+            for size in ONE_SIZES[c]:
+                for t in range(3 // size):
+                    has = counts[size][r] > t
+                    to_one(r[has], stacks[size][r[has], t])
+        assert (n_found == 3).all()
+        ones[start : start + chunk] = np.sort(found, axis=1)
+    return ones
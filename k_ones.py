@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+"""
+The game of recompute_table.py for k ones rather than three (for k up to about 8): the
+signatures and comparisons are generated for k instead of listed by hand, and the solver
+only solves the signatures it needs.
+
+A signature is (u1, ..., uk, zero, one), where us is the number of unknown elements in parts
+of size s, and zero and one are the numbers of elements known to be zero and one.  A part
+with more elements than there are ones left to find (k - one) can only be zeros, so it is
+merged into the zero part at once (as recompute_table does with the parts of more than 3
+elements, but also, e.g., with the parts of size 3 once a one has been found).
+
+The number of signatures grows like n^k, so rather than solving all of them bottom-up,
+solve(n, k) searches top-down from the start, with a bound: it gives up on a comparison as
+soon as one of its results is known to need at least as many more comparisons as the best
+comparison found so far, and remembers a lower bound on the value of each signature it gives
+up on.  It solves exactly only a small part of the signatures (e.g. about 1,000 of the
+117,000 for k = 3, n = 100), which include all those reachable in optimal play.
+
+e.g. python k_ones.py --k 5 --n 40 writes the table for find_k_ones to _table_k5_40.py
+"""
+
+import argparse
+import bisect
+import itertools
+import math
+import sys
+import time
+
+from find_k_ones import k_table_module
+from position import FIELD_BITS, FIELD_MASK
+
+
+def comparison_edges(k):
+    """
+    the comparisons between kinds of parts for k ones, in the form of
+    recompute_table.SIGNATURE_EDGES (for k = 3, the same edges, in the same order):
+    (comparison, priority, lowerbounds or None, ((comparison_result, delta), ...))
+    """
+    zero, one = k, k + 1
+
+    def delta(*changes):
+        d = [0] * (k + 2)
+        for field, change in changes:
+            d[field] += change
+        return tuple(d)
+
+    def lowerbounds(field):
+        return delta((field, 1))
+
+    edges = []
+    pairs = [(s, s) for s in range(1, k + 1)]
+    pairs += itertools.combinations(range(1, k + 1), 2)
+    for s, t in pairs:
+        parts = ((s - 1, -s), (t - 1, -t))
+        merged = s + t - 1 if s + t <= k else zero
+        rs = [(0, delta(*parts, (merged, s + t))), (1, delta(*parts, (zero, t), (one, s)))]
+        if s != t:
+            rs.append((-1, delta(*parts, (zero, s), (one, t))))
+        edges.append((f"u{s}_u{t}", None, rs))
+    for s in range(1, k + 1):
+        part = (s - 1, -s)
+        edges.append(
+            (f"u{s}_zero", lowerbounds(zero), [(0, delta(part, (zero, s))), (1, delta(part, (one, s)))])
+        )
+    for s in range(1, k + 1):
+        part = (s - 1, -s)
+        edges.append(
+            (f"u{s}_one", lowerbounds(one), [(0, delta(part, (one, s))), (-1, delta(part, (zero, s)))])
+        )
+    return tuple(
+        (comparison, priority, bounds, tuple(rs)) for priority, (comparison, bounds, rs) in enumerate(edges)
+    )
+
+
+def count_assignments(parts, total):
+    """
+    the number of assignments of total ones to the unknown parts, where parts[s - 1] is the
+    number of unknown elements in parts of size s: the coefficient of x^total in the product
+    of (1 + x^s)^(parts[s - 1] / s)
+    """
+    if total < 0:
+        return 0
+    ways = [1] + [0] * total
+    for s, u in enumerate(parts, 1):
+        c = u // s
+        if c and s <= total:
+            ways = [
+                sum(math.comb(c, j) * ways[t - s * j] for j in range(min(c, t // s) + 1))
+                for t in range(total + 1)
+            ]
+    return ways[total]
+
+
+def one_assignment(parts, total):
+    """
+    the sizes of the unknown parts that are ones, if exactly one assignment of total ones is
+    consistent (in which case, all the parts of such a size are ones)
+    """
+    sizes = [s for s, u in enumerate(parts, 1) if u]
+    for n_sizes in range(len(sizes) + 1):
+        for ones in itertools.combinations(sizes, n_sizes):
+            if sum(parts[s - 1] for s in ones) == total:
+                return ones
+    return None
+
+
+class Signatures:
+    """
+    the signatures for k ones packed into ints, FIELD_BITS bits per field, as in
+    position.pack (with k + 2 fields), and the comparisons between them
+    """
+
+    def __init__(self, k):
+        self.k = k
+        b = FIELD_BITS
+        self._guards = sum(1 << (b * field + b - 1) for field in range(k + 2))
+        self._one_shift = b * (k + 1)
+        self._zero_shift = b * k
+        # the fields of the parts too large to be ones, by the number of ones found
+        self._too_large = [
+            sum(FIELD_MASK << (b * (s - 1)) for s in range(k - one + 1, k + 1)) for one in range(k + 1)
+        ]
+        self.edges = tuple(
+            (
+                comparison,
+                0 if bounds is None else self.pack(bounds),
+                tuple(
+                    (r, self.pack(delta), self.pack(tuple(max(0, -d) for d in delta)))
+                    for r, delta in rs
+                ),
+            )
+            for comparison, _, bounds, rs in comparison_edges(k)
+        )
+        self._counts = {}
+
+    def pack(self, signature):
+        return sum(field << (FIELD_BITS * i) for i, field in enumerate(signature))
+
+    def unpack(self, packed):
+        return tuple((packed >> (FIELD_BITS * i)) & FIELD_MASK for i in range(self.k + 2))
+
+    def start(self, n):
+        return self.pack((n,) + (0,) * (self.k + 1))
+
+    def at_least(self, packed, bound):
+        """as position.at_least"""
+        return ((packed | self._guards) - bound) & self._guards == self._guards
+
+    def count(self, packed):
+        """the number of assignments of the ones left to find that are consistent with packed"""
+        try:
+            return self._counts[packed]
+        except KeyError:
+            signature = self.unpack(packed)
+            c = self._counts[packed] = count_assignments(signature[: self.k], self.k - signature[-1])
+            return c
+
+    def child(self, packed, delta, needs):
+        """the legal signature that packed leads to by adding delta, or None"""
+        if not self.at_least(packed, needs):
+            return None
+        child = packed + delta
+        one = child >> self._one_shift
+        if one > self.k:
+            return None
+        large = child & self._too_large[one]
+        if large:
+            child -= large
+            while large:
+                child += (large & FIELD_MASK) << self._zero_shift
+                large >>= FIELD_BITS
+        return child if self.count(child) else None
+
+    def children(self, packed, rs):
+        """the (comparison_result, child) pairs for the legal children by the results rs"""
+        children = ((r, self.child(packed, delta, needs)) for r, delta, needs in rs)
+        return [(r, child) for r, child in children if child is not None]
+
+
+def solve(n, k):
+    """
+    {signature: (value, comparison)} for the signatures with n elements that the search
+    solves exactly (see the module docstring), with packed signatures (see Signatures);
+    comparison is None for terminal signatures
+    """
+    signatures = Signatures(k)
+    solved = {}
+    at_least = {}
+    # a comparison has at most 3 results, so a signature with c consistent assignments
+    # needs at least log_3(c) comparisons
+    powers = [3**v for v in range(2 * n + 2)]
+    edges, at_least_fields, child_of = signatures.edges, signatures.at_least, signatures.child
+
+    def search(posn, bound):
+        """the value of posn if it is less than bound, else a lower bound that is at least bound"""
+        try:
+            return solved[posn][0]
+        except KeyError:
+            pass
+        count = signatures.count(posn)
+        if count == 1:
+            solved[posn] = 0, None
+            return 0
+        lowerbound = at_least.get(posn) or max(1, bisect.bisect_left(powers, count))
+        if lowerbound >= bound:
+            return lowerbound
+        best, best_comparison = bound, None
+        for comparison, bounds, rs in edges:
+            if not at_least_fields(posn, bounds):
+                continue
+            worst = None
+            for _, delta, needs in rs:
+                child = child_of(posn, delta, needs)
+                if child is not None:
+                    worst = max(worst or 0, search(child, best - 1))
+                    if worst >= best - 1:
+                        break
+            else:
+                if worst is not None:
+                    best, best_comparison = 1 + worst, comparison
+                    if best <= lowerbound:
+                        break
+        if best_comparison is None:
+            at_least[posn] = best
+        else:
+            solved[posn] = best, best_comparison
+        return best
+
+    # (search recurses once per comparison, and every comparison decreases the number of
+    # unknown elements or of unknown parts)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * n + 100))
+    search(signatures.start(n), math.inf)
+    return solved
+
+
+def solution_rows(solution, n, k):
+    """
+    the rows (signature, value, data) of the table for the signatures reachable from the
+    start in the optimal play in solution, in breadth-first order; data is the pair of kinds
+    of parts to compare, or for a terminal signature, as in recompute_table.solution_rows,
+    (a1, ..., ak, 0, one), where as is the number of unknown elements in parts of size s
+    that are ones
+    """
+    signatures = Signatures(k)
+    edges = {comparison: rs for comparison, _, rs in signatures.edges}
+    start = signatures.start(n)
+    order = [start]
+    visited = {start}
+    for posn in order:
+        value, comparison = solution[posn]
+        signature = signatures.unpack(posn)
+        if comparison is None:
+            ones = one_assignment(signature[:k], k - signature[-1])
+            parts = tuple(signature[s - 1] if s in ones else 0 for s in range(1, k + 1))
+            yield signature, value, (*parts, 0, signature[-1])
+            continue
+        yield signature, value, tuple(comparison.split("_"))
+        for _, child in signatures.children(posn, edges[comparison]):
+            if child not in visited:
+                visited.add(child)
+                order.append(child)
+
+
+def write_rows(rows, file):
+    with open(file, "w") as table:
+        print("table = {", file=table)
+        for posn, value, data in rows:
+            print(f"    {posn}: ({value}, {data}),", file=table)
+        print("}", file=table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="compute the table used by find_k_ones.find_k_ones")
+    parser.add_argument("--k", type=int, default=4, help="number of ones (default 4)")
+    parser.add_argument("--n", type=int, default=50, help="number of elements (default 50)")
+    args = parser.parse_args(argv)
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+    if args.n < args.k:
+        parser.error("--n must be at least --k")
+
+    t = time.perf_counter()
+    solution = solve(args.n, args.k)
+    start = Signatures(args.k).start(args.n)
+    rows = list(solution_rows(solution, args.n, args.k))
+    write_rows(rows, f"{k_table_module(args.n, args.k)}.py")
+    print(
+        f"worst case {solution[start][0]} comparisons; solved {len(solution)} signatures, "
+        f"{len(rows)} reachable, in {time.perf_counter() - t:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
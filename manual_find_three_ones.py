@@ -95,4 +95,5 @@ def find_three_ones(compare):
 ##########################################################################################
 
 
-test_find_three_ones()
+if __name__ == "__main__":
+    test_find_three_ones()
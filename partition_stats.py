@@ -0,0 +1,136 @@
+"""
+Counters and timers for find_three_ones, recorded only when a PartitionStats is passed in
+(find_three_ones(compare, stats=stats)), by an InstrumentedPartition in place of the
+Partition.  Without stats, find_three_ones runs the plain Partition, so this costs nothing.
+
+PartitionStats.exposition() gives the counts in the Prometheus text exposition format.
+
+The rows of the dense table are counted by where they come from: the values recorded in
+the compact table ("table"), or the rule in dense_table.default_rule that fills in a row
+left out of it.  (The rules run when the dense table is compiled, not during solves.)
+"""
+
+import bisect
+import time
+from collections import Counter
+
+from dense_table import TERMINAL, UNKNOWN_VALUE, default_rule
+from disjoint_set import DisjointSets
+from find_three_ones import Partition
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, x):
+        self.counts[bisect.bisect_left(self.bounds, x)] += 1
+        self.sum += x
+        self.count += 1
+
+    def exposition(self, name, help):
+        lines = [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+        cumulative = 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        lines += [f"{name}_sum {self.sum}", f"{name}_count {self.count}"]
+        return lines
+
+
+class PartitionStats:
+    PREFIX = "find_three_ones"
+
+    def __init__(self):
+        self.solves = 0
+        self.unions = 0
+        # (source, rule) -> number of rows read, where source is "table" or "fallback"
+        self.rows = Counter()
+        self.find_path_lengths = Histogram((0, 1, 2, 3, 4, 8))
+        self.step_seconds = Histogram((1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 1e-3))
+
+    def exposition(self):
+        """the stats in the Prometheus text exposition format"""
+        p = self.PREFIX
+        lines = [
+            f"# HELP {p}_solves_total Solves recorded.",
+            f"# TYPE {p}_solves_total counter",
+            f"{p}_solves_total {self.solves}",
+            f"# HELP {p}_rows_total Table rows read, by where the row comes from.",
+            f"# TYPE {p}_rows_total counter",
+        ]
+        for (source, rule), count in sorted(self.rows.items()):
+            labels = f'source="{source}"' + ("" if rule is None else f',rule="{rule}"')
+            lines.append(f"{p}_rows_total{{{labels}}} {count}")
+        lines += [
+            f"# HELP {p}_unions_total Unions of two different parts.",
+            f"# TYPE {p}_unions_total counter",
+            f"{p}_unions_total {self.unions}",
+        ]
+        lines += self.find_path_lengths.exposition(
+            f"{p}_find_path_length", "Parent links followed by DisjointSets.find."
+        )
+        lines += self.step_seconds.exposition(
+            f"{p}_step_seconds",
+            "Time per step in indices_to_compare and register_comparison, "
+            "not counting the comparison (instrumented).",
+        )
+        return "\n".join(lines) + "\n"
+
+
+class CountingSets(DisjointSets):
+    def __init__(self, n, stats):
+        super().__init__(n)
+        self.stats = stats
+
+    def find(self, x):
+        length, root = 0, x
+        while self.parent[root] != root:
+            length, root = length + 1, self.parent[root]
+        self.stats.find_path_lengths.observe(length)
+        return super().find(x)
+
+
+class InstrumentedPartition(Partition):
+    def __init__(self, indices, table, stats):
+        self.stats = stats
+        super().__init__(indices, table)
+        stats.solves += 1
+        self._count_row()
+
+    def _disjoint_sets(self, n):
+        return CountingSets(n, self.stats)
+
+    def _count_row(self):
+        value, code = self.table.values[self._row], self._code
+        if code >= TERMINAL or value == UNKNOWN_VALUE:
+            u1 = self._row // self._strides[1]
+            u2 = self._row % self._strides[1] // self._strides[2] * 2
+            u3 = self._row % self._strides[2] // self._strides[3] * 3
+            signature = (u1, u2, u3, self.table.n - u1 - u2 - u3 - self._n_one, self._n_one)
+            self.stats.rows["fallback", default_rule(signature)[0]] += 1
+        else:
+            self.stats.rows["table", None] += 1
+
+    def _union(self, p1, p2):
+        # (DisjointSets.find, so as not to count these finds)
+        if DisjointSets.find(self.sets, p1) != DisjointSets.find(self.sets, p2):
+            self.stats.unions += 1
+        super()._union(p1, p2)
+
+    # (a step's time is that of indices_to_compare plus that of register_comparison, leaving
+    # out the caller's comparison in between, which may wait on a remote oracle)
+    def indices_to_compare(self):
+        start = time.perf_counter()
+        indices = super().indices_to_compare()
+        self._step_seconds = time.perf_counter() - start
+        return indices
+
+    def register_comparison(self, i, j, result):
+        start = time.perf_counter()
+        super().register_comparison(i, j, result)
+        self.stats.step_seconds.observe(self._step_seconds + time.perf_counter() - start)
+        self._count_row()
@@ -1,5 +1,43 @@
-from dataclasses import asdict, dataclass
-from functools import cache, cached_property
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+# A signature (u1, u2, u3, zero, one) can be packed into one int, FIELD_BITS bits per field
+# (u1 in the lowest), so that adding packed signatures (or deltas, with negative fields)
+# adds them field by field, as long as no field of the sum is negative.  Fields must be
+# less than FIELD_LIMIT = 2 ** (FIELD_BITS - 1), as the top bit of each field is a guard bit
+# for at_least (pack raises ValueError otherwise).
+FIELD_BITS = 16
+FIELD_MASK = (1 << FIELD_BITS) - 1
+FIELD_LIMIT = 1 << (FIELD_BITS - 1)
+GUARDS = sum(1 << (FIELD_BITS * k + FIELD_BITS - 1) for k in range(5))
+
+
+def pack(u1=0, u2=0, u3=0, zero=0, one=0, delta=False):
+    """the packed signature (or, with delta=True, the packed delta, whose fields may be negative)"""
+    # (a field is in range(0, FIELD_LIMIT) iff it has no bit set from FIELD_BITS - 1 up,
+    # negative ints having all of them set)
+    if delta:
+        c = FIELD_LIMIT
+        out_of_range = (u1 + c | u2 + c | u3 + c | zero + c | one + c) >> FIELD_BITS
+    else:
+        out_of_range = (u1 | u2 | u3 | zero | one) >> (FIELD_BITS - 1)
+    if out_of_range:
+        low = -FIELD_LIMIT if delta else 0
+        raise ValueError(
+            f"cannot pack {(u1, u2, u3, zero, one)}: fields must be in range({low}, {FIELD_LIMIT})"
+        )
+    b = FIELD_BITS
+    return u1 + (u2 << b) + (u3 << 2 * b) + (zero << 3 * b) + (one << 4 * b)
+
+
+def unpack(packed):
+    """the fields of a packed signature (with no negative field)"""
+    return tuple((packed >> (FIELD_BITS * k)) & FIELD_MASK for k in range(5))
+
+
+def at_least(packed, bound):
+    """whether every field of packed is at least the same field of bound (neither negative)"""
+    return ((packed | GUARDS) - bound) & GUARDS == GUARDS
 
 
 @dataclass(frozen=True)
@@ -12,16 +50,33 @@ class Delta:
 
     @cached_property
     def values(self):
-        return asdict(self).values()
+        return (self.u1, self.u2, self.u3, self.zero, self.one)
+
+    def __post_init__(self):
+        # (a Position may have negative fields too: the result of an illegal move, see __add__)
+        packed = pack(self.u1, self.u2, self.u3, self.zero, self.one, delta=True)
+        object.__setattr__(self, "packed", packed)
+
+    @cached_property
+    def _needs(self):
+        """packed: a position p with p >= this (as packed) has p + self >= 0"""
+        return pack(*(max(0, -d) for d in self.values))
+
+    def __hash__(self):
+        return hash(self.packed)
 
     def __add__(self, delta):
         assert isinstance(delta, Delta)
+        if self._needs == 0 and at_least(self.packed, delta._needs):
+            return Position.from_packed(self.packed + delta.packed)
         return Position(*(s + d for s, d in zip(self.values, delta.values)))
 
     def __ge__(self, delta):
         if delta is None:
             return True
         assert isinstance(delta, Delta)
+        if delta._needs == 0 == self._needs:
+            return at_least(self.packed, delta.packed)
         return all(s >= d for s, d in zip(self.values, delta.values))
 
     def __repr__(self):
@@ -29,6 +84,15 @@ class Delta:
 
 
 class Position(Delta):
+    @staticmethod
+    @lru_cache(maxsize=1 << 17)
+    def from_packed(packed):
+        """
+        the Position with the packed signature (the same object while it is in the cache,
+        which holds all the signatures for n up to about 100)
+        """
+        return Position(*unpack(packed))
+
     @cached_property
     def components(self):
         return self.u1 + self.u2 // 2 + self.u3 // 3
@@ -51,56 +115,47 @@ class Position(Delta):
     #     return f"({self.u1}, {self.u2}, {self.u3}, {self.zero}, {self.one}, #{self.n_consistent_assignments})"
 
 
-@cache
+# (a, b, c) for each way to make total ones from a size-1, b size-2 and c size-3 parts,
+# in the order one_consistent_assignment prefers them (as many size-1 parts as possible)
+ASSIGNMENTS = (
+    ((0, 0, 0),),
+    ((1, 0, 0),),
+    ((2, 0, 0), (0, 1, 0)),
+    ((3, 0, 0), (1, 1, 0), (0, 0, 1)),
+)
+
+
+def count_assignments(u1, u2, u3, total):
+    """
+    the number of assignments of total ones (at most 3) to the unknown parts:
+    sum of C(u1, a) * C(u2 / 2, b) * C(u3 / 3, c) over the (a, b, c) in ASSIGNMENTS[total]
+    """
+    if u1 < 0 or u2 < 0 or u3 < 0 or not 0 <= total <= 3:
+        return 0
+    if total == 0:
+        return 1
+    if total == 1:
+        return u1
+    if total == 2:
+        return u1 * (u1 - 1) // 2 + u2 // 2
+    return u1 * (u1 - 1) * (u1 - 2) // 6 + u1 * (u2 // 2) + u3 // 3
+
+
 def n_consistent_assignments(u1, u2, u3, total, N=2):
     """
     return min(max(0, N), number of consistent assignments with number of ones equal to total))
     """
+    return max(0, min(N, count_assignments(u1, u2, u3, total)))
+
 
-    def w_or_wout(w1, w2, w3, total_with, total_without):
-        n1 = n_consistent_assignments(w1, w2, w3, total_with, N)
-        assert 0 <= n1 <= N
-        return n1 + n_consistent_assignments(w1, w2, w3, total_without, N - n1)
-
-    return (
-        0
-        if u1 < 0 or u2 < 0 or u3 < 0 or total < 0 or total > 3 or N <= 0
-        else 1
-        if total == 0
-        else 2
-        if u1 > total
-        else w_or_wout(u1 - 1, u2, u3, total - 1, total)  # take first u1, or don't
-        if u1 != 0
-        else w_or_wout(0, u2 - 2, u3, total - 2, total)  # take first u2, or don't
-        if u2 != 0
-        else w_or_wout(0, 0, u3 - 3, total - 3, total)  # take first u3, or don't
-    )
-
-
-@cache
 def one_consistent_assignment(u1, u2, u3, total):
-    def w_or_wout(delta, w1, w2, w3, total_with, total_without):
-        A = one_consistent_assignment(w1, w2, w3, total_with)
-        if A is not None:
-            return A + delta
-        return one_consistent_assignment(w1, w2, w3, total_without)
-
-    asst = (
-        None
-        if u1 < 0 or u2 < 0 or u3 < 0 or total < 0
-        else Delta()
-        if total == 0
-        else Delta(u1=total)
-        if u1 >= total
-        else w_or_wout(Delta(u1=1), u1 - 1, u2, u3, total - 1, total)  # take first u1, or don't
-        if u1 != 0
-        else w_or_wout(Delta(u2=2), 0, u2 - 2, u3, total - 2, total)  # take first u2, or don't
-        if u2 != 0
-        else w_or_wout(Delta(u3=3), 0, 0, u3 - 3, total - 3, total)  # take first u3, or don't
-    )
-    if asst is not None:
-        assert asst.u1 + asst.u2 + asst.u3 == total
-        assert 0 <= asst.u1 <= u1
-        assert 0 <= asst.u2 <= u2
-        assert 0 <= asst.u3 <= u3
-    return asst
+    """
+    the first consistent assignment of total ones (at most 3) in the order of ASSIGNMENTS,
+    as the Delta giving the number of unknown elements of each size that are ones, or None
+    """
+    if u1 < 0 or u2 < 0 or u3 < 0 or not 0 <= total <= 3:
+        return None
+    for a, b, c in ASSIGNMENTS[total]:
+        if a <= u1 and 2 * b <= u2 and 3 * c <= u3:
+            return Delta(u1=a, u2=2 * b, u3=3 * c)
+    return None
@@ -0,0 +1,215 @@
+"""
+A table with a row for every signature (u1, u2, u3, zero, one), like a DenseTable, but
+compressed into ranges: the rows with the same (u1, u2, one) form runs of consecutive u3
+(u3 = 3m, 3m + 3, ...) with the same code, and values in arithmetic progression; and the
+(u1, one) planes form bands of consecutive u2 with the same runs (the last run of each
+reaching to the largest u3, with zero = 0), the values again in arithmetic progression.
+So, e.g., the rows (2, 2, 3m, 95 - 3m, 1): (1, ('u1', 'u2')) of _table.py are one run, in a
+band with the rows for u2 = 4, 6, ...  A signature in no run is ILLEGAL.
+
+RangeTable.compress(n, rows) builds one from the rows of every legal signature, keeping
+only the runs in memory, so that it can stream the rows for large n.  Most of the table's
+size is in the values, which are much less regular than the codes: with values=False, only
+the codes (the algorithm) are stored, and every value is UNKNOWN_VALUE.  Then the number of
+runs grows like n^2 rather than n^3: for n = 100, the 117,000 rows take 2,700 runs (42 KB,
+where the DenseTable takes 700 KB), and for n = 400, 39,000 runs (580 KB, rather than
+86 MB).  (With the values, 9,200 runs for n = 100, and 350,000 runs for n = 400.)
+
+RangeTable.row(signature) finds the row with two binary searches (for the band, then the
+run), and .values and .codes look rows up by their index in the DenseTable for n, so that
+find_three_ones.Partition can play a RangeTable as it does a DenseTable.
+"""
+
+import struct
+from array import array
+from bisect import bisect_right
+
+from dense_table import ILLEGAL, MAX_VALUE, NO_SOURCE, UNKNOWN_VALUE, DenseTable, encode
+
+HEADER = struct.Struct("<4sIIII16s")
+MAGIC = b"F31R"
+# run_stop for a run reaching to the largest u3 of its (u1, u2, one)
+END = 0xFFFF
+# run_value for the runs of rows whose value is not stored
+_UNKNOWN = 0xFFFF
+
+# the arrays of a RangeTable, in the order they are saved: the index of the first band
+# of each (u1, one) plane (and of the first run of each band), by u1 * 4 + one (or band)
+BAND_ARRAYS = (("band_h2", "H"), ("band_last_h2", "H"), ("band_step", "h"), ("band_first_run", "I"))
+RUN_ARRAYS = (("run_start", "H"), ("run_stop", "H"), ("run_code", "B"), ("run_value", "H"), ("run_step", "h"))
+
+
+class _Column:
+    """the values or codes of a RangeTable, indexed like those of the DenseTable for its n"""
+
+    def __init__(self, table, field):
+        self.table = table
+        self.field = field
+
+    def __getitem__(self, i):
+        s1, s2, s3 = self.table.strides
+        u1, rest = divmod(i, s1)
+        h2, rest = divmod(rest, s2)
+        m, one = divmod(rest, s3)
+        return self.table._lookup(u1, h2, m, one)[self.field]
+
+
+def _step(values, previous):
+    """the common difference of values and previous (0 if all are unknown), or None"""
+    if any((value == _UNKNOWN) != (p == _UNKNOWN) for value, p in zip(values, previous)):
+        return None
+    steps = {value - p for value, p in zip(values, previous) if value != _UNKNOWN}
+    if len(steps) > 1:
+        return None
+    return steps.pop() if steps else 0
+
+
+class RangeTable:
+    def __init__(self, n, plane_first, arrays):
+        self.n = n
+        self.strides = DenseTable(n, None, None).strides
+        self.plane_first = plane_first
+        for name, _ in BAND_ARRAYS + RUN_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.values = _Column(self, 0)
+        self.codes = _Column(self, 1)
+
+    def index(self, u1, u2, u3, one):
+        """as DenseTable.index"""
+        s1, s2, s3 = self.strides
+        return u1 * s1 + u2 // 2 * s2 + u3 // 3 * s3 + one
+
+    def row(self, signature):
+        """(value, code) for the signature"""
+        u1, u2, u3, zero, one = signature
+        return self._lookup(u1, u2 // 2, u3 // 3, one)
+
+    def _lookup(self, u1, h2, m, one):
+        plane = u1 * 4 + one
+        lo, hi = self.plane_first[plane], self.plane_first[plane + 1]
+        band = bisect_right(self.band_h2, h2, lo, hi) - 1
+        if band < lo or h2 > self.band_last_h2[band]:
+            return UNKNOWN_VALUE, ILLEGAL
+        lo, hi = self.band_first_run[band], self.band_first_run[band + 1]
+        run = bisect_right(self.run_start, m, lo, hi) - 1
+        if run < lo:
+            return UNKNOWN_VALUE, ILLEGAL
+        stop = self.run_stop[run]
+        if stop == END:
+            stop = (self.n - u1 - 2 * h2 - one) // 3 + 1
+        if m >= stop:
+            return UNKNOWN_VALUE, ILLEGAL
+        value = self.run_value[run]
+        if value == _UNKNOWN:
+            return UNKNOWN_VALUE, self.run_code[run]
+        value += self.run_step[run] * (m - self.run_start[run])
+        value += self.band_step[band] * (h2 - self.band_h2[band])
+        return min(value, MAX_VALUE), self.run_code[run]
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).itemsize * len(getattr(self, name)) for name in self._names())
+
+    @staticmethod
+    def _names():
+        return ["plane_first"] + [name for name, _ in BAND_ARRAYS + RUN_ARRAYS]
+
+    @classmethod
+    def compress(cls, n, rows, values=True):
+        """
+        rows: iterable of (signature, value, data), as for DenseTable.from_rows, for every legal
+        signature, with the rows of each (u1, u2, one) in increasing order of u3 (as in
+        recompute_table.signatures); with values=False, only the codes are kept
+        """
+        # the runs of each (u1, one) plane, by u2 // 2: [start, stop, code, value, step]
+        planes = {}
+        for (u1, u2, u3, zero, one), value, data in rows:
+            code = encode(data)
+            if not values or value is None:
+                value = _UNKNOWN
+            runs = planes.setdefault((u1, one), {}).setdefault(u2 // 2, [])
+            m = u3 // 3
+            if runs and m < runs[-1][1]:
+                raise ValueError(f"{(u1, u2, u3, zero, one)}: rows out of order")
+            if runs and runs[-1][1] == m and runs[-1][2] == code:
+                start, stop, _, start_value, step = run = runs[-1]
+                if value == _UNKNOWN == start_value:
+                    run[1] = m + 1
+                    continue
+                if start_value != _UNKNOWN != value:
+                    if stop - start == 1:
+                        run[1], run[4] = m + 1, value - start_value
+                        continue
+                    if start_value + step * (m - start) == value:
+                        run[1] = m + 1
+                        continue
+            runs.append([m, m + 1, code, value, 0])
+
+        plane_first = array("I")
+        arrays = {name: array(typecode) for name, typecode in BAND_ARRAYS + RUN_ARRAYS}
+        band = None
+        for u1 in range(n + 1):
+            for one in range(4):
+                plane_first.append(len(arrays["band_h2"]))
+                for h2, runs in sorted(planes.get((u1, one), {}).items()):
+                    last_m = (n - u1 - 2 * h2 - one) // 3
+                    shape = [
+                        (start, END if stop == last_m + 1 else stop, code, step)
+                        for start, stop, code, _, step in runs
+                    ]
+                    start_values = [run[3] for run in runs]
+                    if band is not None and band["h2"] == h2 - 1 and band["shape"] == shape:
+                        step = _step(start_values, band["values"])
+                        if step is not None and band["step"] in (None, step):
+                            band.update(h2=h2, values=start_values, step=step)
+                            arrays["band_last_h2"][-1] = h2
+                            arrays["band_step"][-1] = step
+                            continue
+                    band = dict(h2=h2, shape=shape, values=start_values, step=None)
+                    arrays["band_h2"].append(h2)
+                    arrays["band_last_h2"].append(h2)
+                    arrays["band_step"].append(0)
+                    arrays["band_first_run"].append(len(arrays["run_start"]))
+                    for (start, stop, code, step), value in zip(shape, start_values):
+                        arrays["run_start"].append(start)
+                        arrays["run_stop"].append(stop)
+                        arrays["run_code"].append(code)
+                        arrays["run_value"].append(value)
+                        arrays["run_step"].append(step)
+                band = None
+        plane_first.append(len(arrays["band_h2"]))
+        arrays["band_first_run"].append(len(arrays["run_start"]))
+        return cls(n, plane_first, arrays)
+
+    def save(self, path, source=NO_SOURCE):
+        """as DenseTable.save"""
+        with open(path, "wb") as f:
+            f.write(
+                HEADER.pack(MAGIC, self.n, len(self.plane_first), len(self.band_h2), len(self.run_start), source)
+            )
+            for name in self._names():
+                f.write(getattr(self, name))
+
+    @classmethod
+    def load(cls, path, source=None):
+        """as DenseTable.load"""
+        with open(path, "rb") as f:
+            buffer = f.read()
+        if len(buffer) < HEADER.size or buffer[:4] != MAGIC:
+            raise ValueError(f"{path} is not a range table")
+        _, n, n_planes, n_bands, n_runs, saved_source = HEADER.unpack(buffer[: HEADER.size])
+        if source is not None and saved_source != source:
+            raise ValueError(f"{path} is out of date")
+        offset = HEADER.size
+        lengths = dict(plane_first=n_planes, band_first_run=n_bands + 1)
+        columns = [("plane_first", "I")] + list(BAND_ARRAYS + RUN_ARRAYS)
+        arrays = {}
+        for name, typecode in columns:
+            length = lengths.get(name, n_bands if name.startswith("band") else n_runs)
+            arrays[name] = array(typecode)
+            size = arrays[name].itemsize * length
+            arrays[name].frombytes(buffer[offset : offset + size])
+            offset += size
+        if offset != len(buffer):
+            raise ValueError(f"{path} is not a range table for n={n}")
+        return cls(n, arrays.pop("plane_first"), arrays)
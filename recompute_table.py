@@ -1,11 +1,32 @@
 #!/usr/bin/env python3
 
 
-from collections import namedtuple
-from functools import cache, cached_property
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import operator
+import os
 import sys
+import tempfile
+import time
+from collections import defaultdict, namedtuple
+from functools import cache, cached_property, reduce
 
-from position import Position, Delta
+from dense_table import COMPARISONS, DenseTable, default_row, encode, source_hash
+from find_three_ones import OBJECTIVES, machine_file, rounds_module, table_module
+from position import (
+    GUARDS,
+    Delta,
+    Position,
+    n_consistent_assignments,
+    one_consistent_assignment,
+    pack,
+    unpack,
+)
+from solution_memo import SolutionMemo, edges_key
+from state_machine import state_machine
 
 C = namedtuple("C", ["priority", "lowerbounds", "rs"])
 R = namedtuple("R", ["comparison_result", "delta"])
@@ -188,47 +209,1175 @@ class Node:
         return self.__repr__()
 
 
-def dump_alg(start):
-    with open("_table.py", "w") as sys.stdout:
-        with open("_left_out.py", "w") as left_out:
+@cache
+def compact_node(signature):
+    """the CompactNode for the signature (a tuple), or None if it is not legal"""
+    u1, u2, u3, zero, one = signature
+    n_assignments = n_consistent_assignments(u1, u2, u3, 3 - one)
+    if n_assignments == 0:
+        return None
+    if n_assignments == 1:
+        return CompactNode(signature, 0, None)
+    best = None
+    for comparison, priority, lowerbounds, rs in SIGNATURE_EDGES:
+        if lowerbounds is not None and not all(s >= lb for s, lb in zip(signature, lowerbounds)):
+            continue
+        children = (compact_node(_add(signature, delta)) for _, delta in rs)
+        values = [child.value for child in children if child is not None]
+        if values and (best is None or (max(values), priority) < best[:2]):
+            best = (max(values), priority, comparison)
+    return CompactNode(signature, 1 + best[0], best[2])
 
-            def dfs(node):
-                if hasattr(node, "visited"):
-                    return
-                node.visited = True
-                if node.value == 0:
-                    data = tuple(node.position.one_consistent_assignment.values)
-                else:
-                    data = tuple(node.min_edge.comparison.split("_"))
-                    for c_edge in node.comparison_edges:
-                        for r_edge in c_edge.result_edges:
-                            dfs(r_edge.node)
-
-                posn = node.position
-                row = f"    {posn}: ({node.value}, {data}),"
-
-                skip = (
-                    node.value == 0
-                    or data == ("u1", "u1")
-                    or (
-                        data == ("u2", "u2")
-                        and (
-                            posn.u1 <= 2
-                            or posn.u2 < 4
-                            or posn.u1 > 31
-                            or posn.one == 2
-                        )
-                    )
+
+class CompactNode:
+    """
+    a Node that keeps only its signature, value and the comparison to make (None if terminal),
+    recomputing its edges from EDGES (through compact_node) when they are asked for
+    """
+
+    __slots__ = ("signature", "value", "comparison")
+
+    def __init__(self, signature, value, comparison):
+        self.signature = signature
+        self.value = value
+        self.comparison = comparison
+
+    @property
+    def position(self):
+        return Position(*self.signature)
+
+    @property
+    def comparison_edges(self):
+        if self.comparison is None:
+            return ()
+        c_edges = []
+        posn = self.signature
+        for comparison, priority, lowerbounds, rs in SIGNATURE_EDGES:
+            if lowerbounds is not None and not all(s >= lb for s, lb in zip(posn, lowerbounds)):
+                continue
+            r_edges = sorted(
+                (
+                    ResultEdge(r, child)
+                    for r, delta in rs
+                    if (child := compact_node(_add(posn, delta))) is not None
+                ),
+                key=lambda r_edge: (r_edge.node.value, -abs(r_edge.comparison_result)),
+            )
+            if r_edges:
+                c_edges.append(ComparisonEdge(priority, comparison, tuple(r_edges)))
+        c_edges.sort(key=lambda c_edge: (c_edge.result_edges[-1].node.value, c_edge.priority))
+        return tuple(c_edges)
+
+    @property
+    def min_edge(self):
+        return self.comparison_edges[0]
+
+    def __repr__(self):
+        comp = "" if self.comparison is None else " " + self.comparison.replace("_", " ? ")
+        return f"{self.position}: v{self.value}{comp}"
+
+
+def omit_row(posn, value, data):
+    """rows that find_three_ones.Partition._table_row can recompute on its own"""
+    return default_row(posn)[1] == data
+
+
+def write_rows(rows, table_file="_table.py", left_out_file="_left_out.py", keep=True):
+    """
+    rows: iterable of (signature, value, data), in the order they should appear;
+    returns the rows, as a list (or, if not keep, writes them as they come and returns None)
+    """
+    if keep:
+        rows = list(rows)
+    with open(table_file, "w") as table, open(left_out_file, "w") as left_out:
+        print("table = {", file=table)
+        for posn, value, data in rows:
+            print(_format_row(posn, value, data), file=left_out if omit_row(posn, value, data) else table)
+        print("}", file=table)
+    return rows if keep else None
+
+
+def _format_row(posn, value, data):
+    return f"    {tuple(posn)}: ({value}, {data}),"
+
+
+def dump_alg(start, **kwargs):
+    """write the table for the Node (or CompactNode) start and the nodes below it"""
+    visited = set()
+
+    def dfs(node):
+        if node in visited:
+            return
+        visited.add(node)
+        if node.value == 0:
+            data = tuple(node.position.one_consistent_assignment.values)
+        else:
+            data = tuple(node.min_edge.comparison.split("_"))
+            for c_edge in node.comparison_edges:
+                for r_edge in c_edge.result_edges:
+                    yield from dfs(r_edge.node)
+        yield tuple(node.position.values), node.value, data
+
+    return write_rows(dfs(start), **kwargs)
+
+
+##########################################################################################
+# Bottom-up solver.  Works on plain signature tuples (u1, u2, u3, zero, one) instead of
+# Nodes, visiting signatures so that every comparison leads to a signature visited
+# earlier: each comparison either decreases the number of unknown elements, or keeps it
+# and decreases u1 (u1_u1 and u1_u2 with result 0).
+##########################################################################################
+
+SIGNATURE_EDGES = tuple(
+    (
+        comparison,
+        c.priority,
+        None if c.lowerbounds is None else tuple(c.lowerbounds.values),
+        tuple((r.comparison_result, tuple(r.delta.values)) for r in c.rs),
+    )
+    for comparison, c in EDGES
+)
+assert tuple(comparison for comparison, *_ in SIGNATURE_EDGES) == COMPARISONS
+
+
+def signatures(n):
+    """all signatures with n elements, in bottom-up order"""
+    for unknown in range(n + 1):
+        for u1 in range(unknown + 1):
+            for u2 in range(0, unknown - u1 + 1, 2):
+                u3 = unknown - u1 - u2
+                if u3 % 3 == 0:
+                    for one in range(min(3, n - unknown) + 1):
+                        yield (u1, u2, u3, n - unknown - one, one)
+
+
+def _add(posn, delta):
+    return tuple(map(operator.add, posn, delta))
+
+
+def _result_edges(posn, rs, solution):
+    """the (comparison_result, signature) pairs leading to legal signatures"""
+    return [(r, child) for r, delta in rs if (child := _add(posn, delta)) in solution]
+
+
+def pack_edges(edges):
+    """
+    edges (in the form of SIGNATURE_EDGES) with packed signatures (see position.pack):
+    (comparison, priority, packed lowerbounds (0 for none), ((result, packed delta, packed
+    needs), ...)), where a signature at_least needs has no negative field after adding the delta
+    """
+    return tuple(
+        (
+            comparison,
+            priority,
+            0 if lowerbounds is None else pack(*lowerbounds),
+            tuple(
+                (r, pack(*delta, delta=True), pack(*(max(0, -d) for d in delta))) for r, delta in rs
+            ),
+        )
+        for comparison, priority, lowerbounds, rs in edges
+    )
+
+
+PACKED_EDGES = pack_edges(SIGNATURE_EDGES)
+
+
+def solve_iterative(n):
+    """
+    return {signature: (value, comparison)} for every legal signature with n elements,
+    where comparison is None for terminal signatures
+    """
+    return solve_incremental(n)[0]
+
+
+def solve_incremental(n, previous_edges=(), previous=None):
+    """
+    solve_iterative(n), given the solution previous (if not None) for the edges previous_edges
+    (in the form of SIGNATURE_EDGES): re-solves only the signatures in which a comparison that
+    changed (in priority, lower bounds or results) could be made before or after the change,
+    and those with a comparison leading to a signature whose value changed, and copies the
+    rest; returns (solution, number of signatures solved)
+    """
+    if previous is not None:
+        before = {comparison: edge for comparison, *edge in previous_edges}
+        after = {comparison: edge for comparison, *edge in SIGNATURE_EDGES}
+        # packed bounds of the signatures in which the comparisons that changed can be made:
+        # at least lowerbounds, with no negative field after adding one of the deltas
+        changed = [
+            pack(*(max(lb, -d) for lb, d in zip(lowerbounds or (0,) * 5, delta)))
+            for comparison in before.keys() | after.keys()
+            if before.get(comparison) != after.get(comparison)
+            for edges in (before, after)
+            if comparison in edges
+            for _, lowerbounds, rs in [edges[comparison]]
+            for _, delta in rs
+        ]
+        # signatures whose value changed lead to re-solving packed - delta, for every delta
+        # (a field of packed - delta may be negative, but then packed - delta is no signature)
+        deltas = {delta for _, _, _, rs in PACKED_EDGES for _, delta, _ in rs}
+        dirty = set()
+
+    # values and comparisons by packed signature (with at_least inlined)
+    values, comparisons = {}, {}
+    solved = 0
+    for posn in signatures(n):
+        u1, u2, u3, zero, one = posn
+        n_assignments = n_consistent_assignments(u1, u2, u3, 3 - one)
+        if n_assignments == 0:
+            continue
+        packed = pack(*posn)
+        if n_assignments == 1:
+            values[packed], comparisons[packed] = 0, None
+            continue
+
+        guarded = packed | GUARDS
+        if previous is not None and packed not in dirty:
+            if all((guarded - lowerbounds) & GUARDS != GUARDS for lowerbounds in changed):
+                values[packed], comparisons[packed] = previous[posn]
+                continue
+        best = None
+        for comparison, priority, lowerbounds, rs in PACKED_EDGES:
+            if (guarded - lowerbounds) & GUARDS != GUARDS:
+                continue
+            child_values = [
+                value
+                for _, delta, needs in rs
+                if (guarded - needs) & GUARDS == GUARDS
+                and (value := values.get(packed + delta)) is not None
+            ]
+            if child_values and (best is None or (max(child_values), priority) < best[:2]):
+                best = (max(child_values), priority, comparison)
+        assert best is not None, posn
+        values[packed], comparisons[packed] = 1 + best[0], best[2]
+        solved += 1
+        if previous is not None and values[packed] != previous[posn][0]:
+            dirty.update(packed - delta for delta in deltas)
+    solution = {unpack(packed): (value, comparisons[packed]) for packed, value in values.items()}
+    return solution, solved
+
+
+def solve_memoized(n, memo):
+    """
+    solve_iterative(n), reusing the solution in memo (a solution_memo.SolutionMemo) for the
+    same edges, or else updating the last one stored for n with solve_incremental, and
+    storing the solution in memo; returns (solution, number of signatures solved)
+    """
+    solution = memo.load(n, "worst", SIGNATURE_EDGES)
+    if solution is not None:
+        return solution, 0
+    previous_edges, previous = memo.latest(n, "worst") or ((), None)
+    solution, solved = solve_incremental(n, previous_edges, previous)
+    memo.save(n, "worst", SIGNATURE_EDGES, solution)
+    return solution, solved
+
+
+class DenseSolution:
+    """
+    solve_numpy's result: value and comparison arrays over the box of signatures,
+    indexed by (u1, u2 // 2, u3 // 3, one), looked up like solve_iterative's dict
+    """
+
+    def __init__(self, n, n_assignments, value, code, names):
+        self.n = n
+        self.n_assignments = n_assignments
+        self.value = value
+        self.code = code
+        self.names = names
+
+    def _index(self, posn):
+        u1, u2, u3, zero, one = posn
+        if min(posn) < 0 or one > 3 or u2 % 2 or u3 % 3 or sum(posn) != self.n:
+            return None
+        index = (u1, u2 // 2, u3 // 3, one)
+        return index if self.n_assignments[index] else None
+
+    def __contains__(self, posn):
+        return self._index(posn) is not None
+
+    def __getitem__(self, posn):
+        index = self._index(posn)
+        if index is None:
+            raise KeyError(posn)
+        code = int(self.code[index])
+        return int(self.value[index]), None if code < 0 else self.names[code]
+
+    def expected(self, posn):
+        """
+        the expected number of moves from posn, over the consistent assignments
+        (for solutions with objective "expected" or "worst-expected")
+        """
+        index = self._index(posn)
+        return self.total[index] / self.ways[index]
+
+
+def _multiplicity(comparison, comparison_result):
+    """
+    the number of results that comparison_result stands for: EDGES lists only result 1
+    when comparing parts of the same kind, as result -1 is the same with the parts swapped
+    """
+    kind1, kind2 = comparison.split("_")
+    return 2 if kind1 == kind2 and comparison_result != 0 else 1
+
+
+def comparison_moves():
+    """
+    the moves of the game (one comparison each) as (name, lowerbounds, deltas),
+    in order of priority
+    """
+    return [
+        (comparison, lowerbounds, [(delta, _multiplicity(comparison, r)) for r, delta in rs])
+        for comparison, priority, lowerbounds, rs in sorted(SIGNATURE_EDGES, key=lambda e: e[1])
+    ]
+
+
+def solve_numpy(n, moves=None, objective="worst"):
+    """
+    same as solve_iterative, but evaluates a whole layer of signatures at a time with
+    numpy, where a layer is the set of signatures with a given (# unknown elements + u1)
+    (every comparison decreases that quantity, so each layer depends only on earlier ones)
+
+    moves: the moves to choose from, as (name, lowerbounds, deltas), where lowerbounds
+    (None or a signature) bounds the signatures the move can be made in, and deltas are
+    the changes in signature that the move can make, each with the number of combinations
+    of comparison results that make it; among moves with the same value, the first is chosen
+    (default: comparison_moves())
+
+    objective: what the algorithm minimizes, one of
+    * "worst": the number of moves in the worst case,
+    * "expected": the expected number of moves, for an input chosen uniformly at random
+      from those with three ones, and then the number in the worst case,
+    * "worst-expected": the number in the worst case, and then the expected number.
+    (The value of each signature is the number of moves in the worst case, in any case.)
+    """
+    import numpy as np
+
+    shape = (n + 1, n // 2 + 1, n // 3 + 1, 4)
+    strides = np.array([shape[1] * shape[2] * shape[3], shape[2] * shape[3], shape[3], 1])
+    u1, h2, h3, one = np.ogrid[: shape[0], : shape[1], : shape[2], : shape[3]]
+    unknown = u1 + 2 * h2 + 3 * h3
+
+    # number of ways (capped at 2) to place the 3 - one remaining ones in the unknown parts
+    def comb(m, k):
+        return (
+            1 if k == 0 else m if k == 1 else m * (m - 1) // 2 if k == 2 else m * (m - 1) * (m - 2) // 6
+        )
+
+    total = 3 - one
+    ways = sum(
+        np.where(total == a + 2 * b + 3 * c, comb(u1, a) * comb(h2, b) * comb(h3, c), 0)
+        for a in range(4)
+        for b in range(2)
+        for c in range(2)
+        if a + 2 * b + 3 * c <= 3
+    )
+    ways = np.where(unknown + one <= n, ways, 0)
+    n_assignments = np.minimum(ways, 2).astype(np.int8)
+    if objective == "worst":
+        del ways
+
+    value = np.zeros(shape, dtype=np.int16)
+    code = np.full(shape, -1, dtype=np.int16)
+    flat_n_assignments, flat_value, flat_code = (a.reshape(-1) for a in (n_assignments, value, code))
+    if objective != "worst":
+        # (# consistent assignments) * (expected # comparisons, over consistent assignments)
+        total = np.zeros(shape, dtype=np.int64)
+        flat_ways, flat_total = ways.reshape(-1), total.reshape(-1)
+
+    cells = np.flatnonzero(n_assignments.reshape(-1) == 2)
+    layer = (np.broadcast_to(unknown + u1, shape).reshape(-1))[cells]
+    order = np.argsort(layer, kind="stable")
+    cells, layer = cells[order], layer[order]
+    bounds = np.searchsorted(layer, np.arange(2 * n + 2))
+
+    def shift(delta):
+        d1, d2, d3, dzero, done = delta
+        shift = np.array([d1, d2 // 2, d3 // 3, done])
+        return shift, int(strides @ shift)
+
+    if moves is None:
+        moves = comparison_moves()
+    edges = [
+        (lowerbounds, [(*shift(delta), multiplicity) for delta, multiplicity in deltas])
+        for _, lowerbounds, deltas in moves
+    ]
+    INFINITY = np.iinfo(np.int64).max
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start == stop:
+            continue
+        cell = cells[start:stop]
+        coords = np.stack(np.unravel_index(cell, shape))
+        zero = n - coords[0] - 2 * coords[1] - 3 * coords[2] - coords[3]
+        # the best move so far, by (key1, key2) (or by order in moves, for equal keys)
+        best1 = np.full(len(cell), INFINITY, dtype=np.int64)
+        best2 = np.full(len(cell), INFINITY, dtype=np.int64)
+        best_worst = np.zeros(len(cell), dtype=np.int32)
+        best_total = np.zeros(len(cell), dtype=np.int64)
+        best_code = np.zeros(len(cell), dtype=np.int16)
+        for edge_code, (lowerbounds, results) in enumerate(edges):
+            if lowerbounds is None:
+                allowed = np.ones(len(cell), dtype=bool)
+            else:
+                lb1, lb2, lb3, lbzero, lbone = lowerbounds
+                allowed = (
+                    (coords[0] >= lb1)
+                    & (2 * coords[1] >= lb2)
+                    & (3 * coords[2] >= lb3)
+                    & (zero >= lbzero)
+                    & (coords[3] >= lbone)
+                )
+            worst = np.full(len(cell), -1, dtype=np.int32)
+            children_total = np.zeros(len(cell), dtype=np.int64)
+            for delta, offset, multiplicity in results:
+                child_coords = coords + delta[:, None]
+                legal = allowed & (child_coords[:3] >= 0).all(axis=0) & (child_coords[3] <= 3)
+                child = np.where(legal, cell + offset, 0)
+                legal &= flat_n_assignments[child] > 0
+                worst = np.where(legal, np.maximum(worst, flat_value[child]), worst)
+                if objective != "worst":
+                    children_total += np.where(legal, multiplicity * flat_total[child], 0)
+
+            key1, key2 = {
+                "worst": (worst, 0),
+                "expected": (children_total, worst),
+                "worst-expected": (worst, children_total),
+            }[objective]
+            better = (worst >= 0) & ((key1 < best1) | ((key1 == best1) & (key2 < best2)))
+            best1 = np.where(better, key1, best1)
+            best2 = np.where(better, key2, best2)
+            best_worst = np.where(better, worst, best_worst)
+            best_total = np.where(better, children_total, best_total)
+            best_code = np.where(better, edge_code, best_code)
+        assert (best1 < INFINITY).all()
+        flat_value[cell] = best_worst + 1
+        flat_code[cell] = best_code
+        if objective != "worst":
+            flat_total[cell] = flat_ways[cell] + best_total
+
+    solution = DenseSolution(n, n_assignments, value, code, [name for name, _, _ in moves])
+    if objective != "worst":
+        solution.ways, solution.total = ways, total
+    return solution
+
+
+##########################################################################################
+# Layer-streaming solver.  Like solve_numpy, solves a layer of signatures (with the same
+# # unknown elements + u1 = 2 * u1 + u2 + u3) at a time, but keeps in memory only the
+# layers that the comparisons of the next layer can lead to, and spills each solved layer
+# to memory-mapped files, from which the rows of the table are then streamed.
+##########################################################################################
+
+
+class LayeredSolution:
+    """
+    solve_layers's result: the value and comparison code of every signature, in arrays on
+    disk (value.bin and code.bin in directory), one layer after another; layer K is a
+    (K // 2 + 1, K // 6 + 1, 4) array indexed by (u2 // 2, u3 // 6, one) (u3 // 3 has the
+    parity of K, and u1 follows), stored flat; looked up like solve_iterative's dict
+    """
+
+    TERMINAL = 254
+    ILLEGAL = 255
+
+    def __init__(self, n, directory, moves):
+        import numpy as np
+
+        self.n = n
+        self.directory = directory
+        self.moves = moves
+        self.names = [name for name, _, _ in moves]
+        self.offsets = self.layer_offsets(n)
+        self.value = self._array("value", np.uint16)
+        self.code = self._array("code", np.uint8)
+
+    def _array(self, name, dtype, mode="r"):
+        import numpy as np
+
+        return np.memmap(f"{self.directory}/{name}.bin", dtype, mode, shape=(self.offsets[-1],))
+
+    @staticmethod
+    def layer_shape(layer):
+        return layer // 2 + 1, layer // 6 + 1, 4
+
+    @staticmethod
+    def layer_offsets(n):
+        """the offset of each layer in the arrays, and their size"""
+        sizes = (math.prod(LayeredSolution.layer_shape(layer)) for layer in range(2 * n + 1))
+        return [0, *itertools.accumulate(sizes)]
+
+    def layer(self, array, layer):
+        """the part of array (e.g. self.value or self.code) for the layer"""
+        return array[self.offsets[layer] : self.offsets[layer + 1]]
+
+    @staticmethod
+    def signatures(n, layer, start=0, stop=None):
+        """the (u1, u2, u3, zero, one) arrays over the cells start:stop of the layer, not all legal"""
+        import numpy as np
+
+        _, size6, size_one = LayeredSolution.layer_shape(layer)
+        if stop is None:
+            stop = math.prod(LayeredSolution.layer_shape(layer))
+        h2, rest = np.divmod(np.arange(start, stop), size6 * size_one)
+        h6, one = np.divmod(rest, size_one)
+        u2, u3 = 2 * h2, 3 * (2 * h6 + layer % 2)
+        u1 = (layer - u2 - u3) // 2
+        return u1, u2, u3, n - u1 - u2 - u3 - one, one
+
+    def _index(self, posn):
+        u1, u2, u3, zero, one = posn
+        if min(posn) < 0 or one > 3 or u2 % 2 or u3 % 3 or sum(posn) != self.n:
+            return None
+        layer = 2 * u1 + u2 + u3
+        index = self.offsets[layer] + (u2 // 2 * (layer // 6 + 1) + u3 // 6) * 4 + one
+        return index if self.code[index] != self.ILLEGAL else None
+
+    def __contains__(self, posn):
+        return self._index(posn) is not None
+
+    def __getitem__(self, posn):
+        index = self._index(posn)
+        if index is None:
+            raise KeyError(posn)
+        code = int(self.code[index])
+        return int(self.value[index]), None if code == self.TERMINAL else self.names[code]
+
+    def mark_reached(self, start):
+        """mark the signatures reachable from start, top-down, in a third array on disk"""
+        import numpy as np
+
+        self.reached = reached = self._array("reached", np.uint8, "w+")
+        reached[self._index(start)] = 1
+        for layer in range(2 * self.n, 0, -1):
+            code = self.layer(self.code, layer)
+            cells = np.flatnonzero((self.layer(reached, layer) == 1) & (code < self.TERMINAL))
+            if not len(cells):
+                continue
+            posn = [s[cells] for s in self.signatures(self.n, layer)]
+            for _, lowerbounds, deltas in self.moves:
+                allowed = _at_least(posn, lowerbounds)
+                for delta, _ in deltas:
+                    child = _layer_child(posn, layer, delta)
+                    if child is None:
+                        continue
+                    child_layer, index, in_range = child
+                    legal = allowed & in_range & (self.layer(self.code, child_layer)[index] != self.ILLEGAL)
+                    self.layer(reached, child_layer)[index[legal]] = 1
+        reached.flush()
+
+    def layer_rows(self, layer):
+        """the rows of the table for the signatures of the layer marked by mark_reached"""
+        import numpy as np
+
+        if not hasattr(self, "reached"):
+            self.reached = self._array("reached", np.uint8)
+        cells = np.flatnonzero(self.layer(self.reached, layer))
+        columns = [s[cells].tolist() for s in self.signatures(self.n, layer)]
+        columns += [self.layer(a, layer)[cells].tolist() for a in (self.value, self.code)]
+        for u1, u2, u3, zero, one, value, code in zip(*columns):
+            if code == self.TERMINAL:
+                asst = one_consistent_assignment(u1, u2, u3, 3 - one)
+                data = (asst.u1, asst.u2, asst.u3, asst.zero, asst.one + one)
+            else:
+                data = tuple(self.names[code].split("_"))
+            yield (u1, u2, u3, zero, one), value, data
+
+    def rows(self, start):
+        """
+        the rows of the table for the signatures reachable from start (the same rows as
+        solution_rows gives, in another order), streamed from the arrays on disk a layer at
+        a time, after mark_reached
+        """
+        self.mark_reached(start)
+        for layer in range(2 * self.n + 1):
+            yield from self.layer_rows(layer)
+
+
+def _at_least(posn, lowerbounds):
+    """whether each of the signatures posn (u1, u2, u3, zero, one arrays) is >= lowerbounds"""
+    if lowerbounds is None:
+        return True
+    return reduce(operator.and_, (s >= lb for s, lb in zip(posn, lowerbounds)))
+
+
+def _layer_child(posn, layer, delta):
+    """
+    for the signatures posn (u1, u2, u3, zero, one arrays) of the layer, the layer of the
+    signatures posn + delta, their indices in that layer (0 where out of its shape), and
+    whether they are in its shape; None if there is no such layer
+    """
+    import numpy as np
+
+    d1, d2, d3, dzero, done = delta
+    child_layer = layer + 2 * d1 + d2 + d3
+    if child_layer < 0:
+        return None
+    u1, u2, u3, zero, one = posn
+    h2, h3, one = (u2 + d2) // 2, (u3 + d3) // 3, one + done
+    size2, size6, size_one = LayeredSolution.layer_shape(child_layer)
+    in_range = (h2 >= 0) & (h2 < size2) & (h3 >= 0) & (h3 // 2 < size6) & (one >= 0) & (one < size_one)
+    index = np.where(in_range, (h2 * size6 + h3 // 2) * size_one + one, 0)
+    return child_layer, index, in_range
+
+
+def _solve_layer(n, layer, moves, window, start=0, stop=None):
+    """
+    (value, code) arrays for the cells start:stop of the layer, given window, a dict of the
+    (value, code) arrays of the layers below that the moves can lead to
+    """
+    import numpy as np
+
+    u1, u2, u3, zero, one = LayeredSolution.signatures(n, layer, start, stop)
+    h2, h3, total = u2 // 2, u3 // 3, 3 - one
+    ways = np.select(
+        [total == 0, total == 1, total == 2],
+        [1, u1, u1 * (u1 - 1) // 2 + h2],
+        u1 * (u1 - 1) * (u1 - 2) // 6 + u1 * h2 + h3,
+    )
+    ways = np.where((u1 >= 0) & (zero >= 0), ways, 0)
+    value = np.zeros(len(ways), dtype=np.uint16)
+    code = np.full(len(ways), LayeredSolution.ILLEGAL, dtype=np.uint8)
+    code[ways == 1] = LayeredSolution.TERMINAL
+
+    INFINITY = np.iinfo(np.int32).max
+    cells = np.flatnonzero(ways >= 2)
+    posn = [s[cells] for s in (u1, u2, u3, zero, one)]
+    best = np.full(len(cells), INFINITY, dtype=np.int32)
+    best_code = np.zeros(len(cells), dtype=np.uint8)
+    for move_code, (_, lowerbounds, deltas) in enumerate(moves):
+        allowed = _at_least(posn, lowerbounds)
+        worst = np.full(len(cells), -1, dtype=np.int32)
+        for delta, _ in deltas:
+            child = _layer_child(posn, layer, delta)
+            if child is None:
+                continue
+            child_layer, index, in_range = child
+            child_value, child_code = window[child_layer]
+            legal = allowed & in_range & (child_code[index] != LayeredSolution.ILLEGAL)
+            worst = np.where(legal, np.maximum(worst, child_value[index]), worst)
+        better = (worst >= 0) & (worst < best)
+        best = np.where(better, worst, best)
+        best_code[better] = move_code
+    assert (best < INFINITY).all()
+    value[cells] = best + 1
+    code[cells] = best_code
+    return value, code
+
+
+# solve_layers keeps the layers it needs in a ring of depth + 1 rows of two arrays, values
+# and codes, with layer K in row K % (depth + 1) (in shared memory, for a pool of workers)
+
+
+def _ring(buffer, shape):
+    """the values and codes arrays of a ring of the shape, in buffer (3 bytes per cell)"""
+    import numpy as np
+
+    values = np.ndarray(shape, np.uint16, buffer=buffer)
+    codes = np.ndarray(shape, np.uint8, buffer=buffer, offset=values.nbytes)
+    return values, codes
+
+
+def _solve_cells(n, moves, depth, ring, layer, start, stop):
+    """solve the cells start:stop of the layer, into its row of the ring"""
+    values, codes = ring
+    window = {
+        child_layer: (values[child_layer % len(values)], codes[child_layer % len(codes)])
+        for child_layer in range(max(0, layer - depth), layer)
+    }
+    values[layer % len(values), start:stop], codes[layer % len(codes), start:stop] = _solve_layer(
+        n, layer, moves, window, start, stop
+    )
+
+
+_worker = None
+# solve_layers solves layers with fewer cells than this per worker in the main process
+PARALLEL_CELLS = 4096
+
+
+def _init_worker(memory, n, moves, depth, shape):
+    # (memory is the SharedMemory itself, inherited by a forked worker, or else attached by name)
+    global _worker
+    _worker = memory, n, moves, depth, _ring(memory.buf, shape)
+
+
+def _solve_chunk(task):
+    _, n, moves, depth, ring = _worker
+    _solve_cells(n, moves, depth, ring, *task)
+
+
+def solve_layers(n, directory, moves=None, resume=False, checkpoint_seconds=60, workers=1):
+    """
+    same as solve_numpy (with the objective "worst"), but in memory bounded by a few layers
+    of signatures (O(n^2) rather than O(n^3)): solves the layers in order, keeping in memory
+    only the last ones that the moves can lead to, and appends each layer to files in
+    directory as it is solved; returns a LayeredSolution, which memory-maps the files
+
+    Every checkpoint_seconds (and after the last layer), the files are synced to disk, and
+    the number of layers solved recorded in directory/checkpoint.json (a run from the start
+    first records 0).  With resume, if that records a run for the same n and moves, the run
+    continues after the layers it records (dropping any written after them); it raises
+    ValueError if the files are shorter than those layers.
+
+    With workers > 1, each layer (but the smallest) is split into chunks of cells, solved by
+    a pool of that many processes, which share the layers below through shared memory.
+    """
+    import numpy as np
+
+    if moves is None:
+        moves = comparison_moves()
+    # the most any move decreases the layer by
+    depth = max(-(2 * d1 + d2 + d3) for _, _, deltas in moves for (d1, d2, d3, _, _), _ in deltas)
+    offsets = LayeredSolution.layer_offsets(n)
+    sizes = [stop - start for start, stop in zip(offsets[:-1], offsets[1:])]
+    files = {name: f"{directory}/{name}.bin" for name in ("value", "code")}
+    dtypes = dict(value=np.uint16, code=np.uint8)
+    checkpoint = dict(n=n, moves=edges_key(moves, "worst"), layers=0)
+    checkpoint_file = f"{directory}/checkpoint.json"
+
+    if resume:
+        try:
+            with open(checkpoint_file) as f:
+                state = json.load(f)
+            if (state["n"], state["moves"]) == (checkpoint["n"], checkpoint["moves"]):
+                checkpoint["layers"] = state["layers"]
+        except (OSError, ValueError, KeyError):
+            pass
+    start = checkpoint["layers"]
+
+    def save_checkpoint(layers):
+        checkpoint["layers"] = layers
+        with open(f"{checkpoint_file}.tmp", "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(f"{checkpoint_file}.tmp", checkpoint_file)
+
+    if start:
+        for name, file in files.items():
+            size = os.path.getsize(file) if os.path.exists(file) else 0
+            expected = offsets[start] * np.dtype(dtypes[name]).itemsize
+            if size < expected:
+                raise ValueError(
+                    f"cannot resume: {checkpoint_file} records {start} layers solved, but {file} "
+                    f"has {size} bytes, not at least {expected}"
                 )
-                print(row, file=left_out if skip else sys.stdout)
+    else:
+        # (before the files are truncated, so that a checkpoint left by an earlier run
+        # cannot outlive them)
+        save_checkpoint(0)
+
+    shape = (depth + 1, sizes[-1])
+    if workers > 1:
+        from multiprocessing import Pool, shared_memory
+
+        memory = shared_memory.SharedMemory(create=True, size=3 * math.prod(shape))
+        buffer = memory.buf
+    else:
+        memory, buffer = None, bytearray(3 * math.prod(shape))
+    try:
+        with contextlib.ExitStack() as stack:
+            if memory is not None:
+                initargs = (memory, n, moves, depth, shape)
+                pool = stack.enter_context(Pool(workers, initializer=_init_worker, initargs=initargs))
+            ring = values, codes = _ring(buffer, shape)
+            for layer in range(max(0, start - depth), start):
+                for name, array in (("value", values), ("code", codes)):
+                    itemsize = np.dtype(dtypes[name]).itemsize
+                    array[layer % len(array), : sizes[layer]] = np.fromfile(
+                        files[name], dtypes[name], count=sizes[layer], offset=offsets[layer] * itemsize
+                    )
+
+            # (written to the files a layer at a time, rather than through memory maps, so
+            # that the solved layers do not stay in memory)
+            out = {}
+            for name in ("value", "code"):
+                out[name] = stack.enter_context(open(files[name], "r+b" if start else "wb"))
+                out[name].truncate(offsets[start] * np.dtype(dtypes[name]).itemsize)
+                out[name].seek(0, os.SEEK_END)
+            last_checkpoint = time.monotonic()
+            for layer in range(start, 2 * n + 1):
+                size = sizes[layer]
+                if memory is not None and size >= PARALLEL_CELLS * workers:
+                    bounds = np.linspace(0, size, 4 * workers + 1).astype(int).tolist()
+                    pool.map(_solve_chunk, [(layer, a, b) for a, b in zip(bounds[:-1], bounds[1:])])
+                else:
+                    _solve_cells(n, moves, depth, ring, layer, 0, size)
+                out["value"].write(values[layer % len(values), :size].tobytes())
+                out["code"].write(codes[layer % len(codes), :size].tobytes())
+
+                if layer == 2 * n or time.monotonic() - last_checkpoint >= checkpoint_seconds:
+                    for f in out.values():
+                        f.flush()
+                        os.fsync(f.fileno())
+                    save_checkpoint(layer + 1)
+                    last_checkpoint = time.monotonic()
+        if memory is not None:
+            # (no array may be left on the memory when it is closed)
+            del ring, values, codes, buffer
+            memory.close()
+    finally:
+        if memory is not None:
+            memory.unlink()
+    return LayeredSolution(n, directory, moves)
+
+
+_writer = None
+
+
+def _init_writer(n, directory, moves):
+    global _writer
+    _writer = LayeredSolution(n, directory, moves)
+
+
+def _layer_text(layer, solution=None):
+    """
+    the text write_rows writes to the table and the left-out file for the rows of the layer
+    of solution (by default, the worker's)
+    """
+    table, left_out = [], []
+    for posn, value, data in (solution or _writer).layer_rows(layer):
+        (left_out if omit_row(posn, value, data) else table).append(_format_row(posn, value, data) + "\n")
+    return "".join(table), "".join(left_out)
+
+
+def write_layered_rows(solution, start, workers=1, table_file="_table.py", left_out_file="_left_out.py"):
+    """
+    write_rows(solution.rows(start)) for a LayeredSolution, with the rows of each layer
+    formatted by a pool of workers processes (if workers > 1)
+    """
+    solution.mark_reached(start)
+    layers = range(2 * solution.n + 1)
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            from multiprocessing import Pool
+
+            initargs = (solution.n, solution.directory, solution.moves)
+            pool = stack.enter_context(Pool(workers, initializer=_init_writer, initargs=initargs))
+            texts = pool.imap(_layer_text, layers)
+        else:
+            texts = (_layer_text(layer, solution) for layer in layers)
+        with open(table_file, "w") as table, open(left_out_file, "w") as left_out:
+            table.write("table = {\n")
+            for table_text, left_out_text in texts:
+                table.write(table_text)
+                left_out.write(left_out_text)
+            table.write("}\n")
+
+
+def solution_rows(solution, start):
+    """
+    the rows of the table for the signatures reachable from start,
+    in the same (depth-first, post-order) order as dump_alg
+    """
+
+    def value(posn):
+        return solution[posn][0]
+
+    def children(posn):
+        if value(posn) == 0:
+            return
+        c_edges = []
+        for comparison, priority, lowerbounds, rs in SIGNATURE_EDGES:
+            if lowerbounds is not None and not all(s >= lb for s, lb in zip(posn, lowerbounds)):
+                continue
+            r_edges = sorted(
+                _result_edges(posn, rs, solution), key=lambda r_edge: (value(r_edge[1]), -abs(r_edge[0]))
+            )
+            if r_edges:
+                c_edges.append((priority, r_edges))
+        c_edges.sort(key=lambda c_edge: (value(c_edge[1][-1][1]), c_edge[0]))
+        for _, r_edges in c_edges:
+            for _, child in r_edges:
+                yield child
+
+    visited = {start}
+    stack = [(start, children(start))]
+    while stack:
+        posn, unvisited = stack[-1]
+        for child in unvisited:
+            if child not in visited:
+                visited.add(child)
+                stack.append((child, children(child)))
+                break
+        else:
+            stack.pop()
+            _value, comparison = solution[posn]
+            yield posn, _value, _row_data(posn, comparison)
+
+
+def _row_data(posn, comparison):
+    """the data of the row for posn in _table.py, if solved with comparison"""
+    if comparison is None:
+        u1, u2, u3, zero, one = posn
+        asst = one_consistent_assignment(u1, u2, u3, 3 - one)
+        return (asst.u1, asst.u2, asst.u3, asst.zero, asst.one + one)
+    return tuple(comparison.split("_"))
+
+
+def all_rows(solution, n):
+    """
+    the rows (signature, value, data) for every signature in solution, in the bottom-up order
+    of signatures(n) (in which each (u1, u2, one) comes in increasing order of u3, as
+    range_table.RangeTable.compress needs)
+    """
+    for posn in signatures(n):
+        if posn in solution:
+            value, comparison = solution[posn]
+            yield posn, value, _row_data(posn, comparison)
+
+
+##########################################################################################
+# The rounds game: in each round the algorithm makes up to p comparisons at once, each
+# between different unknown parts (or an unknown part and the zero or one part), and the
+# adversary then chooses all of their results.  The algorithm pays one dollar per round.
+##########################################################################################
+
+PART_SIZE = dict(u1=1, u2=2, u3=3)
+
+
+def round_moves(p):
+    """
+    the moves of the rounds game, as for solve_numpy: each is a combination of at most p
+    comparisons, named by a tuple of their names, with combinations of fewer comparisons
+    (and then of higher priority comparisons) first
+    """
+    edges = sorted(SIGNATURE_EDGES, key=lambda e: e[1])
+    moves = []
+    for k in range(1, p + 1):
+        for combination in itertools.combinations_with_replacement(edges, k):
+            lowerbounds = [0, 0, 0, 0, 0]
+            deltas = {(0, 0, 0, 0, 0): 1}
+            for comparison, priority, _, rs in combination:
+                for kind in comparison.split("_"):
+                    if kind in PART_SIZE:
+                        lowerbounds[PART_SIZE[kind] - 1] += PART_SIZE[kind]
+                    else:
+                        lowerbounds[3 if kind == "zero" else 4] = 1
+                sums = defaultdict(int)
+                for total, multiplicity in deltas.items():
+                    for r, delta in rs:
+                        # (at most three elements can be known to be ones)
+                        if (d := _add(total, delta))[4] <= 3:
+                            sums[d] += multiplicity * _multiplicity(comparison, r)
+                deltas = sums
+            name = tuple(comparison for comparison, *_ in combination)
+            moves.append((name, tuple(lowerbounds), sorted(deltas.items())))
+    return moves
+
+
+def rounds_rows(solution, start):
+    """
+    the rows of the rounds table for the signatures reachable from start
+    when the algorithm makes the moves in solution, in breadth-first order
+    """
+    deltas = {name: moves for name, _, moves in round_moves(max(map(len, solution.names)))}
+    order = [start]
+    visited = {start}
+    for posn in order:
+        value, move = solution[posn]
+        if move is None:
+            u1, u2, u3, zero, one = posn
+            asst = one_consistent_assignment(u1, u2, u3, 3 - one)
+            yield posn, value, (asst.u1, asst.u2, asst.u3, asst.zero, asst.one + one)
+            continue
+        yield posn, value, move
+        for delta, _ in deltas[move]:
+            child = _add(posn, delta)
+            if child in solution and child not in visited:
+                visited.add(child)
+                order.append(child)
+
+
+def write_rounds_rows(rows, file):
+    with open(file, "w") as table:
+        print("table = {", file=table)
+        for posn, value, data in rows:
+            print(f"    {posn}: ({value}, {data}),", file=table)
+        print("}", file=table)
+
+
+def checked_ranges(solution, n):
+    """
+    the RangeTable of the comparisons in solution, and the number of rows in it, after
+    checking every row against solution (raises ValueError on a row that differs)
+    """
+    from range_table import RangeTable
+
+    table = RangeTable.compress(n, all_rows(solution, n), values=False)
+    n_rows = 0
+    for posn, value, data in all_rows(solution, n):
+        if table.row(posn)[1] != encode(data):
+            raise ValueError(f"{posn}: {table.row(posn)} in the range table, but {(value, data)} solved")
+        n_rows += 1
+    return table, n_rows
+
 
-            print("table = {")
-            dfs(start)
-            print("}")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="compute the table used by find_three_ones.py")
+    parser.add_argument(
+        "--solver",
+        choices=("iterative", "numpy", "layers", "recursive", "compact"),
+        default="iterative",
+        help="iterative: bottom-up over signatures (fast, no deep recursion); "
+        "numpy: bottom-up a layer of signatures at a time, vectorized with numpy; "
+        "layers: like numpy, but keeping only a few layers in memory, and the rest on disk "
+        "(see --spill), for large n; "
+        "recursive: top-down over the Node graph (the original method); "
+        "compact: top-down like recursive, over CompactNodes, which need much less memory",
+    )
+    parser.add_argument(
+        "--spill",
+        metavar="DIR",
+        help="with --solver layers, the directory to write the solved layers to "
+        "(default: a temporary directory, removed at the end)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="with --solver layers, the number of processes to solve each layer with (default 1; "
+        "some of the work is not parallel, so the speedup is less than linear: an estimated "
+        "3.2 times at most with 4, unmeasured)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=float,
+        default=60,
+        metavar="SECONDS",
+        help="with --solver layers, how often to sync the solved layers to disk and record "
+        "how many there are, in DIR/checkpoint.json (default 60)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="with --solver layers and --spill DIR, continue the run in DIR from its last "
+        "checkpoint (if any, for the same n and EDGES)",
+    )
+    parser.add_argument(
+        "--memo",
+        metavar="DIR",
+        help="with the iterative solver, reuse the results stored in DIR (see solution_memo.py) "
+        "for the same EDGES, or else re-solve only the signatures that changes to EDGES since the "
+        "last run affect, and store the results in DIR",
+    )
+    parser.add_argument("--n", type=int, default=100, help="number of elements (default 100)")
+    parser.add_argument(
+        "--dense",
+        action="store_true",
+        help="also write the table with every row, as a dense binary file _table*.bin "
+        "(see dense_table.py) that find_three_ones loads instead of _table*.py",
+    )
+    parser.add_argument(
+        "--ranges",
+        action="store_true",
+        help="also write the comparisons of every row (not the values), compressed into ranges, "
+        "to _table*.ranges (see range_table.py), which find_three_ones loads instead of "
+        "_table*.py if there is no _table*.bin; checked against the solver's output",
+    )
+    parser.add_argument(
+        "--machine",
+        action="store_true",
+        help="also write the algorithm as a state machine, to _machine*.bin "
+        "(see state_machine.py and find_three_ones_machine)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        metavar="P",
+        help="instead solve the game where up to P comparisons are made per round, "
+        "minimizing the number of rounds, and write its table to _rounds_pP*.py "
+        "(for find_three_ones_rounds; uses the numpy solver)",
+    )
+    parser.add_argument(
+        "--objective",
+        choices=OBJECTIVES,
+        default="worst",
+        help="minimize the number of comparisons (or rounds) in the worst case (the default), "
+        "or the expected number for a uniformly random input, then the worst case (expected), "
+        "or the worst case, then the expected number (worst-expected); "
+        "the table is written to _table_OBJECTIVE*.py (except for worst); "
+        "other objectives than worst use the numpy solver",
+    )
+    args = parser.parse_args(argv)
 
+    n = args.n
+    if n < 3:
+        parser.error("--n must be at least 3")
+    if args.memo is not None and (args.solver, args.objective, args.rounds) != ("iterative", "worst", None):
+        parser.error("--memo is only for the iterative solver, with objective worst")
+    if args.resume and (args.solver != "layers" or args.spill is None):
+        parser.error("--resume is only for --solver layers, with --spill")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.ranges and (args.solver in ("recursive", "compact") or args.rounds is not None):
+        parser.error("--ranges is not for --solver recursive or compact, or --rounds")
+    if args.rounds is not None:
+        if args.rounds < 1:
+            parser.error("--rounds must be at least 1")
+        solution = solve_numpy(n, round_moves(args.rounds), args.objective)
+        write_rounds_rows(
+            rounds_rows(solution, (n, 0, 0, 0, 0)),
+            f"{rounds_module(n, args.rounds, args.objective)}.py",
+        )
+        return
+    name = table_module(n, args.objective)
+    files = dict(
+        table_file=f"{name}.py",
+        left_out_file=f"{name.replace('_table', '_left_out')}.py",
+    )
+    # (--ranges is checked against the solution before any file is written)
+    ranges = None
+    if args.objective != "worst":
+        solution = solve_numpy(n, objective=args.objective)
+        start = (n, 0, 0, 0, 0)
+        print(f"worst case {solution[start][0]}, expected {solution.expected(start):.6f} comparisons")
+        if args.ranges:
+            ranges, n_rows = checked_ranges(solution, n)
+        rows = write_rows(solution_rows(solution, start), **files)
+    elif args.solver == "recursive":
+        start = node(Position(u1=n))
+        # print("\n".join(str(x) for x in start.play))
+        rows = dump_alg(start, **files)
+    elif args.solver == "compact":
+        # (compact_node recurses once per comparison, and every comparison decreases unknown + u1)
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * n + 100))
+        rows = dump_alg(compact_node((n, 0, 0, 0, 0)), **files)
+    elif args.solver == "layers":
+        # (a temporary directory is removed once main returns and it is garbage-collected)
+        temporary = None if args.spill else tempfile.TemporaryDirectory()
+        spill = args.spill or temporary.name
+        os.makedirs(spill, exist_ok=True)
+        solution = solve_layers(
+            n, spill, resume=args.resume, checkpoint_seconds=args.checkpoint, workers=args.workers
+        )
+        if args.ranges:
+            ranges, n_rows = checked_ranges(solution, n)
+        write_layered_rows(solution, (n, 0, 0, 0, 0), args.workers, **files)
+        # (for --dense and --machine, the rows again, streamed rather than kept in memory)
+        rows = itertools.chain.from_iterable(map(solution.layer_rows, range(2 * n + 1)))
+    elif args.memo is not None:
+        solution, solved = solve_memoized(n, SolutionMemo(args.memo))
+        print(f"solved {solved} of {len(solution)} signatures (the rest terminal or reused from {args.memo})")
+        if args.ranges:
+            ranges, n_rows = checked_ranges(solution, n)
+        rows = write_rows(solution_rows(solution, (n, 0, 0, 0, 0)), **files)
+    else:
+        solution = (solve_numpy if args.solver == "numpy" else solve_iterative)(n)
+        if args.ranges:
+            ranges, n_rows = checked_ranges(solution, n)
+        rows = write_rows(solution_rows(solution, (n, 0, 0, 0, 0)), **files)
+    # (the binary tables record the _table*.py they go with, see find_three_ones.load_table)
+    source = source_hash(files["table_file"])
+    if ranges is not None:
+        print(
+            f"{n_rows} rows in {len(ranges.run_start)} ranges ({ranges.nbytes} bytes), "
+            f"checked against the solution"
+        )
+        ranges.save(f"{name}.ranges", source)
+    if args.dense or args.machine:
+        table = DenseTable.from_rows(n, rows)
+        if args.dense:
+            table.save(f"{name}.bin", source)
+        if args.machine:
+            state_machine(table).save(machine_file(n, args.objective), source)
 
-n = 100
-start = node(Position(u1=n))
-# print("\n".join(str(x) for x in start.play))
 
-dump_alg(start)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+A persistent store of the results of recompute_table's solver ({signature: (value,
+comparison)}), for recompute_table.py --memo DIR: one file in DIR per n, objective and edge
+set (recompute_table.SIGNATURE_EDGES, with the priorities), under a name containing a hash
+of the objective and the edges.  Each file also records the edges it was solved with, so
+that after a change to EDGES, recompute_table.solve_incremental can re-solve only the
+signatures that the change affects, and reuse the rest.
+
+The results are stored in the layout of a DenseTable (see dense_table.py), with the exact
+value (16 bits) of every signature, and code TERMINAL for every terminal signature.
+"""
+
+import hashlib
+import json
+import os
+from array import array
+
+from dense_table import COMPARISONS, ILLEGAL, TERMINAL, DenseTable
+
+
+def edges_key(edges, objective):
+    return hashlib.sha256(json.dumps([objective, edges]).encode()).hexdigest()[:16]
+
+
+def _tuples(x):
+    """x, read from JSON, with lists back to tuples"""
+    return tuple(map(_tuples, x)) if isinstance(x, list) else x
+
+
+class SolutionMemo:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, n, objective, edges):
+        return os.path.join(self.directory, f"n{n}_{objective}_{edges_key(edges, objective)}.memo")
+
+    def load(self, n, objective, edges):
+        """the solution stored for exactly these edges, or None"""
+        try:
+            return self._read(self._path(n, objective, edges))[1]
+        except (OSError, ValueError):
+            return None
+
+    def latest(self, n, objective):
+        """(edges, solution) for the solution stored last for n and objective, or None"""
+        prefix = f"n{n}_{objective}_"
+        try:
+            names = [name for name in os.listdir(self.directory) if name.startswith(prefix)]
+        except OSError:
+            return None
+        paths = [os.path.join(self.directory, name) for name in names if name.endswith(".memo")]
+        for path in sorted(paths, key=os.path.getmtime, reverse=True):
+            try:
+                return self._read(path)
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def save(self, n, objective, edges, solution):
+        size = DenseTable.size(n)
+        table = DenseTable(n, array("H", bytes(2 * size)), array("B", bytes([ILLEGAL])) * size)
+        for (u1, u2, u3, zero, one), (value, comparison) in solution.items():
+            i = table.index(u1, u2, u3, one)
+            table.values[i] = value
+            table.codes[i] = TERMINAL if comparison is None else COMPARISONS.index(comparison)
+        header = json.dumps(dict(n=n, objective=objective, edges=edges))
+        path = self._path(n, objective, edges)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(header.encode() + b"\n")
+            f.write(table.values)
+            f.write(table.codes)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read(path):
+        with open(path, "rb") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} is not a solution memo") from e
+            n = header["n"]
+            size = DenseTable.size(n)
+            values, codes = array("H"), array("B")
+            values.frombytes(f.read(2 * size))
+            codes.frombytes(f.read(size))
+        if len(values) != size or len(codes) != size:
+            raise ValueError(f"{path} is truncated")
+
+        s1, s2, s3 = DenseTable(n, values, codes).strides
+        solution = {}
+        for i, code in enumerate(codes):
+            if code == ILLEGAL:
+                continue
+            u1, rest = divmod(i, s1)
+            h2, rest = divmod(rest, s2)
+            h3, one = divmod(rest, s3)
+            posn = (u1, 2 * h2, 3 * h3, n - u1 - 2 * h2 - 3 * h3 - one, one)
+            solution[posn] = values[i], None if code == TERMINAL else COMPARISONS[code]
+        return _tuples(header["edges"]), solution
@@ -0,0 +1,109 @@
+"""
+The optimal algorithm for an n-element input as a state machine, whose states are the
+signatures reachable from (n, 0, 0, 0, 0), numbered from 0 (the start).
+
+codes[state] is the state's code in the dense table (see dense_table.py): the comparison
+to make, or TERMINAL | sizes.  transitions[3 * state + result + 1] is the state reached when
+that comparison has the given result (-1, 0 or 1), or -1 if no input gives that result.
+A saved machine records the source_hash of the _table*.py it was built from, as a saved
+DenseTable does.
+"""
+
+import mmap
+import struct
+from array import array
+
+from dense_table import COMPARED, ILLEGAL, NO_SOURCE, TERMINAL
+
+HEADER = struct.Struct("<4sII16s")
+MAGIC = b"F31M"
+# the field of a signature holding each kind of part
+FIELDS = {"u1": 0, "u2": 1, "u3": 2, "zero": 3, "one": 4}
+ZERO, ONE = FIELDS["zero"], FIELDS["one"]
+
+
+class StateMachine:
+    def __init__(self, n, codes, transitions):
+        self.n = n
+        self.codes = codes
+        self.transitions = transitions
+
+    def save(self, path, source=NO_SOURCE):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.n, len(self.codes), source))
+            f.write(array("i", self.transitions))
+            f.write(self.codes)
+
+    @classmethod
+    def load(cls, path, source=None):
+        """as DenseTable.load"""
+        with open(path, "rb") as f:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a state machine")
+        magic, n, n_states, saved_source = HEADER.unpack(buffer[: HEADER.size])
+        end = HEADER.size + 3 * n_states * array("i").itemsize
+        if magic != MAGIC or len(buffer) != end + n_states:
+            raise ValueError(f"{path} is not a state machine")
+        if source is not None and saved_source != source:
+            raise ValueError(f"{path} is out of date")
+        return cls(n, buffer[end:], buffer[HEADER.size : end].cast("i"))
+
+
+def _results(posn, code):
+    """
+    the (comparison_result, signature) pairs for the comparison code in the signature posn,
+    as in recompute_table.EDGES (but with result -1 also when the kinds compared are the same),
+    whether or not the signatures are legal
+    """
+    a, b = (FIELDS[kind] for kind in COMPARED[code])
+
+    def move(*changes):
+        child = list(posn)
+        for field, change in ((a, -(a + 1)),) + changes:
+            child[field] += change
+        return tuple(child)
+
+    s = a + 1
+    if b == ZERO:
+        return [(0, move((ZERO, s))), (1, move((ONE, s)))]
+    if b == ONE:
+        return [(0, move((ONE, s))), (-1, move((ZERO, s)))]
+    t = b + 1
+    merged = s + t - 1 if s + t <= 3 else ZERO
+    return [
+        (0, move((b, -t), (merged, s + t))),
+        (1, move((b, -t), (ZERO, t), (ONE, s))),
+        (-1, move((b, -t), (ZERO, s), (ONE, t))),
+    ]
+
+
+def state_machine(table):
+    """
+    the StateMachine playing the comparisons in the DenseTable (or RangeTable) table,
+    with the states numbered in breadth-first order from the start
+    """
+    # (imported here, as find_three_ones imports this module, but must not import position)
+    from position import n_consistent_assignments
+
+    n = table.n
+    start = (n, 0, 0, 0, 0)
+    ids = {start: 0}
+    order = [start]
+    codes = array("B")
+    transitions = array("i")
+    for posn in order:
+        code = table.row(posn)[1]
+        assert code != ILLEGAL, posn
+        codes.append(code)
+        next_states = [-1, -1, -1]
+        if code < TERMINAL:
+            for r, child in _results(posn, code):
+                u1, u2, u3, zero, one = child
+                if n_consistent_assignments(u1, u2, u3, 3 - one):
+                    if child not in ids:
+                        ids[child] = len(order)
+                        order.append(child)
+                    next_states[r + 1] = ids[child]
+        transitions.extend(next_states)
+    return StateMachine(n, codes, transitions)
@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 
+import functools
 import random
+import subprocess
+import sys
+import time
 
-from find_three_ones import find_three_ones
+import pytest
 
+from find_three_ones import (
+    find_three_ones,
+    find_three_ones_batch,
+    find_three_ones_machine,
+    find_three_ones_many,
+)
+from verify import report, verify
 
-def trial(input):
+
+def trial(input, find_three_ones=find_three_ones):
     soln = frozenset(i for i, b in enumerate(input) if b == 1)
     assert len(input) == 100
     assert len(soln) == 3
@@ -48,7 +60,102 @@ def test_find_three_ones():
     # soln = random_choice(100, 3)
     # print(trial(input(100, soln)))
 
-    print(max(trial(input(100, c)) for c in choose(100, 3)))
+    histogram = verify(find_three_ones)
+    print(report(histogram))
+    assert max(histogram) == 70
+
+
+def test_find_three_ones_machine():
+    assert max(verify(find_three_ones_machine)) == 70
+
+
+def test_manual_find_three_ones():
+    import manual_find_three_ones
+
+    assert max(verify(manual_find_three_ones.find_three_ones)) == 70
+
+
+def test_find_three_ones_batch():
+    import numpy as np
+
+    solns = np.array(list(choose(100, 3)))
+    X = np.zeros((len(solns), 100), dtype=np.int8)
+    np.put_along_axis(X, solns, 1, axis=1)
+    assert (find_three_ones_batch(X, chunk=50000) == np.sort(solns, axis=1)).all()
+
+
+def test_find_three_ones_many():
+    import asyncio
+
+    solns = [random_choice(100, 3) for _ in range(1000)]
+
+    def oracle(soln):
+        async def compare(i, j):
+            await asyncio.sleep(0)
+            return (i in soln) - (j in soln)
+
+        return compare
+
+    for limit in (None, 10):
+        found = asyncio.run(find_three_ones_many(map(oracle, solns), limit=limit))
+        assert [sorted(f) for f in found] == [sorted(s) for s in solns]
+
+
+def test_partition_stats():
+    from partition_stats import PartitionStats
+
+    stats = PartitionStats()
+    n_comparisons = sum(
+        trial(input(100, random_choice(100, 3)), functools.partial(find_three_ones, stats=stats))
+        for _ in range(20)
+    )
+    assert stats.solves == 20
+    assert stats.step_seconds.count == n_comparisons
+    # one row read at the start and after each comparison, and a terminal row at the end
+    assert sum(stats.rows.values()) == 20 + n_comparisons
+    assert stats.rows["fallback", "terminal"] == 20
+    assert stats.unions > 0 and stats.find_path_lengths.count > 0
+    exposition = stats.exposition()
+    assert "find_three_ones_solves_total 20\n" in exposition
+    assert f'find_three_ones_step_seconds_bucket{{le="+Inf"}} {n_comparisons}\n' in exposition
+
+    # the time per step leaves out the comparisons, here slower than the rest of a step
+    slow = PartitionStats()
+    ones = random_choice(100, 3)
+
+    def slow_compare(i, j):
+        time.sleep(0.005)
+        return (i in ones) - (j in ones)
+
+    find_three_ones(slow_compare, stats=slow)
+    assert slow.step_seconds.sum < 0.005 * slow.step_seconds.count
+
+
+def test_import_is_lazy():
+    """importing find_three_ones must not load the table, or position.py and its imports"""
+    code = "import sys, find_three_ones; print(*sys.modules)"
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout
+    assert not {"_table", "position", "dataclasses"} & set(modules.split())
+
+
+def test_benchmark_main(monkeypatch, capsys):
+    """with no benchmark named, benchmark.py runs them all"""
+    import benchmark
+
+    # (the benchmarks themselves, stubbed out: this only tests the command line)
+    monkeypatch.setattr(benchmark, "import_time", lambda module="find_three_ones": 0.001)
+    monkeypatch.setattr(benchmark, "first_call_time", lambda: 0.001)
+    monkeypatch.setattr(benchmark, "solve_benchmarks", lambda: {"find_three_ones": {"p50_us": 1.0}})
+    monkeypatch.setattr(benchmark, "partition_benchmarks", lambda: {"register_comparison_us": 1.0})
+    monkeypatch.setattr(
+        benchmark, "recompute_benchmark", lambda n, solver=None, workers=None: {"seconds": 1.0}
+    )
+    benchmark.main([])
+    printed = {line.split()[0] for line in capsys.readouterr().out.splitlines()}
+    assert printed == set(benchmark.BENCHMARKS)
+
+    with pytest.raises(SystemExit):
+        benchmark.main(["nothing"])
 
 
 test_find_three_ones()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+import functools
+import itertools
+import json
+import operator
+
+import pytest
+
+import find_k_ones
+import find_three_ones
+import k_ones
+import recompute_table
+import verify
+from dense_table import COMPARISONS, ILLEGAL, UNKNOWN_VALUE, DenseTable, source_hash
+from position import Delta, Position, count_assignments, one_consistent_assignment, pack, unpack
+from range_table import RangeTable
+from recompute_table import (
+    EDGES,
+    SIGNATURE_EDGES,
+    LayeredSolution,
+    all_rows,
+    compact_node,
+    dump_alg,
+    node,
+    pack_edges,
+    round_moves,
+    rounds_rows,
+    solution_rows,
+    solve_incremental,
+    solve_iterative,
+    solve_layers,
+    solve_memoized,
+    solve_numpy,
+    write_layered_rows,
+    write_rounds_rows,
+    write_rows,
+)
+from solution_memo import SolutionMemo
+from state_machine import StateMachine, state_machine
+from verify_table import verify_table
+
+
+def node_solution(start):
+    solution, stack = {}, [start]
+    while stack:
+        _node = stack.pop()
+        posn = tuple(_node.position.values)
+        if posn in solution:
+            continue
+        solution[posn] = (_node.value, _node.min_edge.comparison if _node.value else None)
+        stack.extend(r_edge.node for c_edge in _node.comparison_edges for r_edge in c_edge.result_edges)
+    return solution
+
+
+def test_packed_positions():
+    for signature in itertools.product(range(4), repeat=5):
+        posn = Position(*signature)
+        assert unpack(posn.packed) == signature
+        for _, c in EDGES:
+            lowerbounds = (0,) * 5 if c.lowerbounds is None else c.lowerbounds.values
+            assert (posn >= c.lowerbounds) == all(map(operator.ge, signature, lowerbounds))
+            for r in c.rs:
+                child = tuple(map(operator.add, signature, r.delta.values))
+                assert (posn + r.delta).values == child
+
+    # (a negative field, as in an illegal position, does not go through the packed fields)
+    assert (Position(-1, 2, 0, 0, 0) + Delta(u2=1)).values == (-1, 3, 0, 0, 0)
+    assert (Delta(u1=-2) + Delta(u1=1)).values == (-1, 0, 0, 0, 0)
+
+    assert unpack(pack(u1=(1 << 15) - 1)) == ((1 << 15) - 1, 0, 0, 0, 0)
+    for fields in (dict(u1=1 << 15), dict(one=-1)):
+        with pytest.raises(ValueError, match="cannot pack"):
+            pack(**fields)
+    assert pack(u1=1, one=-1, delta=True) == 1 - (1 << 64)
+
+
+def test_count_assignments():
+    for u1, g2, g3 in itertools.product(range(6), range(4), range(4)):
+        sizes = [1] * u1 + [2] * g2 + [3] * g3
+        for total in range(4):
+            ones = [
+                parts
+                for k in range(total + 1)
+                for parts in itertools.combinations(range(len(sizes)), k)
+                if sum(sizes[p] for p in parts) == total
+            ]
+            assert count_assignments(u1, 2 * g2, 3 * g3, total) == len(ones)
+            assignment = one_consistent_assignment(u1, 2 * g2, 3 * g3, total)
+            if ones:
+                assert sum(assignment.values) == total and Position(u1, 2 * g2, 3 * g3) >= assignment
+            else:
+                assert assignment is None
+
+
+def test_solvers_agree():
+    for n in (3, 4, 7, 12, 25):
+        expected = node_solution(node(Position(u1=n)))
+        iterative = solve_iterative(n)
+        dense = solve_numpy(n)
+        for posn, row in expected.items():
+            assert iterative[posn] == row, (n, posn)
+            assert dense[posn] == row, (n, posn)
+            assert (compact_node(posn).value, compact_node(posn).comparison) == row, (n, posn)
+        assert all(posn in dense for posn in iterative)
+
+
+def test_solve_layers(tmp_path):
+    for n in (3, 4, 7, 12, 25):
+        iterative = solve_iterative(n)
+        (tmp_path / str(n)).mkdir()
+        layered = solve_layers(n, tmp_path / str(n))
+        for posn, row in iterative.items():
+            assert layered[posn] == row, (n, posn)
+        assert int((layered.code != layered.ILLEGAL).sum()) == len(iterative)
+        # the same rows as solution_rows, in another order
+        start = (n, 0, 0, 0, 0)
+        rows = list(layered.rows(start))
+        assert len(rows) == len({posn for posn, _, _ in rows})
+        assert sorted(rows) == sorted(solution_rows(iterative, start))
+
+
+def test_parallel_layers(tmp_path, monkeypatch):
+    n = 25
+    start = (n, 0, 0, 0, 0)
+    monkeypatch.setattr(recompute_table, "PARALLEL_CELLS", 1)
+    for workers in (1, 3):
+        (tmp_path / str(workers)).mkdir()
+        layered = solve_layers(n, tmp_path / str(workers), workers=workers)
+        write_layered_rows(
+            layered,
+            start,
+            workers,
+            table_file=tmp_path / f"table_{workers}.py",
+            left_out_file=tmp_path / f"left_out_{workers}.py",
+        )
+    write_rows(
+        layered.rows(start), table_file=tmp_path / "table.py", left_out_file=tmp_path / "left_out.py"
+    )
+    for name in ("table", "left_out"):
+        text = (tmp_path / f"{name}.py").read_text()
+        assert (tmp_path / f"{name}_1.py").read_text() == (tmp_path / f"{name}_3.py").read_text() == text
+
+
+def test_resume_layers(tmp_path, monkeypatch):
+    n = 25
+    expected = solve_iterative(n)
+    signatures = LayeredSolution.signatures
+    solved, preempt = [], [30]
+
+    def preemptible(n, layer, *cells):
+        if layer in preempt:
+            preempt.clear()
+            raise RuntimeError("preempted")
+        solved.append(layer)
+        return signatures(n, layer, *cells)
+
+    monkeypatch.setattr(LayeredSolution, "signatures", staticmethod(preemptible))
+    try:
+        solve_layers(n, tmp_path, checkpoint_seconds=0)
+    except RuntimeError:
+        pass
+    assert solved == list(range(30))
+
+    # a checkpoint behind the layers written, as after a crash between checkpoints
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    checkpoint["layers"] = 28
+    (tmp_path / "checkpoint.json").write_text(json.dumps(checkpoint))
+    solved.clear()
+    layered = solve_layers(n, tmp_path, resume=True)
+    assert solved == list(range(28, 2 * n + 1))
+    for posn, row in expected.items():
+        assert layered[posn] == row, posn
+
+    solved.clear()
+    solve_layers(n, tmp_path, resume=True)
+    assert solved == []
+
+    # a run from the start records no layers solved before it truncates the files
+    preempt.append(0)
+    with pytest.raises(RuntimeError):
+        solve_layers(n, tmp_path)
+    assert json.loads((tmp_path / "checkpoint.json").read_text())["layers"] == 0
+    # and a checkpoint ahead of the files is not resumed from
+    (tmp_path / "checkpoint.json").write_text(json.dumps(checkpoint))
+    with pytest.raises(ValueError, match="cannot resume"):
+        solve_layers(n, tmp_path, resume=True)
+
+
+def test_solve_incremental(tmp_path, monkeypatch):
+    n = 25
+    memo = SolutionMemo(tmp_path)
+    solution, solved = solve_memoized(n, memo)
+    assert solution == solve_iterative(n)
+    assert solved == sum(comparison is not None for _, comparison in solution.values())
+    assert solve_memoized(n, memo) == (solution, 0)
+
+    # change the priority of u3_one, then also the lower bounds of u2_u3 (which changes values)
+    edges = list(recompute_table.SIGNATURE_EDGES)
+    for comparison, field, change in (("u3_one", 1, 1), ("u2_u3", 2, (0, 4, 3, 0, 0))):
+        i = [edge[0] for edge in edges].index(comparison)
+        edges[i] = (*edges[i][:field], change, *edges[i][field + 1 :])
+        monkeypatch.setattr(recompute_table, "SIGNATURE_EDGES", tuple(edges))
+        monkeypatch.setattr(recompute_table, "PACKED_EDGES", pack_edges(edges))
+        previous = solution
+        solution, solved = solve_memoized(n, memo)
+        assert solution == solve_incremental(n)[0]
+        assert 0 < solved < sum(comparison is not None for _, comparison in solution.values())
+    assert any(solution[posn][0] != previous[posn][0] for posn in solution)
+
+
+def test_dump_compact_node(tmp_path):
+    n = 25
+    for start, name in ((node(Position(u1=n)), "node"), (compact_node((n, 0, 0, 0, 0)), "compact")):
+        dump_alg(start, table_file=tmp_path / f"{name}.py", left_out_file=tmp_path / f"{name}_left_out.py")
+    for name in ("", "_left_out"):
+        assert (tmp_path / f"node{name}.py").read_text() == (tmp_path / f"compact{name}.py").read_text()
+
+
+def test_table_for_other_n(tmp_path, monkeypatch):
+    n = 20
+    write_rows(
+        solution_rows(solve_iterative(n), (n, 0, 0, 0, 0)),
+        table_file=tmp_path / f"{find_three_ones.table_module(n)}.py",
+        left_out_file=tmp_path / "_left_out.py",
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setattr(find_three_ones, "_tables", {})
+
+    find = functools.partial(find_three_ones.find_three_ones, n=n)
+    assert max(verify.verify(find, n, processes=1)) <= node(Position(u1=n)).value
+
+
+def test_expected_objectives(tmp_path, monkeypatch):
+    n = 12
+    start = (n, 0, 0, 0, 0)
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setattr(find_three_ones, "_tables", {})
+    monkeypatch.setattr(find_three_ones, "_machines", {})
+
+    worst = node(Position(u1=n)).value
+    for objective in ("expected", "worst-expected"):
+        solution = solve_numpy(n, objective=objective)
+        write_rows(
+            solution_rows(solution, start),
+            table_file=tmp_path / f"{find_three_ones.table_module(n, objective)}.py",
+            left_out_file=tmp_path / "_left_out.py",
+        )
+        # (the state machine, unlike find_three_ones, picks the elements to compare
+        # deterministically, so the average over all inputs is exactly the expectation)
+        find = functools.partial(find_three_ones.find_three_ones_machine, n=n, objective=objective)
+        histogram = verify.verify(find, n, processes=1)
+        counts = sum(histogram.values())
+        assert sum(c * count for c, count in histogram.items()) / counts == solution.expected(start)
+        assert max(histogram) == solution[start][0]
+        if objective == "worst-expected":
+            assert max(histogram) == worst
+
+
+def test_dense_table(tmp_path):
+    n = 20
+    rows = write_rows(
+        solution_rows(solve_iterative(n), (n, 0, 0, 0, 0)),
+        table_file=tmp_path / "_table_20.py",
+        left_out_file=tmp_path / "_left_out.py",
+    )
+    compact = {}
+    exec((tmp_path / "_table_20.py").read_text(), compact)
+
+    source = source_hash(tmp_path / "_table_20.py")
+    DenseTable.from_rows(n, rows).save(tmp_path / "_table_20.bin", source)
+    dense = DenseTable.load(tmp_path / "_table_20.bin", source)
+    compiled = DenseTable.compile(n, compact["table"])
+    for posn, value, data in rows:
+        assert dense.row(posn) == (value, compiled.row(posn)[1]) != (value, ILLEGAL)
+
+    # once _table_20.py changes, find_three_ones compiles it rather than using the .bin
+    assert find_three_ones._saved_table(tmp_path / "_table_20").row((n, 0, 0, 0, 0)) == dense.row((n, 0, 0, 0, 0))
+    with open(tmp_path / "_table_20.py", "a") as f:
+        print("# edited", file=f)
+    assert find_three_ones._saved_table(tmp_path / "_table_20") is None
+    with pytest.raises(ValueError, match="out of date"):
+        DenseTable.load(tmp_path / "_table_20.bin", source_hash(tmp_path / "_table_20.py"))
+
+
+def test_verify_table():
+    n = 20
+    rows = list(solution_rows(solve_iterative(n), (n, 0, 0, 0, 0)))
+    table = DenseTable.from_rows(n, rows)
+    verified = verify_table(table)
+    assert verified.errors == []
+    assert verified.worst == node(Position(u1=n)).value
+
+    # compare a u3 part at the start, where there is none
+    table.codes[table.index(n, 0, 0, 0)] = COMPARISONS.index("u1_u3")
+    assert verify_table(table).errors == [f"{(n, 0, 0, 0, 0)}: compares parts that do not exist"]
+
+
+def test_state_machine(tmp_path, monkeypatch):
+    n = 20
+    rows = list(solution_rows(solve_iterative(n), (n, 0, 0, 0, 0)))
+    state_machine(DenseTable.from_rows(n, rows)).save(tmp_path / "_machine_20.bin")
+    machine = StateMachine.load(tmp_path / "_machine_20.bin")
+    monkeypatch.setattr(find_three_ones, "_machines", {(n, "worst"): machine})
+
+    find = functools.partial(find_three_ones.find_three_ones_machine, n=n)
+    assert max(verify.verify(find, n, processes=1)) <= node(Position(u1=n)).value
+
+
+def test_rounds(tmp_path, monkeypatch):
+    n = 20
+    one_per_round = solve_numpy(n, round_moves(1))
+    for posn, (value, comparison) in solve_iterative(n).items():
+        assert one_per_round[posn] == (value, comparison and (comparison,))
+
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setattr(find_three_ones, "_rounds_tables", {})
+    for p in (2, 3):
+        solution = solve_numpy(n, round_moves(p))
+        write_rounds_rows(rounds_rows(solution, (n, 0, 0, 0, 0)), tmp_path / f"_rounds_p{p}_{n}.py")
+        rounds = []
+
+        def find(compare):
+            rounds.append(0)
+
+            def compare_round(pairs):
+                rounds[-1] += 1
+                assert 1 <= len(pairs) <= p
+                assert len({i for i, j in pairs}) == len(pairs)
+                return [compare(i, j) for i, j in pairs]
+
+            return find_three_ones.find_three_ones_rounds(compare_round, n=n, p=p)
+
+        for ones in itertools.combinations(range(n), 3):
+            verify.n_comparisons(find, frozenset(ones))
+        assert max(rounds) <= solution[n, 0, 0, 0, 0][0]
+
+
+def test_range_table(tmp_path, monkeypatch):
+    n = 40
+    solution = solve_iterative(n)
+    dense = DenseTable.from_rows(n, all_rows(solution, n))
+    for values in (True, False):
+        RangeTable.compress(n, all_rows(solution, n), values).save(tmp_path / "_table_40.ranges")
+        ranges = RangeTable.load(tmp_path / "_table_40.ranges")
+        for i in range(DenseTable.size(n)):
+            value = dense.values[i] if values else UNKNOWN_VALUE
+            assert (ranges.values[i], ranges.codes[i]) == (value, dense.codes[i])
+    assert len(ranges.run_start) * 10 < len(solution)
+
+    with pytest.raises(ValueError, match="out of order"):
+        RangeTable.compress(n, reversed(list(all_rows(solution, n))))
+
+    assert verify_table(ranges).worst == solution[n, 0, 0, 0, 0][0]
+    monkeypatch.setattr(find_three_ones, "_tables", {(n, "worst"): ranges})
+    find = functools.partial(find_three_ones.find_three_ones, n=n)
+    for ones in itertools.islice(itertools.combinations(range(n), 3), 0, None, 97):
+        verify.n_comparisons(find, frozenset(ones))
+
+
+def test_main_ranges(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    n = 20
+    expected = RangeTable.compress(n, all_rows(solve_iterative(n), n), values=False)
+    for solver in ("numpy", "layers"):
+        recompute_table.main(["--solver", solver, "--n", str(n), "--ranges", "--dense"])
+        ranges = RangeTable.load(tmp_path / "_table_20.ranges")
+        assert ranges.run_start == expected.run_start and ranges.run_code == expected.run_code
+        assert (tmp_path / "_table_20.bin").exists()
+        (tmp_path / "_table_20.bin").unlink()
+
+    # find_three_ones loads the range table beside the _table_20.py it finds on sys.path
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setattr(find_three_ones, "_tables", {})
+    assert isinstance(find_three_ones.load_table(n), RangeTable)
+
+    # a range table that differs from the solution is an error, before any file is written
+    for path in tmp_path.iterdir():
+        path.unlink()
+    monkeypatch.setattr(RangeTable, "row", lambda self, signature: (UNKNOWN_VALUE, ILLEGAL))
+    with pytest.raises(ValueError, match="in the range table"):
+        recompute_table.main(["--n", str(n), "--ranges"])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_k_ones(tmp_path, monkeypatch, capsys):
+    # for k = 3, the same comparisons as EDGES, and the same values as the other solvers
+    edges = sorted(SIGNATURE_EDGES, key=operator.itemgetter(1))
+    assert [(c, lb, rs) for c, _, lb, rs in k_ones.comparison_edges(3)] == [
+        (c, lb, rs) for c, _, lb, rs in edges
+    ]
+    n = 40
+    iterative = solve_iterative(n)
+    signatures = k_ones.Signatures(3)
+    for packed, (value, comparison) in k_ones.solve(n, 3).items():
+        assert iterative[signatures.unpack(packed)][0] == value
+
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setattr(find_k_ones, "_k_tables", {})
+    for n, k in ((12, 4), (11, 5), (9, 8)):
+        rows = list(k_ones.solution_rows(k_ones.solve(n, k), n, k))
+        k_ones.write_rows(rows, tmp_path / f"{find_k_ones.k_table_module(n, k)}.py")
+        worst = rows[0][1]
+        find = functools.partial(find_k_ones.find_k_ones, n=n, k=k)
+        assert max(verify.verify(find, n, k, processes=1)) == worst
+
+    capsys.readouterr()
+    verify.main(["--n", str(n), "--k", str(k), "--processes", "1"])
+    assert capsys.readouterr().out.endswith(f", max {worst}\n")
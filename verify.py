@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+Run an algorithm on every n-element input with k ones, in a pool of processes,
+and report the histogram, mean and max of the number of comparisons it makes.
+
+e.g. python verify.py --n 20 --algorithm machine
+"""
+
+import argparse
+import functools
+import itertools
+import multiprocessing
+import os
+from collections import Counter
+
+import find_three_ones as _find_three_ones
+import manual_find_three_ones
+from find_k_ones import find_k_ones
+
+ALGORITHMS = {
+    "table": _find_three_ones.find_three_ones,
+    "machine": _find_three_ones.find_three_ones_machine,
+    # (only for n = 100, k = 3)
+    "manual": manual_find_three_ones.find_three_ones,
+}
+# for k other than 3, the table is find_k_ones's (written by k_ones.py)
+
+
+def n_comparisons(find, ones):
+    """the number of comparisons find makes on the input with ones at the indices in ones"""
+    count = 0
+
+    def compare(i, j):
+        nonlocal count
+        count += 1
+        return (i in ones) - (j in ones)
+
+    found = find(compare)
+    assert sorted(found) == sorted(ones), (sorted(ones), found)
+    return count
+
+
+_find = None
+
+
+def _init(find):
+    global _find
+    _find = find
+
+
+def _histogram(task):
+    """the histogram for the inputs whose first one is at index first"""
+    n, k, first = task
+    return Counter(
+        n_comparisons(_find, frozenset((first, *rest)))
+        for rest in itertools.combinations(range(first + 1, n), k - 1)
+    )
+
+
+def histograms(find, n=100, k=3, processes=None):
+    """
+    run find (a picklable function of compare) on every input, yielding the histogram
+    (a Counter mapping number of comparisons to number of inputs) of each batch of inputs
+    as it completes; the inputs are split into batches by the index of their first one
+    """
+    # biggest batches first, so that the last ones to finish are small
+    tasks = [(n, k, first) for first in range(n - k + 1)]
+    with multiprocessing.Pool(processes, initializer=_init, initargs=(find,)) as pool:
+        yield from pool.imap_unordered(_histogram, tasks)
+
+
+def verify(find, n=100, k=3, processes=None):
+    """the histogram over every input (see histograms)"""
+    total = Counter()
+    for histogram in histograms(find, n, k, processes):
+        total.update(histogram)
+    return total
+
+
+def report(histogram):
+    n_inputs = sum(histogram.values())
+    mean = sum(count * n for count, n in histogram.items()) / n_inputs
+    lines = [f"{count:4d} {n:8d}" for count, n in sorted(histogram.items())]
+    lines.append(f"inputs {n_inputs}, mean {mean:.6f}, max {max(histogram)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=100)
+    parser.add_argument(
+        "--k", type=int, default=3, help="number of ones (for k other than 3, only --algorithm table)"
+    )
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="table")
+    parser.add_argument("--objective", choices=_find_three_ones.OBJECTIVES, default="worst")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    find = ALGORITHMS[args.algorithm]
+    if args.algorithm == "manual":
+        if (args.n, args.k, args.objective) != (100, 3, "worst"):
+            parser.error("the manual algorithm is only for n = 100, k = 3")
+    elif args.k != 3:
+        if (args.algorithm, args.objective) != ("table", "worst"):
+            parser.error("for k other than 3, only --algorithm table, with --objective worst")
+        find = functools.partial(find_k_ones, n=args.n, k=args.k)
+    else:
+        find = functools.partial(find, n=args.n, objective=args.objective)
+    print(report(verify(find, args.n, args.k, args.processes)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+"""
+Verify a table by walking the signatures reachable from the start, instead of running
+find_three_ones on every input.
+
+For each reachable signature, the verifier reads the code of its row in the DenseTable (so
+rows left out of the compact table are checked as the rules in dense_table.default_row
+fill them in), checks that a terminal row gives the one consistent assignment, and that a
+comparison row compares parts that exist, and follows the comparison's EDGES to the
+signatures it can lead to.  It then recomputes the worst-case and expected number of
+comparisons bottom-up, and checks them against the values recorded in the table.
+
+e.g. python verify_table.py --expect 70
+"""
+
+import argparse
+import sys
+from collections import namedtuple
+
+import find_three_ones
+from dense_table import ILLEGAL, MAX_VALUE, TERMINAL, UNKNOWN_VALUE, DenseTable, encode
+from position import count_assignments, n_consistent_assignments, one_consistent_assignment
+from range_table import RangeTable
+from recompute_table import SIGNATURE_EDGES, _add, _multiplicity
+
+Verified = namedtuple("Verified", ["n_states", "worst", "expected", "errors"])
+
+
+def _children(posn, code):
+    """(multiplicity, child) for each legal signature the comparison with the code leads to"""
+    comparison, _, lowerbounds, rs = SIGNATURE_EDGES[code]
+    if lowerbounds is not None and not all(s >= lb for s, lb in zip(posn, lowerbounds)):
+        return None
+    children = []
+    for r, delta in rs:
+        child = _add(posn, delta)
+        u1, u2, u3, zero, one = child
+        if min(child) >= 0 and n_consistent_assignments(u1, u2, u3, 3 - one):
+            children.append((_multiplicity(comparison, r), child))
+    return children
+
+
+def verify_table(table):
+    """verify the DenseTable (or RangeTable) table (see the module docstring)"""
+    n = table.n
+    start = (n, 0, 0, 0, 0)
+    errors = []
+    edges = {}
+    order = [start]
+    seen = {start}
+    for posn in order:
+        u1, u2, u3, zero, one = posn
+        code = table.row(posn)[1]
+        if code == ILLEGAL:
+            errors.append(f"{posn}: no row")
+        elif code >= TERMINAL:
+            if n_consistent_assignments(u1, u2, u3, 3 - one) != 1:
+                errors.append(f"{posn}: terminal, but more than one assignment is consistent")
+                continue
+            asst = one_consistent_assignment(u1, u2, u3, 3 - one)
+            if code != encode((asst.u1, asst.u2, asst.u3, asst.zero, asst.one + one)):
+                errors.append(f"{posn}: terminal, but not with the consistent assignment")
+        else:
+            if n_consistent_assignments(u1, u2, u3, 3 - one) == 1:
+                errors.append(f"{posn}: compares, but only one assignment is consistent")
+            children = _children(posn, code)
+            if not children:
+                errors.append(f"{posn}: compares parts that do not exist")
+                continue
+            edges[posn] = children
+            for _, child in children:
+                if child not in seen:
+                    seen.add(child)
+                    order.append(child)
+    if errors:
+        return Verified(len(order), None, None, errors)
+
+    # bottom-up: every comparison decreases (unknown, u1), as in recompute_table.signatures
+    worst, total = {}, {}
+    for posn in sorted(order, key=lambda s: (s[0] + s[1] + s[2], s[0])):
+        u1, u2, u3, zero, one = posn
+        if posn in edges:
+            worst[posn] = 1 + max(worst[child] for _, child in edges[posn])
+            total[posn] = count_assignments(u1, u2, u3, 3 - one) + sum(
+                m * total[child] for m, child in edges[posn]
+            )
+        else:
+            worst[posn] = total[posn] = 0
+        recorded = table.row(posn)[0]
+        if recorded not in (UNKNOWN_VALUE, min(worst[posn], MAX_VALUE)):
+            errors.append(f"{posn}: value {recorded} recorded, but {worst[posn]} comparisons needed")
+
+    expected = total[start] / count_assignments(n, 0, 0, 3)
+    return Verified(len(worst), worst[start], expected, errors)
+
+
+def load(path, n):
+    """
+    the table in path: the DenseTable in a _table*.bin, the RangeTable in a _table*.ranges,
+    or a _table*.py compiled as find_three_ones does
+    """
+    if path.endswith(".bin"):
+        return DenseTable.load(path)
+    if path.endswith(".ranges"):
+        return RangeTable.load(path)
+    module = {}
+    with open(path) as f:
+        exec(f.read(), module)
+    return DenseTable.compile(n, module["table"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "path",
+        nargs="?",
+        help="a _table*.py, _table*.bin or _table*.ranges (default: the table find_three_ones loads for n and objective)",
+    )
+    parser.add_argument("--n", type=int, default=100)
+    parser.add_argument("--objective", choices=find_three_ones.OBJECTIVES, default="worst")
+    parser.add_argument("--expect", type=int, help="the worst-case number of comparisons to expect")
+    args = parser.parse_args(argv)
+
+    if args.path is None:
+        table = find_three_ones.load_table(args.n, args.objective)
+    else:
+        table = load(args.path, args.n)
+    verified = verify_table(table)
+    for error in verified.errors:
+        print(error)
+    if verified.errors:
+        return 1
+    print(
+        f"{verified.n_states} signatures, worst case {verified.worst}, "
+        f"expected {verified.expected:.6f} comparisons"
+    )
+    if args.expect is not None and verified.worst != args.expect:
+        print(f"expected worst case {args.expect}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())